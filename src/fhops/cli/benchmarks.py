@@ -11,7 +11,8 @@ from __future__ import annotations
 import json
 import math
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -40,11 +41,12 @@ from fhops.evaluation import compute_kpis
 from fhops.model.milp.driver import solve_operational_milp
 from fhops.optimization.heuristics import solve_ils, solve_sa, solve_tabu
 from fhops.optimization.operational_problem import build_operational_problem
+from fhops.optimization.pool import shared_solver_pool
 from fhops.scenario.contract import Problem
 from fhops.scenario.io import load_scenario
 from fhops.telemetry import append_jsonl
 from fhops.telemetry.machine_costs import build_machine_cost_snapshots, summarize_machine_costs
-from fhops.telemetry.watch import WatchConfig
+from fhops.telemetry.watch import SnapshotSink, WatchConfig
 
 console = Console()
 COLUMNS_AXIS: Literal["columns"] = "columns"
@@ -176,6 +178,7 @@ def run_benchmark_suite(
     profile: Profile | None = None,
     watch: bool = False,
     watch_refresh: float = 0.5,
+    workers: int = 1,
 ) -> pd.DataFrame:
     """Execute the benchmark suite and return the summary DataFrame.
 
@@ -257,6 +260,10 @@ def run_benchmark_suite(
         Enable live dashboard updates (requires interactive terminal).
     watch_refresh : float, default=0.5
         Refresh interval (seconds) for the live dashboard when ``watch`` is enabled.
+    workers : int, default=1
+        Worker processes for SA/ILS/Tabu runs. Values above one dispatch every heuristic run to
+        :func:`fhops.optimization.pool.shared_solver_pool` (each worker loads a scenario once) while
+        MIP solves continue in the calling process; the summary rows keep sequential order.
 
     Returns
     -------
@@ -295,6 +302,11 @@ def run_benchmark_suite(
         else None
     )
 
+    # Heuristic runs go to a shared worker pool (scenarios loaded once per worker) when
+    # ``workers > 1``; MIP solves stay in this process and overlap with the pooled runs.
+    pool = shared_solver_pool(workers) if workers > 1 else None
+    pending: list[tuple[Future, Callable[[dict[str, Any], float], None]]] = []
+
     watch_runner: LiveWatch | None = None
     if watch:
         if console.is_terminal:
@@ -303,291 +315,313 @@ def run_benchmark_suite(
         else:
             console.print("[yellow]Watch mode disabled: not running in an interactive terminal.[/]")
 
-    def _run_benchmark_scenarios() -> None:
-        for bench in scenarios:
-            resolved_path = bench.path.expanduser()
-            if not resolved_path.exists():
-                raise FileNotFoundError(f"Scenario not found: {resolved_path}")
-            sc = load_scenario(str(resolved_path))
-            machine_cost_dicts = [
-                snapshot.to_dict() for snapshot in build_machine_cost_snapshots(sc.machines)
-            ]
-            machine_costs_summary = summarize_machine_costs(machine_cost_dicts)
-            pb = Problem.from_scenario(sc)
-            scenario_out = out_dir / bench.name
-            scenario_out.mkdir(parents=True, exist_ok=True)
-
-            scenario_mip_objective: float | None = None
-            if include_mip:
-                build_start = time.perf_counter()
-                ctx = build_operational_problem(pb)
-                bundle = ctx.bundle
-                build_time = time.perf_counter() - build_start
-                solver_candidates = _operational_solver_candidates(driver)
-                mip_res: Mapping[str, object] | None = None
-                chosen_solver: str | None = None
-                mip_runtime = 0.0
-                last_error: Exception | None = None
-                for solver_name in solver_candidates:
-                    start = time.perf_counter()
-                    try:
-                        mip_res = solve_operational_milp(
-                            bundle,
-                            solver=solver_name,
-                            time_limit=time_limit,
-                            tee=bool(debug),
-                            context=ctx,
+    def _run_scenario(bench: BenchmarkScenario) -> None:
+        resolved_path = bench.path.expanduser()
+        if not resolved_path.exists():
+            raise FileNotFoundError(f"Scenario not found: {resolved_path}")
+        sc = load_scenario(str(resolved_path))
+        machine_cost_dicts = [
+            snapshot.to_dict() for snapshot in build_machine_cost_snapshots(sc.machines)
+        ]
+        machine_costs_summary = summarize_machine_costs(machine_cost_dicts)
+        pb = Problem.from_scenario(sc)
+
+        def _dispatch(
+            solver_name: str,
+            kwargs: dict[str, Any],
+            finish: Callable[[dict[str, Any], float], None],
+        ) -> None:
+            if pool is None:
+                solver_funcs: dict[str, Callable[..., dict[str, Any]]] = {
+                    "sa": solve_sa,
+                    "ils": solve_ils,
+                    "tabu": solve_tabu,
+                }
+                start = time.perf_counter()
+                result = solver_funcs[solver_name](pb, **kwargs)
+                finish(result, time.perf_counter() - start)
+            else:
+                pending.append((pool.submit_timed(resolved_path, solver_name, **kwargs), finish))
+
+        scenario_out = out_dir / bench.name
+        scenario_out.mkdir(parents=True, exist_ok=True)
+
+        scenario_mip_objective: float | None = None
+        if include_mip:
+            build_start = time.perf_counter()
+            ctx = build_operational_problem(pb)
+            bundle = ctx.bundle
+            build_time = time.perf_counter() - build_start
+            solver_candidates = _operational_solver_candidates(driver)
+            mip_res: Mapping[str, object] | None = None
+            chosen_solver: str | None = None
+            mip_runtime = 0.0
+            last_error: Exception | None = None
+            for solver_name in solver_candidates:
+                start = time.perf_counter()
+                try:
+                    mip_res = solve_operational_milp(
+                        bundle,
+                        solver=solver_name,
+                        time_limit=time_limit,
+                        tee=bool(debug),
+                        context=ctx,
+                    )
+                    mip_runtime = time.perf_counter() - start
+                    chosen_solver = solver_name
+                    break
+                except Exception as exc:  # pragma: no cover - exercised via fallback
+                    mip_runtime = time.perf_counter() - start
+                    last_error = exc
+                    if debug:
+                        console.print(
+                            f"[yellow]Operational MILP solver '{solver_name}' failed: {exc}[/]"
                         )
-                        mip_runtime = time.perf_counter() - start
-                        chosen_solver = solver_name
-                        break
-                    except Exception as exc:  # pragma: no cover - exercised via fallback
-                        mip_runtime = time.perf_counter() - start
-                        last_error = exc
-                        if debug:
-                            console.print(
-                                f"[yellow]Operational MILP solver '{solver_name}' failed: {exc}[/]"
-                            )
-                        continue
-                if mip_res is None:
-                    raise RuntimeError(
-                        f"Operational MILP solve failed for {bench.path} (driver={driver})."
-                    ) from last_error
-                mip_assign = cast(pd.DataFrame, mip_res["assignments"]).copy()
-                mip_assign.to_csv(scenario_out / "mip_assignments.csv", index=False)
-                objective_val = mip_res.get("objective")
-                scenario_mip_objective = (
-                    float(objective_val) if isinstance(objective_val, int | float) else None
+                    continue
+            if mip_res is None:
+                raise RuntimeError(
+                    f"Operational MILP solve failed for {bench.path} (driver={driver})."
+                ) from last_error
+            mip_assign = cast(pd.DataFrame, mip_res["assignments"]).copy()
+            mip_assign.to_csv(scenario_out / "mip_assignments.csv", index=False)
+            objective_val = mip_res.get("objective")
+            scenario_mip_objective = (
+                float(objective_val) if isinstance(objective_val, int | float) else None
+            )
+            mip_kpis = compute_kpis(pb, mip_assign)
+            extra_payload: dict[str, object] = {
+                "build_time_s": build_time,
+            }
+            if chosen_solver:
+                extra_payload["mip_solver"] = chosen_solver
+            solver_status = mip_res.get("solver_status")
+            if solver_status is not None:
+                extra_payload["solver_status"] = solver_status
+            termination = mip_res.get("termination_condition")
+            if termination is not None:
+                extra_payload["termination_condition"] = termination
+            rows.append(
+                _record_metrics(
+                    scenario=bench,
+                    solver="mip",
+                    objective=(
+                        scenario_mip_objective
+                        if scenario_mip_objective is not None
+                        else float("nan")
+                    ),
+                    assignments=mip_assign,
+                    kpis=mip_kpis,
+                    runtime_s=mip_runtime,
+                    extra=extra_payload,
+                    machine_costs_summary=machine_costs_summary,
+                )
+            )
+
+        sc_name = getattr(sc, "name", bench.name)
+        watch_sink: SnapshotSink | None = None
+        if watch_runner:
+            # Pooled runs stream snapshots back from the worker processes through a relay.
+            watch_sink = watch_runner.sink if pool is None else watch_runner.process_sink()
+
+        override_weights = operator_weights or {}
+        explicit_ops = [op.lower() for op in operators] if operators else []
+
+        def build_label(presets: Sequence[str] | None, has_override: bool) -> str:
+            if presets:
+                return "+".join(presets)
+            if has_override:
+                return "custom"
+            return "default"
+
+        def build_sa_run(
+            presets: Sequence[str] | None,
+        ) -> tuple[str, Sequence[str] | None]:
+            label_local = build_label(presets, bool(override_weights or explicit_ops))
+            return label_local, presets
+
+        runs: list[tuple[str, Sequence[str] | None]] = []
+        base_label, base_presets = build_sa_run(operator_presets)
+        runs.append((base_label, base_presets))
+
+        if preset_comparisons:
+            for preset_name in preset_comparisons:
+                comparison_label, comp_presets = build_sa_run([preset_name])
+                runs.append((comparison_label, comp_presets))
+
+        def _run_sa(preset_label: str, run_presets: Sequence[str] | None) -> None:
+            resolved_sa = merge_profile_with_cli(
+                profile_sa_config,
+                run_presets,
+                override_weights,
+                explicit_ops,
+                None,
+                None,
+                None,
+            )
+            sa_kwargs: dict[str, Any] = {
+                "iters": sa_iters,
+                "seed": sa_seed,
+                "operators": resolved_sa.operators,
+                "operator_weights": (
+                    resolved_sa.operator_weights if resolved_sa.operator_weights else None
+                ),
+                "batch_size": resolved_sa.batch_neighbours,
+                "max_workers": resolved_sa.parallel_workers,
+                "cooling_rate": sa_cooling_rate,
+                "restart_interval": sa_restart_interval,
+                "objective_weight_overrides": objective_weight_overrides,
+                "milp_objective": scenario_mip_objective,
+            }
+            if resolved_sa.extra_kwargs:
+                sa_kwargs.update(resolved_sa.extra_kwargs)
+            if watch_sink:
+                sa_kwargs["watch_sink"] = watch_sink
+                sa_kwargs["watch_interval"] = max(1, sa_iters // 200 or 1)
+                sa_kwargs["watch_metadata"] = {
+                    "scenario": sc_name,
+                    "solver": f"sa[{preset_label}]" if preset_label else "sa",
+                }
+
+            def _finish_sa(sa_res: dict[str, Any], sa_runtime: float) -> None:
+                sa_assign = cast(pd.DataFrame, sa_res["assignments"]).copy()
+                output_name = (
+                    f"sa_assignments_{preset_label.replace('+', '_')}.csv"
+                    if preset_label not in {"default", "custom"}
+                    else "sa_assignments.csv"
                 )
-                mip_kpis = compute_kpis(pb, mip_assign)
-                extra_payload: dict[str, object] = {
-                    "build_time_s": build_time,
+                sa_assign.to_csv(scenario_out / output_name, index=False)
+                sa_kpis = compute_kpis(pb, sa_assign)
+                sa_meta = cast(dict[str, Any], sa_res.get("meta", {}))
+                if profile:
+                    sa_meta["profile"] = profile.name
+                    sa_meta["profile_version"] = profile.version
+                extra = {
+                    "iters": sa_iters,
+                    "seed": sa_seed,
+                    "sa_initial_score": sa_meta.get("initial_score"),
+                    "sa_acceptance_rate": sa_meta.get("acceptance_rate"),
+                    "sa_accepted_moves": sa_meta.get("accepted_moves"),
+                    "sa_proposals": sa_meta.get("proposals"),
+                    "sa_restarts": sa_meta.get("restarts"),
+                    "preset_label": preset_label,
                 }
-                if chosen_solver:
-                    extra_payload["mip_solver"] = chosen_solver
-                solver_status = mip_res.get("solver_status")
-                if solver_status is not None:
-                    extra_payload["solver_status"] = solver_status
-                termination = mip_res.get("termination_condition")
-                if termination is not None:
-                    extra_payload["termination_condition"] = termination
+                if profile:
+                    extra["profile"] = profile.name
+                    extra["profile_version"] = profile.version
+                operators_meta = cast(dict[str, float], sa_meta.get("operators", {}))
+                operator_stats = cast(
+                    dict[str, dict[str, float]], sa_meta.get("operators_stats", {})
+                )
+                resolved_weights = operators_meta or (
+                    resolved_sa.operator_weights if resolved_sa.operator_weights else {}
+                )
                 rows.append(
                     _record_metrics(
                         scenario=bench,
-                        solver="mip",
-                        objective=(
-                            scenario_mip_objective
-                            if scenario_mip_objective is not None
-                            else float("nan")
-                        ),
-                        assignments=mip_assign,
-                        kpis=mip_kpis,
-                        runtime_s=mip_runtime,
-                        extra=extra_payload,
+                        solver="sa",
+                        objective=cast(float, sa_res.get("objective", 0.0)),
+                        assignments=sa_assign,
+                        kpis=sa_kpis,
+                        runtime_s=sa_runtime,
+                        extra=extra,
+                        operator_config=resolved_weights,
+                        operator_stats=operator_stats,
                         machine_costs_summary=machine_costs_summary,
                     )
                 )
-
-            sc_name = getattr(sc, "name", bench.name)
-            watch_sink = watch_runner.sink if watch_runner else None
-
-            override_weights = operator_weights or {}
-            explicit_ops = [op.lower() for op in operators] if operators else []
-
-            def build_label(presets: Sequence[str] | None, has_override: bool) -> str:
-                if presets:
-                    return "+".join(presets)
-                if has_override:
-                    return "custom"
-                return "default"
-
-            def build_sa_run(
-                presets: Sequence[str] | None,
-            ) -> tuple[str, Sequence[str] | None]:
-                label_local = build_label(presets, bool(override_weights or explicit_ops))
-                return label_local, presets
-
-            runs: list[tuple[str, Sequence[str] | None]] = []
-            base_label, base_presets = build_sa_run(operator_presets)
-            runs.append((base_label, base_presets))
-
-            if preset_comparisons:
-                for preset_name in preset_comparisons:
-                    comparison_label, comp_presets = build_sa_run([preset_name])
-                    runs.append((comparison_label, comp_presets))
-
-            if include_sa:
-                for preset_label, run_presets in runs:
-                    resolved_sa = merge_profile_with_cli(
-                        profile_sa_config,
-                        run_presets,
-                        override_weights,
-                        explicit_ops,
-                        None,
-                        None,
-                        None,
-                    )
-                    sa_kwargs: dict[str, Any] = {
-                        "iters": sa_iters,
-                        "seed": sa_seed,
-                        "operators": resolved_sa.operators,
-                        "operator_weights": (
-                            resolved_sa.operator_weights if resolved_sa.operator_weights else None
-                        ),
-                        "batch_size": resolved_sa.batch_neighbours,
-                        "max_workers": resolved_sa.parallel_workers,
-                        "cooling_rate": sa_cooling_rate,
-                        "restart_interval": sa_restart_interval,
-                        "objective_weight_overrides": objective_weight_overrides,
-                        "milp_objective": scenario_mip_objective,
-                    }
-                    if resolved_sa.extra_kwargs:
-                        sa_kwargs.update(resolved_sa.extra_kwargs)
-                    if watch_sink:
-                        sa_kwargs["watch_sink"] = watch_sink
-                        sa_kwargs["watch_interval"] = max(1, sa_iters // 200 or 1)
-                        sa_kwargs["watch_metadata"] = {
-                            "scenario": sc_name,
-                            "solver": f"sa[{preset_label}]" if preset_label else "sa",
-                        }
-                    start = time.perf_counter()
-                    sa_res = solve_sa(pb, **sa_kwargs)
-                    sa_runtime = time.perf_counter() - start
-                    sa_assign = cast(pd.DataFrame, sa_res["assignments"]).copy()
-                    output_name = (
-                        f"sa_assignments_{preset_label.replace('+', '_')}.csv"
-                        if preset_label not in {"default", "custom"}
-                        else "sa_assignments.csv"
-                    )
-                    sa_assign.to_csv(scenario_out / output_name, index=False)
-                    sa_kpis = compute_kpis(pb, sa_assign)
-                    sa_meta = cast(dict[str, Any], sa_res.get("meta", {}))
-                    if profile:
-                        sa_meta["profile"] = profile.name
-                        sa_meta["profile_version"] = profile.version
-                    extra = {
-                        "iters": sa_iters,
+                if telemetry_log:
+                    log_record = {
+                        "timestamp": datetime.now(UTC).isoformat(),
+                        "source": "bench-suite",
+                        "scenario": sc.name,
+                        "scenario_path": str(resolved_path),
+                        "solver": "sa",
                         "seed": sa_seed,
-                        "sa_initial_score": sa_meta.get("initial_score"),
-                        "sa_acceptance_rate": sa_meta.get("acceptance_rate"),
-                        "sa_accepted_moves": sa_meta.get("accepted_moves"),
-                        "sa_proposals": sa_meta.get("proposals"),
-                        "sa_restarts": sa_meta.get("restarts"),
+                        "iterations": sa_iters,
+                        "objective": cast(float, sa_res.get("objective", 0.0)),
+                        "kpis": sa_kpis.to_dict(),
+                        "operators_config": resolved_weights,
+                        "operators_stats": operator_stats,
                         "preset_label": preset_label,
+                        "machine_costs": machine_cost_dicts,
                     }
+                    if scenario_mip_objective is not None:
+                        log_record["milp_objective"] = float(scenario_mip_objective)
                     if profile:
-                        extra["profile"] = profile.name
-                        extra["profile_version"] = profile.version
-                    operators_meta = cast(dict[str, float], sa_meta.get("operators", {}))
-                    operator_stats = cast(
-                        dict[str, dict[str, float]], sa_meta.get("operators_stats", {})
-                    )
-                    resolved_weights = operators_meta or (
-                        resolved_sa.operator_weights if resolved_sa.operator_weights else {}
-                    )
-                    rows.append(
-                        _record_metrics(
-                            scenario=bench,
-                            solver="sa",
-                            objective=cast(float, sa_res.get("objective", 0.0)),
-                            assignments=sa_assign,
-                            kpis=sa_kpis,
-                            runtime_s=sa_runtime,
-                            extra=extra,
-                            operator_config=resolved_weights,
-                            operator_stats=operator_stats,
-                            machine_costs_summary=machine_costs_summary,
-                        )
-                    )
-                    if telemetry_log:
-                        log_record = {
-                            "timestamp": datetime.now(UTC).isoformat(),
-                            "source": "bench-suite",
-                            "scenario": sc.name,
-                            "scenario_path": str(resolved_path),
-                            "solver": "sa",
-                            "seed": sa_seed,
-                            "iterations": sa_iters,
-                            "objective": cast(float, sa_res.get("objective", 0.0)),
-                            "kpis": sa_kpis.to_dict(),
-                            "operators_config": resolved_weights,
-                            "operators_stats": operator_stats,
-                            "preset_label": preset_label,
-                            "machine_costs": machine_cost_dicts,
-                        }
-                        if scenario_mip_objective is not None:
-                            log_record["milp_objective"] = float(scenario_mip_objective)
-                        if profile:
-                            log_record["profile"] = profile.name
-                            log_record["profile_version"] = profile.version
-                        append_jsonl(telemetry_log, log_record)
-
-            if include_ils:
-                resolved_ils = merge_profile_with_cli(
-                    profile_ils_config,
-                    operator_presets,
-                    override_weights,
-                    explicit_ops,
-                    ils_batch_neighbours,
-                    ils_workers,
-                    None,
-                )
-                ils_batch_arg = resolved_ils.batch_neighbours
-                if ils_batch_arg is None and ils_batch_neighbours > 1:
-                    ils_batch_arg = ils_batch_neighbours
-                ils_worker_arg = resolved_ils.parallel_workers
-                if ils_worker_arg is None and ils_workers > 1:
-                    ils_worker_arg = ils_workers
-                ils_weight_config = (
-                    resolved_ils.operator_weights if resolved_ils.operator_weights else None
-                )
-                ils_extra_kwargs: dict[str, Any] = dict(resolved_ils.extra_kwargs)
-                perturbation_strength_val = ils_perturbation_strength
-                stall_limit_val = ils_stall_limit
-                hybrid_use_mip_val = ils_hybrid_use_mip
-                hybrid_mip_time_limit_val = ils_hybrid_mip_time_limit
-
-                value = ils_extra_kwargs.pop("perturbation_strength", None)
-                if isinstance(value, int | float):
-                    perturbation_strength_val = int(value)
-                value = ils_extra_kwargs.pop("stall_limit", None)
-                if isinstance(value, int | float):
-                    stall_limit_val = int(value)
-                value = ils_extra_kwargs.pop("hybrid_use_mip", None)
-                if isinstance(value, bool):
-                    hybrid_use_mip_val = value
-                value = ils_extra_kwargs.pop("hybrid_mip_time_limit", None)
-                if isinstance(value, int | float):
-                    hybrid_mip_time_limit_val = int(value)
-
-                ils_run_iters = ils_iters if ils_iters is not None else sa_iters
-                ils_run_seed = ils_seed if ils_seed is not None else sa_seed
-                ils_kwargs: dict[str, Any] = {
-                    "iters": ils_run_iters,
-                    "seed": ils_run_seed,
-                    "operators": resolved_ils.operators,
-                    "operator_weights": ils_weight_config,
-                    "batch_size": ils_batch_arg,
-                    "max_workers": ils_worker_arg,
-                    "perturbation_strength": perturbation_strength_val,
-                    "stall_limit": stall_limit_val,
-                    "hybrid_use_mip": hybrid_use_mip_val,
-                    "hybrid_mip_time_limit": hybrid_mip_time_limit_val,
-                    "objective_weight_overrides": objective_weight_overrides,
-                    "milp_objective": scenario_mip_objective,
+                        log_record["profile"] = profile.name
+                        log_record["profile_version"] = profile.version
+                    append_jsonl(telemetry_log, log_record)
+
+            _dispatch("sa", sa_kwargs, _finish_sa)
+
+        if include_sa:
+            for preset_label, run_presets in runs:
+                _run_sa(preset_label, run_presets)
+
+        if include_ils:
+            resolved_ils = merge_profile_with_cli(
+                profile_ils_config,
+                operator_presets,
+                override_weights,
+                explicit_ops,
+                ils_batch_neighbours,
+                ils_workers,
+                None,
+            )
+            ils_batch_arg = resolved_ils.batch_neighbours
+            if ils_batch_arg is None and ils_batch_neighbours > 1:
+                ils_batch_arg = ils_batch_neighbours
+            ils_worker_arg = resolved_ils.parallel_workers
+            if ils_worker_arg is None and ils_workers > 1:
+                ils_worker_arg = ils_workers
+            ils_weight_config = (
+                resolved_ils.operator_weights if resolved_ils.operator_weights else None
+            )
+            ils_extra_kwargs: dict[str, Any] = dict(resolved_ils.extra_kwargs)
+            perturbation_strength_val = ils_perturbation_strength
+            stall_limit_val = ils_stall_limit
+            hybrid_use_mip_val = ils_hybrid_use_mip
+            hybrid_mip_time_limit_val = ils_hybrid_mip_time_limit
+
+            value = ils_extra_kwargs.pop("perturbation_strength", None)
+            if isinstance(value, int | float):
+                perturbation_strength_val = int(value)
+            value = ils_extra_kwargs.pop("stall_limit", None)
+            if isinstance(value, int | float):
+                stall_limit_val = int(value)
+            value = ils_extra_kwargs.pop("hybrid_use_mip", None)
+            if isinstance(value, bool):
+                hybrid_use_mip_val = value
+            value = ils_extra_kwargs.pop("hybrid_mip_time_limit", None)
+            if isinstance(value, int | float):
+                hybrid_mip_time_limit_val = int(value)
+
+            ils_run_iters = ils_iters if ils_iters is not None else sa_iters
+            ils_run_seed = ils_seed if ils_seed is not None else sa_seed
+            ils_kwargs: dict[str, Any] = {
+                "iters": ils_run_iters,
+                "seed": ils_run_seed,
+                "operators": resolved_ils.operators,
+                "operator_weights": ils_weight_config,
+                "batch_size": ils_batch_arg,
+                "max_workers": ils_worker_arg,
+                "perturbation_strength": perturbation_strength_val,
+                "stall_limit": stall_limit_val,
+                "hybrid_use_mip": hybrid_use_mip_val,
+                "hybrid_mip_time_limit": hybrid_mip_time_limit_val,
+                "objective_weight_overrides": objective_weight_overrides,
+                "milp_objective": scenario_mip_objective,
+            }
+            ils_kwargs.update(ils_extra_kwargs)
+            if watch_sink:
+                ils_kwargs["watch_sink"] = watch_sink
+                ils_kwargs["watch_interval"] = max(1, ils_run_iters // 50 or 1)
+                ils_kwargs["watch_metadata"] = {
+                    "scenario": sc_name,
+                    "solver": "ils",
                 }
-                ils_kwargs.update(ils_extra_kwargs)
-                if watch_sink:
-                    ils_kwargs["watch_sink"] = watch_sink
-                    ils_kwargs["watch_interval"] = max(1, ils_run_iters // 50 or 1)
-                    ils_kwargs["watch_metadata"] = {
-                        "scenario": sc_name,
-                        "solver": "ils",
-                    }
 
-                start = time.perf_counter()
-                ils_res = solve_ils(pb, **ils_kwargs)
-                ils_runtime = time.perf_counter() - start
+            def _finish_ils(ils_res: dict[str, Any], ils_runtime: float) -> None:
                 ils_assign = cast(pd.DataFrame, ils_res["assignments"]).copy()
                 ils_assign.to_csv(scenario_out / "ils_assignments.csv", index=False)
                 ils_kpis = compute_kpis(pb, ils_assign)
@@ -649,61 +683,61 @@ def run_benchmark_suite(
                         record["profile_version"] = profile.version
                     append_jsonl(telemetry_log, record)
 
-            if include_tabu:
-                resolved_tabu = merge_profile_with_cli(
-                    profile_tabu_config,
-                    operator_presets,
-                    override_weights,
-                    explicit_ops,
-                    tabu_batch_neighbours,
-                    tabu_workers,
-                    None,
-                )
-                tabu_batch_arg = resolved_tabu.batch_neighbours
-                if tabu_batch_arg is None and tabu_batch_neighbours > 1:
-                    tabu_batch_arg = tabu_batch_neighbours
-                tabu_worker_arg = resolved_tabu.parallel_workers
-                if tabu_worker_arg is None and tabu_workers > 1:
-                    tabu_worker_arg = tabu_workers
-                tabu_weight_config = (
-                    resolved_tabu.operator_weights if resolved_tabu.operator_weights else None
-                )
-                tabu_extra_kwargs: dict[str, Any] = dict(resolved_tabu.extra_kwargs)
-                tabu_tenure_val = tabu_tenure
-                tabu_stall_limit_val = tabu_stall_limit
-                value = tabu_extra_kwargs.pop("tabu_tenure", None)
-                if isinstance(value, int | float):
-                    tabu_tenure_val = int(value)
-                value = tabu_extra_kwargs.pop("stall_limit", None)
-                if isinstance(value, int | float):
-                    tabu_stall_limit_val = int(value)
-
-                tabu_run_iters = tabu_iters if tabu_iters is not None else sa_iters
-                tabu_run_seed = tabu_seed if tabu_seed is not None else sa_seed
-                tabu_kwargs: dict[str, Any] = {
-                    "iters": tabu_run_iters,
-                    "seed": tabu_run_seed,
-                    "operators": resolved_tabu.operators,
-                    "operator_weights": tabu_weight_config,
-                    "batch_size": tabu_batch_arg,
-                    "max_workers": tabu_worker_arg,
-                    "tabu_tenure": tabu_tenure_val,
-                    "stall_limit": tabu_stall_limit_val,
-                    "objective_weight_overrides": objective_weight_overrides,
-                    "milp_objective": scenario_mip_objective,
+            _dispatch("ils", ils_kwargs, _finish_ils)
+
+        if include_tabu:
+            resolved_tabu = merge_profile_with_cli(
+                profile_tabu_config,
+                operator_presets,
+                override_weights,
+                explicit_ops,
+                tabu_batch_neighbours,
+                tabu_workers,
+                None,
+            )
+            tabu_batch_arg = resolved_tabu.batch_neighbours
+            if tabu_batch_arg is None and tabu_batch_neighbours > 1:
+                tabu_batch_arg = tabu_batch_neighbours
+            tabu_worker_arg = resolved_tabu.parallel_workers
+            if tabu_worker_arg is None and tabu_workers > 1:
+                tabu_worker_arg = tabu_workers
+            tabu_weight_config = (
+                resolved_tabu.operator_weights if resolved_tabu.operator_weights else None
+            )
+            tabu_extra_kwargs: dict[str, Any] = dict(resolved_tabu.extra_kwargs)
+            tabu_tenure_val = tabu_tenure
+            tabu_stall_limit_val = tabu_stall_limit
+            value = tabu_extra_kwargs.pop("tabu_tenure", None)
+            if isinstance(value, int | float):
+                tabu_tenure_val = int(value)
+            value = tabu_extra_kwargs.pop("stall_limit", None)
+            if isinstance(value, int | float):
+                tabu_stall_limit_val = int(value)
+
+            tabu_run_iters = tabu_iters if tabu_iters is not None else sa_iters
+            tabu_run_seed = tabu_seed if tabu_seed is not None else sa_seed
+            tabu_kwargs: dict[str, Any] = {
+                "iters": tabu_run_iters,
+                "seed": tabu_run_seed,
+                "operators": resolved_tabu.operators,
+                "operator_weights": tabu_weight_config,
+                "batch_size": tabu_batch_arg,
+                "max_workers": tabu_worker_arg,
+                "tabu_tenure": tabu_tenure_val,
+                "stall_limit": tabu_stall_limit_val,
+                "objective_weight_overrides": objective_weight_overrides,
+                "milp_objective": scenario_mip_objective,
+            }
+            tabu_kwargs.update(tabu_extra_kwargs)
+            if watch_sink:
+                tabu_kwargs["watch_sink"] = watch_sink
+                tabu_kwargs["watch_interval"] = max(1, tabu_run_iters // 50 or 1)
+                tabu_kwargs["watch_metadata"] = {
+                    "scenario": sc_name,
+                    "solver": "tabu",
                 }
-                tabu_kwargs.update(tabu_extra_kwargs)
-                if watch_sink:
-                    tabu_kwargs["watch_sink"] = watch_sink
-                    tabu_kwargs["watch_interval"] = max(1, tabu_run_iters // 50 or 1)
-                    tabu_kwargs["watch_metadata"] = {
-                        "scenario": sc_name,
-                        "solver": "tabu",
-                    }
 
-                start = time.perf_counter()
-                tabu_res = solve_tabu(pb, **tabu_kwargs)
-                tabu_runtime = time.perf_counter() - start
+            def _finish_tabu(tabu_res: dict[str, Any], tabu_runtime: float) -> None:
                 tabu_assign = cast(pd.DataFrame, tabu_res["assignments"]).copy()
                 tabu_assign.to_csv(scenario_out / "tabu_assignments.csv", index=False)
                 tabu_kpis = compute_kpis(pb, tabu_assign)
@@ -760,6 +794,20 @@ def run_benchmark_suite(
                         record["profile_version"] = profile.version
                     append_jsonl(telemetry_log, record)
 
+            _dispatch("tabu", tabu_kwargs, _finish_tabu)
+
+    def _run_benchmark_scenarios() -> None:
+        for bench in scenarios:
+            _run_scenario(bench)
+        # Pooled heuristic runs finish in submission order; a stable sort by scenario then puts
+        # each scenario's MIP row back in front of its heuristic rows, as in sequential runs.
+        for future, finish in pending:
+            result, runtime = future.result()
+            finish(result, runtime)
+        if pending:
+            order = {bench.name: position for position, bench in enumerate(scenarios)}
+            rows.sort(key=lambda row: order.get(str(row["scenario"]), len(order)))
+
     try:
         _run_benchmark_scenarios()
     finally:
@@ -1031,6 +1079,13 @@ def bench_suite(
         "-C",
         help="Run additional SA passes for each preset and include them in the summary.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes for heuristic runs (scenarios are loaded once per worker).",
+    ),
 ):
     """Run the benchmark harness from the CLI and emit summary CSV/JSON artifacts.
 
@@ -1101,7 +1156,156 @@ def bench_suite(
         profile=profile_obj,
         watch=watch,
         watch_refresh=watch_refresh,
+        workers=workers,
         objective_weight_overrides=(
             objective_weight_override if objective_weight_override else None
         ),
     )
+
+
+@benchmark_app.command("perf")
+def bench_perf(
+    scenario: list[Path] | None = typer.Option(
+        None,
+        "--scenario",
+        "-s",
+        help="Scenario YAML path(s) to profile. Defaults to tiny7 → large84 plus synthetic tiers.",
+    ),
+    case: list[str] | None = typer.Option(
+        None,
+        "--case",
+        "-c",
+        help="Hot-path case(s) to measure (repeatable). Defaults to all cases.",
+    ),
+    sqlite: Path = typer.Option(
+        Path("telemetry/runs.sqlite"),
+        "--sqlite",
+        help="Telemetry SQLite store holding perf history.",
+        dir_okay=False,
+    ),
+    store: bool = typer.Option(
+        True,
+        "--store/--no-store",
+        help="Persist this run to --sqlite (the baseline is still read when the store exists).",
+    ),
+    label: str | None = typer.Option(None, "--label", help="Label stored with this perf run."),
+    baseline: str | None = typer.Option(
+        None,
+        "--baseline",
+        help="Baseline run id, git commit prefix, or label (default: most recent stored run).",
+    ),
+    threshold: float = typer.Option(
+        0.10,
+        "--threshold",
+        min=0.0,
+        max=1.0,
+        help="Fractional ops/sec drop versus the baseline that counts as a regression.",
+    ),
+    min_time: float = typer.Option(
+        0.5, "--min-time", min=0.0, help="Minimum timed seconds per case (after one warm-up)."
+    ),
+    max_calls: int = typer.Option(10_000, "--max-calls", min=1, help="Maximum calls per case."),
+    fail_on_regression: bool = typer.Option(
+        False,
+        "--fail-on-regression",
+        help="Exit with status 1 when any case regresses beyond --threshold.",
+    ),
+    out: Path | None = typer.Option(
+        None,
+        "--out",
+        help="Optional JSON path for the results and regression report.",
+        dir_okay=False,
+    ),
+):
+    """Measure solver hot paths (evaluations/sec, allocations, peak memory) and track regressions.
+
+    Each case (schedule evaluation, cloning, sanitising, neighbour generation, playback, KPIs and
+    MILP model construction) is timed on every scenario. Results are appended to the ``perf_runs``
+    and ``perf_results`` tables of the telemetry SQLite store, tagged with the current git commit,
+    and compared with ``--baseline`` (or the previous run) using ``--threshold``.
+    """
+    from fhops.cli.perf import (
+        DEFAULT_PERF_SCENARIOS,
+        PERF_CASES,
+        compare_results,
+        load_perf_results,
+        record_perf_run,
+        run_perf_suite,
+    )
+
+    scenarios = _resolve_scenarios(scenario) if scenario else list(DEFAULT_PERF_SCENARIOS)
+    unknown = sorted(set(case or ()) - set(PERF_CASES))
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown perf case(s): {', '.join(unknown)}. Options: {', '.join(PERF_CASES)}"
+        )
+
+    results = run_perf_suite(scenarios, case, min_time=min_time, max_calls=max_calls)
+
+    run_record: dict[str, Any] | None = None
+    baseline_run: dict[str, Any] | None = None
+    baseline_rows: list[dict[str, Any]] = []
+    if store:
+        run_record = record_perf_run(sqlite, results, label=label)
+    baseline_run, baseline_rows = load_perf_results(
+        sqlite, baseline, exclude_run=run_record["perf_run_id"] if run_record else None
+    )
+    report = compare_results(results, baseline_rows, threshold=threshold)
+
+    table = Table(title="FHOPS Hot-Path Benchmarks")
+    table.add_column("Scenario")
+    table.add_column("Case")
+    table.add_column("Calls", justify="right")
+    table.add_column("Ops/s", justify="right")
+    table.add_column("Alloc KiB", justify="right")
+    table.add_column("Peak KiB", justify="right")
+    table.add_column("vs baseline", justify="right")
+    for row in report:
+        ratio = row["ratio"]
+        if ratio is None:
+            change = "-"
+        else:
+            change = f"{(ratio - 1.0) * 100:+.1f}%"
+            if row["regressed"]:
+                change = f"[red]{change}[/red]"
+        table.add_row(
+            row["scenario"],
+            row["case_name"],
+            str(row["calls"]),
+            f"{row['ops_per_sec']:,.1f}",
+            f"{row['alloc_kib']:,.1f}",
+            f"{row['peak_kib']:,.1f}",
+            change,
+        )
+    console.print(table)
+
+    if baseline_run is not None:
+        console.print(
+            f"Baseline: {baseline_run.get('label') or baseline_run['perf_run_id']} "
+            f"(commit {baseline_run.get('git_commit') or 'unknown'}, {baseline_run.get('created_at')})"
+        )
+    elif baseline:
+        console.print(f"[yellow]No stored perf run matches baseline '{baseline}'.[/yellow]")
+    regressions = [row for row in report if row["regressed"]]
+    if regressions:
+        console.print(
+            f"[red]{len(regressions)} case(s) regressed by more than {threshold:.0%}:[/red] "
+            + ", ".join(f"{row['scenario']}/{row['case_name']}" for row in regressions)
+        )
+
+    if out is not None:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(
+            json.dumps(
+                {
+                    "run": run_record,
+                    "baseline": baseline_run,
+                    "threshold": threshold,
+                    "results": report,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    if regressions and fail_on_regression:
+        raise typer.Exit(code=1)
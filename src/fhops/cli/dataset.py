@@ -18,6 +18,7 @@ from rich.console import Console
 from rich.table import Table
 
 from fhops.core import FHOPSValueError
+from fhops.core.cache import DEFAULT_MAXSIZE, disable_result_cache, enable_result_cache
 from fhops.costing import (
     MachineCostEstimate,
     estimate_unit_cost_from_distribution,
@@ -211,9 +212,11 @@ from fhops.reference import (
     load_unbc_hoe_chucking_data,
     load_unbc_processing_costs,
 )
-from fhops.resources import data_path
+from fhops.resources import ReferenceBundle, build_reference_bundle, data_path
 from fhops.scenario.contract import Machine, RoadConstruction, SalvageProcessingMode, Scenario
 from fhops.scenario.io import load_scenario
+from fhops.scenario.io.binary import BINARY_SUFFIX, save_scenario_binary
+from fhops.scenario.production_rates import ProductionRateCache, derive_production_rates
 from fhops.scheduling.systems import (
     HarvestSystem,
     default_system_registry,
@@ -295,6 +298,39 @@ _KELLOGG_RANGE_TEXT = (
 console = Console()
 dataset_app = typer.Typer(help="Inspect FHOPS datasets and bundled examples.")
 
+
+@dataset_app.callback()
+def _dataset_result_cache(
+    ctx: typer.Context,
+    result_cache: Path | None = typer.Option(
+        None,
+        "--result-cache",
+        envvar="FHOPS_RESULT_CACHE",
+        help="SQLite file persisting productivity/costing results across invocations.",
+    ),
+    cache_size: int = typer.Option(
+        DEFAULT_MAXSIZE, "--cache-size", min=1, help="Maximum in-memory cached results."
+    ),
+    cache_stats: bool = typer.Option(
+        False, "--cache-stats", help="Print result-cache hit/miss statistics on exit."
+    ),
+):
+    """Memoise repeated productivity/costing evaluations for the duration of the command."""
+    cache = enable_result_cache(maxsize=cache_size, path=result_cache)
+
+    def _finish() -> None:
+        if cache_stats:
+            stats = cache.stats()
+            console.print(
+                f"[dim]Result cache: {stats.hits} hits ({stats.disk_hits} from disk), "
+                f"{stats.misses} misses, {stats.evictions} evictions, "
+                f"hit rate {stats.hit_rate:.0%}[/dim]"
+            )
+        disable_result_cache()
+
+    ctx.call_on_close(_finish)
+
+
 _LOADER_METADATA_PATH = data_path("productivity", "loader_models.json")
 
 
@@ -4797,6 +4833,108 @@ def inspect_block(
     )
 
 
+@dataset_app.command("derive-rates")
+def derive_rates_cmd(
+    dataset: str | None = typer.Option(
+        None,
+        "--dataset",
+        "-d",
+        help="Dataset name (e.g., med42) or path to scenario/dataset folder.",
+    ),
+    out: Path = typer.Option(..., "--out", help="Destination prod_rates CSV."),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Processes used to evaluate model groups."
+    ),
+    cache_path: Path | None = typer.Option(
+        None,
+        "--cache",
+        help="JSON cache of model results reused (and updated) across runs.",
+    ),
+    hours_per_day: float | None = typer.Option(
+        None,
+        "--hours-per-day",
+        min=0.0,
+        help="Productive hours per day (defaults to each machine's daily_hours).",
+    ),
+    interactive: bool = typer.Option(
+        True,
+        "--interactive/--no-interactive",
+        help="Enable prompts when context is missing.",
+    ),
+):
+    """Derive the (machine, block) production-rate table from block attributes and systems."""
+    dataset_name, scenario, _ = _ensure_dataset(dataset, interactive)
+    cache = ProductionRateCache.load(cache_path) if cache_path is not None else None
+    derived = derive_production_rates(
+        scenario, hours_per_day=hours_per_day, workers=workers, cache=cache
+    )
+    derived.to_csv(out)
+    if cache is not None and cache_path is not None:
+        cache.save(cache_path)
+
+    table = Table(title=f"Derived Production Rates — {dataset_name}")
+    for column in ("Role", "Model", "Systems", "Blocks", "Evaluated", "Cached", "Skipped"):
+        table.add_column(column)
+    for row in derived.groups.itertuples(index=False):
+        table.add_row(
+            str(row.role),
+            str(row.model or "—"),
+            str(row.systems or "—"),
+            str(row.blocks),
+            str(row.evaluated),
+            str(row.cached),
+            str(row.skipped),
+        )
+    console.print(table)
+    for row in derived.groups.itertuples(index=False):
+        if row.reason:
+            console.print(
+                f"[yellow]{row.role!s} ({row.model or 'no model'!s}): {row.reason!s}[/yellow]"
+            )
+    console.print(f"Wrote {len(derived.rates)} production rates to {out}")
+
+
+@dataset_app.command("build-reference-bundle")
+def build_reference_bundle_cmd(
+    out: Path | None = typer.Option(
+        None,
+        "--out",
+        help="Bundle destination (defaults to data/reference.bundle, which loaders pick up).",
+    ),
+) -> None:
+    """Precompile reference JSON (plus CPI-inflated machine rates) into one fast-loading bundle."""
+    path = build_reference_bundle(out)
+    bundle = ReferenceBundle(path)
+    size_kib = path.stat().st_size / 1024
+    console.print(f"Wrote {len(bundle)} reference tables ({size_kib:.1f} KiB) to {path}")
+
+
+@dataset_app.command("compile-scenario")
+def compile_scenario_cmd(
+    dataset: str | None = typer.Option(
+        None,
+        "--dataset",
+        "-d",
+        help="Dataset name (e.g., med42) or path to scenario/dataset folder.",
+    ),
+    out: Path | None = typer.Option(
+        None,
+        "--out",
+        help=f"Destination file (defaults to the scenario YAML path with a {BINARY_SUFFIX} suffix).",
+    ),
+    interactive: bool = typer.Option(
+        True,
+        "--interactive/--no-interactive",
+        help="Enable prompts when context is missing.",
+    ),
+) -> None:
+    """Compile a scenario into the single-file binary format accepted wherever a YAML path is."""
+    _, scenario, path = _ensure_dataset(dataset, interactive)
+    written = save_scenario_binary(scenario, out or path.with_suffix(BINARY_SUFFIX))
+    size_kib = written.stat().st_size / 1024
+    console.print(f"Wrote {scenario.name} ({size_kib:.1f} KiB) to {written}")
+
+
 @dataset_app.command("berry-log-grades")
 def berry_log_grades_cmd() -> None:
     """Show the digitised Berry (2019) log-grade cycle-time emmeans."""
@@ -5,10 +5,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Annotated
 
-import pandas as pd
 import typer
 
-from fhops.scheduling.geospatial import compute_distance_matrix, load_block_geometries
+from fhops.scheduling.geospatial import (
+    DEFAULT_CHUNK_ROWS,
+    RoadNetwork,
+    iter_distance_pairs,
+    load_block_geometries,
+    write_distance_pairs,
+)
 
 geospatial_app = typer.Typer(help="Geospatial preprocessing utilities.")
 
@@ -16,17 +21,38 @@ geospatial_app = typer.Typer(help="Geospatial preprocessing utilities.")
 @geospatial_app.command("distances")
 def compute_distances(
     geojson: Annotated[Path, typer.Argument(help="Path to block GeoJSON with 'block_id' column.")],
-    output: Annotated[Path, typer.Option("--out", help="CSV file to write distance matrix")],
+    output: Annotated[
+        Path,
+        typer.Option("--out", help="CSV or Parquet (.parquet) file to write distance pairs"),
+    ],
+    max_distance: Annotated[
+        float | None,
+        typer.Option(
+            "--max-distance",
+            min=0.0,
+            help="Only write pairs within this many metres (KD-tree accelerated when SciPy is installed).",
+        ),
+    ] = None,
+    roads: Annotated[
+        Path | None,
+        typer.Option(
+            "--roads",
+            help="Road network GeoJSON (LineStrings); distances become shortest paths over it.",
+        ),
+    ] = None,
+    chunk_rows: Annotated[
+        int,
+        typer.Option("--chunk-rows", min=1, help="Source blocks expanded per output chunk."),
+    ] = DEFAULT_CHUNK_ROWS,
 ) -> None:
-    """Compute centroid-to-centroid distances between blocks (metres)."""
+    """Compute block-to-block distances (metres), streaming pairs to disk in chunks."""
     geometries = load_block_geometries(geojson)
-    matrix = compute_distance_matrix(geometries)
-    records = [
-        {"from_block": src, "to_block": dst, "distance_m": dist}
-        for (src, dst), dist in matrix.items()
-        if src != dst
-    ]
-    df = pd.DataFrame(records)
-    output.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output, index=False)
-    typer.echo(f"Wrote {len(df)} distance entries to {output}")
+    road_network = RoadNetwork.from_geojson(roads) if roads is not None else None
+    frames = iter_distance_pairs(
+        geometries,
+        max_distance_m=max_distance,
+        road_network=road_network,
+        chunk_rows=chunk_rows,
+    )
+    written = write_distance_pairs(frames, output)
+    typer.echo(f"Wrote {written} distance entries to {output}")
@@ -14,6 +14,7 @@ import json
 import random
 import time
 from collections.abc import Sequence
+from concurrent.futures import Future
 from contextlib import nullcontext
 from datetime import UTC, datetime
 from pathlib import Path
@@ -70,6 +71,7 @@ from fhops.optimization.heuristics import (
 from fhops.optimization.heuristics.registry import OperatorRegistry
 from fhops.optimization.mip import solve_mip
 from fhops.optimization.operational_problem import build_operational_problem
+from fhops.optimization.pool import shared_solver_pool
 from fhops.scenario.contract import Problem
 from fhops.scenario.io import load_scenario
 from fhops.telemetry import RunTelemetryLogger, append_jsonl
@@ -267,6 +269,28 @@ def _print_sequencing_debug(stats: dict[str, Any] | None) -> None:
     console.print("[yellow]Sequencing diagnostics:[/]", " | ".join(str(p) for p in parts))
 
 
+def _print_phase_timings(meta: dict[str, Any]) -> None:
+    """Render ``meta["phase_timings"]`` and any cProfile artifacts when a run recorded them."""
+
+    timings = meta.get("phase_timings")
+    if timings:
+        table = Table(title="Phase timings")
+        table.add_column("Phase")
+        table.add_column("Seconds", justify="right")
+        table.add_column("Calls", justify="right")
+        table.add_column("Share", justify="right")
+        for name, payload in timings.items():
+            table.add_row(
+                name,
+                f"{payload.get('seconds', 0.0):.3f}",
+                str(payload.get("calls", 0)),
+                f"{payload.get('share', 0.0):.1%}",
+            )
+        console.print(table)
+    for artifact in meta.get("profile_artifacts", []):
+        console.print(f"[dim]Profile written to {artifact}[/]")
+
+
 def _machine_cost_snapshot(sc) -> list[dict[str, Any]]:
     """Return CPI-adjusted machine-cost snapshots for telemetry logging."""
     return [snapshot.to_dict() for snapshot in build_machine_cost_snapshots(sc.machines)]
@@ -364,6 +388,24 @@ def _resolve_bundle_spec(spec: str) -> list[tuple[str, str, Path]]:
     return _resolve_bundle_from_path(bundle_alias, target_path)
 
 
+def _collect_tuning_results(
+    pending: list[tuple[Future, str, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Resolve queued tuning solves (in submission order) into result rows."""
+
+    results: list[dict[str, Any]] = []
+    for future, label, entry in pending:
+        try:
+            res = future.result()
+        except Exception as exc:  # pragma: no cover - defensive
+            console.print(f"[yellow]Run failed for {label}: {exc!r}[/]")
+            continue
+        entry["objective"] = float(res.get("objective", 0.0))
+        entry["telemetry_run_id"] = res.get("meta", {}).get("telemetry_run_id")
+        results.append(entry)
+    return results
+
+
 def _collect_tuning_scenarios(
     scenario_args: Sequence[Path] | None,
     bundle_specs: Sequence[str] | None,
@@ -796,6 +838,11 @@ def solve_heur_cmd(
         "--restart-interval",
         help="Non-accepting iterations before SA restarts (0=auto).",
     ),
+    adaptive_operators: bool = typer.Option(
+        False,
+        "--adaptive-operators/--static-operators",
+        help="Adapt operator weights online from improvement per wall-clock second.",
+    ),
     milp_objective: float | None = typer.Option(
         None,
         "--milp-objective",
@@ -815,7 +862,18 @@ def solve_heur_cmd(
     watch_debug: bool = typer.Option(
         False,
         "--watch-debug/--no-watch-debug",
-        help="Include sequencing debug metadata in watch output (adds evaluation overhead).",
+        help="Include sequencing debug metadata in watch output.",
+    ),
+    phase_timings: bool = typer.Option(
+        False,
+        "--phase-timings/--no-phase-timings",
+        help="Record per-phase timings (neighbours, sanitize, repair, evaluate, telemetry, watch).",
+    ),
+    profile_out: Path | None = typer.Option(
+        None,
+        "--profile-out",
+        help="Run the search under cProfile and write stats (plus a .txt report) to this path.",
+        dir_okay=False,
     ),
     sequencing_debug: bool = typer.Option(
         False,
@@ -877,6 +935,12 @@ def solve_heur_cmd(
         Cooling rate multiplier (higher = slower cooling).
     restart_interval : int, default=0
         Non-accepting-iteration interval before restarts (0 auto-scales with ``iters``).
+    adaptive_operators : bool, default=False
+        Adapt operator weights during the run; the final weights are reported in telemetry under
+        ``operators_adaptive``.
+    phase_timings / profile_out :
+        Record per-phase hot-path timings (printed after the run and stored in telemetry) and
+        optionally dump a cProfile report; multi-start runs write one report per run.
     kpi_mode : str, default="extended"
         Controls verbosity of KPI summaries (``basic`` omits diagnostics).
     batch_neighbours : int, default=1
@@ -967,7 +1031,10 @@ def solve_heur_cmd(
         "max_workers": worker_arg,
         "cooling_rate": cooling_rate,
         "restart_interval": restart_value,
+        "adaptive_operators": adaptive_operators,
         "watch_debug": watch_debug,
+        "phase_timings": phase_timings,
+        "profile_out": profile_out,
         "objective_weight_overrides": (
             objective_weight_override if objective_weight_override else None
         ),
@@ -976,7 +1043,11 @@ def solve_heur_cmd(
     if resolved.extra_kwargs:
         sa_kwargs.update(resolved.extra_kwargs)
     if watch_runner:
-        sa_kwargs["watch_sink"] = watch_runner.sink
+        # Parallel multi-start runs execute in worker processes, so they need the relay sink.
+        parallel_runs = multi_start > 1 and worker_arg is not None
+        sa_kwargs["watch_sink"] = (
+            watch_runner.process_sink() if parallel_runs else watch_runner.sink
+        )
         sa_kwargs["watch_interval"] = max(1, iters // 200 or 1)
         sa_kwargs["watch_metadata"] = {
             "scenario": scenario_label,
@@ -1077,6 +1148,7 @@ def solve_heur_cmd(
     _print_kpi_summary(metrics, mode=kpi_mode)
     if sequencing_debug:
         _print_sequencing_debug(getattr(metrics, "sequencing_debug", None))
+    _print_phase_timings(cast(dict[str, Any], res.get("meta", {})))
     operators_meta = cast(dict[str, float], meta.get("operators", {}))
     if operators_meta:
         console.print(f"Operators: {operators_meta}")
@@ -1226,7 +1298,18 @@ def solve_ils_cmd(
     watch_debug: bool = typer.Option(
         False,
         "--watch-debug/--no-watch-debug",
-        help="Include sequencing debug metadata in watch output (adds evaluation overhead).",
+        help="Include sequencing debug metadata in watch output.",
+    ),
+    phase_timings: bool = typer.Option(
+        False,
+        "--phase-timings/--no-phase-timings",
+        help="Record per-phase timings (neighbours, sanitize, repair, evaluate, telemetry, watch).",
+    ),
+    profile_out: Path | None = typer.Option(
+        None,
+        "--profile-out",
+        help="Run the search under cProfile and write stats (plus a .txt report) to this path.",
+        dir_okay=False,
     ),
     kpi_mode: str = typer.Option(
         "extended",
@@ -1402,6 +1485,8 @@ def solve_ils_cmd(
         "hybrid_use_mip": hybrid_use_mip,
         "hybrid_mip_time_limit": hybrid_mip_time_limit,
         "watch_debug": watch_debug,
+        "phase_timings": phase_timings,
+        "profile_out": profile_out,
         "objective_weight_overrides": (
             objective_weight_override if objective_weight_override else None
         ),
@@ -1433,6 +1518,7 @@ def solve_ils_cmd(
     if sequencing_debug:
         _print_sequencing_debug(getattr(metrics, "sequencing_debug", None))
     meta = cast(dict[str, Any], res.get("meta", {}))
+    _print_phase_timings(meta)
     if selected_profile:
         meta["profile"] = selected_profile.name
         meta["profile_version"] = selected_profile.version
@@ -1554,7 +1640,18 @@ def solve_tabu_cmd(
     watch_debug: bool = typer.Option(
         False,
         "--watch-debug/--no-watch-debug",
-        help="Include sequencing debug metadata in watch output (adds evaluation overhead).",
+        help="Include sequencing debug metadata in watch output.",
+    ),
+    phase_timings: bool = typer.Option(
+        False,
+        "--phase-timings/--no-phase-timings",
+        help="Record per-phase timings (neighbours, sanitize, repair, evaluate, telemetry, watch).",
+    ),
+    profile_out: Path | None = typer.Option(
+        None,
+        "--profile-out",
+        help="Run the search under cProfile and write stats (plus a .txt report) to this path.",
+        dir_okay=False,
     ),
     kpi_mode: str = typer.Option(
         "extended",
@@ -1722,6 +1819,8 @@ def solve_tabu_cmd(
         "tabu_tenure": tenure,
         "stall_limit": stall_limit,
         "watch_debug": watch_debug,
+        "phase_timings": phase_timings,
+        "profile_out": profile_out,
         "objective_weight_overrides": (
             objective_weight_override if objective_weight_override else None
         ),
@@ -1753,6 +1852,7 @@ def solve_tabu_cmd(
     if sequencing_debug:
         _print_sequencing_debug(getattr(metrics, "sequencing_debug", None))
     meta = cast(dict[str, Any], res.get("meta", {}))
+    _print_phase_timings(meta)
     if selected_profile:
         meta["profile"] = selected_profile.name
         meta["profile_version"] = selected_profile.version
@@ -2332,6 +2432,13 @@ def tune_random_cli(
         min=0.1,
         help="Refresh interval for the live dashboard (seconds).",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes for tuning runs (scenarios are loaded once per worker).",
+    ),
 ):
     """Randomly sample simulated annealing configurations and log telemetry.
 
@@ -2351,6 +2458,10 @@ def tune_random_cli(
         Seed controlling the RNG that draws per-run seeds/batch sizes/operator weights.
     tier_label : str | None
         Optional label forwarded to telemetry to distinguish experimentation budgets.
+    workers : int, default=1
+        Worker processes for the SA runs. Values above one queue every configuration on
+        :func:`fhops.optimization.pool.shared_solver_pool`, which loads each scenario once per
+        worker; results are collected in submission order.
 
     Notes
     -----
@@ -2373,7 +2484,8 @@ def tune_random_cli(
     registry = OperatorRegistry.from_defaults()
     operator_names = list(registry.names())
 
-    results: list[dict[str, Any]] = []
+    pool = shared_solver_pool(workers)
+    pending: list[tuple[Future, str, dict[str, Any]]] = []
 
     with watch_runner or nullcontext():
         for scenario_path in scenario_files:
@@ -2458,39 +2570,36 @@ def tune_random_cli(
                 }
                 sa_kwargs.update(telemetry_kwargs)
                 if watch_runner:
-                    sa_kwargs["watch_sink"] = watch_runner.sink
+                    sa_kwargs["watch_sink"] = (
+                        watch_runner.sink if pool.in_process else watch_runner.process_sink()
+                    )
                     sa_kwargs["watch_interval"] = max(1, iters // 200 or 1)
                     sa_kwargs["watch_metadata"] = {
                         "scenario": scenario_display,
                         "solver": f"tune-random[{run_idx + 1}]",
                     }
 
-                try:
-                    res = solve_sa(pb, **sa_kwargs)
-                except Exception as exc:  # pragma: no cover - defensive
-                    console.print(
-                        f"[yellow]Run failed for {scenario_path} (seed={run_seed}): {exc!r}[/]"
+                pending.append(
+                    (
+                        pool.submit(pb if pool.in_process else scenario_path, "sa", **sa_kwargs),
+                        f"{scenario_path} (seed={run_seed})",
+                        {
+                            "scenario": scenario_display,
+                            "scenario_key": (
+                                f"{bundle_meta['bundle']}:{bundle_meta.get('bundle_member', scenario_display)}"
+                                if bundle_meta
+                                else scenario_display
+                            ),
+                            "bundle": bundle_meta["bundle"] if bundle_meta else None,
+                            "seed": run_seed,
+                            "batch_size": batch_size_choice,
+                            "cooling_rate": cooling_rate_choice,
+                            "restart_interval": restart_interval_choice,
+                            "operator_weights": operator_weights,
+                        },
                     )
-                    continue
-
-                results.append(
-                    {
-                        "scenario": scenario_display,
-                        "scenario_key": (
-                            f"{bundle_meta['bundle']}:{bundle_meta.get('bundle_member', scenario_display)}"
-                            if bundle_meta
-                            else scenario_display
-                        ),
-                        "bundle": bundle_meta["bundle"] if bundle_meta else None,
-                        "objective": float(res.get("objective", 0.0)),
-                        "seed": run_seed,
-                        "batch_size": batch_size_choice,
-                        "cooling_rate": cooling_rate_choice,
-                        "restart_interval": restart_interval_choice,
-                        "operator_weights": operator_weights,
-                        "telemetry_run_id": res.get("meta", {}).get("telemetry_run_id"),
-                    }
                 )
+        results = _collect_tuning_results(pending)
 
     if not results:
         console.print("[yellow]Random tuner did not produce any successful runs.[/]")
@@ -2612,6 +2721,13 @@ def tune_grid_cli(
         min=0.1,
         help="Refresh interval for the live dashboard (seconds).",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes for tuning runs (scenarios are loaded once per worker).",
+    ),
 ):
     """Exhaustively evaluate a grid of operator presets and batch sizes.
 
@@ -2633,6 +2749,10 @@ def tune_grid_cli(
         Base seed incremented deterministically across configurations for reproducibility.
     tier_label : str | None
         Optional telemetry label for grouping tuning campaigns.
+    workers : int, default=1
+        Worker processes for the SA runs. Values above one queue every configuration on
+        :func:`fhops.optimization.pool.shared_solver_pool`, which loads each scenario once per
+        worker; results are collected in submission order.
 
     Notes
     -----
@@ -2660,7 +2780,8 @@ def tune_grid_cli(
     elif watch and not console.is_terminal:
         console.print("[yellow]Watch mode disabled: not running in an interactive terminal.[/]")
 
-    results: list[dict[str, Any]] = []
+    pool = shared_solver_pool(workers)
+    pending: list[tuple[Future, str, dict[str, Any]]] = []
     run_seed = seed
 
     with watch_runner or nullcontext():
@@ -2738,38 +2859,36 @@ def tune_grid_cli(
                     }
                     sa_kwargs.update(telemetry_kwargs)
                     if watch_runner:
-                        sa_kwargs["watch_sink"] = watch_runner.sink
+                        sa_kwargs["watch_sink"] = (
+                            watch_runner.sink if pool.in_process else watch_runner.process_sink()
+                        )
                         sa_kwargs["watch_interval"] = max(1, iters // 200 or 1)
                         sa_kwargs["watch_metadata"] = {
                             "scenario": scenario_display,
                             "solver": f"tune-grid[{preset_name}/{batch_choice}]",
                         }
-                    try:
-                        res = solve_sa(pb, **sa_kwargs)
-                    except Exception as exc:  # pragma: no cover - defensive
-                        console.print(
-                            f"[yellow]Run failed for {scenario_path} (preset={preset_name}, batch={batch_choice}): {exc!r}[/]"
-                        )
-                        run_seed += 1
-                        continue
-
-                    results.append(
-                        {
-                            "scenario": scenario_display,
-                            "scenario_key": (
-                                f"{bundle_meta['bundle']}:{bundle_meta.get('bundle_member', scenario_display)}"
-                                if bundle_meta
-                                else scenario_display
+                    pending.append(
+                        (
+                            pool.submit(
+                                pb if pool.in_process else scenario_path, "sa", **sa_kwargs
                             ),
-                            "bundle": bundle_meta["bundle"] if bundle_meta else None,
-                            "objective": float(res.get("objective", 0.0)),
-                            "preset": preset_name,
-                            "batch_size": batch_choice,
-                            "seed": run_seed,
-                            "telemetry_run_id": res.get("meta", {}).get("telemetry_run_id"),
-                        }
+                            f"{scenario_path} (preset={preset_name}, batch={batch_choice})",
+                            {
+                                "scenario": scenario_display,
+                                "scenario_key": (
+                                    f"{bundle_meta['bundle']}:{bundle_meta.get('bundle_member', scenario_display)}"
+                                    if bundle_meta
+                                    else scenario_display
+                                ),
+                                "bundle": bundle_meta["bundle"] if bundle_meta else None,
+                                "preset": preset_name,
+                                "batch_size": batch_choice,
+                                "seed": run_seed,
+                            },
+                        )
                     )
                     run_seed += 1
+        results = _collect_tuning_results(pending)
         console.print("[yellow]Grid tuner did not produce any successful runs.[/]")
         return
 
@@ -0,0 +1,297 @@
+"""Micro-benchmarks for solver hot paths (``fhops bench perf``).
+
+Where ``fhops bench suite`` measures end-to-end solver objective/runtime, this harness times the
+individual routines the solvers spend their time in (schedule evaluation, cloning, sanitising,
+neighbour generation, playback, KPIs, MILP model construction) on the bundled scenarios. Each case
+reports calls per second plus the memory allocated during one call (``tracemalloc``), and runs are
+stored in the telemetry SQLite store so results can be compared across commits.
+"""
+
+from __future__ import annotations
+
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from random import Random
+from typing import Any
+
+import pandas as pd
+
+from fhops.cli.benchmarks import DEFAULT_SCENARIOS, BenchmarkScenario
+from fhops.evaluation import compute_kpis
+from fhops.evaluation.playback import run_playback
+from fhops.evaluation.playback.adapters import assignments_to_records
+from fhops.model.milp.operational import build_operational_model
+from fhops.optimization.heuristics.common import (
+    Schedule,
+    clone_schedule,
+    evaluate_schedule,
+    generate_neighbors,
+    greedy_seed,
+)
+from fhops.optimization.heuristics.registry import OperatorRegistry
+from fhops.optimization.operational_problem import OperationalProblem, get_operational_problem
+from fhops.scenario.contract import Problem
+from fhops.scenario.io import load_scenario
+from fhops.telemetry.sqlite_store import load_perf_results, persist_perf_run
+
+DEFAULT_PERF_SCENARIOS: tuple[BenchmarkScenario, ...] = (
+    *DEFAULT_SCENARIOS,
+    BenchmarkScenario("synthetic-medium", Path("examples/synthetic/medium/scenario.yaml")),
+    BenchmarkScenario("synthetic-large", Path("examples/synthetic/large/scenario.yaml")),
+)
+
+
+@dataclass
+class PerfFixture:
+    """Inputs shared by every case on one scenario (built once, outside the timed region)."""
+
+    problem: Problem
+    ctx: OperationalProblem
+    schedule: Schedule
+    assignments: pd.DataFrame
+
+
+PerfCase = Callable[[PerfFixture], Callable[[], object]]
+
+
+def _case_evaluate_schedule(fixture: PerfFixture) -> Callable[[], object]:
+    return lambda: evaluate_schedule(fixture.problem, fixture.schedule, fixture.ctx)
+
+
+def _case_clone_schedule(fixture: PerfFixture) -> Callable[[], object]:
+    return lambda: clone_schedule(fixture.schedule)
+
+
+def _case_sanitizer(fixture: PerfFixture) -> Callable[[], object]:
+    sanitize = fixture.ctx.build_sanitizer(Schedule)
+    return lambda: sanitize(fixture.schedule)
+
+
+def _case_generate_neighbors(fixture: PerfFixture) -> Callable[[], object]:
+    registry = OperatorRegistry.from_defaults()
+    rng = Random(0)
+    return lambda: generate_neighbors(
+        fixture.problem, fixture.schedule, registry, rng, {}, fixture.ctx
+    )
+
+
+def _case_assignments_to_records(fixture: PerfFixture) -> Callable[[], object]:
+    return lambda: tuple(assignments_to_records(fixture.problem, fixture.assignments))
+
+
+def _case_run_playback(fixture: PerfFixture) -> Callable[[], object]:
+    return lambda: run_playback(fixture.problem, fixture.assignments)
+
+
+def _case_compute_kpis(fixture: PerfFixture) -> Callable[[], object]:
+    return lambda: compute_kpis(fixture.problem, fixture.assignments)
+
+
+def _case_build_operational_model(fixture: PerfFixture) -> Callable[[], object]:
+    return lambda: build_operational_model(fixture.ctx.bundle)
+
+
+PERF_CASES: dict[str, PerfCase] = {
+    "evaluate_schedule": _case_evaluate_schedule,
+    "clone_schedule": _case_clone_schedule,
+    "sanitizer": _case_sanitizer,
+    "generate_neighbors": _case_generate_neighbors,
+    "assignments_to_records": _case_assignments_to_records,
+    "run_playback": _case_run_playback,
+    "compute_kpis": _case_compute_kpis,
+    "build_operational_model": _case_build_operational_model,
+}
+
+
+@dataclass(frozen=True)
+class PerfResult:
+    """Throughput and memory for one case on one scenario."""
+
+    scenario: str
+    case_name: str
+    calls: int
+    seconds: float
+    ops_per_sec: float
+    alloc_kib: float
+    peak_kib: float
+
+
+def _schedule_assignments(schedule: Schedule) -> pd.DataFrame:
+    rows = [
+        {"machine_id": machine_id, "block_id": block_id, "day": int(day), "shift_id": shift_id}
+        for machine_id, plan in schedule.plan.items()
+        for (day, shift_id), block_id in plan.items()
+        if block_id is not None
+    ]
+    frame = pd.DataFrame(rows, columns=["machine_id", "block_id", "day", "shift_id"])
+    frame["assigned"] = 1
+    return frame
+
+
+def build_fixture(scenario_path: Path) -> PerfFixture:
+    """Load a scenario and prepare the greedy seed schedule and its assignment frame."""
+
+    problem = Problem.from_scenario(load_scenario(str(scenario_path)))
+    ctx = get_operational_problem(problem)
+    schedule = greedy_seed(problem, ctx)
+    evaluate_schedule(problem, schedule, ctx)
+    return PerfFixture(problem, ctx, schedule, _schedule_assignments(schedule))
+
+
+def measure(
+    func: Callable[[], object],
+    *,
+    min_time: float = 0.5,
+    max_calls: int = 10_000,
+) -> tuple[int, float, float, float]:
+    """Return ``(calls, seconds, alloc_kib, peak_kib)`` for ``func``.
+
+    One untimed warm-up call fills lazily built caches, then calls are repeated until ``min_time``
+    seconds or ``max_calls`` calls have elapsed. Memory is traced over one extra call so the
+    ``tracemalloc`` overhead never reaches the timed loop: ``alloc_kib`` is what the call leaves
+    allocated and ``peak_kib`` its high-water mark above the starting point.
+    """
+
+    func()
+    calls = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while calls < max_calls and (calls == 0 or elapsed < min_time):
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - started
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    result = func()
+    current, peak = tracemalloc.get_traced_memory()
+    del result
+    if not was_tracing:
+        tracemalloc.stop()
+    return calls, elapsed, (current - baseline) / 1024.0, (peak - baseline) / 1024.0
+
+
+def run_perf_suite(
+    scenarios: Sequence[BenchmarkScenario],
+    cases: Sequence[str] | None = None,
+    *,
+    min_time: float = 0.5,
+    max_calls: int = 10_000,
+) -> list[PerfResult]:
+    """Measure every selected case on every scenario (scenario fixtures are built once)."""
+
+    selected = list(cases) if cases else list(PERF_CASES)
+    unknown = sorted(set(selected) - set(PERF_CASES))
+    if unknown:
+        raise ValueError(f"Unknown perf cases: {', '.join(unknown)}")
+    results: list[PerfResult] = []
+    for scenario in scenarios:
+        fixture = build_fixture(scenario.path)
+        for case_name in selected:
+            calls, seconds, alloc_kib, peak_kib = measure(
+                PERF_CASES[case_name](fixture), min_time=min_time, max_calls=max_calls
+            )
+            results.append(
+                PerfResult(
+                    scenario=scenario.name,
+                    case_name=case_name,
+                    calls=calls,
+                    seconds=seconds,
+                    ops_per_sec=calls / seconds if seconds > 0 else float("inf"),
+                    alloc_kib=alloc_kib,
+                    peak_kib=peak_kib,
+                )
+            )
+    return results
+
+
+def current_git_commit(cwd: Path | None = None) -> str | None:
+    """Return the short ``HEAD`` commit, or ``None`` outside a git checkout."""
+
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def compare_results(
+    results: Sequence[PerfResult],
+    baseline: Sequence[Mapping[str, Any]],
+    *,
+    threshold: float = 0.1,
+) -> list[dict[str, Any]]:
+    """Compare throughput with a baseline run.
+
+    ``ratio`` is current / baseline ``ops_per_sec``; a case regresses when it drops below
+    ``1 - threshold``. Cases missing from the baseline get ``ratio=None``.
+    """
+
+    reference = {(row["scenario"], row["case_name"]): row for row in baseline}
+    report: list[dict[str, Any]] = []
+    for result in results:
+        row = reference.get((result.scenario, result.case_name))
+        base_ops = float(row["ops_per_sec"]) if row and row.get("ops_per_sec") else None
+        ratio = result.ops_per_sec / base_ops if base_ops else None
+        report.append(
+            {
+                **asdict(result),
+                "baseline_ops_per_sec": base_ops,
+                "ratio": ratio,
+                "regressed": ratio is not None and ratio < 1.0 - threshold,
+            }
+        )
+    return report
+
+
+def record_perf_run(
+    sqlite_path: Path,
+    results: Sequence[PerfResult],
+    *,
+    label: str | None = None,
+    git_commit: str | None = None,
+) -> dict[str, Any]:
+    """Store ``results`` in the telemetry SQLite store and return the run record."""
+
+    return persist_perf_run(
+        sqlite_path,
+        {
+            "git_commit": git_commit if git_commit is not None else current_git_commit(),
+            "label": label,
+            "context": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "machine": platform.machine(),
+            },
+        },
+        [asdict(result) for result in results],
+    )
+
+
+__all__ = [
+    "DEFAULT_PERF_SCENARIOS",
+    "PERF_CASES",
+    "PerfFixture",
+    "PerfResult",
+    "build_fixture",
+    "compare_results",
+    "current_git_commit",
+    "load_perf_results",
+    "measure",
+    "record_perf_run",
+    "run_perf_suite",
+]
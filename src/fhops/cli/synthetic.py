@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import json
 import shutil
-from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -16,7 +17,11 @@ except ModuleNotFoundError:  # pragma: no cover
 
 import yaml
 
-from fhops.scenario.synthetic import SyntheticDatasetConfig, generate_random_dataset
+from fhops.scenario.synthetic import (
+    TABLE_FORMATS,
+    SyntheticDatasetConfig,
+    generate_random_dataset,
+)
 from fhops.scheduling.systems import default_system_registry
 
 console = Console()
@@ -211,14 +216,16 @@ def _refresh_aggregate_metadata(base_dir: Path) -> None:
             yaml.safe_dump(aggregate, handle, sort_keys=False)
 
 
-def _maybe_refresh_metadata(target_dir: Path) -> None:
-    """Refresh aggregate metadata when the generated dataset lives under examples/synthetic."""
+def _maybe_refresh_metadata(*target_dirs: Path) -> None:
+    """Refresh aggregate metadata when any generated dataset lives under examples/synthetic."""
     base_dir = Path("examples/synthetic").resolve()
-    try:
-        target_dir.resolve().relative_to(base_dir)
-    except ValueError:
+    for target_dir in target_dirs:
+        try:
+            target_dir.resolve().relative_to(base_dir)
+        except ValueError:
+            continue
+        _refresh_aggregate_metadata(base_dir)
         return
-    _refresh_aggregate_metadata(base_dir)
 
 
 def _resolve_dataset_inputs(
@@ -270,7 +277,33 @@ def _resolve_dataset_inputs(
     return merged, seed_value
 
 
-def _generate_dataset(
+@dataclass(frozen=True)
+class _BundleJob:
+    """Fully resolved bundle request that can be generated in any process."""
+
+    config: SyntheticDatasetConfig
+    seed: int
+    target_dir: Path | None  # ``None`` previews without writing
+    table_format: str = "csv"
+
+
+def _build_bundle(job: _BundleJob) -> dict[str, Any]:
+    """Generate one bundle (writing it unless previewing) and return its metadata."""
+    system_registry = dict(default_system_registry())
+    bundle = generate_random_dataset(job.config, seed=job.seed, systems=system_registry)
+    metadata = {**(bundle.metadata or {}), "seed": job.seed}
+    if job.target_dir is not None:
+        job.target_dir.mkdir(parents=True, exist_ok=True)
+        bundle.metadata = metadata
+        bundle.write(
+            job.target_dir,
+            metadata_path=job.target_dir / "metadata.yaml",
+            table_format=job.table_format,
+        )
+    return metadata
+
+
+def _prepare_job(
     *,
     output_dir: Path | None,
     tier: str,
@@ -280,8 +313,9 @@ def _generate_dataset(
     cli_overrides: dict[str, Any] | None,
     overwrite: bool,
     preview: bool,
-) -> dict[str, Any]:
-    """Generate (and optionally persist) a synthetic dataset bundle."""
+    table_format: str = "csv",
+) -> _BundleJob:
+    """Resolve config/seed and clear the target directory for a bundle request."""
     merged_config, seed_value = _resolve_dataset_inputs(
         tier,
         config_path,
@@ -289,18 +323,8 @@ def _generate_dataset(
         cli_overrides or {},
         seed,
     )
-    system_registry = dict(default_system_registry())
-    bundle = generate_random_dataset(merged_config, seed=seed_value, systems=system_registry)
-
-    metadata = bundle.metadata or {}
-    metadata = {
-        **metadata,
-        "seed": seed_value,
-    }
-
     if preview:
-        _describe_metadata(metadata)
-        return metadata
+        return _BundleJob(merged_config, seed_value, None, table_format)
 
     target_dir = output_dir
     if target_dir is None:
@@ -312,18 +336,55 @@ def _generate_dataset(
             )
             raise typer.Exit(1)
         shutil.rmtree(target_dir)
-    target_dir.mkdir(parents=True, exist_ok=True)
+    return _BundleJob(merged_config, seed_value, target_dir, table_format)
 
-    metadata_path = target_dir / "metadata.yaml"
-    bundle.metadata = metadata
-    bundle.write(target_dir, metadata_path=metadata_path)
 
-    console.print(f"[green]Synthetic dataset written to {target_dir}[/green]")
+def _report_bundle(job: _BundleJob, metadata: dict[str, Any]) -> None:
+    if job.target_dir is not None:
+        console.print(f"[green]Synthetic dataset written to {job.target_dir}[/green]")
     _describe_metadata(metadata)
-    _maybe_refresh_metadata(target_dir)
+
+
+def _generate_dataset(
+    *,
+    output_dir: Path | None,
+    tier: str,
+    config_path: Path | None,
+    seed: int | None,
+    config_overrides: dict[str, Any] | None,
+    cli_overrides: dict[str, Any] | None,
+    overwrite: bool,
+    preview: bool,
+    table_format: str = "csv",
+) -> dict[str, Any]:
+    """Generate (and optionally persist) a synthetic dataset bundle."""
+    job = _prepare_job(
+        output_dir=output_dir,
+        tier=tier,
+        config_path=config_path,
+        seed=seed,
+        config_overrides=config_overrides,
+        cli_overrides=cli_overrides,
+        overwrite=overwrite,
+        preview=preview,
+        table_format=table_format,
+    )
+    metadata = _build_bundle(job)
+    _report_bundle(job, metadata)
+    if job.target_dir is not None:
+        _maybe_refresh_metadata(job.target_dir)
     return metadata
 
 
+def _check_table_format(value: str) -> str:
+    value = value.lower()
+    if value not in TABLE_FORMATS:
+        raise typer.BadParameter(
+            f"Unknown format '{value}'. Valid options: {', '.join(TABLE_FORMATS)}."
+        )
+    return value
+
+
 @synth_app.command("generate")
 def generate_synthetic_dataset(
     output_dir: Path = typer.Argument(
@@ -387,6 +448,12 @@ def generate_synthetic_dataset(
         min=0.0,
         help="Override daily hours assigned to each generated machine.",
     ),
+    table_format: str = typer.Option(
+        "csv",
+        "--format",
+        callback=_check_table_format,
+        help="Table file format for data/ (csv or parquet).",
+    ),
 ):
     """Generate a single synthetic dataset bundle using tier presets plus optional overrides."""
     cli_overrides = _resolve_cli_overrides(
@@ -401,6 +468,7 @@ def generate_synthetic_dataset(
         cli_overrides=cli_overrides,
         overwrite=overwrite,
         preview=preview,
+        table_format=table_format,
     )
 
 
@@ -415,13 +483,32 @@ def generate_batch(
     preview: bool = typer.Option(
         False, "--preview", help="Preview metadata for all bundles without writing files."
     ),
+    workers: int = typer.Option(
+        1, "--workers", "-j", min=1, help="Worker processes used to generate bundles."
+    ),
+    base_seed: int | None = typer.Option(
+        None,
+        "--base-seed",
+        help="Seed entries without an explicit seed as base_seed + entry index.",
+    ),
+    table_format: str = typer.Option(
+        "csv",
+        "--format",
+        callback=_check_table_format,
+        help="Default table file format for data/ (csv or parquet; entries may set 'format').",
+    ),
 ) -> None:
-    """Generate multiple synthetic datasets based on a YAML/TOML/JSON batch plan."""
+    """Generate multiple synthetic datasets based on a YAML/TOML/JSON batch plan.
+
+    Every entry is resolved (config, seed, target directory) up front, so results are identical
+    whether bundles are generated sequentially or across ``--workers`` processes.
+    """
     payload = _load_config(plan)
     if not isinstance(payload, list):
         raise typer.BadParameter("Batch plan must be a list of bundle entries.")
 
-    for entry in payload:
+    jobs: list[tuple[str, _BundleJob]] = []
+    for index, entry in enumerate(payload):
         if not isinstance(entry, dict):
             raise typer.BadParameter("Each batch entry must be a mapping.")
         tier = entry.get("tier", "small")
@@ -430,6 +517,8 @@ def generate_batch(
         config_path = entry.get("config")
         config_path = Path(config_path) if config_path else None
         seed_value = entry.get("seed")
+        if seed_value is None and base_seed is not None:
+            seed_value = base_seed + index
         entry_overrides = entry.get("overrides", {})
         if not isinstance(entry_overrides, dict):
             raise typer.BadParameter("Batch entry 'overrides' must be a mapping.")
@@ -447,17 +536,33 @@ def generate_batch(
             cli_flags.get("machine_daily_hours"),
         )
 
-        entry_preview = entry.get("preview", preview)
-        entry_overwrite = entry.get("overwrite", overwrite)
-
-        console.print(f"[bold]Generating bundle for tier '{tier}'[/bold]")
-        _generate_dataset(
+        job = _prepare_job(
             output_dir=output_path,
             tier=tier,
             config_path=config_path,
             seed=seed_value,
             config_overrides=entry_overrides,
             cli_overrides=cli_overrides,
-            overwrite=entry_overwrite,
-            preview=entry_preview,
+            overwrite=entry.get("overwrite", overwrite),
+            preview=entry.get("preview", preview),
+            table_format=_check_table_format(str(entry.get("format", table_format))),
         )
+        jobs.append((tier, job))
+
+    targets = [job.target_dir.resolve() for _, job in jobs if job.target_dir is not None]
+    if len(set(targets)) != len(targets):
+        raise typer.BadParameter("Batch entries must write to distinct output directories.")
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_build_bundle, job) for _, job in jobs]
+            # Report in plan order so the output does not depend on scheduling.
+            for (tier, job), future in zip(jobs, futures, strict=True):
+                metadata = future.result()
+                console.print(f"[bold]Generated bundle for tier '{tier}'[/bold]")
+                _report_bundle(job, metadata)
+    else:
+        for tier, job in jobs:
+            console.print(f"[bold]Generating bundle for tier '{tier}'[/bold]")
+            _report_bundle(job, _build_bundle(job))
+    _maybe_refresh_metadata(*(job.target_dir for _, job in jobs if job.target_dir is not None))
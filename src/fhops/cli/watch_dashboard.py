@@ -3,12 +3,20 @@ from __future__ import annotations
 import threading
 from collections import deque
 from dataclasses import dataclass, field
+from datetime import datetime
 
 from rich.console import Console, Group
 from rich.live import Live
 from rich.table import Table
 
-from fhops.telemetry.watch import Snapshot, SnapshotBus, SnapshotSink, WatchConfig
+from fhops.telemetry.watch import (
+    ProcessSnapshotRelay,
+    ProcessSnapshotSink,
+    Snapshot,
+    SnapshotBus,
+    SnapshotSink,
+    WatchConfig,
+)
 
 
 @dataclass
@@ -17,9 +25,11 @@ class LiveWatch:
     console: Console = field(default_factory=Console)
 
     def __post_init__(self) -> None:
-        self._bus = SnapshotBus()
+        self._bus = SnapshotBus(maxsize=self.config.queue_size)
         self._state: dict[tuple[str, str], Snapshot] = {}
         self._history: dict[tuple[str, str], deque[float]] = {}
+        self._workers: dict[str, Snapshot] = {}
+        self._relay: ProcessSnapshotRelay | None = None
         self._stop = threading.Event()
         self._thread: threading.Thread | None = None
         self._live: Live | None = None
@@ -28,6 +38,18 @@ class LiveWatch:
     def sink(self) -> SnapshotSink:
         return self._bus.sink()
 
+    def process_sink(self) -> ProcessSnapshotSink:
+        """Return a picklable sink for solver runs in worker processes.
+
+        The first call starts a :class:`ProcessSnapshotRelay` feeding this dashboard; it is shut
+        down by :meth:`stop`. Snapshots arriving through it populate the per-worker panel.
+        """
+
+        if self._relay is None:
+            self._relay = ProcessSnapshotRelay(self.sink, maxsize=self.config.queue_size)
+            self._relay.start()
+        return self._relay.sink
+
     def __enter__(self) -> LiveWatch:
         self.start()
         return self
@@ -46,6 +68,9 @@ class LiveWatch:
         self._thread.start()
 
     def stop(self) -> None:
+        if self._relay is not None:
+            self._relay.stop()
+            self._relay = None
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=1)
@@ -69,6 +94,8 @@ class LiveWatch:
         for snapshot in self._bus.drain():
             key = (snapshot.scenario, snapshot.solver)
             self._state[key] = snapshot
+            if snapshot.worker is not None:
+                self._workers[snapshot.worker] = snapshot
             self._record_history(key, snapshot)
             updated = True
         if updated and self._live:
@@ -107,7 +134,8 @@ class LiveWatch:
     def _solver_details(self, snap: Snapshot) -> str:
         solver = (snap.solver or "").lower()
         parts: list[str] = []
-        metadata = snap.metadata or {}
+        # Deferred metadata is formatted here, once per rendered snapshot, not in the solver loop.
+        metadata = snap.resolve_metadata()
 
         def _append_volume(parts_list: list[str]) -> None:
             delivered = metadata.get("delivered_volume_m3")
@@ -185,7 +213,10 @@ class LiveWatch:
         return " | ".join(parts)
 
     def _render(self) -> Group:
-        table = Table(title="FHOPS Heuristic Watch", expand=True)
+        title = "FHOPS Heuristic Watch"
+        if self._bus.dropped:
+            title += f" ({self._bus.dropped} stale snapshots dropped)"
+        table = Table(title=title, expand=True)
         table.add_column("Scenario", style="cyan")
         table.add_column("Solver", style="magenta")
         table.add_column("Iter", justify="right")
@@ -242,4 +273,99 @@ class LiveWatch:
         for scenario, solver, sparkline, details in trend_rows:
             trend_table.add_row(scenario, solver, sparkline or "-", details or "")
 
-        return Group(table, trend_table)
+        renderables: list[Table] = [table, trend_table]
+        if self._workers:
+            renderables.append(self._render_workers())
+        best_table = self._render_global_best()
+        if best_table is not None:
+            renderables.append(best_table)
+        return Group(*renderables)
+
+    def _stale_after(self) -> float:
+        """Seconds without an update after which a worker or run counts as inactive."""
+
+        return max(2.0, 4 * self.config.refresh_interval)
+
+    @staticmethod
+    def _is_running(snap: Snapshot, now: datetime, stale_after: float) -> bool:
+        """Whether ``snap`` belongs to an unfinished run updated within ``stale_after`` seconds."""
+
+        if snap.max_iterations and snap.iteration >= snap.max_iterations:
+            return False
+        return (now - snap.timestamp).total_seconds() <= stale_after
+
+    def _render_workers(self) -> Table:
+        """Latest snapshot per worker process, with throughput and staleness."""
+
+        now = datetime.utcnow()
+        stale_after = self._stale_after()
+        rows: list[list[str]] = []
+        active = 0
+        for worker, snap in sorted(self._workers.items()):
+            age = max(0.0, (now - snap.timestamp).total_seconds())
+            if age <= stale_after:
+                active += 1
+            rate = "-"
+            if snap.evaluations is not None and snap.runtime_seconds > 0:
+                rate = f"{snap.evaluations / snap.runtime_seconds:,.0f}"
+            rows.append(
+                [
+                    worker,
+                    f"{snap.scenario}/{snap.solver}",
+                    str(snap.iteration),
+                    f"{snap.objective:.3f}",
+                    rate,
+                    f"{age:.1f}s",
+                ]
+            )
+        table = Table(
+            title=f"Workers ({active}/{len(self._workers)} active)",
+            expand=True,
+        )
+        table.add_column("Worker", style="cyan")
+        table.add_column("Run", style="magenta")
+        table.add_column("Iter", justify="right")
+        table.add_column("Best Z", justify="right")
+        table.add_column("Evals/s", justify="right")
+        table.add_column("Updated", justify="right")
+        for row in rows:
+            table.add_row(*row)
+        return table
+
+    def _render_global_best(self) -> Table | None:
+        """Best objective per scenario across runs, shown once a scenario has several runs.
+
+        The throughput column sums only runs that are still active: finished runs and runs
+        without an update within the worker staleness cutoff are left out.
+        """
+
+        runs: dict[str, list[Snapshot]] = {}
+        for (scenario, _solver), snap in self._state.items():
+            runs.setdefault(scenario, []).append(snap)
+        if not any(len(snaps) > 1 for snaps in runs.values()):
+            return None
+        table = Table(title="Global Best", expand=True)
+        table.add_column("Scenario", style="cyan")
+        table.add_column("Best Z", justify="right")
+        table.add_column("Run", style="magenta")
+        table.add_column("Runs", justify="right")
+        table.add_column("Evals/s (total)", justify="right")
+        now = datetime.utcnow()
+        stale_after = self._stale_after()
+        for scenario, snaps in sorted(runs.items()):
+            best = max(snaps, key=lambda snap: snap.objective)
+            throughput = sum(
+                snap.evaluations / snap.runtime_seconds
+                for snap in snaps
+                if snap.evaluations is not None
+                and snap.runtime_seconds > 0
+                and self._is_running(snap, now, stale_after)
+            )
+            table.add_row(
+                scenario,
+                f"{best.objective:.3f}",
+                best.solver,
+                str(len(snaps)),
+                f"{throughput:,.0f}" if throughput else "-",
+            )
+        return table
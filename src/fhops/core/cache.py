@@ -0,0 +1,306 @@
+"""Keyed result cache for pure productivity/costing helpers.
+
+Helpers decorated with :func:`memoised` consult the process-wide :class:`ResultCache` when one has
+been enabled (see :func:`enable_result_cache`) and otherwise call straight through. Keys are built
+from the namespace plus the call arguments (enums, dataclasses, and mappings are normalised), the
+in-memory store is a bounded LRU, and an optional SQLite file persists results across processes so
+repeated CLI invocations reuse earlier evaluations.
+"""
+
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import enum
+import functools
+import hashlib
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+from fhops import __version__
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+DEFAULT_MAXSIZE = 4096
+_FLUSH_EVERY = 256
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters reported by :meth:`ResultCache.stats`."""
+
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable, repr-stable stand-in for ``value`` (``TypeError`` if unsupported)."""
+
+    if value is None or isinstance(value, bool | int | float | str | bytes):
+        return value
+    if isinstance(value, enum.Enum):
+        return (type(value).__qualname__, value.value)
+    if isinstance(value, Mapping):
+        return ("map", tuple(sorted((str(key), _freeze(item)) for key, item in value.items())))
+    if isinstance(value, list | tuple):
+        return ("seq", tuple(_freeze(item) for item in value))
+    if isinstance(value, set | frozenset):
+        return ("set", tuple(sorted(repr(_freeze(item)) for item in value)))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value).__qualname__,
+            tuple(
+                (field.name, _freeze(getattr(value, field.name)))
+                for field in dataclasses.fields(value)
+            ),
+        )
+    item = getattr(value, "item", None)
+    if callable(item) and getattr(value, "shape", None) == ():
+        return _freeze(item())
+    raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+
+_SCALARS = (type(None), bool, int, float, str)
+
+
+def make_key(namespace: str, args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> Hashable:
+    """Build the cache key for a call (raises ``TypeError`` for unhashable arguments)."""
+
+    items = tuple(kwargs.items())
+    # Fast path: keyword calls with plain scalars/enums (the common productivity signature).
+    if all(type(value) in _SCALARS for value in args) and all(
+        type(value) in _SCALARS or isinstance(value, enum.Enum) for _, value in items
+    ):
+        return (namespace, args, items)
+    return (namespace, _freeze(args), _freeze(kwargs))
+
+
+class ResultCache:
+    """Bounded LRU of call results with optional SQLite persistence.
+
+    Parameters
+    ----------
+    maxsize:
+        Maximum number of in-memory entries; least-recently used entries are evicted first.
+    path:
+        Optional SQLite file. Misses fall back to the file before computing, and new results are
+        written back in batches (and on :meth:`close`). The file records the FHOPS version that
+        wrote it; opening it from a different version discards the stored results.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, path: str | Path | None = None) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.path = Path(path) if path is not None else None
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: dict[str, bytes] = {}
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE name = 'fhops_version'").fetchone()
+            if row is None or row[0] != __version__:
+                # Results computed by another FHOPS release may no longer match; start afresh.
+                conn.execute("DELETE FROM results")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('fhops_version', ?)",
+                    (__version__,),
+                )
+                conn.commit()
+            self._conn = conn
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            disk_hits=self.disk_hits,
+            evictions=self.evictions,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def get_or_compute(self, key: Hashable, factory: Callable[[], R]) -> R:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            value = self._load(key)
+            if value is not _MISSING:
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+            self.misses += 1
+        result = factory()
+        with self._lock:
+            self._remember(key, result)
+            self._persist(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (the disk file is left untouched)."""
+
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _disk_key(key: Hashable) -> str:
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def _load(self, key: Hashable) -> Any:
+        if self._conn is None:
+            return _MISSING
+        disk_key = self._disk_key(key)
+        blob = self._pending.get(disk_key)
+        if blob is None:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ?", (disk_key,)
+            ).fetchone()
+            if row is None:
+                return _MISSING
+            blob = row[0]
+        return pickle.loads(blob)
+
+    def _persist(self, key: Hashable, value: Any) -> None:
+        if self._conn is None:
+            return
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        self._pending[self._disk_key(key)] = blob
+        if len(self._pending) >= _FLUSH_EVERY:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._conn is None or not self._pending:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)", self._pending.items()
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+
+_active: ResultCache | None = None
+
+
+def active_result_cache() -> ResultCache | None:
+    """Return the process-wide cache used by :func:`memoised` helpers (``None`` when disabled)."""
+
+    return _active
+
+
+def enable_result_cache(
+    maxsize: int = DEFAULT_MAXSIZE, path: str | Path | None = None
+) -> ResultCache:
+    """Install (replacing any existing) process-wide result cache and return it."""
+
+    global _active
+    disable_result_cache()
+    _active = ResultCache(maxsize=maxsize, path=path)
+    return _active
+
+
+def disable_result_cache() -> None:
+    """Flush and remove the process-wide result cache."""
+
+    global _active
+    if _active is not None:
+        _active.close()
+    _active = None
+
+
+atexit.register(disable_result_cache)
+
+
+def memoised(
+    namespace: str, *, copy: Callable[[Any], Any] | None = None
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a pure helper so calls are served from the active :class:`ResultCache`.
+
+    ``copy`` is applied to every returned value so callers cannot mutate cached results (use it
+    for helpers returning dicts or dataclasses holding dicts). Calls with arguments that cannot be
+    keyed bypass the cache.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            cache = _active
+            if cache is None:
+                return func(*args, **kwargs)
+            try:
+                key = make_key(namespace, args, kwargs)
+            except TypeError:
+                return func(*args, **kwargs)
+            result = cache.get_or_compute(key, lambda: func(*args, **kwargs))
+            return copy(result) if copy is not None else result
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "CacheStats",
+    "DEFAULT_MAXSIZE",
+    "ResultCache",
+    "active_result_cache",
+    "disable_result_cache",
+    "enable_result_cache",
+    "make_key",
+    "memoised",
+]
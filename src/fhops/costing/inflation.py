@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import json
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 TARGET_YEAR = 2024
 _CPI_PATH = data_path("costing", "cpi_canada_all_items_2002_100.json")
@@ -15,7 +14,7 @@ _CPI_PATH = data_path("costing", "cpi_canada_all_items_2002_100.json")
 def _load_cpi_series() -> dict[int, float]:
     """Load the CPI index (2002=100) used to inflate historical costs."""
 
-    data = json.loads(_CPI_PATH.read_text(encoding="utf-8"))
+    data = load_json(_CPI_PATH)
     series = data.get("values") or {}
     return {int(year): float(value) for year, value in series.items()}
 
@@ -9,14 +9,15 @@ printing cost references or logging telemetry.
 
 from __future__ import annotations
 
-import json
 import re
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
+from typing import cast
 
+from fhops.core.cache import memoised
 from fhops.costing.inflation import TARGET_YEAR, inflate_value
-from fhops.resources import data_path
+from fhops.resources import bundled_table, data_path, load_json
 
 DATA_PATH = data_path("machine_rates.json")
 
@@ -79,7 +80,9 @@ def load_default_machine_rates() -> Sequence[MachineRate]:
     Returns
     -------
     tuple[MachineRate, ...]
-        Machine rates keyed by role names (before normalisation).
+        Machine rates keyed by role names (before normalisation). When a current compiled reference
+        bundle is available (see :func:`fhops.resources.build_reference_bundle`) the pre-inflated
+        rates are returned from it without re-reading the JSON or the CPI series.
 
     Raises
     ------
@@ -89,10 +92,18 @@ def load_default_machine_rates() -> Sequence[MachineRate]:
         inflated to :data:`TARGET_YEAR` CAD so callers can compare rates across publications.
     """
 
+    bundled = bundled_table("costing/machine_rates@inflated")
+    if bundled is not None:
+        return cast(tuple[MachineRate, ...], bundled)
+    return _build_default_machine_rates()
+
+
+def _build_default_machine_rates() -> tuple[MachineRate, ...]:
+    """Parse ``machine_rates.json`` and inflate every component (bundle builder)."""
+
     if not DATA_PATH.exists():
         raise FileNotFoundError(f"Missing machine rate data: {DATA_PATH}")
-    with DATA_PATH.open(encoding="utf-8") as fh:
-        data = json.load(fh)
+    data = load_json(DATA_PATH)
     rates = []
     for entry in data:
         base_year = int(entry.get("cost_base_year", TARGET_YEAR))
@@ -250,6 +261,7 @@ def select_usage_class_multiplier(
     return bucket, multiplier
 
 
+@memoised("costing.compose_rental_rate", copy=lambda result: (result[0], dict(result[1])))
 def compose_rental_rate(
     machine_rate: MachineRate,
     *,
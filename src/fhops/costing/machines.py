@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
+from fhops.core.cache import memoised
 from fhops.core.errors import FHOPSValueError
 from fhops.productivity import (
     LahrsenModel,
@@ -68,6 +69,12 @@ def _validate_inputs(rental_rate_smh: float, utilisation: float, productivity: f
         raise FHOPSValueError("productivity must be positive")
 
 
+def _copy_estimate(estimate: MachineCostEstimate) -> MachineCostEstimate:
+    breakdown = estimate.rental_rate_breakdown
+    return replace(estimate, rental_rate_breakdown=dict(breakdown) if breakdown else breakdown)
+
+
+@memoised("costing.compute_unit_cost", copy=_copy_estimate)
 def compute_unit_cost(
     *,
     rental_rate_smh: float,
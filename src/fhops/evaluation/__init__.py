@@ -1,7 +1,7 @@
 """Evaluation layer (playback, metrics, reporting)."""
 
 from .metrics.aggregates import compute_makespan_metrics, compute_utilisation_metrics
-from .metrics.kpis import KPIResult, compute_kpis
+from .metrics.kpis import KPIEvaluator, KPIResult, compute_kpis
 from .playback import (
     DaySummary,
     DowntimeEvent,
@@ -44,6 +44,7 @@ from .playback.exporters import (
 
 __all__ = [
     "compute_kpis",
+    "KPIEvaluator",
     "KPIResult",
     "compute_utilisation_metrics",
     "compute_makespan_metrics",
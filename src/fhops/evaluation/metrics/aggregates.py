@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 from collections.abc import Iterable
-from typing import Any, cast
+from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from fhops.scenario.contract import Problem
@@ -13,6 +14,7 @@ from fhops.scenario.contract import Problem
 __all__ = [
     "compute_makespan_metrics",
     "compute_utilisation_metrics",
+    "shift_order_index",
 ]
 
 
@@ -71,37 +73,52 @@ def compute_utilisation_metrics(
     return metrics
 
 
+def shift_order_index(problem: Problem) -> pd.Series:
+    """Return a ``(day, shift_id) -> position`` Series following ``problem.shifts`` order."""
+
+    shift_order = {(shift.day, shift.shift_id): idx for idx, shift in enumerate(problem.shifts)}
+    if not shift_order:
+        return pd.Series(
+            [], index=pd.MultiIndex.from_tuples([], names=["day", "shift_id"]), dtype="float64"
+        )
+    return pd.Series(
+        list(shift_order.values()),
+        index=pd.MultiIndex.from_tuples(list(shift_order), names=["day", "shift_id"]),
+        dtype="float64",
+    )
+
+
 def compute_makespan_metrics(
     problem: Problem,
     shift_df: pd.DataFrame,
     *,
     fallback_days: Iterable[int] | None = None,
     fallback_shift_keys: Iterable[tuple[int, str]] | None = None,
+    shift_order: pd.Series | None = None,
 ) -> dict[str, Any]:
-    """Compute makespan metrics (latest productive day/shift) given playback summaries."""
+    """Compute makespan metrics (latest productive day/shift) given playback summaries.
+
+    ``shift_order`` may carry a precomputed :func:`shift_order_index` for ``problem`` so repeated
+    calls skip rebuilding it.
+    """
 
     metrics: dict[str, Any] = {"makespan_day": 0, "makespan_shift": "N/A"}
 
     if shift_df is not None and not shift_df.empty:
-        active = shift_df[shift_df.get("production_units", 0) > 0].copy()
+        active = shift_df[shift_df.get("production_units", 0) > 0]
         if not active.empty:
-            shift_order = {
-                (shift.day, shift.shift_id): idx for idx, shift in enumerate(problem.shifts)
-            }
-
-            def _rank(row: pd.Series) -> tuple[int, float, float]:
-                key = (int(row["day"]), str(row["shift_id"]))
-                order = shift_order.get(key)
-                if order is not None:
-                    return (0, float(order), float(row["day"]))
-                return (1, float(row["day"]), 0.0)
-
-            active["_rank_tuple"] = active.apply(_rank, axis=1)
-            sorted_active = cast(pd.DataFrame, active).sort_values(by="_rank_tuple")
-            last_row = sorted_active.iloc[-1]
+            order_index = shift_order if shift_order is not None else shift_order_index(problem)
+            days = active["day"].astype(int).to_numpy()
+            keys = pd.MultiIndex.from_arrays([days, active["shift_id"].astype(str).to_numpy()])
+            order = order_index.reindex(keys).to_numpy(dtype=float)
+            known = ~np.isnan(order)
+            # Scheduled shifts rank by calendar position; unknown (day, shift) pairs sort after
+            # them by day.
+            primary = np.where(known, order, days.astype(float))
+            secondary = np.where(known, days.astype(float), 0.0)
+            last_row = active.iloc[int(np.lexsort((secondary, primary, ~known))[-1])]
             metrics["makespan_day"] = int(last_row["day"])
             metrics["makespan_shift"] = str(last_row["shift_id"])
-            del active["_rank_tuple"]
 
     if metrics["makespan_day"] == 0 and fallback_days:
         fallback_days = list(fallback_days)
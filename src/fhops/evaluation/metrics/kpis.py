@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import json
-from collections import Counter, defaultdict
-from collections.abc import Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
+import numpy as np
 import pandas as pd
 
-from fhops.evaluation.playback import PlaybackConfig, run_playback
+from fhops.evaluation.playback import PlaybackConfig, PlaybackRecord, run_playback
 from fhops.evaluation.playback.aggregates import (
     DAY_SUMMARY_COLUMNS,
     SHIFT_SUMMARY_COLUMNS,
@@ -18,12 +18,16 @@ from fhops.evaluation.playback.aggregates import (
     shift_dataframe,
 )
 from fhops.evaluation.sequencing import build_role_priority
-from fhops.optimization.operational_problem import build_operational_problem
+from fhops.optimization.operational_problem import get_operational_problem
 from fhops.scenario.contract import Problem
 
-from .aggregates import compute_makespan_metrics, compute_utilisation_metrics
+from .aggregates import (
+    compute_makespan_metrics,
+    compute_utilisation_metrics,
+    shift_order_index,
+)
 
-__all__ = ["KPIResult", "compute_kpis"]
+__all__ = ["KPIEvaluator", "KPIResult", "compute_kpis"]
 
 
 @dataclass(slots=True)
@@ -84,130 +88,209 @@ class KPIResult(Mapping[str, float | int | str]):
         )
 
 
-def compute_kpis(pb: Problem, assignments: pd.DataFrame) -> KPIResult:
-    """Compute production, mobilisation, utilisation, and sequencing KPIs from assignments."""
-
-    playback_result = run_playback(pb, assignments, config=PlaybackConfig())
-    shift_df = shift_dataframe(playback_result)
-    day_df = day_dataframe(playback_result)
-
-    delivered_total = getattr(playback_result, "delivered_total", None)
-    remaining_work_total = getattr(playback_result, "remaining_work_total", None)
-
-    sc = pb.scenario
-    total_required = sum(block.work_required for block in sc.blocks)
-
-    mobilisation_cost = 0.0
-    mobilisation_by_machine: dict[str, float] = defaultdict(float)
-    mobilisation_by_landing: dict[str, float] = defaultdict(float)
-    fallback_prod = 0.0
-    completed_blocks: set[str] = set()
-    seq_violation_events = 0
-    seq_violation_blocks: set[str] = set()
-    seq_violation_days: set[tuple[str, int]] = set()
-    seq_reason_counts: Counter[str] = Counter()
-
-    for record in playback_result.records:
-        production = float(record.production_units or 0.0)
-        fallback_prod += production
-        if record.mobilisation_cost:
-            cost = float(record.mobilisation_cost)
-            mobilisation_cost += cost
-            mobilisation_by_machine[record.machine_id] += cost
-            landing_id = record.metadata.get("landing_id") or record.landing_id
-            if landing_id is not None:
-                mobilisation_by_landing[str(landing_id)] += cost
-        if record.metadata.get("block_completed") and record.block_id:
-            completed_blocks.add(record.block_id)
-        violation = record.metadata.get("sequencing_violation")
-        if violation and record.block_id:
-            seq_violation_events += 1
-            seq_violation_blocks.add(record.block_id)
-            seq_violation_days.add((record.block_id, record.day))
-            seq_reason_counts[str(violation)] += 1
-
-    if delivered_total is None:
-        delivered_total = fallback_prod
-    result: dict[str, float | int | str] = {
-        "total_production": float(delivered_total),
-        "completed_blocks": float(len(completed_blocks)),
-    }
-    if remaining_work_total is not None:
-        staged_volume = float(remaining_work_total)
-        residual = float(total_required - float(delivered_total))
-        if residual >= 0 and abs(staged_volume - residual) <= 1e-6:
-            staged_volume = residual
-        if abs(staged_volume) <= 1e-6:
-            staged_volume = 0.0
-        result["staged_production"] = staged_volume
-        result["remaining_work_total"] = staged_volume
-        adjusted_total = float(total_required) - staged_volume
-        if adjusted_total >= 0:
-            result["total_production"] = adjusted_total
-    if mobilisation_cost > 0:
-        result["mobilisation_cost"] = mobilisation_cost
-        result["mobilisation_cost_by_machine"] = json.dumps(
-            {machine: round(cost, 3) for machine, cost in sorted(mobilisation_by_machine.items())}
+class KPIEvaluator:
+    """Evaluate KPIs for many assignment sets against a single :class:`Problem`.
+
+    Scenario-level inputs (required work, system blocks, repair alerts, role ordering, the shift
+    calendar index) are derived once at construction; :meth:`evaluate` then runs playback and
+    reduces the records with column-wise group-bys. Use :meth:`for_problem` to share one
+    evaluator per problem (tuner trials, ensemble samples, rolling windows); ``compute_kpis``
+    does so implicitly.
+    """
+
+    def __init__(self, problem: Problem) -> None:
+        self.problem = problem
+        scenario = problem.scenario
+        self._total_required = sum(block.work_required for block in scenario.blocks)
+        self._system_blocks = frozenset(
+            block.id for block in scenario.blocks if block.harvest_system_id
         )
-        result["mobilisation_cost_by_landing"] = json.dumps(
-            {landing: round(cost, 3) for landing, cost in sorted(mobilisation_by_landing.items())}
+        non_default_repairs = [
+            machine.id
+            for machine in scenario.machines
+            if getattr(machine, "repair_usage_hours", None) not in (None, 10000)
+        ]
+        self._repair_alert = ", ".join(sorted(non_default_repairs)) if non_default_repairs else None
+        self._role_priority = build_role_priority(get_operational_problem(problem))
+        self._shift_order = shift_order_index(problem)
+
+    @classmethod
+    def for_problem(cls, problem: Problem) -> KPIEvaluator:
+        """Return the evaluator memoised on ``problem``'s operational context."""
+
+        return get_operational_problem(problem).cached("kpi_evaluator", lambda: cls(problem))
+
+    def evaluate(self, assignments: pd.DataFrame) -> KPIResult:
+        """Compute production, mobilisation, utilisation, and sequencing KPIs."""
+
+        playback_result = run_playback(self.problem, assignments, config=PlaybackConfig())
+        shift_df = shift_dataframe(playback_result)
+        day_df = day_dataframe(playback_result)
+        records = _records_frame(playback_result.records)
+
+        delivered_total = getattr(playback_result, "delivered_total", None)
+        remaining_work_total = getattr(playback_result, "remaining_work_total", None)
+        if delivered_total is None:
+            delivered_total = float(records["production"].sum())
+
+        result: dict[str, float | int | str] = {
+            "total_production": float(delivered_total),
+            "completed_blocks": float(
+                records.loc[records["completed"] & records["has_block"], "block_id"].nunique()
+            ),
+        }
+        if remaining_work_total is not None:
+            staged_volume = float(remaining_work_total)
+            residual = float(self._total_required - float(delivered_total))
+            if residual >= 0 and abs(staged_volume - residual) <= 1e-6:
+                staged_volume = residual
+            if abs(staged_volume) <= 1e-6:
+                staged_volume = 0.0
+            result["staged_production"] = staged_volume
+            result["remaining_work_total"] = staged_volume
+            adjusted_total = float(self._total_required) - staged_volume
+            if adjusted_total >= 0:
+                result["total_production"] = adjusted_total
+
+        result.update(self._mobilisation_metrics(records))
+        if self._system_blocks:
+            result.update(self._sequencing_metrics(records))
+        if self._repair_alert:
+            result["repair_usage_alert"] = self._repair_alert
+
+        utilisation_metrics = compute_utilisation_metrics(shift_df, day_df)
+        role_metric = utilisation_metrics.get("utilisation_ratio_by_role")
+        if role_metric:
+            role_priority = self._role_priority
+            ordered_payload = json.loads(role_metric)
+            ordered_items = sorted(
+                ordered_payload.items(),
+                key=lambda item: (role_priority.get(item[0], 999), item[0]),
+            )
+            utilisation_metrics["utilisation_ratio_by_role"] = json.dumps(
+                {role: value for role, value in ordered_items}
+            )
+        result.update(utilisation_metrics)
+
+        if not shift_df.empty and "production_units" in shift_df.columns:
+            productive_rows = shift_df[shift_df["production_units"] > 0]
+            productive_days = productive_rows["day"].astype(int).tolist()
+            days_with_work = set(productive_days)
+            shift_keys_with_work = set(
+                zip(productive_days, productive_rows["shift_id"].astype(str).tolist())
+            )
+        else:
+            days_with_work = set()
+            shift_keys_with_work = set()
+
+        makespan_metrics = compute_makespan_metrics(
+            self.problem,
+            shift_df,
+            fallback_days=days_with_work,
+            fallback_shift_keys=shift_keys_with_work,
+            shift_order=self._shift_order,
         )
+        result.update(makespan_metrics)
+        result.update(_disruption_metrics(shift_df, float(delivered_total)))
 
-    system_blocks = {block.id for block in sc.blocks if block.harvest_system_id}
-    if system_blocks:
-        result["sequencing_violation_count"] = seq_violation_events
-        result["sequencing_violation_blocks"] = len(seq_violation_blocks)
-        result["sequencing_violation_days"] = len(seq_violation_days)
-        clean_blocks = max(len(system_blocks - seq_violation_blocks), 0)
-        result["sequencing_clean_blocks"] = clean_blocks
-        result["sequencing_violation_breakdown"] = (
-            ", ".join(f"{reason}={count}" for reason, count in sorted(seq_reason_counts.items()))
-            if seq_reason_counts
-            else "none"
+        return KPIResult(
+            totals=result,
+            shift_calendar=shift_df,
+            day_calendar=day_df,
+            sequencing_debug=playback_result.sequencing_debug,
         )
 
-    non_default_repairs = [
-        machine.id
-        for machine in sc.machines
-        if getattr(machine, "repair_usage_hours", None) not in (None, 10000)
-    ]
-    if non_default_repairs:
-        result["repair_usage_alert"] = ", ".join(sorted(non_default_repairs))
-
-    ctx = build_operational_problem(pb)
-    utilisation_metrics = compute_utilisation_metrics(shift_df, day_df)
-    role_metric = utilisation_metrics.get("utilisation_ratio_by_role")
-    if role_metric:
-        role_priority = build_role_priority(ctx)
-        ordered_payload = json.loads(role_metric)
-        ordered_items = sorted(
-            ordered_payload.items(),
-            key=lambda item: (role_priority.get(item[0], 999), item[0]),
+    __call__ = evaluate
+
+    def evaluate_many(self, assignment_sets: Iterable[pd.DataFrame]) -> list[KPIResult]:
+        """Evaluate several assignment sets, reusing the precomputed scenario structures."""
+
+        return [self.evaluate(assignments) for assignments in assignment_sets]
+
+    def _mobilisation_metrics(self, records: pd.DataFrame) -> dict[str, float | int | str]:
+        charged = records[records["mobilisation_cost"] != 0]
+        if charged.empty:
+            return {}
+        mobilisation_cost = _ordered_sum(charged["mobilisation_cost"])
+        if mobilisation_cost <= 0:
+            return {}
+        by_machine = charged.groupby("machine_id")["mobilisation_cost"].agg(_ordered_sum)
+        by_landing = (
+            charged.dropna(subset=["landing_id"])
+            .groupby("landing_id")["mobilisation_cost"]
+            .agg(_ordered_sum)
         )
-        utilisation_metrics["utilisation_ratio_by_role"] = json.dumps(
-            {role: value for role, value in ordered_items}
-        )
-    result.update(utilisation_metrics)
-
-    if not shift_df.empty and "production_units" in shift_df.columns:
-        productive_rows = shift_df[shift_df["production_units"] > 0]
-        days_with_work = set(int(day) for day in productive_rows["day"].tolist())
-        shift_keys_with_work = {
-            (int(row["day"]), str(row["shift_id"]))
-            for _, row in productive_rows[["day", "shift_id"]].iterrows()
+        return {
+            "mobilisation_cost": mobilisation_cost,
+            "mobilisation_cost_by_machine": json.dumps(
+                {machine: round(float(cost), 3) for machine, cost in by_machine.items()}
+            ),
+            "mobilisation_cost_by_landing": json.dumps(
+                {landing: round(float(cost), 3) for landing, cost in by_landing.items()}
+            ),
+        }
+
+    def _sequencing_metrics(self, records: pd.DataFrame) -> dict[str, float | int | str]:
+        violations = records[records["violation"].notna() & records["has_block"]]
+        violation_blocks = set(violations["block_id"].tolist())
+        reason_counts = violations["violation"].value_counts().sort_index()
+        return {
+            "sequencing_violation_count": len(violations),
+            "sequencing_violation_blocks": len(violation_blocks),
+            "sequencing_violation_days": len(violations[["block_id", "day"]].drop_duplicates()),
+            "sequencing_clean_blocks": max(len(self._system_blocks - violation_blocks), 0),
+            "sequencing_violation_breakdown": (
+                ", ".join(f"{reason}={count}" for reason, count in reason_counts.items())
+                if not reason_counts.empty
+                else "none"
+            ),
+        }
+
+
+def _records_frame(records: Sequence[PlaybackRecord]) -> pd.DataFrame:
+    """Project the record fields the KPI reductions need into a column frame."""
+
+    violations: list[str | None] = []
+    for record in records:
+        violation = record.metadata.get("sequencing_violation")
+        violations.append(str(violation) if violation else None)
+    frame = pd.DataFrame(
+        {
+            "day": [record.day for record in records],
+            "machine_id": [record.machine_id for record in records],
+            "block_id": [record.block_id for record in records],
+            "production": [float(record.production_units or 0.0) for record in records],
+            "mobilisation_cost": [float(record.mobilisation_cost or 0.0) for record in records],
+            "landing_id": [
+                _landing_key(record.metadata.get("landing_id") or record.landing_id)
+                for record in records
+            ],
+            "completed": [bool(record.metadata.get("block_completed")) for record in records],
+            "violation": violations,
         }
-    else:
-        days_with_work = set()
-        shift_keys_with_work = set()
-
-    makespan_metrics = compute_makespan_metrics(
-        pb,
-        shift_df,
-        fallback_days=days_with_work,
-        fallback_shift_keys=shift_keys_with_work,
     )
-    result.update(makespan_metrics)
+    frame["has_block"] = frame["block_id"].astype(bool) & frame["block_id"].notna()
+    return frame
+
+
+def _ordered_sum(values: pd.Series) -> float:
+    """Left-to-right float sum in record order (pandas' compensated sum can differ by an ulp)."""
+
+    if values.empty:
+        return 0.0
+    return float(np.cumsum(values.to_numpy(dtype=float))[-1])
+
+
+def _landing_key(landing_id: object) -> str | None:
+    return None if landing_id is None else str(landing_id)
 
+
+def _disruption_metrics(
+    shift_df: pd.DataFrame, delivered_total: float
+) -> dict[str, float | int | str]:
+    """Downtime and weather KPIs derived from the shift calendar."""
+
+    result: dict[str, float | int | str] = {}
     total_hours_recorded = float(shift_df.get("total_hours", pd.Series(dtype=float)).sum())
     avg_production_rate = (
         delivered_total / total_hours_recorded if total_hours_recorded > 0 else 0.0
@@ -255,10 +338,13 @@ def compute_kpis(pb: Problem, assignments: pd.DataFrame) -> KPIResult:
                     for machine, value in sorted(weather_by_machine.items())
                 }
             )
+    return result
 
-    return KPIResult(
-        totals=result,
-        shift_calendar=shift_df,
-        day_calendar=day_df,
-        sequencing_debug=playback_result.sequencing_debug,
-    )
+
+def compute_kpis(pb: Problem, assignments: pd.DataFrame) -> KPIResult:
+    """Compute production, mobilisation, utilisation, and sequencing KPIs from assignments.
+
+    Delegates to the :class:`KPIEvaluator` memoised on ``pb``.
+    """
+
+    return KPIEvaluator.for_problem(pb).evaluate(assignments)
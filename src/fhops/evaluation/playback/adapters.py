@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Iterator
+import math
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from fhops.optimization.operational_problem import OperationalProblem, get_operational_problem
 from fhops.scenario.contract import Problem
-from fhops.scheduling.mobilisation import build_distance_lookup
 
 from ..sequencing import (
-    SequencingTracker,
+    IndexedSequencingTracker,
     build_role_order_lookup,
     build_role_priority,
-    build_sequencing_tracker,
 )
 from .core import PlaybackRecord
 
@@ -51,8 +52,93 @@ def schedule_to_records(problem: Problem, schedule: Schedule) -> Iterator[Playba
     return assignments_to_records(problem, frame)
 
 
+@dataclass(frozen=True)
+class _PlaybackLookups:
+    """Scenario-level lookup frames reused by every ``assignments_to_records`` call."""
+
+    machine_roles: pd.Series
+    role_order: pd.Series
+    role_priority: pd.Series
+    rates: pd.Series
+    block_positions: pd.Series
+    distances: np.ndarray
+    mobilisation: pd.DataFrame
+    machine_hours: pd.Series
+    shift_hours: pd.Series
+    landings: pd.Series
+    blackout_days: frozenset[int]
+
+
+def _playback_lookups(ctx: OperationalProblem) -> _PlaybackLookups:
+    return ctx.cached("playback_lookups", lambda: _build_playback_lookups(ctx))
+
+
+def _build_playback_lookups(ctx: OperationalProblem) -> _PlaybackLookups:
+    scenario = ctx.problem.scenario
+    bundle = ctx.bundle
+    role_order = build_role_order_lookup(ctx)
+    role_priority = build_role_priority(ctx)
+
+    shift_hours: dict[str, float] = {}
+    if scenario.timeline and scenario.timeline.shifts:
+        shift_hours = {shift_def.name: shift_def.hours for shift_def in scenario.timeline.shifts}
+
+    blackout_days: set[int] = set()
+    if scenario.timeline and scenario.timeline.blackouts:
+        for blackout in scenario.timeline.blackouts:
+            blackout_days.update(range(blackout.start_day, blackout.end_day + 1))
+
+    mobilisation = pd.DataFrame.from_records(
+        [
+            (
+                machine_id,
+                params.setup_cost,
+                params.walk_cost_per_meter,
+                params.walk_threshold_m,
+                params.move_cost_flat,
+            )
+            for machine_id, params in ctx.mobilisation_params.items()
+        ],
+        columns=["machine_id", "setup_cost", "walk_cost", "walk_threshold", "move_cost"],
+    ).set_index("machine_id")
+
+    return _PlaybackLookups(
+        machine_roles=pd.Series(bundle.machine_roles, dtype=object),
+        role_order=_pair_series(role_order, dtype="float64"),
+        role_priority=pd.Series(role_priority, dtype="float64"),
+        rates=_pair_series(bundle.production_rates, dtype="float64"),
+        block_positions=pd.Series(ctx.block_index, dtype="int64"),
+        distances=ctx.distance_matrix,
+        mobilisation=mobilisation,
+        machine_hours=pd.Series(bundle.machine_daily_hours, dtype="float64"),
+        shift_hours=pd.Series(shift_hours, dtype="float64"),
+        landings=pd.Series(bundle.landing_for_block, dtype=object),
+        blackout_days=frozenset(blackout_days),
+    )
+
+
+def _pair_series(mapping: Mapping[tuple[str, str], float], *, dtype: str) -> pd.Series:
+    if not mapping:
+        return pd.Series([], index=pd.MultiIndex.from_tuples([], names=["a", "b"]), dtype=dtype)
+    return pd.Series(list(mapping.values()), index=pd.MultiIndex.from_tuples(mapping), dtype=dtype)
+
+
+def _lookup_pairs(series: pd.Series, first: pd.Series, second: pd.Series) -> np.ndarray:
+    """Vectorised ``series.get((first[i], second[i]))`` returning NaN for missing pairs."""
+
+    if series.empty or first.empty:
+        return np.full(len(first), np.nan)
+    keys = pd.MultiIndex.from_arrays([first.to_numpy(), second.to_numpy()])
+    return series.reindex(keys).to_numpy(dtype=float)
+
+
 def assignments_to_records(problem: Problem, assignments: pd.DataFrame) -> Iterator[PlaybackRecord]:
-    """Convert solver assignments dataframe into playback records."""
+    """Convert solver assignments dataframe into playback records.
+
+    Ordering, hours, landing, mobilisation cost, and blackout columns are derived with vectorised
+    lookups against per-scenario frames cached on the problem's operational context; only the
+    sequencing pass (which depends on the running block inventory) iterates row by row.
+    """
 
     if assignments is None or assignments.empty:
         return iter(())
@@ -70,157 +156,179 @@ def assignments_to_records(problem: Problem, assignments: pd.DataFrame) -> Itera
     if "assigned" in df.columns:
         df = df[df["assigned"] > 0]
 
-    tracker = build_sequencing_tracker(problem)
-    machine_roles = tracker.ctx.bundle.machine_roles
-    role_order_lookup = build_role_order_lookup(tracker.ctx)
-    role_priority = build_role_priority(tracker.ctx)
-
-    def _role_sort_value(row: pd.Series) -> int:
-        block_val = row.get("block_id")
-        machine_val = row.get("machine_id")
-        if pd.isna(block_val) or pd.isna(machine_val):
-            return 999
-        block_id = str(block_val)
-        role = machine_roles.get(str(machine_val))
-        role_key = role if role is not None else ""
-        return role_order_lookup.get((block_id, role_key), role_priority.get(role_key, 999))
-
-    df["_role_order"] = df.apply(_role_sort_value, axis=1)
+    ctx = get_operational_problem(problem)
+    lookups = _playback_lookups(ctx)
+    tracker = IndexedSequencingTracker(ctx)
+
+    machine_key = df["machine_id"].astype(str)
+    block_key = df["block_id"].astype(str)
+    role_key = machine_key.map(lookups.machine_roles).fillna("")
+    order = pd.Series(
+        _lookup_pairs(lookups.role_order, block_key, role_key), index=df.index, dtype=float
+    )
+    order = order.fillna(role_key.map(lookups.role_priority)).fillna(999.0)
+    order[df["block_id"].isna() | df["machine_id"].isna()] = 999.0
+    df["_role_order"] = order.astype(int)
     df = df.sort_values(["day", "shift_id", "_role_order", "machine_id", "block_id"]).reset_index(
         drop=True
     )
-    df = df.drop(columns=["_role_order"])
-
-    scenario = problem.scenario
-    rate = {(r.machine_id, r.block_id): r.rate for r in scenario.production_rates}
-    remaining = tracker.remaining_work
-    machine_hours = {machine.id: machine.daily_hours for machine in scenario.machines}
-
-    shift_hours_map: dict[str, float] = {}
-    if scenario.timeline and scenario.timeline.shifts:
-        shift_hours_map = {
-            shift_def.name: shift_def.hours for shift_def in scenario.timeline.shifts
-        }
-
-    mobilisation = scenario.mobilisation
-    mobilisation_lookup = build_distance_lookup(mobilisation) if mobilisation else {}
-    mobilisation_params = (
-        {param.machine_id: param for param in mobilisation.machine_params}
-        if mobilisation is not None
-        else {}
+    df = df[df["block_id"].notna()].reset_index(drop=True)
+    if df.empty:
+        return _RecordIterator(iter(()), tracker)
+
+    machines = df["machine_id"].astype(str)
+    blocks = df["block_id"].astype(str)
+    shifts = df["shift_id"].astype(str)
+    days = df["day"].astype(int)
+
+    shift_hours = shifts.map(lookups.shift_hours)
+    machine_hours = machines.map(lookups.machine_hours)
+    hours = shift_hours.where(shift_hours.notna(), machine_hours)
+    hours_source = np.where(
+        shift_hours.notna(),
+        "shift_definition",
+        np.where(machine_hours.notna(), "machine_daily_hours", ""),
     )
-    previous_block: dict[str, str | None] = defaultdict(lambda: None)
-
-    landing_lookup = {block.id: block.landing_id for block in scenario.blocks}
 
-    blackout_days: set[int] = set()
-    if scenario.timeline and scenario.timeline.blackouts:
-        for blackout in scenario.timeline.blackouts:
-            blackout_days.update(range(blackout.start_day, blackout.end_day + 1))
-
-    def hours_for(machine_id: str, shift_id: str) -> tuple[float | None, str | None]:
-        if shift_id in shift_hours_map:
-            return shift_hours_map[shift_id], "shift_definition"
-        hours = machine_hours.get(machine_id)
-        if hours is not None:
-            return hours, "machine_daily_hours"
-        return None, None
-
-    def production_for(machine_id: str, block_id: str, proposed: float | None) -> tuple[float, str]:
-        if proposed is not None:
-            value = max(proposed, 0.0)
-            return value, "column"
-        rate_value = rate.get((machine_id, block_id), 0.0)
-        block_remaining = remaining.get(block_id, 0.0)
-        production = min(rate_value, block_remaining)
-        return production, "rate"
-
-    def mobilisation_cost(machine_id: str, block_id: str) -> float | None:
-        params = mobilisation_params.get(machine_id)
-        if params is None:
-            return None
-        previous = previous_block[machine_id]
-        previous_block[machine_id] = block_id
-        if previous is None or previous == block_id:
-            return None
-        distance = mobilisation_lookup.get((previous, block_id), 0.0)
-        cost = params.setup_cost
-        if distance <= params.walk_threshold_m:
-            cost += params.walk_cost_per_meter * distance
-        else:
-            cost += params.move_cost_flat
-        return cost
+    if "production" in df.columns:
+        proposed = pd.to_numeric(df["production"], errors="coerce")
+    else:
+        proposed = pd.Series(np.nan, index=df.index)
+    has_proposed = proposed.notna().to_numpy()
+    column_production = np.maximum(proposed.fillna(0.0).to_numpy(dtype=float), 0.0)
+    rates = np.nan_to_num(_lookup_pairs(lookups.rates, machines, blocks), nan=0.0)
+
+    mobilisation_cost = _mobilisation_costs(lookups, machines, blocks)
+    landing = blocks.map(lookups.landings)
+    blackout_hit = days.isin(lookups.blackout_days).to_numpy()
+    if "_downtime" in df.columns:
+        downtime = df["_downtime"].to_numpy().astype(bool)
+    else:
+        downtime = np.zeros(len(df), dtype=bool)
+    if "_weather_severity" in df.columns:
+        severity = pd.to_numeric(df["_weather_severity"], errors="coerce")
+        weather = severity.where(severity.notna() & (severity != 0))
+    else:
+        weather = pd.Series(np.nan, index=df.index)
+
+    columns = zip(
+        days.tolist(),
+        shifts.tolist(),
+        machines.tolist(),
+        blocks.tolist(),
+        hours.tolist(),
+        hours_source.tolist(),
+        has_proposed.tolist(),
+        column_production.tolist(),
+        rates.tolist(),
+        mobilisation_cost.tolist(),
+        landing.tolist(),
+        blackout_hit.tolist(),
+        downtime.tolist(),
+        weather.tolist(),
+        strict=True,
+    )
 
     def iter_records() -> Iterator[PlaybackRecord]:
-        for _, row in df.iterrows():
-            machine_id = str(row["machine_id"])
-            block_id = row.get("block_id")
-            if pd.isna(block_id):
-                continue
-            block_id = str(block_id)
-            day = int(row["day"])
-            shift_id = str(row.get("shift_id", "S1"))
-
-            proposed_production = None
-            if "production" in row and not pd.isna(row["production"]):
-                proposed_production = float(row["production"])
-
-            production_units, production_source = production_for(
-                machine_id, block_id, proposed_production
-            )
-            hours_worked, hours_source = hours_for(machine_id, shift_id)
-            mobilisation_value = mobilisation_cost(machine_id, block_id)
-
+        for (
+            day,
+            shift_id,
+            machine_id,
+            block_id,
+            hours_worked,
+            hours_src,
+            from_column,
+            column_value,
+            rate_value,
+            mobilisation_value,
+            landing_id,
+            blackout,
+            downtime_flag,
+            weather_value,
+        ) in columns:
             metadata: dict[str, object] = {}
-            if hours_source:
-                metadata["hours_source"] = hours_source
-            metadata["production_source"] = production_source
-            landing_id = landing_lookup.get(block_id)
+            if hours_src:
+                metadata["hours_source"] = hours_src
+            if from_column:
+                production_units = column_value
+                metadata["production_source"] = "column"
+            else:
+                production_units = min(rate_value, tracker.remaining_for(block_id))
+                metadata["production_source"] = "rate"
+            if not isinstance(landing_id, str):
+                landing_id = None
             if landing_id is not None:
                 metadata["landing_id"] = landing_id
 
             sequencing = tracker.process(day, machine_id, block_id, production_units)
-            production_units = sequencing.production_units
-            role = sequencing.machine_role
             if sequencing.violation_reason:
                 metadata["sequencing_violation"] = sequencing.violation_reason
             if sequencing.block_completed:
                 metadata["block_completed"] = True
 
-            blackout_hit = day in blackout_days
-            downtime_flag = bool(row.get("_downtime", 0))
-            weather_severity_value = row.get("_weather_severity")
-            if pd.notna(weather_severity_value) and weather_severity_value != 0:
-                weather_severity = float(weather_severity_value)
-            else:
-                weather_severity = None
-
             yield PlaybackRecord(
                 day=day,
                 shift_id=shift_id,
                 machine_id=machine_id,
                 block_id=block_id,
-                hours_worked=hours_worked,
-                production_units=production_units,
-                mobilisation_cost=mobilisation_value,
-                blackout_hit=blackout_hit,
+                hours_worked=None if math.isnan(hours_worked) else hours_worked,
+                production_units=sequencing.production_units,
+                mobilisation_cost=None if math.isnan(mobilisation_value) else mobilisation_value,
+                blackout_hit=blackout,
                 landing_id=landing_id,
-                machine_role=role,
+                machine_role=sequencing.machine_role,
                 downtime=downtime_flag,
-                weather_severity=weather_severity,
+                weather_severity=None if math.isnan(weather_value) else weather_value,
                 metadata=metadata,
             )
         tracker.finalize()
 
-    class RecordIterator:
-        def __init__(self, iterator: Iterator[PlaybackRecord], tracker: SequencingTracker) -> None:
-            self._iterator = iterator
-            self.sequencing_tracker = tracker
+    return _RecordIterator(iter_records(), tracker)
+
+
+def _mobilisation_costs(
+    lookups: _PlaybackLookups, machines: pd.Series, blocks: pd.Series
+) -> np.ndarray:
+    """Per-row mobilisation cost (NaN when no move is charged), in playback order."""
+
+    costs = np.full(len(machines), np.nan)
+    params = lookups.mobilisation
+    if params.empty:
+        return costs
+    previous = blocks.groupby(machines, sort=False).shift(1)
+    charged = machines.isin(params.index) & previous.notna() & (previous != blocks)
+    if not charged.any():
+        return costs
+    moved_machines = machines[charged]
+    prev_pos = previous[charged].map(lookups.block_positions).to_numpy(dtype=float)
+    curr_pos = blocks[charged].map(lookups.block_positions).to_numpy(dtype=float)
+    known = ~(np.isnan(prev_pos) | np.isnan(curr_pos))
+    distance = np.zeros(len(prev_pos))
+    distance[known] = lookups.distances[
+        prev_pos[known].astype(np.intp), curr_pos[known].astype(np.intp)
+    ]
+    machine_params = params.reindex(moved_machines.to_numpy())
+    setup = machine_params["setup_cost"].to_numpy(dtype=float)
+    walk = machine_params["walk_cost"].to_numpy(dtype=float)
+    threshold = machine_params["walk_threshold"].to_numpy(dtype=float)
+    flat = machine_params["move_cost"].to_numpy(dtype=float)
+    costs[charged.to_numpy()] = np.where(
+        distance <= threshold, setup + walk * distance, setup + flat
+    )
+    return costs
+
+
+class _RecordIterator:
+    """Record iterator exposing the sequencing tracker once playback is exhausted."""
 
-        def __iter__(self) -> RecordIterator:
-            return self
+    def __init__(
+        self, iterator: Iterator[PlaybackRecord], tracker: IndexedSequencingTracker
+    ) -> None:
+        self._iterator = iterator
+        self.sequencing_tracker = tracker
 
-        def __next__(self) -> PlaybackRecord:
-            return next(self._iterator)
+    def __iter__(self) -> _RecordIterator:
+        return self
 
-    return RecordIterator(iter_records(), tracker)
+    def __next__(self) -> PlaybackRecord:
+        return next(self._iterator)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from dataclasses import asdict
+from dataclasses import fields
 
 import pandas as pd
 
@@ -74,8 +74,10 @@ def _summary_dataframe(
     """
     if not summaries:
         return pd.DataFrame(columns=list(columns))
-    rows = [asdict(summary) for summary in summaries]
-    df = pd.DataFrame(rows)
+    # Summaries only hold scalars, so a shallow field read replaces ``asdict``'s deep copy.
+    names = [summary_field.name for summary_field in fields(summaries[0])]
+    rows = [[getattr(summary, name) for name in names] for summary in summaries]
+    df = pd.DataFrame(rows, columns=names)
     return df.reindex(columns=list(columns))
 
 
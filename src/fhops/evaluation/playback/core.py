@@ -7,6 +7,7 @@ from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from fhops.optimization.operational_problem import get_operational_problem
 from fhops.scenario.contract import Problem
 
 if TYPE_CHECKING:  # pragma: no cover - import for typing only
@@ -119,7 +120,11 @@ def run_playback(
     """Convert solver assignments into playback records and aggregated summaries."""
 
     cfg = config or PlaybackConfig()
-    availability_map = _compute_shift_availability(problem, cfg)
+    # Availability only depends on the scenario and ``infer_missing_shifts``; reuse it across calls.
+    availability_map = get_operational_problem(problem).cached(
+        f"shift_availability:{cfg.infer_missing_shifts}",
+        lambda: _compute_shift_availability(problem, cfg),
+    )
 
     from .adapters import assignments_to_records  # Local import to avoid circular dependency.
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections import Counter, defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from fhops.optimization.operational_problem import OperationalProblem, build_operational_problem
 from fhops.scenario.contract import Problem
 
@@ -286,6 +289,510 @@ class SequencingTracker:
         return role in terminal
 
 
+@dataclass(frozen=True)
+class SequencingLayout:
+    """Integer indexing of blocks/roles plus static sequencing metadata for a context."""
+
+    block_index: Mapping[str, int]
+    roles: tuple[str, ...]
+    machine_role: Mapping[str, str | None]
+    machine_role_index: Mapping[str, int]
+    work_required: np.ndarray
+    explicit: tuple[bool, ...]
+    allowed_any: tuple[bool, ...]
+    allowed: tuple[tuple[bool, ...], ...]
+    prereqs: tuple[tuple[tuple[int, ...], ...], ...]
+    headstart: tuple[tuple[float, ...], ...]
+    loader: tuple[tuple[bool, ...], ...]
+    terminal: tuple[tuple[bool, ...], ...]
+    loader_batch: tuple[float, ...]
+    role_work_required: np.ndarray
+    has_role_work: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (len(self.block_index), len(self.roles))
+
+
+def build_sequencing_layout(ctx: OperationalProblem) -> SequencingLayout:
+    """Return the (cached) :class:`SequencingLayout` for ``ctx``."""
+
+    return ctx.cached("sequencing_layout", lambda: _build_sequencing_layout(ctx))
+
+
+def _build_sequencing_layout(ctx: OperationalProblem) -> SequencingLayout:
+    bundle = ctx.bundle
+    blocks = tuple(bundle.work_required.keys())
+    block_index = {block_id: idx for idx, block_id in enumerate(blocks)}
+    roles = tuple(sorted({role for role in bundle.machine_roles.values() if role}))
+    role_index = {role: idx for idx, role in enumerate(roles)}
+    machine_role_index = {
+        machine_id: role_index[role] if role else -1
+        for machine_id, role in bundle.machine_roles.items()
+    }
+    explicit_blocks = ctx.blocks_with_explicit_system
+
+    explicit: list[bool] = []
+    allowed_any: list[bool] = []
+    allowed: list[tuple[bool, ...]] = []
+    prereqs: list[tuple[tuple[int, ...], ...]] = []
+    headstart: list[tuple[float, ...]] = []
+    loader: list[tuple[bool, ...]] = []
+    terminal: list[tuple[bool, ...]] = []
+    loader_batch: list[float] = []
+    role_work = np.zeros((len(blocks), len(roles)), dtype=np.float64)
+    has_role_work = np.zeros((len(blocks), len(roles)), dtype=bool)
+    for b_idx, block_id in enumerate(blocks):
+        is_explicit = block_id in explicit_blocks
+        explicit.append(is_explicit)
+        allowed_roles = ctx.allowed_roles.get(block_id)
+        allowed_any.append(allowed_roles is None)
+        allowed.append(tuple(allowed_roles is None or role in allowed_roles for role in roles))
+        system_id = bundle.block_system.get(block_id)
+        terminal_roles = ctx.terminal_roles.get(system_id) if system_id is not None else None
+        block_prereqs: list[tuple[int, ...]] = []
+        block_headstart: list[float] = []
+        block_loader: list[bool] = []
+        block_terminal: list[bool] = []
+        for r_idx, role in enumerate(roles):
+            upstream = ctx.prereq_roles.get((block_id, role))
+            block_prereqs.append(
+                tuple(role_index[name] for name in upstream if name in role_index)
+                if upstream
+                else ()
+            )
+            block_headstart.append(ctx.role_headstarts.get((block_id, role), 0.0))
+            block_loader.append((block_id, role) in ctx.loader_roles)
+            block_terminal.append(
+                not is_explicit or system_id is None or not terminal_roles or role in terminal_roles
+            )
+            work = ctx.role_work_required.get((block_id, role))
+            if work is not None:
+                role_work[b_idx, r_idx] = work
+                has_role_work[b_idx, r_idx] = True
+        prereqs.append(tuple(block_prereqs))
+        headstart.append(tuple(block_headstart))
+        loader.append(tuple(block_loader))
+        terminal.append(tuple(block_terminal))
+        loader_batch.append(ctx.loader_batch_volume.get(block_id, 0.0))
+
+    work_required = np.array([bundle.work_required[block_id] for block_id in blocks], dtype=float)
+    for array in (work_required, role_work, has_role_work):
+        array.flags.writeable = False
+    return SequencingLayout(
+        block_index=block_index,
+        roles=roles,
+        machine_role=dict(bundle.machine_roles),
+        machine_role_index=machine_role_index,
+        work_required=work_required,
+        explicit=tuple(explicit),
+        allowed_any=tuple(allowed_any),
+        allowed=tuple(allowed),
+        prereqs=tuple(prereqs),
+        headstart=tuple(headstart),
+        loader=tuple(loader),
+        terminal=tuple(terminal),
+        loader_batch=tuple(loader_batch),
+        role_work_required=role_work,
+        has_role_work=has_role_work,
+    )
+
+
+@dataclass(slots=True)
+class SequencingState:
+    """Opaque copy of an :class:`IndexedSequencingTracker` state for snapshot/restore."""
+
+    arrays: tuple[np.ndarray, ...]
+    inventory_touched: frozenset[int]
+    counts_touched: frozenset[int]
+    current_day: int | None
+    delivered_total: float
+    violation_counts: Counter[str]
+    first_violation: tuple[Any, ...]
+
+
+class IndexedSequencingTracker:
+    """Array-backed drop-in for :class:`SequencingTracker`.
+
+    Block/role keys are integer indices into preallocated ``(blocks, roles)`` arrays built once
+    per :class:`OperationalProblem` (see :func:`build_sequencing_layout`). Day rollovers only
+    touch the cells written that day, :meth:`reset` reuses the buffers, and
+    :meth:`snapshot`/:meth:`restore` support delta evaluation. Violation semantics match
+    :class:`SequencingTracker` exactly.
+    """
+
+    __slots__ = (
+        "ctx",
+        "debug",
+        "layout",
+        "_remaining",
+        "_completed",
+        "_role_remaining",
+        "_inventory",
+        "_inventory_today",
+        "_inventory_seen",
+        "_counts_total",
+        "_counts_day",
+        "_inventory_touched",
+        "_counts_touched",
+        "_current_day",
+        "delivered_total",
+        "debug_violation_counts",
+        "debug_first_violation_role",
+        "debug_first_violation_reason",
+        "debug_first_violation_block",
+        "debug_first_violation_day",
+        "debug_first_violation_detail",
+    )
+
+    def __init__(
+        self,
+        ctx: OperationalProblem,
+        debug: bool = False,
+        *,
+        layout: SequencingLayout | None = None,
+    ) -> None:
+        self.ctx = ctx
+        self.debug = debug
+        self.layout = layout or build_sequencing_layout(ctx)
+        shape = self.layout.shape
+        self._remaining = self.layout.work_required.copy()
+        self._completed = np.zeros(shape[0], dtype=bool)
+        self._role_remaining = self.layout.role_work_required.copy()
+        self._inventory = np.zeros(shape, dtype=np.float64)
+        self._inventory_today = np.zeros(shape, dtype=np.float64)
+        self._inventory_seen = np.zeros(shape, dtype=bool)
+        self._counts_total = np.zeros(shape, dtype=np.int64)
+        self._counts_day = np.zeros(shape, dtype=np.int64)
+        self._inventory_touched: set[int] = set()
+        self._counts_touched: set[int] = set()
+        self._current_day: int | None = None
+        self.delivered_total = 0.0
+        self.debug_violation_counts: Counter[str] = Counter()
+        self.debug_first_violation_role: str | None = None
+        self.debug_first_violation_reason: str | None = None
+        self.debug_first_violation_block: str | None = None
+        self.debug_first_violation_day: int | None = None
+        self.debug_first_violation_detail: dict[str, Any] | None = None
+
+    def _state_arrays(self) -> tuple[np.ndarray, ...]:
+        return (
+            self._remaining,
+            self._completed,
+            self._role_remaining,
+            self._inventory,
+            self._inventory_today,
+            self._inventory_seen,
+            self._counts_total,
+            self._counts_day,
+        )
+
+    def reset(self) -> None:
+        """Return the tracker to its initial state without reallocating buffers."""
+
+        np.copyto(self._remaining, self.layout.work_required)
+        np.copyto(self._role_remaining, self.layout.role_work_required)
+        for array in self._state_arrays()[3:]:
+            array.fill(0)
+        self._completed.fill(False)
+        self._inventory_touched.clear()
+        self._counts_touched.clear()
+        self._current_day = None
+        self.delivered_total = 0.0
+        self.debug_violation_counts.clear()
+        self.debug_first_violation_role = None
+        self.debug_first_violation_reason = None
+        self.debug_first_violation_block = None
+        self.debug_first_violation_day = None
+        self.debug_first_violation_detail = None
+
+    def snapshot(self) -> SequencingState:
+        """Capture the current state so it can be restored after a trial evaluation."""
+
+        return SequencingState(
+            arrays=tuple(array.copy() for array in self._state_arrays()),
+            inventory_touched=frozenset(self._inventory_touched),
+            counts_touched=frozenset(self._counts_touched),
+            current_day=self._current_day,
+            delivered_total=self.delivered_total,
+            violation_counts=Counter(self.debug_violation_counts),
+            first_violation=(
+                self.debug_first_violation_role,
+                self.debug_first_violation_reason,
+                self.debug_first_violation_block,
+                self.debug_first_violation_day,
+                dict(self.debug_first_violation_detail)
+                if self.debug_first_violation_detail
+                else None,
+            ),
+        )
+
+    def restore(self, state: SequencingState) -> None:
+        """Restore a state previously captured with :meth:`snapshot`."""
+
+        for target, source in zip(self._state_arrays(), state.arrays, strict=True):
+            np.copyto(target, source)
+        self._inventory_touched = set(state.inventory_touched)
+        self._counts_touched = set(state.counts_touched)
+        self._current_day = state.current_day
+        self.delivered_total = state.delivered_total
+        self.debug_violation_counts = Counter(state.violation_counts)
+        (
+            self.debug_first_violation_role,
+            self.debug_first_violation_reason,
+            self.debug_first_violation_block,
+            self.debug_first_violation_day,
+            detail,
+        ) = state.first_violation
+        self.debug_first_violation_detail = dict(detail) if detail else None
+
+    def _flush_day(self) -> None:
+        if self._inventory_touched:
+            idx = np.fromiter(self._inventory_touched, dtype=np.intp)
+            inventory = self._inventory.reshape(-1)
+            today = self._inventory_today.reshape(-1)
+            inventory[idx] += today[idx]
+            today[idx] = 0.0
+            self._inventory_seen.reshape(-1)[idx] = True
+            self._inventory_touched.clear()
+        if self._counts_touched:
+            idx = np.fromiter(self._counts_touched, dtype=np.intp)
+            counts_total = self._counts_total.reshape(-1)
+            counts_day = self._counts_day.reshape(-1)
+            counts_total[idx] += counts_day[idx]
+            counts_day[idx] = 0
+            self._counts_touched.clear()
+
+    def _roll_day(self, day: int) -> None:
+        if self._current_day is None or day == self._current_day:
+            self._current_day = day
+            return
+        self._flush_day()
+        self._current_day = day
+
+    def finalize(self) -> None:
+        """Flush any remaining day counters (call once after iterating assignments)."""
+
+        self._flush_day()
+
+    @property
+    def remaining_work(self) -> dict[str, float]:
+        """Remaining block work keyed by block ID (materialised on access)."""
+
+        return dict(zip(self.layout.block_index, self._remaining.tolist(), strict=True))
+
+    @property
+    def completed_blocks(self) -> set[str]:
+        """Block IDs whose remaining work has been exhausted."""
+
+        blocks = tuple(self.layout.block_index)
+        return {blocks[idx] for idx in np.flatnonzero(self._completed)}
+
+    def remaining_for(self, block_id: str) -> float:
+        """Return the remaining work for ``block_id`` (``0.0`` for unknown blocks)."""
+
+        b_idx = self.layout.block_index.get(block_id)
+        return 0.0 if b_idx is None else float(self._remaining[b_idx])
+
+    def leftover_total(self, threshold: float = 0.0) -> float:
+        """Sum remaining block work strictly above ``threshold``."""
+
+        return sum(value for value in self._remaining.tolist() if value > threshold)
+
+    def process(
+        self,
+        day: int,
+        machine_id: str,
+        block_id: str,
+        proposed_production: float,
+    ) -> SequencingResult:
+        """Advance the sequencing state for a single assignment."""
+
+        self._roll_day(day)
+        layout = self.layout
+        role = layout.machine_role.get(machine_id)
+        b = layout.block_index.get(block_id)
+        if b is None:
+            # Blocks outside the scenario carry no remaining work or sequencing metadata.
+            return SequencingResult(
+                production_units=0.0,
+                machine_role=role,
+                violation_reason=None,
+                block_completed=False,
+            )
+        r = layout.machine_role_index.get(machine_id, -1)
+        n_roles = len(layout.roles)
+
+        violation_reason: str | None = None
+        if not layout.allowed_any[b]:
+            if r < 0:
+                violation_reason = "unknown_role"
+            elif not layout.allowed[b][r]:
+                violation_reason = "forbidden_role"
+
+        prereqs = layout.prereqs[b][r] if r >= 0 else ()
+        counts_total = self._counts_total
+        inventory = self._inventory
+        if prereqs:
+            buffer = layout.headstart[b][r]
+            if buffer > 0.0:
+                available_units = min(int(counts_total[b, p]) for p in prereqs)
+                required_buffer = int(counts_total[b, r]) + buffer
+                if available_units + 1e-9 < required_buffer:
+                    violation_reason = violation_reason or "missing_prereq"
+                    self._record_violation(
+                        block_id,
+                        role,
+                        "missing_prereq",
+                        day,
+                        {
+                            "available_units": float(available_units),
+                            "buffer_requirement": float(required_buffer),
+                            "headstart_deficit": float(required_buffer - available_units),
+                            "reason": "headstart",
+                        },
+                    )
+
+        production_units = max(proposed_production, 0.0)
+        explicit_block = layout.explicit[b]
+        remaining_block = float(self._remaining[b])
+        has_role_work = r >= 0 and bool(layout.has_role_work[b, r])
+        target_remaining = remaining_block
+        if has_role_work:
+            target_remaining = min(target_remaining, float(self._role_remaining[b, r]))
+        production_units = min(production_units, target_remaining)
+
+        if prereqs and explicit_block:
+            available_volume = min(float(inventory[b, p]) for p in prereqs)
+            loader_requirement = 0.0
+            if layout.loader[b][r]:
+                loader_requirement = min(layout.loader_batch[b], remaining_block)
+            required_volume = production_units
+            if loader_requirement > 0.0:
+                required_volume = max(required_volume, loader_requirement)
+            if available_volume + 1e-9 < required_volume:
+                violation_reason = violation_reason or "missing_prereq"
+                self._record_violation(
+                    block_id,
+                    role,
+                    "missing_prereq",
+                    day,
+                    {
+                        "available_volume": float(available_volume),
+                        "required_volume": float(required_volume),
+                        "reason": "inventory",
+                    },
+                )
+            production_units = min(production_units, available_volume)
+            seen = self._inventory_seen
+            for p in prereqs:
+                inventory[b, p] = max(0.0, float(inventory[b, p]) - production_units)
+                seen[b, p] = True
+
+        if r >= 0:
+            flat = b * n_roles + r
+            if explicit_block:
+                self._inventory_today[b, r] += production_units
+                self._inventory_touched.add(flat)
+            self._counts_day[b, r] += 1
+            self._counts_touched.add(flat)
+
+        terminal = r < 0 or layout.terminal[b][r]
+        if (not explicit_block or terminal) and production_units > 0:
+            self.delivered_total += production_units
+
+        if has_role_work:
+            self._role_remaining[b, r] = max(
+                0.0, float(self._role_remaining[b, r]) - production_units
+            )
+
+        if terminal:
+            remaining_block = max(0.0, remaining_block - production_units)
+            self._remaining[b] = remaining_block
+        block_completed = False
+        if remaining_block <= BLOCK_EPSILON and not self._completed[b]:
+            block_completed = True
+            self._completed[b] = True
+
+        return SequencingResult(
+            production_units=production_units,
+            machine_role=role,
+            violation_reason=violation_reason,
+            block_completed=block_completed,
+        )
+
+    def _record_violation(
+        self,
+        block_id: str,
+        role: str | None,
+        reason: str,
+        day: int,
+        detail: dict[str, Any] | None = None,
+    ) -> None:
+        self.debug_violation_counts[reason] += 1
+        if self.debug_first_violation_reason is not None:
+            return
+        self.debug_first_violation_reason = reason
+        self.debug_first_violation_role = role
+        self.debug_first_violation_block = block_id
+        self.debug_first_violation_day = day
+        if detail:
+            self.debug_first_violation_detail = dict(detail)
+
+    def watch_summary(self) -> dict[str, Any]:
+        """Return the violation counters and completion totals maintained by :meth:`process`.
+
+        This is the cheap subset of :meth:`debug_snapshot` (no per-role aggregation), so the
+        heuristic evaluator can attach it to every scored schedule for live watch output.
+        """
+
+        stats: dict[str, Any] = {}
+        violation_total = int(sum(self.debug_violation_counts.values()))
+        stats["sequencing_violation_count"] = violation_total
+        if self.debug_violation_counts:
+            stats["sequencing_violation_breakdown"] = dict(self.debug_violation_counts)
+        if self.debug_first_violation_role:
+            stats["sequencing_first_violation_role"] = self.debug_first_violation_role
+        if self.debug_first_violation_reason:
+            stats["sequencing_first_violation_reason"] = self.debug_first_violation_reason
+        if self.debug_first_violation_block:
+            stats["sequencing_first_violation_block"] = self.debug_first_violation_block
+        if self.debug_first_violation_day is not None:
+            stats["sequencing_first_violation_day"] = self.debug_first_violation_day
+        if self.debug_first_violation_detail:
+            for key, value in self.debug_first_violation_detail.items():
+                stats[f"sequencing_first_violation_{key}"] = value
+        stats["completed_blocks"] = int(self._completed.sum())
+        stats["remaining_work_total"] = sum(self._remaining.tolist())
+        stats["delivered_total"] = float(self.delivered_total)
+        if violation_total == 0:
+            stats["sequencing_status"] = "clean"
+        return stats
+
+    def debug_snapshot(self) -> dict[str, Any]:
+        """Aggregate sequencing debug metrics for watch/telemetry surfaces."""
+
+        stats = self.watch_summary()
+        roles = self.layout.roles
+        inventory_mask = self._inventory_seen
+        role_inventory_totals = {
+            roles[r_idx]: float(self._inventory[:, r_idx].sum())
+            for r_idx in range(len(roles))
+            if inventory_mask[:, r_idx].any()
+        }
+        if role_inventory_totals:
+            stats["role_inventory_totals"] = dict(sorted(role_inventory_totals.items()))
+        has_role_work = self.layout.has_role_work
+        role_remaining_totals = {
+            roles[r_idx]: float(self._role_remaining[has_role_work[:, r_idx], r_idx].sum())
+            for r_idx in range(len(roles))
+            if has_role_work[:, r_idx].any()
+        }
+        if role_remaining_totals:
+            stats["role_remaining_totals"] = dict(sorted(role_remaining_totals.items()))
+        return stats
+
+
 def build_sequencing_tracker(problem: Problem) -> SequencingTracker:
     """Create a sequencing tracker for the supplied problem."""
 
@@ -311,11 +818,4 @@ def build_role_order_lookup(ctx: OperationalProblem) -> dict[tuple[str, str], in
 def build_role_priority(ctx: OperationalProblem) -> dict[str, int]:
     """Return a scenario-wide role ordering derived from harvest systems."""
 
-    priority: dict[str, int] = {}
-    for system in ctx.bundle.systems.values():
-        for idx, role_cfg in enumerate(system.roles):
-            role = role_cfg.role
-            if not role:
-                continue
-            priority[role] = min(priority.get(role, idx), idx)
-    return priority
+    return dict(ctx.role_priority)
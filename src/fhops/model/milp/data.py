@@ -61,7 +61,7 @@ class OperationalMilpBundle:
     block_system: dict[str, str]
     systems: dict[str, SystemConfig]
     mobilisation_params: dict[str, dict[str, float]]
-    mobilisation_distances: dict[tuple[str, str], float]
+    mobilisation_distances: Mapping[tuple[str, str], float]
 
 
 def build_operational_bundle(pb: Problem) -> OperationalMilpBundle:
@@ -93,7 +93,7 @@ def build_operational_bundle(pb: Problem) -> OperationalMilpBundle:
 
     objective_weights = sc.objective_weights or ObjectiveWeights()
     mobilisation_params: dict[str, dict[str, float]] = {}
-    mobilisation_distances: dict[tuple[str, str], float] = {}
+    mobilisation_distances: Mapping[tuple[str, str], float] = {}
     if sc.mobilisation:
         mobilisation_distances = build_distance_lookup(sc.mobilisation)
         for param in sc.mobilisation.machine_params:
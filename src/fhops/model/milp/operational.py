@@ -7,6 +7,7 @@ from collections import defaultdict
 import pyomo.environ as pyo
 
 from fhops.model.milp.data import OperationalMilpBundle
+from fhops.scheduling.mobilisation import DistanceMatrix
 
 __all__ = ["build_operational_model"]
 
@@ -51,7 +52,7 @@ def build_operational_model(bundle: OperationalMilpBundle) -> pyo.ConcreteModel:
     block_terminal_roles: dict[str, tuple[str, ...]] = {}
     terminal_pairs: list[tuple[str, str]] = []
     mobilisation_params = bundle.mobilisation_params
-    mobilisation_distances = bundle.mobilisation_distances
+    mobilisation_distances = DistanceMatrix.from_mapping(bundle.mobilisation_distances)
 
     system_terminal_roles: dict[str, tuple[str, ...]] = {}
     for system in system_configs.values():
@@ -235,7 +236,7 @@ def build_operational_model(bundle: OperationalMilpBundle) -> pyo.ConcreteModel:
             params = mobilisation_params.get(mach)
             if not params:
                 return 0.0
-            distance = mobilisation_distances.get((prev_blk, curr_blk), 0.0)
+            distance = mobilisation_distances.get(prev_blk, curr_blk, 0.0)
             cost = params["setup_cost"]
             if distance <= params["walk_threshold_m"]:
                 cost += params["walk_cost_per_meter"] * distance
@@ -0,0 +1,110 @@
+"""Adaptive operator weighting for heuristic solvers (ALNS-style roulette)."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Any
+
+from fhops.optimization.heuristics.registry import OperatorRegistry
+
+
+class AdaptiveOperatorWeights:
+    """Re-weight registry operators online from the improvement per second they deliver.
+
+    Solvers call :meth:`credit` for every scored neighbour and :meth:`update` once per iteration.
+    At the end of each ``segment`` of iterations an operator's segment score is the objective
+    improvement its neighbours produced divided by the wall-clock seconds spent proposing and
+    scoring them (including waits on speculative scoring threads). Weights then move a fraction
+    ``reaction`` towards those scores, rescaled so the best operator maps to the largest starting
+    weight. Weights never drop below ``min_share`` of that value, so no enabled operator is
+    starved, and operators disabled at construction stay disabled.
+    """
+
+    def __init__(
+        self,
+        registry: OperatorRegistry,
+        *,
+        segment: int = 50,
+        reaction: float = 0.3,
+        min_share: float = 0.05,
+    ) -> None:
+        if segment < 1:
+            raise ValueError("segment must be at least 1")
+        if not 0.0 < reaction <= 1.0:
+            raise ValueError("reaction must be in (0, 1]")
+        self.registry = registry
+        self.segment = segment
+        self.reaction = reaction
+        self.min_share = min_share
+        self.initial_weights = {
+            name: weight for name, weight in registry.weights().items() if weight > 0
+        }
+        self.scale = max(self.initial_weights.values(), default=0.0)
+        self.segments = 0
+        self.total_improvement: defaultdict[str, float] = defaultdict(float)
+        self.total_seconds: defaultdict[str, float] = defaultdict(float)
+        self._improvement: defaultdict[str, float] = defaultdict(float)
+        self._seconds: defaultdict[str, float] = defaultdict(float)
+        self._proposal_seconds: dict[str, float] = {}
+        self._iterations = 0
+
+    def credit(self, operator: str | None, delta: float, seconds: float) -> None:
+        """Record a scored neighbour from ``operator`` (``delta`` is its score change)."""
+        if operator not in self.initial_weights:
+            return
+        self._improvement[operator] += max(0.0, delta)
+        self._seconds[operator] += max(0.0, seconds)
+
+    def update(self, operator_stats: Mapping[str, Mapping[str, float]]) -> bool:
+        """Close the iteration; re-weight the registry when a segment ends (returns ``True``)."""
+        self._iterations += 1
+        if self._iterations % self.segment:
+            return False
+        for name in self.initial_weights:
+            spent = operator_stats.get(name, {}).get("seconds", 0.0)
+            self._seconds[name] += spent - self._proposal_seconds.get(name, 0.0)
+            self._proposal_seconds[name] = spent
+        rates = {
+            name: self._improvement[name] / self._seconds[name]
+            for name in self.initial_weights
+            if self._seconds[name] > 0.0
+        }
+        best_rate = max(rates.values(), default=0.0)
+        if best_rate > 0.0:
+            current = self.registry.weights()
+            floor = self.min_share * self.scale
+            self.registry.configure(
+                {
+                    name: max(
+                        floor,
+                        (1.0 - self.reaction) * current[name]
+                        + self.reaction * self.scale * rate / best_rate,
+                    )
+                    for name, rate in rates.items()
+                }
+            )
+        for name in self.initial_weights:
+            self.total_improvement[name] += self._improvement[name]
+            self.total_seconds[name] += self._seconds[name]
+        self._improvement.clear()
+        self._seconds.clear()
+        self.segments += 1
+        return True
+
+    def state(self) -> dict[str, Any]:
+        """Return a telemetry snapshot; ``weights`` can seed a later run's ``operator_weights``."""
+        weights = self.registry.weights()
+        return {
+            "segment": self.segment,
+            "reaction": self.reaction,
+            "min_share": self.min_share,
+            "segments": self.segments,
+            "initial_weights": dict(self.initial_weights),
+            "weights": {name: weights[name] for name in self.initial_weights},
+            "improvement": {name: self.total_improvement[name] for name in self.initial_weights},
+            "seconds": {name: self.total_seconds[name] for name in self.initial_weights},
+        }
+
+
+__all__ = ["AdaptiveOperatorWeights"]
@@ -4,20 +4,27 @@ from __future__ import annotations
 
 import json
 import math
+import time
 from bisect import insort
 from collections import defaultdict
-from collections.abc import Mapping
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Generator, Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from random import Random
 from typing import Any
 
-from fhops.evaluation.sequencing import SequencingTracker, build_role_priority
-from fhops.optimization.heuristics.registry import OperatorContext, OperatorRegistry
+from fhops.evaluation.sequencing import IndexedSequencingTracker
+from fhops.optimization.heuristics.registry import Move, OperatorContext, OperatorRegistry
 from fhops.optimization.operational_problem import OperationalProblem
 from fhops.scenario.contract import Problem
+from fhops.telemetry.profiling import PhaseProfiler
 
 BLOCK_COMPLETION_EPS = 1e-6
+GREEDY_VARIANT_NOISE = 0.15
 LEFTOVER_PENALTY_FACTOR = 1.0
+# Shared no-op context used when no PhaseProfiler is attached (nullcontext is reusable).
+_NO_PHASE = nullcontext()
 AUTO_OBJECTIVE_WEIGHT_OVERRIDES: dict[str, dict[str, float]] = {
     "FHOPS Tiny7": {
         "production": 1.0,
@@ -73,6 +80,11 @@ class Schedule:
     dirty_slots: set[tuple[str, int, str]] = field(default_factory=set)
     slot_production: dict[tuple[str, int, str], SlotProduction] = field(default_factory=dict)
     watch_stats: dict[str, Any] | None = None
+    move: Move | None = None
+    operator: str | None = None
+    operator_index: dict[str, Any] = field(default_factory=dict)
+    # Slots that may differ from the parent the move was applied to (``None`` when unknown).
+    changed_slots: set[tuple[str, int, str]] | None = None
 
 
 @dataclass(slots=True)
@@ -133,6 +145,9 @@ def _set_assignment(
     if old_block == block_id:
         return
     assignments[key] = block_id
+    schedule.operator_index.clear()
+    if schedule.changed_slots is not None:
+        schedule.changed_slots.add((machine_id, day, shift_id))
     row = _ensure_machine_matrix(schedule, machine_id, ctx)
     shift_idx = ctx.shift_index[key]
     row[shift_idx] = block_id
@@ -177,7 +192,8 @@ def _recompute_mobilisation_for(
 
     params = ctx.mobilisation_params.get(machine_id)
     row = _ensure_machine_matrix(schedule, machine_id, ctx)
-    distance_lookup = ctx.distance_lookup
+    distances = ctx.distance_matrix
+    block_index = ctx.block_index
     cost = 0.0
     transitions = 0.0
     prev_block: str | None = None
@@ -191,7 +207,13 @@ def _recompute_mobilisation_for(
             continue
         transitions += 1.0
         if params is not None:
-            distance = distance_lookup.get((prev_block, block_id), 0.0)
+            prev_pos = block_index.get(prev_block)
+            curr_pos = block_index.get(block_id)
+            distance = (
+                distances.item(prev_pos, curr_pos)
+                if prev_pos is not None and curr_pos is not None
+                else 0.0
+            )
             move_cost = params.setup_cost
             if distance <= params.walk_threshold_m:
                 move_cost += params.walk_cost_per_meter * distance
@@ -298,7 +320,6 @@ def _repair_schedule_cover_blocks(
     explicit_blocks = ctx.blocks_with_explicit_system
     prereq_roles = ctx.prereq_roles
     role_headstarts = ctx.role_headstarts
-    role_priority = build_role_priority(ctx)
 
     shift_keys = ctx.shift_keys
 
@@ -319,17 +340,14 @@ def _repair_schedule_cover_blocks(
     def set_assignment(machine_id: str, day: int, shift_id: str, block_id: str | None) -> None:
         _set_assignment(sched, machine_id, day, shift_id, block_id, ctx, mark_dirty=False)
 
-    block_machine_index: defaultdict[str, set[str]] = defaultdict(set)
-    for (machine_id, block_id), rate_value in rate.items():
-        if rate_value > 0.0:
-            block_machine_index[block_id].add(machine_id)
+    machines_for_block = ctx.machines_for_block
 
     machines_to_visit: set[str] = set()
     if not limit_to_dirty_slots:
         machines_to_visit = set(plan.keys())
     else:
         for block_id in dirty_blocks:
-            machines_to_visit.update(block_machine_index.get(block_id, ()))
+            machines_to_visit.update(machines_for_block.get(block_id, ()))
             for _, machine_id in sched.block_slots.get(block_id, []):
                 machines_to_visit.add(machine_id)
         if not machines_to_visit:
@@ -363,10 +381,9 @@ def _repair_schedule_cover_blocks(
     else:
         shift_iteration = list(shift_keys)
 
-    ordered_machines = [machine for machine in sc.machines if machine.id in machines_to_visit]
-    ordered_machines.sort(
-        key=lambda m: (role_priority.get(machine_roles.get(m.id) or "", 999), m.id)
-    )
+    ordered_machines = [
+        machine_id for machine_id in ctx.machine_order if machine_id in machines_to_visit
+    ]
 
     role_inventory_estimate: defaultdict[tuple[str, str], float] = defaultdict(float)
     role_inventory_today: defaultdict[tuple[str, str], float] = defaultdict(float)
@@ -566,65 +583,65 @@ def _repair_schedule_cover_blocks(
             if not machines_for_slot:
                 continue
             machine_iter = [
-                machine for machine in ordered_machines if machine.id in machines_for_slot
+                machine_id for machine_id in ordered_machines if machine_id in machines_for_slot
             ]
             if not machine_iter:
                 continue
         else:
             machine_iter = ordered_machines
-        for machine in machine_iter:
+        for machine_id in machine_iter:
             slots_visited += 1
-            role = machine_roles.get(machine.id)
+            role = machine_roles.get(machine_id)
             slot_key = (day, shift_id)
-            machine_plan = plan[machine.id]
+            machine_plan = plan[machine_id]
             slot_block: str | None = machine_plan.get(slot_key)
-            lock_block = locked.get((machine.id, day))
+            lock_block = locked.get((machine_id, day))
             locked_slot = lock_block is not None
             if locked_slot:
                 slot_block = lock_block
-                set_assignment(machine.id, day, shift_id, slot_block)
+                set_assignment(machine_id, day, shift_id, slot_block)
             if (
                 limit_to_dirty_slots
                 and not locked_slot
                 and slot_block is not None
                 and slot_block not in dirty_blocks
             ):
-                record_assignment(machine.id, day, shift_id, slot_block)
+                record_assignment(machine_id, day, shift_id, slot_block)
                 continue
-            if shift_availability.get((machine.id, day, shift_id), 1) == 0:
-                set_assignment(machine.id, day, shift_id, None)
+            if shift_availability.get((machine_id, day, shift_id), 1) == 0:
+                set_assignment(machine_id, day, shift_id, None)
                 continue
-            if availability.get((machine.id, day), 1) == 0:
-                set_assignment(machine.id, day, shift_id, None)
+            if availability.get((machine_id, day), 1) == 0:
+                set_assignment(machine_id, day, shift_id, None)
                 continue
-            if (machine.id, day, shift_id) in blackout:
-                set_assignment(machine.id, day, shift_id, None)
+            if (machine_id, day, shift_id) in blackout:
+                set_assignment(machine_id, day, shift_id, None)
                 continue
             if slot_block is not None and slot_block not in dirty_blocks and not locked_slot:
                 continue
             if slot_block is not None:
                 if not slot_is_valid(
-                    machine.id,
+                    machine_id,
                     day,
                     slot_block,
                     role,
                     enforce_prereq=not locked_slot,
                 ):
                     slot_block = None
-                    set_assignment(machine.id, day, shift_id, None)
+                    set_assignment(machine_id, day, shift_id, None)
             if slot_block is None and fill_voids:
-                candidate = select_block(machine.id, day, shift_id, role)
+                candidate = select_block(machine_id, day, shift_id, role)
                 if candidate is None:
-                    set_assignment(machine.id, day, shift_id, None)
+                    set_assignment(machine_id, day, shift_id, None)
                     continue
-                set_assignment(machine.id, day, shift_id, candidate)
+                set_assignment(machine_id, day, shift_id, candidate)
                 slot_block = candidate
-                machines_touched.add(machine.id)
+                machines_touched.add(machine_id)
             if slot_block is not None:
-                record_assignment(machine.id, day, shift_id, slot_block)
-                machines_touched.add(machine.id)
+                record_assignment(machine_id, day, shift_id, slot_block)
+                machines_touched.add(machine_id)
             if limit_to_dirty_slots:
-                processed_slots.add((machine.id, day, shift_id))
+                processed_slots.add((machine_id, day, shift_id))
 
     sched.dirty_blocks.difference_update(dirty_blocks)
     if limit_to_dirty_slots:
@@ -647,8 +664,18 @@ def _repair_schedule_cover_blocks(
             repair_stats["slots_processed"] = float(slots_visited)
 
 
-def init_greedy_schedule(pb: Problem, ctx: OperationalProblem) -> Schedule:
-    """Construct an initial Schedule by greedily filling shifts with best-rate blocks."""
+def init_greedy_schedule(
+    pb: Problem,
+    ctx: OperationalProblem,
+    *,
+    rng: Random | None = None,
+    noise: float = 0.0,
+) -> Schedule:
+    """Construct an initial Schedule by greedily filling shifts with best-rate blocks.
+
+    With an ``rng`` the construction is randomised: the coverage pass visits blocks in random order
+    and fill-pass rates are scaled by up to ``1 + noise`` before ranking.
+    """
 
     sc = pb.scenario
     bundle = ctx.bundle
@@ -726,35 +753,38 @@ def init_greedy_schedule(pb: Problem, ctx: OperationalProblem) -> Schedule:
                 role_volume=role_delta,
             )
 
+    machines_for_block = ctx.machines_for_block
+    blocks_for_machine = ctx.blocks_for_machine
+    block_shift_span = ctx.block_shift_span
+
     def best_slot_for(block_id: str) -> tuple[str, int, str] | None:
-        earliest, latest = windows[block_id]
+        start, stop = block_shift_span[block_id]
         best_slot: tuple[str, int, str] | None = None
         best_rate = 0.0
         allowed = allowed_roles.get(block_id)
-        for machine in sc.machines:
-            role = machine_roles.get(machine.id)
+        for machine_id in machines_for_block.get(block_id, ()):
+            r = rate[(machine_id, block_id)]
+            if r <= best_rate:
+                continue
+            role = machine_roles.get(machine_id)
             if allowed is not None and role is not None and role not in allowed:
                 continue
             if _role_demand(block_id, role) <= BLOCK_COMPLETION_EPS:
                 continue
-            for day, shift_id in shift_keys:
-                if day < earliest or day > latest:
-                    continue
-                if plan[machine.id][(day, shift_id)] is not None:
-                    continue
-                if shift_availability.get((machine.id, day, shift_id), 1) == 0:
+            machine_plan = plan[machine_id]
+            for shift_idx in range(start, stop):
+                day, shift_id = shift_keys[shift_idx]
+                if machine_plan[(day, shift_id)] is not None:
                     continue
-                if availability.get((machine.id, day), 1) == 0:
+                if shift_availability.get((machine_id, day, shift_id), 1) == 0:
                     continue
-                if (machine.id, day, shift_id) in blackout:
+                if availability.get((machine_id, day), 1) == 0:
                     continue
-                r = rate.get((machine.id, block_id), 0.0)
-                if r <= 0.0:
+                if (machine_id, day, shift_id) in blackout:
                     continue
-                if r > best_rate:
-                    best_rate = r
-                    best_slot = (machine.id, day, shift_id)
-                    break
+                best_rate = r
+                best_slot = (machine_id, day, shift_id)
+                break
         return best_slot
 
     # Respect locked assignments up front.
@@ -770,6 +800,8 @@ def init_greedy_schedule(pb: Problem, ctx: OperationalProblem) -> Schedule:
         sc.blocks,
         key=lambda blk: (*sc.window_for(blk.id), blk.id),
     )
+    if rng is not None:
+        rng.shuffle(blocks_by_window)
     while True:
         progress = False
         for block in blocks_by_window:
@@ -796,23 +828,24 @@ def init_greedy_schedule(pb: Problem, ctx: OperationalProblem) -> Schedule:
             if (machine.id, day, shift_id) in blackout:
                 continue
             candidates: list[tuple[float, str]] = []
-            for block in sc.blocks:
-                role = machine_roles.get(machine.id)
+            role = machine_roles.get(machine.id)
+            for block_id in blocks_for_machine.get(machine.id, ()):
                 if role is not None:
-                    demand = role_remaining.get((block.id, role), 0.0)
+                    demand = role_remaining.get((block_id, role), 0.0)
                 else:
-                    demand = block_remaining.get(block.id, 0.0)
+                    demand = block_remaining.get(block_id, 0.0)
                 if demand <= BLOCK_COMPLETION_EPS:
                     continue
-                earliest, latest = windows[block.id]
+                earliest, latest = windows[block_id]
                 if day < earliest or day > latest:
                     continue
-                allowed = allowed_roles.get(block.id)
+                allowed = allowed_roles.get(block_id)
                 if allowed is not None and role is not None and role not in allowed:
                     continue
-                r = rate.get((machine.id, block.id), 0.0)
-                if r > 0:
-                    candidates.append((r, block.id))
+                rate_value = rate[(machine.id, block_id)]
+                if rng is not None:
+                    rate_value *= 1.0 + noise * rng.random()
+                candidates.append((rate_value, block_id))
             if candidates:
                 candidates.sort(reverse=True)
                 _, best_block = candidates[0]
@@ -826,6 +859,100 @@ def init_greedy_schedule(pb: Problem, ctx: OperationalProblem) -> Schedule:
     return schedule
 
 
+def clone_schedule(schedule: Schedule) -> Schedule:
+    """Return an independent copy of ``schedule`` including its incremental caches.
+
+    The copy keeps ``schedule``'s class. Matrix rows that were never built (``None``) stay
+    ``None``.
+    """
+
+    clone = schedule.__class__(
+        plan={machine: assignments.copy() for machine, assignments in schedule.plan.items()},
+        matrix={
+            machine: row[:] if row is not None else None for machine, row in schedule.matrix.items()
+        },
+    )
+    clone.mobilisation_cache = {
+        machine: MobilisationStats(stats.cost, stats.transitions)
+        for machine, stats in schedule.mobilisation_cache.items()
+        if stats is not None
+    }
+    clone.dirty_machines = set(schedule.dirty_machines)
+    if schedule.block_remaining_cache is not None:
+        clone.block_remaining_cache = dict(schedule.block_remaining_cache)
+    if schedule.role_remaining_cache is not None:
+        clone.role_remaining_cache = dict(schedule.role_remaining_cache)
+    clone.dirty_blocks = set(schedule.dirty_blocks)
+    clone.block_slots = {block: entries.copy() for block, entries in schedule.block_slots.items()}
+    clone.dirty_slots = set(schedule.dirty_slots)
+    clone.slot_production = {
+        key: SlotProduction(value.block_id, value.role, value.block_volume, value.role_volume)
+        for key, value in schedule.slot_production.items()
+    }
+    return clone
+
+
+def greedy_seed(pb: Problem, ctx: OperationalProblem, variant: int = 0) -> Schedule:
+    """Return a copy of the greedy seed memoised on ``ctx``.
+
+    ``variant=0`` is :func:`init_greedy_schedule`; higher variants are randomised constructions
+    seeded by their index, so every run on the same context sees the same variants. The greedy
+    construction ignores objective weights, so solvers pass the context from
+    :func:`~fhops.optimization.operational_problem.get_operational_problem` rather than a
+    weight-overridden copy to share seeds across runs.
+    """
+
+    def build() -> Schedule:
+        if variant == 0:
+            return init_greedy_schedule(pb, ctx)
+        return init_greedy_schedule(pb, ctx, rng=Random(variant), noise=GREEDY_VARIANT_NOISE)
+
+    return clone_schedule(ctx.cached(f"greedy_seed:{variant}", build))
+
+
+class RestartPool:
+    """Restart points for stalled searches: greedy seed variants plus the run's elite schedules.
+
+    Each :meth:`draw` picks uniformly among the ``variants + 1`` greedy seeds and the recorded
+    elites, so repeated restarts do not all return to the deterministic greedy seed.
+    """
+
+    def __init__(
+        self,
+        pb: Problem,
+        ctx: OperationalProblem,
+        rng: Random,
+        *,
+        variants: int = 2,
+        elite_size: int = 3,
+    ) -> None:
+        self.pb = pb
+        self.ctx = ctx
+        self.rng = rng
+        self.variants = max(0, variants)
+        self.elite_size = max(0, elite_size)
+        self._elites: list[tuple[float, Schedule]] = []
+
+    def record(self, schedule: Schedule, score: float) -> None:
+        """Offer ``schedule`` as an elite, keeping the ``elite_size`` best distinct plans."""
+
+        if self.elite_size == 0:
+            return
+        if any(elite.plan == schedule.plan for _, elite in self._elites):
+            return
+        self._elites.append((score, clone_schedule(schedule)))
+        self._elites.sort(key=lambda item: item[0], reverse=True)
+        del self._elites[self.elite_size :]
+
+    def draw(self) -> Schedule:
+        """Return a fresh copy of a randomly chosen restart point."""
+
+        pick = self.rng.randrange(self.variants + 1 + len(self._elites))
+        if pick <= self.variants:
+            return greedy_seed(self.pb, self.ctx, variant=pick)
+        return clone_schedule(self._elites[pick - self.variants - 1][1])
+
+
 def evaluate_schedule(
     pb: Problem,
     sched: Schedule,
@@ -833,17 +960,39 @@ def evaluate_schedule(
     debug: dict[str, Any] | None = None,
     *,
     limit_repairs_to_dirty: bool = False,
+    capture_watch: bool = False,
+    profiler: PhaseProfiler | None = None,
 ) -> float:
-    """Score a schedule using production, mobilisation, transition, and slack penalties."""
+    """Score a schedule using production, mobilisation, transition, and slack penalties.
+
+    ``sched.watch_stats`` always receives the volume and repair totals. With ``capture_watch``
+    (solvers set it when a watch sink is attached) it also gets the tracker's sequencing summary.
+    With a ``profiler`` the cover-block repair is timed as the ``repair`` phase and the scoring
+    pass as ``evaluate``.
+    """
 
     repair_stats: dict[str, float] | None = {} if limit_repairs_to_dirty else None
-    _repair_schedule_cover_blocks(
-        pb,
-        sched,
-        ctx,
-        limit_to_dirty_slots=limit_repairs_to_dirty,
-        repair_stats=repair_stats,
-    )
+    with profiler.phase("repair") if profiler is not None else _NO_PHASE:
+        _repair_schedule_cover_blocks(
+            pb,
+            sched,
+            ctx,
+            limit_to_dirty_slots=limit_repairs_to_dirty,
+            repair_stats=repair_stats,
+        )
+    with profiler.phase("evaluate") if profiler is not None else _NO_PHASE:
+        return _score_repaired_schedule(pb, sched, ctx, debug, repair_stats, capture_watch)
+
+
+def _score_repaired_schedule(
+    pb: Problem,
+    sched: Schedule,
+    ctx: OperationalProblem,
+    debug: dict[str, Any] | None,
+    repair_stats: dict[str, float] | None,
+    capture_watch: bool = False,
+) -> float:
+    """Score an already repaired schedule (the body of :func:`evaluate_schedule`)."""
 
     sc = pb.scenario
     bundle = ctx.bundle
@@ -866,30 +1015,26 @@ def evaluate_schedule(
     penalty = 0.0
 
     previous_block: dict[str, str | None] = {machine.id: None for machine in sc.machines}
-    tracker = SequencingTracker(ctx, debug=bool(debug))
+    tracker = IndexedSequencingTracker(ctx, debug=bool(debug))
 
-    role_priority = build_role_priority(ctx)
-    ordered_machines = sorted(
-        sc.machines,
-        key=lambda m: (role_priority.get(bundle.machine_roles.get(m.id) or "", 999), m.id),
-    )
+    ordered_machines = ctx.machine_order
 
     for day, shift_id in ctx.shift_keys:
         used = {landing.id: 0 for landing in sc.landings}
-        for machine in ordered_machines:
-            block_id = sched.plan[machine.id][(day, shift_id)]
-            lock_key = (machine.id, day)
+        for machine_id in ordered_machines:
+            block_id = sched.plan[machine_id][(day, shift_id)]
+            lock_key = (machine_id, day)
 
             if (
-                shift_availability.get((machine.id, day, shift_id), 1) == 0
-                or availability.get((machine.id, day), 1) == 0
+                shift_availability.get((machine_id, day, shift_id), 1) == 0
+                or availability.get((machine_id, day), 1) == 0
             ):
                 penalty += 1000.0
-                previous_block[machine.id] = None
+                previous_block[machine_id] = None
                 continue
-            if (machine.id, day, shift_id) in blackout:
+            if (machine_id, day, shift_id) in blackout:
                 penalty += 1000.0
-                previous_block[machine.id] = None
+                previous_block[machine_id] = None
                 continue
 
             locked_block = locked.get(lock_key)
@@ -901,7 +1046,7 @@ def evaluate_schedule(
             if block_id is None:
                 continue
 
-            role = bundle.machine_roles.get(machine.id)
+            role = bundle.machine_roles.get(machine_id)
             allowed = allowed_roles.get(block_id)
             if allowed is not None and role is not None and role not in allowed:
                 penalty += 1000.0
@@ -912,12 +1057,12 @@ def evaluate_schedule(
                 penalty += 1000.0
                 continue
 
-            rate_value = rate.get((machine.id, block_id), 0.0)
+            rate_value = rate.get((machine_id, block_id), 0.0)
             if rate_value <= 0.0:
                 penalty += 1000.0
                 continue
 
-            sequencing = tracker.process(day, machine.id, block_id, rate_value)
+            sequencing = tracker.process(day, machine_id, block_id, rate_value)
             if sequencing.violation_reason:
                 penalty += 1000.0
 
@@ -933,29 +1078,28 @@ def evaluate_schedule(
                     landing_surplus_total += excess
 
             if sequencing.production_units <= BLOCK_COMPLETION_EPS:
-                previous_block[machine.id] = block_id
+                previous_block[machine_id] = block_id
                 continue
 
-            previous_block[machine.id] = block_id
+            previous_block[machine_id] = block_id
 
     tracker.finalize()
     delivered_total = tracker.delivered_total
-    leftover_total = sum(
-        remaining_work
-        for remaining_work in tracker.remaining_work.values()
-        if remaining_work > BLOCK_COMPLETION_EPS
-    )
+    leftover_total = tracker.leftover_total(BLOCK_COMPLETION_EPS)
     score = weights.production * (delivered_total - LEFTOVER_PENALTY_FACTOR * leftover_total)
     score -= weights.mobilisation * mobilisation_total
     score -= weights.transitions * transition_count
     score -= weights.landing_surplus * landing_surplus_total
     score -= penalty
-    watch_stats: dict[str, Any] = {
-        "delivered_total": delivered_total,
-        "leftover_total": leftover_total,
-        "landing_surplus_total": landing_surplus_total,
-        "penalty_total": penalty,
-    }
+    # The tracker maintains its violation counters during the pass above, so the watch stats
+    # carry sequencing diagnostics without a second (debug) evaluation.
+    watch_stats: dict[str, Any] = (
+        tracker.watch_summary() if capture_watch or debug is not None else {}
+    )
+    watch_stats["delivered_total"] = delivered_total
+    watch_stats["leftover_total"] = leftover_total
+    watch_stats["landing_surplus_total"] = landing_surplus_total
+    watch_stats["penalty_total"] = penalty
     if repair_stats:
         watch_stats.setdefault("repair_slots_processed", repair_stats.get("slots_processed", 0.0))
         watch_stats.setdefault("repair_slots_visited", repair_stats.get("slots_visited", 0.0))
@@ -976,6 +1120,7 @@ def evaluate_schedule_with_debug(
     capture_debug: bool,
     *,
     limit_repairs_to_dirty: bool = False,
+    profiler: PhaseProfiler | None = None,
 ) -> tuple[float, dict[str, Any] | None]:
     """Evaluate a schedule and optionally capture sequencing debug statistics."""
 
@@ -986,16 +1131,45 @@ def evaluate_schedule_with_debug(
         ctx,
         debug=debug_map,
         limit_repairs_to_dirty=limit_repairs_to_dirty,
+        profiler=profiler,
     )
     return score, debug_map
 
 
-def build_watch_metadata_from_debug(stats: Mapping[str, Any] | None) -> dict[str, str]:
-    """Convert sequencing debug stats into watch-friendly metadata."""
+def build_watch_metadata_from_debug(
+    stats: Mapping[str, Any] | None,
+    *,
+    sequencing: bool = True,
+) -> dict[str, str]:
+    """Convert sequencing debug stats into watch-friendly metadata.
+
+    ``sequencing=False`` keeps only the volume/repair fields and drops the ``seq_*`` diagnostics.
+    """
 
     if not stats:
         return {}
     meta: dict[str, str] = {}
+    if sequencing:
+        _add_sequencing_metadata(meta, stats)
+    remaining_total = stats.get("remaining_work_total")
+    if remaining_total is not None:
+        meta["staged_volume_m3"] = f"{float(remaining_total):.2f}"
+    delivered_total = stats.get("delivered_total")
+    if delivered_total is not None:
+        meta["delivered_volume_m3"] = f"{float(delivered_total):.2f}"
+    slots_processed = stats.get("repair_slots_processed")
+    if slots_processed is not None:
+        meta["repair_slots"] = f"{float(slots_processed):.0f}"
+    dirty_blocks = stats.get("repair_dirty_blocks")
+    if dirty_blocks is not None:
+        meta["repair_blocks"] = f"{float(dirty_blocks):.0f}"
+    completed_blocks = stats.get("completed_blocks")
+    if completed_blocks is not None:
+        meta["completed_blocks"] = str(int(completed_blocks))
+    return meta
+
+
+def _add_sequencing_metadata(meta: dict[str, str], stats: Mapping[str, Any]) -> None:
     violation_count = stats.get("sequencing_violation_count")
     if violation_count is not None:
         meta["seq_violation_count"] = str(int(violation_count))
@@ -1019,25 +1193,40 @@ def build_watch_metadata_from_debug(stats: Mapping[str, Any] | None) -> dict[str
         deficit = stats.get("sequencing_first_violation_deficit")
     if deficit is not None:
         meta["seq_first_deficit"] = f"{float(deficit):.3f}"
-    remaining_total = stats.get("remaining_work_total")
-    if remaining_total is not None:
-        meta["staged_volume_m3"] = f"{float(remaining_total):.2f}"
-    delivered_total = stats.get("delivered_total")
-    if delivered_total is not None:
-        meta["delivered_volume_m3"] = f"{float(delivered_total):.2f}"
-    slots_processed = stats.get("repair_slots_processed")
-    if slots_processed is not None:
-        meta["repair_slots"] = f"{float(slots_processed):.0f}"
-    dirty_blocks = stats.get("repair_dirty_blocks")
-    if dirty_blocks is not None:
-        meta["repair_blocks"] = f"{float(dirty_blocks):.0f}"
-    completed_blocks = stats.get("completed_blocks")
-    if completed_blocks is not None:
-        meta["completed_blocks"] = str(int(completed_blocks))
     breakdown = stats.get("sequencing_violation_breakdown")
     if breakdown:
         meta["seq_violation_breakdown"] = json.dumps(breakdown, sort_keys=True)
-    return meta
+
+
+def deferred_watch_metadata(
+    stats: Mapping[str, Any] | None,
+    values: Mapping[str, float | int | None] | None = None,
+    *,
+    sequencing: bool = False,
+    profiler: PhaseProfiler | None = None,
+) -> Callable[[], dict[str, str]]:
+    """Return a :attr:`Snapshot.metadata_factory` that formats solver state on demand.
+
+    Solvers hand over the watch stats of the emitted schedule and a small mapping of numeric
+    counters; the string conversion (including the JSON violation breakdown) only happens when the
+    watch consumer renders the snapshot. Integers are rendered as-is, floats with three decimals,
+    and ``None`` values are skipped. A ``profiler`` contributes its ``phase_*`` totals, copied
+    when the factory is built so they describe the emitted iteration rather than render time.
+    """
+
+    phases = profiler.watch_metadata() if profiler is not None else None
+
+    def _format() -> dict[str, str]:
+        meta = build_watch_metadata_from_debug(stats, sequencing=sequencing)
+        for key, value in (values or {}).items():
+            if value is None:
+                continue
+            meta[key] = str(value) if isinstance(value, int) else f"{value:.3f}"
+        if phases is not None:
+            meta.update(phases)
+        return meta
+
+    return _format
 
 
 def generate_neighbors(
@@ -1049,8 +1238,13 @@ def generate_neighbors(
     ctx: OperationalProblem,
     *,
     batch_size: int | None = None,
+    profiler: PhaseProfiler | None = None,
 ) -> list[Schedule]:
-    """Generate neighbour schedules via enabled operators with feasibility sanitization."""
+    """Generate neighbour schedules via enabled operators with feasibility sanitization.
+
+    With a ``profiler`` operator proposals are timed as ``neighbours``, sanitizer calls as
+    ``sanitize`` and the post-move cover-block repair as ``repair``.
+    """
 
     sc = pb.scenario
     if not sc.machines or not pb.shifts:
@@ -1062,6 +1256,10 @@ def generate_neighbors(
 
     schedule_cls = sched.__class__
     sanitizer = ctx.build_sanitizer(schedule_cls)
+    move_sanitizer = ctx.build_move_sanitizer(schedule_cls)
+    if profiler is not None:
+        sanitizer = profiler.wrap("sanitize", sanitizer)
+        move_sanitizer = profiler.wrap("sanitize", move_sanitizer)
 
     context = OperatorContext(
         problem=pb,
@@ -1074,6 +1272,11 @@ def generate_neighbors(
         block_windows=block_windows,
         landing_capacity=landing_cap,
         landing_of=landing_of,
+        locked_assignments=ctx.locked_assignments,
+        production_rates=ctx.bundle.production_rates,
+        machines_for_block=ctx.machines_for_block,
+        block_shift_span=ctx.block_shift_span,
+        move_sanitizer=move_sanitizer,
     )
 
     enabled_ops = list(registry.enabled())
@@ -1114,9 +1317,15 @@ def generate_neighbors(
         stats["weight"] = operator.weight
         stats["proposals"] += 1.0
 
-        candidate = operator.apply(context)
+        started = time.perf_counter()
+        with profiler.phase("neighbours") if profiler is not None else _NO_PHASE:
+            candidate = operator.apply(context)
+        if candidate is not None:
+            with profiler.phase("repair") if profiler is not None else _NO_PHASE:
+                _repair_schedule_cover_blocks(pb, candidate, ctx, fill_voids=False)
+            candidate.operator = operator.name
+        stats["seconds"] = stats.get("seconds", 0.0) + time.perf_counter() - started
         if candidate is not None:
-            _repair_schedule_cover_blocks(pb, candidate, ctx, fill_voids=False)
             neighbours.append(candidate)
             stats["accepted"] += 1.0
             if limit is not None and len(neighbours) >= limit:
@@ -1127,6 +1336,64 @@ def generate_neighbors(
     return neighbours
 
 
+def iter_candidate_scores(
+    pb: Problem,
+    candidates: list[Schedule],
+    ctx: OperationalProblem,
+    *,
+    executor: Executor | None = None,
+    lookahead: int = 1,
+    limit_repairs_to_dirty: bool = False,
+    capture_watch: bool = False,
+    profiler: PhaseProfiler | None = None,
+) -> Generator[tuple[Schedule, float], None, None]:
+    """Yield ``(schedule, score)`` pairs in candidate order, scoring each only when needed.
+
+    Acceptance loops that stop at the first accepted neighbour should consume this instead of
+    :func:`evaluate_candidates`: candidates after the accepted one are never scored. With an
+    ``executor``, up to ``lookahead`` candidates are scored speculatively ahead of the consumer;
+    closing the generator cancels the queued ones. Scores and their order are identical to
+    :func:`evaluate_candidates`, so callers' RNG consumption does not change.
+    """
+
+    if executor is None or lookahead <= 1 or len(candidates) <= 1:
+        for candidate in candidates:
+            yield (
+                candidate,
+                evaluate_schedule(
+                    pb,
+                    candidate,
+                    ctx,
+                    limit_repairs_to_dirty=limit_repairs_to_dirty,
+                    capture_watch=capture_watch,
+                    profiler=profiler,
+                ),
+            )
+        return
+
+    def _score(schedule: Schedule) -> float:
+        return evaluate_schedule(
+            pb,
+            schedule,
+            ctx,
+            limit_repairs_to_dirty=limit_repairs_to_dirty,
+            capture_watch=capture_watch,
+            profiler=profiler,
+        )
+
+    in_flight: list[Future[float]] = []
+    submitted = 0
+    try:
+        for index, candidate in enumerate(candidates):
+            while submitted < len(candidates) and submitted < index + lookahead:
+                in_flight.append(executor.submit(_score, candidates[submitted]))
+                submitted += 1
+            yield candidate, in_flight[index].result()
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
 def evaluate_candidates(
     pb: Problem,
     candidates: list[Schedule],
@@ -1134,6 +1401,8 @@ def evaluate_candidates(
     max_workers: int | None = None,
     *,
     limit_repairs_to_dirty: bool = False,
+    capture_watch: bool = False,
+    profiler: PhaseProfiler | None = None,
 ) -> list[tuple[Schedule, float]]:
     """Evaluate candidate schedules, optionally in parallel, returning (schedule, score)."""
 
@@ -1148,6 +1417,8 @@ def evaluate_candidates(
                     candidate,
                     ctx,
                     limit_repairs_to_dirty=limit_repairs_to_dirty,
+                    capture_watch=capture_watch,
+                    profiler=profiler,
                 ),
             )
             for candidate in candidates
@@ -1157,7 +1428,12 @@ def evaluate_candidates(
 
         def _score(schedule: Schedule) -> float:
             return evaluate_schedule(
-                pb, schedule, ctx, limit_repairs_to_dirty=limit_repairs_to_dirty
+                pb,
+                schedule,
+                ctx,
+                limit_repairs_to_dirty=limit_repairs_to_dirty,
+                capture_watch=capture_watch,
+                profiler=profiler,
             )
 
         scores = list(executor.map(_score, candidates))
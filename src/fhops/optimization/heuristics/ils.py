@@ -5,7 +5,7 @@ from __future__ import annotations
 import random as _random
 import time
 from collections import deque
-from contextlib import nullcontext
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
 from typing import Any, cast
 
@@ -14,23 +14,22 @@ import pandas as pd
 from fhops.evaluation import compute_kpis
 from fhops.optimization.heuristics.common import (
     Schedule,
-    build_watch_metadata_from_debug,
+    deferred_watch_metadata,
     evaluate_candidates,
     evaluate_schedule,
-    evaluate_schedule_with_debug,
     generate_neighbors,
-    init_greedy_schedule,
+    greedy_seed,
     resolve_objective_weight_overrides,
 )
 from fhops.optimization.heuristics.registry import OperatorRegistry
 from fhops.optimization.mip import solve_mip
 from fhops.optimization.operational_problem import (
     OperationalProblem,
-    build_operational_problem,
+    get_operational_problem,
     override_objective_weights,
 )
 from fhops.scenario.contract import Problem
-from fhops.telemetry import RunTelemetryLogger
+from fhops.telemetry import CProfileReport, PhaseProfiler, RunTelemetryLogger
 from fhops.telemetry.watch import Snapshot, SnapshotSink
 
 
@@ -80,6 +79,7 @@ def _perturb_schedule(
     ctx: OperationalProblem,
     strength: int,
     operator_stats: dict[str, dict[str, float]],
+    profiler: PhaseProfiler | None = None,
 ) -> Schedule:
     """Apply a series of random operator moves to escape local optima."""
     current = schedule
@@ -92,6 +92,7 @@ def _perturb_schedule(
             operator_stats,
             ctx,
             batch_size=1,
+            profiler=profiler,
         )
         if not neighbours:
             break
@@ -109,17 +110,27 @@ def _local_search(
     max_workers: int | None,
     operator_stats: dict[str, dict[str, float]],
     use_local_repairs: bool,
-) -> tuple[Schedule, float, bool, int]:
-    """Run local search until no improving neighbour is found."""
+    profiler: PhaseProfiler | None = None,
+    *,
+    capture_watch: bool = False,
+) -> tuple[Schedule, float, bool, int, int]:
+    """Run local search until no improving neighbour is found.
+
+    Returns the final schedule and score, whether it improved, the number of improving steps, and
+    the number of candidates evaluated.
+    """
     current = schedule
     current_score = evaluate_schedule(
         pb,
         current,
         ctx,
         limit_repairs_to_dirty=use_local_repairs,
+        capture_watch=capture_watch,
+        profiler=profiler,
     )
     improved = False
     local_steps = 0
+    evaluated = 0
     while True:
         candidates = generate_neighbors(
             pb,
@@ -129,6 +140,7 @@ def _local_search(
             operator_stats,
             ctx,
             batch_size=batch_size,
+            profiler=profiler,
         )
         evaluations = evaluate_candidates(
             pb,
@@ -136,9 +148,12 @@ def _local_search(
             ctx,
             max_workers,
             limit_repairs_to_dirty=use_local_repairs,
+            capture_watch=capture_watch,
+            profiler=profiler,
         )
         if not evaluations:
             break
+        evaluated += len(evaluations)
 
         best_candidate, best_score = max(evaluations, key=lambda x: x[1])
         if best_score > current_score:
@@ -148,7 +163,7 @@ def _local_search(
             local_steps += 1
         else:
             break
-    return current, current_score, improved, local_steps
+    return current, current_score, improved, local_steps, evaluated
 
 
 def solve_ils(
@@ -173,6 +188,8 @@ def solve_ils(
     use_local_repairs: bool = False,
     objective_weight_overrides: dict[str, float] | None = None,
     milp_objective: float | None = None,
+    phase_timings: bool = False,
+    profile_out: str | Path | None = None,
 ) -> dict[str, Any]:
     """Run Iterated Local Search (optionally with MIP warm starts).
 
@@ -212,7 +229,8 @@ def solve_ils(
     watch_metadata : dict[str, str] | None
         Extra metadata (scenario/solver labels) attached to snapshot payloads.
     watch_debug : bool, default=False
-        When ``True`` capture sequencing debug stats for watch snapshots (minor overhead).
+        When ``True`` include sequencing diagnostics in watch snapshots. The counters come from
+        the scoring pass itself, so this no longer triggers extra evaluations.
     use_local_repairs : bool, default=False
         Limit repairs to dirty slots while scoring candidates. Final schedules are always
         re-scored with a full repair before returning results.
@@ -223,6 +241,12 @@ def solve_ils(
     milp_objective : float | None, optional
         Reference MILP objective used to report the current gap (best - MILP) in watch/telemetry
         output. ``None`` skips gap reporting.
+    phase_timings : bool, default=False
+        Accumulate per-phase seconds and call counts (see :func:`solve_sa`); reported in
+        ``meta["phase_timings"]``, the telemetry run record, and snapshot metadata.
+    profile_out : str | pathlib.Path | None, optional
+        Run the search loop under :mod:`cProfile` and write the stats (plus ``<path>.txt``) here.
+        Implies ``phase_timings``; paths are listed in ``meta["profile_artifacts"]``.
 
     Returns
     -------
@@ -272,6 +296,9 @@ def solve_ils(
         config_snapshot["milp_objective"] = float(milp_objective)
     if resolved_weight_overrides:
         config_snapshot["objective_weight_overrides"] = resolved_weight_overrides
+    profiler = PhaseProfiler() if phase_timings or profile_out else None
+    if profiler is not None:
+        config_snapshot["phase_timings"] = True
     context_payload = dict(telemetry_context or {})
     scenario = pb.scenario
     timeline = getattr(scenario, "timeline", None)
@@ -316,42 +343,35 @@ def solve_ils(
     improvement_window: deque[int] = deque(maxlen=window_size)
     last_watch_best: float | None = None
 
-    ctx = build_operational_problem(pb)
+    seed_ctx = ctx = get_operational_problem(pb)
     if resolved_weight_overrides:
         ctx = override_objective_weights(ctx, resolved_weight_overrides)
     debug_capture = bool(watch_debug and watch_sink)
+    capture_watch = bool(watch_sink)
     local_repairs = bool(use_local_repairs)
     objective_weights_snapshot = ctx.bundle.objective_weights.model_dump()
 
-    def _score_schedule(
-        schedule: Schedule,
-        *,
-        capture: bool | None = None,
-    ) -> tuple[float, dict[str, Any] | None]:
-        """Evaluate a schedule and optionally capture sequencing debug statistics."""
+    def _score_schedule(schedule: Schedule) -> float:
+        """Evaluate a schedule (sequencing watch stats are captured by the same pass)."""
 
-        flag = debug_capture if capture is None else capture
-        if flag:
-            return evaluate_schedule_with_debug(
-                pb,
-                schedule,
-                ctx,
-                capture_debug=True,
-                limit_repairs_to_dirty=local_repairs,
-            )
         return evaluate_schedule(
             pb,
             schedule,
             ctx,
             limit_repairs_to_dirty=local_repairs,
-        ), None
+            capture_watch=capture_watch,
+            profiler=profiler,
+        )
 
-    with telemetry_logger if telemetry_logger else nullcontext() as run_logger:
-        current = init_greedy_schedule(pb, ctx)
-        current_score, current_debug_stats = _score_schedule(current)
+    with ExitStack() as stack:
+        run_logger = stack.enter_context(telemetry_logger if telemetry_logger else nullcontext())
+        profile_report = (
+            stack.enter_context(CProfileReport(profile_out)) if profile_out is not None else None
+        )
+        current = greedy_seed(pb, seed_ctx)
+        current_score = _score_schedule(current)
         best = current
         best_score = current_score
-        best_debug_stats = dict(current_debug_stats) if current_debug_stats else None
         initial_score = current_score
         rolling_scores.append(float(current_score))
 
@@ -359,6 +379,7 @@ def solve_ils(
         perturbations = 0
         restarts = 0
         improvement_steps = 0
+        evaluated = 0
         operator_stats: dict[str, dict[str, float]] = {}
         run_start = time.perf_counter()
 
@@ -366,6 +387,7 @@ def solve_ils(
             nonlocal last_watch_best
             if not watch_sink:
                 return
+            watch_started = time.perf_counter()
             rolling_mean = (
                 float(sum(rolling_scores) / len(rolling_scores))
                 if rolling_scores
@@ -380,19 +402,14 @@ def solve_ils(
                 float(best_score - last_watch_best) if last_watch_best is not None else 0.0
             )
             last_watch_best = float(best_score)
-            metadata = {
-                **watch_meta,
-                "stalls": str(stalls),
-                "perturbations": str(perturbations),
-                "restarts": str(restarts),
+            values: dict[str, float | int | None] = {
+                "stalls": stalls,
+                "perturbations": perturbations,
+                "restarts": restarts,
             }
-            if debug_capture:
-                metadata.update(build_watch_metadata_from_debug(current_debug_stats))
-            elif getattr(current, "watch_stats", None):
-                metadata.update(build_watch_metadata_from_debug(current.watch_stats))
             if milp_objective is not None:
-                metadata["milp_objective"] = f"{milp_objective:.3f}"
-                metadata["milp_gap"] = f"{best_score - milp_objective:.3f}"
+                values["milp_objective"] = float(milp_objective)
+                values["milp_gap"] = float(best_score - milp_objective)
             watch_sink(
                 Snapshot(
                     scenario=watch_scenario,
@@ -409,13 +426,22 @@ def solve_ils(
                     temperature=None,
                     acceptance_rate_window=window_acceptance,
                     delta_objective=delta_objective,
-                    metadata=metadata,
+                    evaluations=evaluated,
+                    metadata=dict(watch_meta),
+                    metadata_factory=deferred_watch_metadata(
+                        current.watch_stats,
+                        values,
+                        sequencing=debug_capture,
+                        profiler=profiler,
+                    ),
                 )
             )
+            if profiler is not None:
+                profiler.add("watch", time.perf_counter() - watch_started)
 
         total_iterations = max(1, iters)
         for iteration in range(1, total_iterations + 1):
-            current, current_score, improved, steps = _local_search(
+            current, current_score, improved, steps, step_evaluations = _local_search(
                 pb,
                 current,
                 registry,
@@ -425,17 +451,15 @@ def solve_ils(
                 worker_arg,
                 operator_stats,
                 local_repairs,
+                profiler,
+                capture_watch=capture_watch,
             )
-            if debug_capture:
-                current_score, current_debug_stats = _score_schedule(current, capture=True)
-            else:
-                current_debug_stats = None
             improvement_steps += steps
+            evaluated += step_evaluations
             rolling_scores.append(float(current_score))
             best_improved = False
             if current_score > best_score:
                 best, best_score = current, current_score
-                best_debug_stats = dict(current_debug_stats) if current_debug_stats else None
                 stalls = 0
                 best_improved = True
             else:
@@ -448,15 +472,16 @@ def solve_ils(
                     or iteration == total_iterations
                     or iteration % telemetry_logger.step_interval == 0
                 ):
-                    run_logger.log_step(
-                        step=iteration,
-                        objective=float(current_score),
-                        best_objective=float(best_score),
-                        temperature=None,
-                        acceptance_rate=None,
-                        proposals=int(steps),
-                        accepted_moves=int(steps if improved else 0),
-                    )
+                    with profiler.phase("telemetry") if profiler is not None else nullcontext():
+                        run_logger.log_step(
+                            step=iteration,
+                            objective=float(current_score),
+                            best_objective=float(best_score),
+                            temperature=None,
+                            acceptance_rate=None,
+                            proposals=int(steps),
+                            accepted_moves=int(steps if improved else 0),
+                        )
 
             if watch_sink and (
                 iteration == 1
@@ -473,17 +498,11 @@ def solve_ils(
                         )
                         assignments = cast(pd.DataFrame, mip_res["assignments"]).copy()
                         hybrid_schedule = _assignments_to_schedule(pb, assignments)
-                        hybrid_score, hybrid_debug = _score_schedule(
-                            hybrid_schedule, capture=debug_capture
-                        )
+                        hybrid_score = _score_schedule(hybrid_schedule)
                         if hybrid_score > best_score:
                             best, best_score = hybrid_schedule, hybrid_score
-                            best_debug_stats = dict(hybrid_debug) if hybrid_debug else None
                             current = best
                             current_score = best_score
-                            current_debug_stats = (
-                                dict(best_debug_stats) if best_debug_stats else None
-                            )
                             stalls = 0
                             restarts += 1
                             continue
@@ -491,31 +510,38 @@ def solve_ils(
                         pass
                 current = best
                 current = _perturb_schedule(
-                    pb, current, registry, rng, ctx, perturbation_strength, operator_stats
+                    pb,
+                    current,
+                    registry,
+                    rng,
+                    ctx,
+                    perturbation_strength,
+                    operator_stats,
+                    profiler,
                 )
-                current_score, current_debug_stats = _score_schedule(current)
+                current_score = _score_schedule(current)
                 stalls = 0
                 perturbations += 1
             else:
                 current = _perturb_schedule(
-                    pb, current, registry, rng, ctx, perturbation_strength, operator_stats
+                    pb,
+                    current,
+                    registry,
+                    rng,
+                    ctx,
+                    perturbation_strength,
+                    operator_stats,
+                    profiler,
                 )
-                current_score, current_debug_stats = _score_schedule(current)
+                current_score = _score_schedule(current)
                 perturbations += 1
                 rolling_scores.append(float(current_score))
                 improvement_window.append(0)
 
+        profile_artifacts = profile_report.stop() if profile_report is not None else []
+
         if local_repairs:
-            if debug_capture:
-                best_score, best_debug_stats = evaluate_schedule_with_debug(
-                    pb,
-                    best,
-                    ctx,
-                    capture_debug=True,
-                    limit_repairs_to_dirty=False,
-                )
-            else:
-                best_score = evaluate_schedule(pb, best, ctx, limit_repairs_to_dirty=False)
+            best_score = evaluate_schedule(pb, best, ctx, limit_repairs_to_dirty=False)
             current_score = evaluate_schedule(pb, current, ctx, limit_repairs_to_dirty=False)
 
         rows = []
@@ -566,6 +592,10 @@ def solve_ils(
                 }
                 for name, stats in operator_stats.items()
             }
+        if profiler is not None:
+            meta["phase_timings"] = profiler.summary()
+        if profile_artifacts:
+            meta["profile_artifacts"] = profile_artifacts
         kpi_result = compute_kpis(pb, assignments)
         kpi_totals = kpi_result.to_dict()
         meta["kpi_totals"] = {
@@ -605,7 +635,9 @@ def solve_ils(
                     "stall_limit": stall_limit,
                     "perturbation_strength": perturbation_strength,
                     "hybrid_used": hybrid_use_mip,
+                    **({"phase_timings": meta["phase_timings"]} if profiler is not None else {}),
                 },
+                artifacts=profile_artifacts or None,
                 kpis=kpi_totals,
                 tuner_meta=tuner_meta,
             )
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from fhops.cli._utils import resolve_operator_presets
 from fhops.optimization.heuristics.sa import solve_sa
+from fhops.optimization.pool import shared_solver_pool
 from fhops.scenario.contract import Problem
 from fhops.telemetry import append_jsonl
 
@@ -54,6 +55,18 @@ def _run_single(
             telemetry_ctx.setdefault("preset", preset_label)
         telemetry_ctx.setdefault("source", telemetry_ctx.get("source", "run_multi_start"))
         kwargs["telemetry_context"] = telemetry_ctx
+        profile_out = kwargs.get("profile_out")
+        if profile_out is not None:
+            # Concurrent runs must not overwrite each other's cProfile reports.
+            profile_path = Path(profile_out)
+            kwargs["profile_out"] = profile_path.with_name(
+                f"{profile_path.stem}.run{run_id}{profile_path.suffix}"
+            )
+        if kwargs.get("watch_sink") is not None:
+            # Give every run its own dashboard row instead of overwriting a shared one.
+            watch_meta = dict(kwargs.get("watch_metadata") or {})
+            watch_meta["solver"] = f"{watch_meta.get('solver', 'sa')}#{run_id}"
+            kwargs["watch_metadata"] = watch_meta
         if operators is not None:
             if operators:
                 kwargs["operators"] = operators
@@ -93,7 +106,12 @@ def run_multi_start(
     summary_log: bool = True,
     telemetry_context: dict[str, Any] | None = None,
 ) -> MultiStartResult:
-    """Run several SA instances (possibly in parallel) and return the best outcome."""
+    """Run several SA instances (possibly in parallel) and return the best outcome.
+
+    A ``watch_sink`` in ``sa_kwargs`` receives snapshots labelled ``<solver>#<run_id>``. With
+    ``max_workers > 1`` the runs execute in worker processes, so the sink must be picklable, e.g.
+    :attr:`fhops.telemetry.watch.ProcessSnapshotRelay.sink`.
+    """
 
     seed_list = list(seeds)
     if not seed_list:
@@ -127,19 +145,20 @@ def run_multi_start(
                 append_jsonl(telemetry_log, meta)
                 seen_ids.add(idx)
     else:
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(_run_single, pb, seed, preset, sa_kwargs, idx): idx
-                for idx, (seed, preset) in enumerate(zip(seed_list, preset_list))
-            }
-            for future in as_completed(futures):
-                idx = futures[future]
-                objective, result, meta = future.result()
-                runs_meta.append(meta)
-                results.append((objective, result))
-                if telemetry_log and not log_via_sa and idx not in seen_ids:
-                    append_jsonl(telemetry_log, meta)
-                    seen_ids.add(idx)
+        # Workers persist across calls and receive ``pb`` once, not once per seed.
+        pool = shared_solver_pool(max_workers)
+        futures = {
+            pool.submit(pb, _run_single, seed, preset, sa_kwargs, idx): idx
+            for idx, (seed, preset) in enumerate(zip(seed_list, preset_list))
+        }
+        for future in as_completed(futures):
+            idx = futures[future]
+            objective, result, meta = future.result()
+            runs_meta.append(meta)
+            results.append((objective, result))
+            if telemetry_log and not log_via_sa and idx not in seen_ids:
+                append_jsonl(telemetry_log, meta)
+                seen_ids.add(idx)
 
     # Select the best result (highest objective) among successful runs.
     best_objective = float("-inf")
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from bisect import insort
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from itertools import combinations
 from random import Random
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar
 
+from fhops.optimization.heuristics import common
 from fhops.scenario.contract import Problem
 
 if TYPE_CHECKING:
@@ -21,6 +22,39 @@ else:  # pragma: no cover - runtime placeholder to keep annotations happy
 
 
 Sanitizer = Callable[[Schedule], Schedule]
+_T = TypeVar("_T")
+
+
+class SlotChange(NamedTuple):
+    """One slot reassignment within a move (``old_block`` is the parent's value)."""
+
+    machine_id: str
+    day: int
+    shift_id: str
+    old_block: str | None
+    new_block: str | None
+
+
+#: Canonical move descriptor: slot changes sorted by slot, one per slot, no no-ops.
+Move = tuple[SlotChange, ...]
+MoveSanitizer = Callable[[Schedule, Move], Schedule]
+
+
+def normalize_move(changes: Iterable[SlotChange]) -> Move:
+    """Collapse sequential slot changes into a canonical :data:`Move`.
+
+    Later changes to the same slot win (keeping the first ``old_block``) and changes that end where
+    they started are dropped, so equal neighbourhood moves always compare and hash equal.
+    """
+
+    merged: dict[tuple[str, int, str], SlotChange] = {}
+    for change in changes:
+        key = (change.machine_id, change.day, change.shift_id)
+        first = merged.get(key)
+        merged[key] = change if first is None else change._replace(old_block=first.old_block)
+    return tuple(
+        merged[key] for key in sorted(merged) if merged[key].old_block != merged[key].new_block
+    )
 
 
 @dataclass(slots=True)
@@ -39,6 +73,11 @@ class OperatorContext:
     landing_of: Mapping[str, str] | None = None
     mobilisation_budget: Mapping[str, float] | None = None
     cooldown_tracker: Mapping[str, Any] | None = None
+    locked_assignments: Mapping[tuple[str, int], str] | None = None
+    production_rates: Mapping[tuple[str, str], float] | None = None
+    machines_for_block: Mapping[str, tuple[str, ...]] | None = None
+    block_shift_span: Mapping[str, tuple[int, int]] | None = None
+    move_sanitizer: MoveSanitizer | None = None
 
 
 class Operator(Protocol):
@@ -120,38 +159,10 @@ def _clone_schedule(
     schedule = context.schedule
     shift_keys = context.shift_keys
     if not machines_to_copy:
-        plan = {machine: assignments.copy() for machine, assignments in schedule.plan.items()}
-        matrix = {
-            machine: row[:] if row is not None else [plan[machine].get(key) for key in shift_keys]
-            for machine, row in schedule.matrix.items()
-        }
-        for machine in plan:
-            matrix.setdefault(machine, [plan[machine].get(key) for key in shift_keys])
-        clone = schedule.__class__(plan=plan, matrix=matrix)
-        clone.mobilisation_cache = {}
-        for machine, stats in schedule.mobilisation_cache.items():
-            if stats is None:
-                continue
-            clone.mobilisation_cache[machine] = stats.__class__(stats.cost, stats.transitions)
-        clone.dirty_machines = set(schedule.dirty_machines)
-        clone.block_slots = {
-            block: entries.copy() for block, entries in schedule.block_slots.items()
-        }
-        clone.dirty_slots = set(schedule.dirty_slots)
-        if schedule.block_remaining_cache is not None:
-            clone.block_remaining_cache = dict(schedule.block_remaining_cache)
-        if schedule.role_remaining_cache is not None:
-            clone.role_remaining_cache = dict(schedule.role_remaining_cache)
-        if schedule.slot_production:
-            clone.slot_production = {
-                key: value.__class__(
-                    block_id=value.block_id,
-                    role=value.role,
-                    block_volume=value.block_volume,
-                    role_volume=value.role_volume,
-                )
-                for key, value in schedule.slot_production.items()
-            }
+        clone = common.clone_schedule(schedule)
+        for machine, assignments in clone.plan.items():
+            if clone.matrix.get(machine) is None:
+                clone.matrix[machine] = [assignments.get(key) for key in shift_keys]
         return clone
 
     plan = schedule.plan.copy()
@@ -203,6 +214,9 @@ def _set_slot(
     if old_block == block_id:
         return
     assignments[shift_key] = block_id
+    schedule.operator_index.clear()
+    if schedule.changed_slots is not None:
+        schedule.changed_slots.add((machine_id, shift_key[0], shift_key[1]))
     row = schedule.matrix.setdefault(machine_id, [None] * len(context.shift_keys))
     shift_idx = context.shift_index[shift_key]
     row[shift_idx] = block_id
@@ -226,6 +240,32 @@ def _set_slot(
     schedule.dirty_slots.add((machine_id, shift_key[0], shift_key[1]))
 
 
+def realize_move(context: OperatorContext, changes: Iterable[SlotChange]) -> Schedule:
+    """Return the sanitized neighbour obtained by applying ``changes`` to the context schedule.
+
+    The result records its canonical descriptor on ``Schedule.move``. With a
+    ``context.move_sanitizer`` the parent is never cloned; otherwise the touched machines are
+    cloned, updated, and passed through ``context.sanitizer``.
+    """
+
+    move = normalize_move(changes)
+    if context.move_sanitizer is not None:
+        candidate = context.move_sanitizer(context.schedule, move)
+    else:
+        candidate = _clone_schedule(context, {change.machine_id for change in move})
+        for change in move:
+            _set_slot(
+                context,
+                candidate,
+                change.machine_id,
+                (change.day, change.shift_id),
+                change.new_block,
+            )
+        candidate = context.sanitizer(candidate)
+    candidate.move = move
+    return candidate
+
+
 def _locked_assignments(problem: Problem) -> dict[tuple[str, int], str]:
     """Return a lookup of (machine, day) → block IDs that must remain fixed."""
     locks = getattr(problem.scenario, "locked_assignments", None)
@@ -241,6 +281,33 @@ def _production_rates(problem: Problem) -> dict[tuple[str, str], float]:
     }
 
 
+def _context_locks(context: OperatorContext) -> Mapping[tuple[str, int], str]:
+    """Return the shared lock lookup, deriving it from the scenario only when absent."""
+    if context.locked_assignments is not None:
+        return context.locked_assignments
+    return _locked_assignments(context.problem)
+
+
+def _context_rates(context: OperatorContext) -> Mapping[tuple[str, str], float]:
+    """Return the shared production-rate lookup, deriving it from the scenario when absent."""
+    if context.production_rates is not None:
+        return context.production_rates
+    return _production_rates(context.problem)
+
+
+def _compatible_machines(
+    block_id: str,
+    machines: list[str],
+    production: Mapping[tuple[str, str], float],
+    context: OperatorContext,
+) -> list[str]:
+    """Return machines (in ``machines`` order) with a positive rate on ``block_id``."""
+    if context.machines_for_block is not None:
+        compatible = set(context.machines_for_block.get(block_id, ()))
+        return [machine for machine in machines if machine in compatible]
+    return [machine for machine in machines if production.get((machine, block_id), 0.0) > 0.0]
+
+
 def _block_window(block_id: str, context: OperatorContext) -> tuple[int, int] | None:
     """Return the allowable day window for a block, if block windows are configured."""
     if context.block_windows is None:
@@ -257,6 +324,105 @@ def _window_allows(day: int, block_id: str, context: OperatorContext) -> bool:
     return start <= day <= end
 
 
+def _window_span(block_id: str, context: OperatorContext) -> tuple[int, int]:
+    """Return the ``[start, stop)`` slice of ``context.shift_keys`` to search for ``block_id``.
+
+    Uses the precomputed window spans when available; otherwise the whole horizon (callers still
+    apply :func:`_window_allows`).
+    """
+    if context.block_shift_span is not None:
+        span = context.block_shift_span.get(block_id)
+        if span is not None:
+            return span
+    return 0, len(context.shift_keys)
+
+
+def _sample_indices(rng: Random, count: int) -> Iterator[int]:
+    """Yield ``range(count)`` in uniformly random order, drawing one index per step.
+
+    A sparse Fisher–Yates shuffle: consumers that stop after a few accepted candidates pay for the
+    draws they made rather than for shuffling (or even materialising) the whole candidate space.
+    """
+    displaced: dict[int, int] = {}
+    for pos in range(count):
+        pick = rng.randrange(pos, count)
+        yield displaced.get(pick, pick)
+        displaced[pick] = displaced.pop(pos, pos)
+
+
+def _shuffled(rng: Random, items: Sequence[_T]) -> Iterator[_T]:
+    """Yield ``items`` in random order lazily (see :func:`_sample_indices`)."""
+    for index in _sample_indices(rng, len(items)):
+        yield items[index]
+
+
+def _schedule_index(context: OperatorContext, key: str, factory: Callable[[], _T]) -> _T:
+    """Return a lookup derived from ``context.schedule``, building it on first use.
+
+    Entries live on ``Schedule.operator_index`` and are dropped whenever a slot of that schedule
+    changes, so proposals against an unchanged incumbent reuse them.
+    """
+    index = context.schedule.operator_index
+    try:
+        return index[key]
+    except KeyError:
+        value = factory()
+        index[key] = value
+        return value
+
+
+def _movable_assignments(context: OperatorContext) -> list[tuple[str, tuple[int, str], str]]:
+    """Return the schedule's non-idle, non-locked ``(machine, shift, block)`` assignments."""
+
+    def build() -> list[tuple[str, tuple[int, str], str]]:
+        locks = _context_locks(context)
+        return [
+            (machine, shift_key, block_id)
+            for machine, machine_plan in context.schedule.plan.items()
+            for shift_key, block_id in machine_plan.items()
+            if block_id is not None and locks.get((machine, shift_key[0])) != block_id
+        ]
+
+    return _schedule_index(context, "movable_assignments", build)
+
+
+class _CoverageIndex(NamedTuple):
+    """Per-schedule coverage summary used by :class:`CoverageInjectionOperator`."""
+
+    target_block: str | None
+    surplus_blocks: frozenset[str]
+
+
+def _coverage_index(context: OperatorContext) -> _CoverageIndex:
+    """Return the highest-deficit block and the blocks holding surplus capacity."""
+
+    def build() -> _CoverageIndex:
+        production = _context_rates(context)
+        capacities: defaultdict[str, float] = defaultdict(float)
+        for machine_id, machine_plan in context.schedule.plan.items():
+            for block_id in machine_plan.values():
+                if block_id is None:
+                    continue
+                rate_value = production.get((machine_id, block_id), 0.0)
+                if rate_value > 0.0:
+                    capacities[block_id] += rate_value
+        work_required = {block.id: block.work_required for block in context.problem.scenario.blocks}
+        deficits = {
+            block_id: required - capacities.get(block_id, 0.0)
+            for block_id, required in work_required.items()
+            if required - capacities.get(block_id, 0.0) > CAPACITY_EPS
+        }
+        target_block = max(deficits.items(), key=lambda item: item[1])[0] if deficits else None
+        surplus = frozenset(
+            block_id
+            for block_id, capacity in capacities.items()
+            if capacity - work_required.get(block_id, 0.0) > CAPACITY_EPS
+        )
+        return _CoverageIndex(target_block, surplus)
+
+    return _schedule_index(context, "coverage", build)
+
+
 def _plan_equals(
     plan_a: dict[str, dict[tuple[int, str], str | None]],
     plan_b: dict[str, dict[tuple[int, str], str | None]],
@@ -294,12 +460,14 @@ class SwapOperator:
         except ValueError:
             return None
         m1, m2 = machine_pair
-        candidate = _clone_schedule(context, {m1, m2})
-        val1 = candidate.plan[m1].get(shift_key)
-        val2 = candidate.plan[m2].get(shift_key)
-        _set_slot(context, candidate, m1, shift_key, val2)
-        _set_slot(context, candidate, m2, shift_key, val1)
-        return context.sanitizer(candidate)
+        plan = context.schedule.plan
+        val1 = plan[m1].get(shift_key)
+        val2 = plan[m2].get(shift_key)
+        day, shift_id = shift_key
+        return realize_move(
+            context,
+            (SlotChange(m1, day, shift_id, val1, val2), SlotChange(m2, day, shift_id, val2, val1)),
+        )
 
 
 class MoveOperator:
@@ -325,11 +493,15 @@ class MoveOperator:
             from_shift, to_shift = rng.sample(shift_keys, k=2)
         else:
             from_shift = to_shift = shift_keys[0]
-        candidate = _clone_schedule(context, {machine})
-        value = candidate.plan[machine].get(from_shift)
-        _set_slot(context, candidate, machine, to_shift, value)
-        _set_slot(context, candidate, machine, from_shift, None)
-        return context.sanitizer(candidate)
+        machine_plan = schedule.plan[machine]
+        value = machine_plan.get(from_shift)
+        return realize_move(
+            context,
+            (
+                SlotChange(machine, *to_shift, machine_plan.get(to_shift), value),
+                SlotChange(machine, *from_shift, value, None),
+            ),
+        )
 
 
 class BlockInsertionOperator:
@@ -343,46 +515,46 @@ class BlockInsertionOperator:
 
     def apply(self, context: OperatorContext) -> Schedule | None:
         schedule = context.schedule
-        pb = context.problem
         rng = context.rng
-        locks = _locked_assignments(pb)
-        production = _production_rates(pb)
+        locks = _context_locks(context)
+        production = _context_rates(context)
         machines = list(schedule.plan.keys())
         if not machines:
             return None
-        assignments: list[tuple[str, tuple[int, str], str]] = [
-            (machine, shift_key, block_id)
-            for machine, machine_plan in schedule.plan.items()
-            for shift_key, block_id in machine_plan.items()
-            if block_id is not None and locks.get((machine, shift_key[0])) != block_id
-        ]
+        assignments = _movable_assignments(context)
         if not assignments:
             return None
-        rng.shuffle(assignments)
         shifts = context.shift_keys
         if not shifts:
             return None
-        for machine_src, shift_src, block_id in assignments:
-            candidate_targets: list[tuple[str, tuple[int, str]]] = []
-            for machine_tgt in machines:
-                for shift_day, shift_id in shifts:
-                    if machine_tgt == machine_src and (shift_day, shift_id) == shift_src:
-                        continue
-                    if not _window_allows(shift_day, block_id, context):
-                        continue
-                    lock_key = (machine_tgt, shift_day)
-                    locked_block = locks.get(lock_key)
-                    if locked_block is not None and locked_block != block_id:
-                        continue
-                    if production.get((machine_tgt, block_id), 0.0) <= 0.0:
-                        continue
-                    candidate_targets.append((machine_tgt, (shift_day, shift_id)))
-            rng.shuffle(candidate_targets)
-            for machine_tgt, shift_tgt in candidate_targets:
-                candidate = _clone_schedule(context, {machine_src, machine_tgt})
-                _set_slot(context, candidate, machine_src, shift_src, None)
-                _set_slot(context, candidate, machine_tgt, shift_tgt, block_id)
-                candidate = context.sanitizer(candidate)
+        for machine_src, shift_src, block_id in _shuffled(rng, assignments):
+            # Targets are compatible machines × shifts inside the block window, drawn lazily.
+            targets = _compatible_machines(block_id, machines, production, context)
+            start, stop = _window_span(block_id, context)
+            width = stop - start
+            for index in _sample_indices(rng, len(targets) * width):
+                machine_tgt = targets[index // width]
+                shift_tgt = shifts[start + index % width]
+                shift_day = shift_tgt[0]
+                if machine_tgt == machine_src and shift_tgt == shift_src:
+                    continue
+                if not _window_allows(shift_day, block_id, context):
+                    continue
+                locked_block = locks.get((machine_tgt, shift_day))
+                if locked_block is not None and locked_block != block_id:
+                    continue
+                candidate = realize_move(
+                    context,
+                    (
+                        SlotChange(machine_src, *shift_src, block_id, None),
+                        SlotChange(
+                            machine_tgt,
+                            *shift_tgt,
+                            schedule.plan.get(machine_tgt, {}).get(shift_tgt),
+                            block_id,
+                        ),
+                    ),
+                )
                 if _plan_equals(candidate.plan, schedule.plan):
                     continue
                 if candidate.plan.get(machine_tgt, {}).get(shift_tgt) != block_id:
@@ -402,66 +574,58 @@ class CoverageInjectionOperator:
 
     def apply(self, context: OperatorContext) -> Schedule | None:
         schedule = context.schedule
-        pb = context.problem
-        production = _production_rates(pb)
-        work_required = {block.id: block.work_required for block in pb.scenario.blocks}
-        locks = _locked_assignments(pb)
-        capacities: defaultdict[str, float] = defaultdict(float)
-        assignments: defaultdict[str, list[tuple[str, tuple[int, str]]]] = defaultdict(list)
-        idle_slots: list[tuple[str, tuple[int, str]]] = []
-
-        for machine_id, machine_plan in schedule.plan.items():
-            for shift_key, block_id in machine_plan.items():
-                if block_id is None:
-                    idle_slots.append((machine_id, shift_key))
-                    continue
-                rate_value = production.get((machine_id, block_id), 0.0)
-                if rate_value <= 0.0:
-                    idle_slots.append((machine_id, shift_key))
-                    continue
-                capacities[block_id] += rate_value
-                assignments[block_id].append((machine_id, shift_key))
-
-        deficits = {
-            block_id: required - capacities.get(block_id, 0.0)
-            for block_id, required in work_required.items()
-            if required - capacities.get(block_id, 0.0) > CAPACITY_EPS
-        }
-        if not deficits:
+        target_block, surplus_blocks = _coverage_index(context)
+        if target_block is None:
             return None
-        target_block = max(deficits.items(), key=lambda item: item[1])[0]
-
-        candidate_slots: list[tuple[float, str, tuple[int, str]]] = []
-        rng = context.rng
-
-        def _maybe_add_slot(machine_id: str, shift_key: tuple[int, str]) -> None:
-            locked_block = locks.get((machine_id, shift_key[0]))
-            if locked_block is not None and locked_block != target_block:
-                return
-            if not _window_allows(shift_key[0], target_block, context):
-                return
-            rate_value = production.get((machine_id, target_block), 0.0)
-            if rate_value <= 0.0:
-                return
-            candidate_slots.append((rate_value, machine_id, shift_key))
-
-        for machine_id, shift_key in idle_slots:
-            _maybe_add_slot(machine_id, shift_key)
-        for block_id, entries in assignments.items():
-            surplus = capacities.get(block_id, 0.0) - work_required.get(block_id, 0.0)
-            if surplus <= CAPACITY_EPS:
-                continue
-            for machine_id, shift_key in entries:
-                _maybe_add_slot(machine_id, shift_key)
-
+        production = _context_rates(context)
+        locks = _context_locks(context)
+        shifts = context.shift_keys
+        start, stop = _window_span(target_block, context)
+        compatible = _compatible_machines(
+            target_block, list(schedule.plan.keys()), production, context
+        )
+        by_rate: defaultdict[float, list[str]] = defaultdict(list)
+        for machine_id in compatible:
+            by_rate[production.get((machine_id, target_block), 0.0)].append(machine_id)
+
+        # Only the fastest machines with a usable slot matter; slower tiers are searched only
+        # when every faster one is fully committed.
+        candidate_slots: list[tuple[str, tuple[int, str]]] = []
+        for rate_value in sorted(by_rate, reverse=True):
+            for machine_id in by_rate[rate_value]:
+                machine_plan = schedule.plan[machine_id]
+                for shift_key in shifts[start:stop]:
+                    if shift_key not in machine_plan:
+                        continue
+                    current = machine_plan[shift_key]
+                    if (
+                        current is not None
+                        and current not in surplus_blocks
+                        and production.get((machine_id, current), 0.0) > 0.0
+                    ):
+                        continue
+                    locked_block = locks.get((machine_id, shift_key[0]))
+                    if locked_block is not None and locked_block != target_block:
+                        continue
+                    if not _window_allows(shift_key[0], target_block, context):
+                        continue
+                    candidate_slots.append((machine_id, shift_key))
+            if candidate_slots:
+                break
         if not candidate_slots:
             return None
-        rng.shuffle(candidate_slots)
-        candidate_slots.sort(key=lambda item: item[0], reverse=True)
-        _, machine_id, shift_key = candidate_slots[0]
-        candidate = _clone_schedule(context, {machine_id})
-        _set_slot(context, candidate, machine_id, shift_key, target_block)
-        candidate = context.sanitizer(candidate)
+        machine_id, shift_key = context.rng.choice(candidate_slots)
+        candidate = realize_move(
+            context,
+            (
+                SlotChange(
+                    machine_id,
+                    *shift_key,
+                    schedule.plan[machine_id].get(shift_key),
+                    target_block,
+                ),
+            ),
+        )
         if _plan_equals(candidate.plan, schedule.plan):
             return None
         if candidate.plan.get(machine_id, {}).get(shift_key) != target_block:
@@ -480,10 +644,9 @@ class CrossExchangeOperator:
 
     def apply(self, context: OperatorContext) -> Schedule | None:
         schedule = context.schedule
-        pb = context.problem
         rng = context.rng
-        locks = _locked_assignments(pb)
-        production = _production_rates(pb)
+        locks = _context_locks(context)
+        production = _context_rates(context)
         assignments: list[tuple[str, tuple[int, str], str]] = [
             (machine, shift_key, block_id)
             for machine, machine_plan in schedule.plan.items()
@@ -510,10 +673,13 @@ class CrossExchangeOperator:
                 continue
             if not _window_allows(shift_b[0], block_a, context):
                 continue
-            candidate = _clone_schedule(context, {machine_a, machine_b})
-            _set_slot(context, candidate, machine_a, shift_a, block_b)
-            _set_slot(context, candidate, machine_b, shift_b, block_a)
-            candidate = context.sanitizer(candidate)
+            candidate = realize_move(
+                context,
+                (
+                    SlotChange(machine_a, *shift_a, block_a, block_b),
+                    SlotChange(machine_b, *shift_b, block_b, block_a),
+                ),
+            )
             if _plan_equals(candidate.plan, schedule.plan):
                 continue
             if candidate.plan.get(machine_a, {}).get(shift_a) != block_b:
@@ -536,10 +702,9 @@ class MobilisationShakeOperator:
 
     def apply(self, context: OperatorContext) -> Schedule | None:
         schedule = context.schedule
-        pb = context.problem
         rng = context.rng
-        locks = _locked_assignments(pb)
-        production = _production_rates(pb)
+        locks = _context_locks(context)
+        production = _context_rates(context)
         distance_lookup = context.distance_lookup or {}
         machines = list(schedule.plan.keys())
         if not machines:
@@ -581,10 +746,18 @@ class MobilisationShakeOperator:
             rng.shuffle(candidate_targets)
             candidate_targets.sort(key=lambda item: (item[0], item[1]), reverse=True)
             for _, _, machine_tgt, shift_tgt in candidate_targets:
-                candidate = _clone_schedule(context, {machine_src, machine_tgt})
-                _set_slot(context, candidate, machine_src, shift_src, None)
-                _set_slot(context, candidate, machine_tgt, shift_tgt, block_id)
-                candidate = context.sanitizer(candidate)
+                candidate = realize_move(
+                    context,
+                    (
+                        SlotChange(machine_src, *shift_src, block_id, None),
+                        SlotChange(
+                            machine_tgt,
+                            *shift_tgt,
+                            schedule.plan[machine_tgt].get(shift_tgt),
+                            block_id,
+                        ),
+                    ),
+                )
                 if _plan_equals(candidate.plan, schedule.plan):
                     continue
                 if candidate.plan.get(machine_tgt, {}).get(shift_tgt) != block_id:
@@ -594,8 +767,13 @@ class MobilisationShakeOperator:
 
 
 __all__ = [
+    "Move",
+    "MoveSanitizer",
     "OperatorContext",
     "Sanitizer",
+    "SlotChange",
+    "normalize_move",
+    "realize_move",
     "Operator",
     "OperatorRegistry",
     "SwapOperator",
@@ -6,30 +6,32 @@ import math
 import random as _random
 import time
 from collections import deque
-from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
 from fhops.evaluation import compute_kpis
+from fhops.optimization.heuristics.adaptive import AdaptiveOperatorWeights
 from fhops.optimization.heuristics.common import (
+    RestartPool,
     Schedule,
-    build_watch_metadata_from_debug,
-    evaluate_candidates,
+    deferred_watch_metadata,
     evaluate_schedule,
-    evaluate_schedule_with_debug,
     generate_neighbors,
-    init_greedy_schedule,
+    greedy_seed,
+    iter_candidate_scores,
     resolve_objective_weight_overrides,
 )
 from fhops.optimization.heuristics.registry import OperatorRegistry
 from fhops.optimization.operational_problem import (
-    build_operational_problem,
+    get_operational_problem,
     override_objective_weights,
 )
 from fhops.scenario.contract import Problem
-from fhops.telemetry import RunTelemetryLogger
+from fhops.telemetry import CProfileReport, PhaseProfiler, RunTelemetryLogger
 from fhops.telemetry.watch import Snapshot, SnapshotSink
 
 __all__ = ["Schedule", "solve_sa"]
@@ -108,6 +110,9 @@ def solve_sa(
     use_local_repairs: bool = False,
     objective_weight_overrides: dict[str, float] | None = None,
     milp_objective: float | None = None,
+    adaptive_operators: bool = False,
+    phase_timings: bool = False,
+    profile_out: str | Path | None = None,
 ) -> dict[str, Any]:
     """Solve the scheduling problem with simulated annealing.
 
@@ -128,10 +133,14 @@ def solve_sa(
         ``None`` or ``<= 1`` keeps the sequential single-candidate behaviour.
     max_workers : int | None
         Maximum worker threads for evaluating batched neighbours. ``None``/``<=1`` keeps sequential scoring.
+        Batched neighbours are scored lazily in proposal order and evaluation stops at the first
+        accepted candidate; with workers, up to ``max_workers`` candidates are scored ahead
+        speculatively and the rest are cancelled once one is accepted. Results do not depend on
+        ``max_workers``.
     cooling_rate : float, default=0.999
         Multiplicative cooling factor applied each iteration (0 < rate < 1). Larger values cool more slowly.
     restart_interval : int | None, optional
-        Number of consecutive non-accepting iterations before restarting from the greedy seed. ``None`` auto-scales
+        Number of consecutive non-accepting iterations before restarting from the restart pool. ``None`` auto-scales
         to ``max(1000, iters / 5)``.
     telemetry_log : str | pathlib.Path | None
         Optional telemetry JSONL path. When provided, solver progress and final metrics are logged.
@@ -146,7 +155,8 @@ def solve_sa(
     watch_metadata : dict[str, str] | None
         Additional metadata (e.g., scenario/solver labels) attached to each snapshot.
     watch_debug : bool, default=False
-        When ``True`` capture sequencing debug stats for watch snapshots (adds overhead).
+        When ``True`` include sequencing diagnostics in watch snapshots. The counters come from
+        the scoring pass itself, so this no longer triggers extra evaluations.
     use_local_repairs : bool, default=False
         When ``True`` repairs only the slots touched by a candidate before scoring. The
         final schedule is always re-scored with a full repair before reporting.
@@ -157,6 +167,23 @@ def solve_sa(
     milp_objective : float | None, optional
         Reference MILP objective used for gap reporting (best - MILP) in watch/telemetry output.
         ``None`` skips gap metrics.
+    adaptive_operators : bool, default=False
+        When ``True`` operator weights adapt during the run (see
+        :class:`fhops.optimization.heuristics.adaptive.AdaptiveOperatorWeights`): every 50
+        iterations they move towards each operator's objective improvement per wall-clock second. The
+        starting weights come from ``operators``/``operator_weights`` as usual, the auto shake boost
+        is disabled, and the final state is reported in ``meta["operators_adaptive"]``. Its
+        ``weights`` can be passed as ``operator_weights`` to seed later runs.
+    phase_timings : bool, default=False
+        When ``True`` accumulate wall-clock seconds and call counts per hot-path phase
+        (``neighbours``, ``sanitize``, ``repair``, ``evaluate``, ``telemetry``, ``watch``; see
+        :class:`fhops.telemetry.profiling.PhaseProfiler`). The summary is reported in
+        ``meta["phase_timings"]`` and the telemetry run record, and snapshots carry running
+        ``phase_<name>`` totals.
+    profile_out : str | pathlib.Path | None, optional
+        When set, run the search loop under :mod:`cProfile` and write the stats to this path plus
+        a text report (``<path>.txt``). Implies ``phase_timings``; both paths are listed in
+        ``meta["profile_artifacts"]`` and the telemetry record's ``artifacts``.
 
     Returns
     -------
@@ -238,12 +265,17 @@ def solve_sa(
         config_snapshot["auto_profile"] = "mobilisation"
     if auto_batch_applied:
         config_snapshot["auto_batch_applied"] = True
+    if adaptive_operators:
+        config_snapshot["adaptive_operators"] = True
+    profiler = PhaseProfiler() if phase_timings or profile_out else None
+    if profiler is not None:
+        config_snapshot["phase_timings"] = True
 
     shake_settings = AUTO_SHAKE_CONFIG.get(scenario_name) if scenario_name else None
     mobilisation_shake_default = registry.weights().get("mobilisation_shake", 0.0)
     shake_threshold = (
         float(shake_settings["threshold"])
-        if shake_settings and mobilisation_shake_default > 0
+        if shake_settings and mobilisation_shake_default > 0 and not adaptive_operators
         else None
     )
     shake_boost_factor = float(shake_settings["boost_factor"]) if shake_settings else 1.0
@@ -292,42 +324,42 @@ def solve_sa(
     workers_total = max_workers if max_workers and max_workers > 1 else None
     current_workers_busy: int | None = workers_total
 
-    ctx = build_operational_problem(pb)
+    seed_ctx = ctx = get_operational_problem(pb)
     if resolved_weight_overrides:
         ctx = override_objective_weights(ctx, resolved_weight_overrides)
     debug_capture = bool(watch_debug and watch_sink)
+    capture_watch = bool(watch_sink)
     local_repairs = bool(use_local_repairs)
     objective_weights_snapshot = ctx.bundle.objective_weights.model_dump()
 
-    def _score_schedule(
-        schedule: Schedule,
-        *,
-        capture: bool | None = None,
-    ) -> tuple[float, dict[str, Any] | None]:
-        """Evaluate a schedule and optionally capture sequencing debug stats."""
+    def _score_schedule(schedule: Schedule) -> float:
+        """Evaluate a schedule (sequencing watch stats are captured by the same pass)."""
 
-        flag = debug_capture if capture is None else capture
-        if flag:
-            return evaluate_schedule_with_debug(
-                pb,
-                schedule,
-                ctx,
-                capture_debug=True,
-                limit_repairs_to_dirty=local_repairs,
-            )
         return evaluate_schedule(
             pb,
             schedule,
             ctx,
             limit_repairs_to_dirty=local_repairs,
-        ), None
+            capture_watch=capture_watch,
+            profiler=profiler,
+        )
 
-    with telemetry_logger if telemetry_logger else nullcontext() as run_logger:
-        current = init_greedy_schedule(pb, ctx)
-        current_score, current_debug_stats = _score_schedule(current)
+    speculative = bool(batch_size and batch_size > 1 and workers_total)
+    with ExitStack() as stack:
+        run_logger = stack.enter_context(telemetry_logger if telemetry_logger else nullcontext())
+        executor = (
+            stack.enter_context(ThreadPoolExecutor(max_workers=workers_total))
+            if speculative
+            else None
+        )
+        profile_report = (
+            stack.enter_context(CProfileReport(profile_out)) if profile_out is not None else None
+        )
+        restart_pool = RestartPool(pb, seed_ctx, rng)
+        current = greedy_seed(pb, seed_ctx)
+        current_score = _score_schedule(current)
         best = current
         best_score = current_score
-        best_debug_stats = dict(current_debug_stats) if current_debug_stats else None
         initial_plan = _clone_plan(current.plan)
         assignment_slots_total = sum(len(assignments) for assignments in initial_plan.values())
         best_assignment_delta = 0
@@ -340,7 +372,22 @@ def solve_sa(
         restarts = 0
         stalled_steps = 0
         operator_stats: dict[str, dict[str, float]] = {}
+        adaptive = AdaptiveOperatorWeights(registry) if adaptive_operators else None
         run_start = time.perf_counter()
+
+        def _watch_values() -> dict[str, float | int | None]:
+            """Numeric watch counters; formatting is deferred to the watch consumer."""
+
+            return {
+                "greedy_objective": float(initial_score),
+                "obj_delta_vs_initial": float(best_score - initial_score),
+                "assignment_delta_slots": best_assignment_delta,
+                "milp_objective": milp_objective,
+                "milp_gap": (
+                    float(best_score - milp_objective) if milp_objective is not None else None
+                ),
+            }
+
         for step in range(1, iters + 1):
             accepted = False
             candidates = generate_neighbors(
@@ -351,46 +398,54 @@ def solve_sa(
                 operator_stats,
                 ctx,
                 batch_size=batch_size,
+                profiler=profiler,
             )
-            evaluations = evaluate_candidates(
+            evaluations = iter_candidate_scores(
                 pb,
                 candidates,
                 ctx,
-                max_workers=max_workers if batch_size and batch_size > 1 else None,
+                executor=executor,
+                lookahead=workers_total or 1,
                 limit_repairs_to_dirty=local_repairs,
+                capture_watch=capture_watch,
+                profiler=profiler,
             )
             if workers_total:
-                current_workers_busy = min(workers_total, len(evaluations)) if evaluations else 0
+                current_workers_busy = min(workers_total, len(candidates))
+            scored_at = time.perf_counter()
             for neighbor, neighbor_score in evaluations:
                 proposals += 1
                 delta = neighbor_score - current_score
+                if adaptive is not None:
+                    now = time.perf_counter()
+                    adaptive.credit(neighbor.operator, delta, now - scored_at)
+                    scored_at = now
                 if delta >= 0 or rng.random() < math.exp(delta / max(temperature, 1e-6)):
                     current = neighbor
                     current_score = neighbor_score
                     accepted = True
                     accepted_moves += 1
-                    if debug_capture:
-                        current_score, current_debug_stats = _score_schedule(current, capture=True)
-                    else:
-                        current_debug_stats = None
                     break
+            evaluations.close()
+            if adaptive is not None:
+                adaptive.update(operator_stats)
             if current_score > best_score:
                 best, best_score = current, current_score
-                best_debug_stats = dict(current_debug_stats) if current_debug_stats else None
                 best_assignment_delta = _assignment_delta(initial_plan, best.plan)
             temperature = max(temperature * cooling_rate, 1e-6)
             if run_logger and telemetry_logger and telemetry_logger.step_interval:
                 if step == 1 or step == iters or (step % telemetry_logger.step_interval == 0):
                     acceptance_rate_log = (accepted_moves / proposals) if proposals else 0.0
-                    run_logger.log_step(
-                        step=step,
-                        objective=float(current_score),
-                        best_objective=float(best_score),
-                        temperature=float(temperature),
-                        acceptance_rate=acceptance_rate_log,
-                        proposals=proposals,
-                        accepted_moves=accepted_moves,
-                    )
+                    with profiler.phase("telemetry") if profiler is not None else nullcontext():
+                        run_logger.log_step(
+                            step=step,
+                            objective=float(current_score),
+                            best_objective=float(best_score),
+                            temperature=float(temperature),
+                            acceptance_rate=acceptance_rate_log,
+                            proposals=proposals,
+                            accepted_moves=accepted_moves,
+                        )
             if accepted:
                 stalled_steps = 0
             else:
@@ -407,8 +462,9 @@ def solve_sa(
                     shake_boosted = False
 
             if stalled_steps >= restart_interval_value:
-                current = init_greedy_schedule(pb, ctx)
-                current_score, current_debug_stats = _score_schedule(current)
+                restart_pool.record(best, best_score)
+                current = restart_pool.draw()
+                current_score = _score_schedule(current)
                 restarts += 1
                 stalled_steps = 0
                 temperature = temperature0
@@ -417,6 +473,7 @@ def solve_sa(
             acceptance_window.append(1 if accepted else 0)
 
             if watch_sink and (step == 1 or step == iters or (step % watch_interval_value == 0)):
+                watch_started = time.perf_counter()
                 acceptance_rate_watch = (accepted_moves / proposals) if proposals else None
                 rolling_mean = (
                     float(sum(rolling_scores) / len(rolling_scores))
@@ -432,17 +489,6 @@ def solve_sa(
                     float(best_score - last_watch_best) if last_watch_best is not None else 0.0
                 )
                 last_watch_best = float(best_score)
-                metadata = dict(watch_meta)
-                if debug_capture:
-                    metadata.update(build_watch_metadata_from_debug(current_debug_stats))
-                elif getattr(current, "watch_stats", None):
-                    metadata.update(build_watch_metadata_from_debug(current.watch_stats))
-                metadata.setdefault("greedy_objective", f"{initial_score:.3f}")
-                metadata.setdefault("obj_delta_vs_initial", f"{best_score - initial_score:.3f}")
-                metadata.setdefault("assignment_delta_slots", str(best_assignment_delta))
-                if milp_objective is not None:
-                    metadata["milp_objective"] = f"{milp_objective:.3f}"
-                    metadata["milp_gap"] = f"{best_score - milp_objective:.3f}"
                 watch_sink(
                     Snapshot(
                         scenario=watch_scenario,
@@ -461,22 +507,26 @@ def solve_sa(
                         temperature=float(temperature),
                         acceptance_rate_window=window_acceptance,
                         delta_objective=delta_objective,
-                        metadata=metadata,
+                        evaluations=proposals,
+                        metadata=dict(watch_meta),
+                        metadata_factory=deferred_watch_metadata(
+                            current.watch_stats,
+                            _watch_values(),
+                            sequencing=debug_capture,
+                            profiler=profiler,
+                        ),
                     )
                 )
+                if profiler is not None:
+                    profiler.add("watch", time.perf_counter() - watch_started)
+
+        profile_artifacts = profile_report.stop() if profile_report is not None else []
 
         # Re-score the best schedule with a full repair pass for final reporting.
         if local_repairs:
-            if debug_capture:
-                best_score, best_debug_stats = evaluate_schedule_with_debug(
-                    pb,
-                    best,
-                    ctx,
-                    capture_debug=True,
-                    limit_repairs_to_dirty=False,
-                )
-            else:
-                best_score = evaluate_schedule(pb, best, ctx, limit_repairs_to_dirty=False)
+            best_score = evaluate_schedule(
+                pb, best, ctx, limit_repairs_to_dirty=False, capture_watch=capture_watch
+            )
             current_score = evaluate_schedule(pb, current, ctx, limit_repairs_to_dirty=False)
 
         rows: list[dict[str, str | int]] = []
@@ -512,17 +562,6 @@ def solve_sa(
                 float(best_score - last_watch_best) if last_watch_best is not None else 0.0
             )
             last_watch_best = float(best_score)
-            metadata = dict(watch_meta)
-            if debug_capture:
-                metadata.update(build_watch_metadata_from_debug(best_debug_stats))
-            elif getattr(best, "watch_stats", None):
-                metadata.update(build_watch_metadata_from_debug(best.watch_stats))
-            metadata.setdefault("greedy_objective", f"{initial_score:.3f}")
-            metadata.setdefault("obj_delta_vs_initial", f"{best_score - initial_score:.3f}")
-            metadata.setdefault("assignment_delta_slots", str(best_assignment_delta))
-            if milp_objective is not None:
-                metadata["milp_objective"] = f"{milp_objective:.3f}"
-                metadata["milp_gap"] = f"{best_score - milp_objective:.3f}"
             watch_sink(
                 Snapshot(
                     scenario=watch_scenario,
@@ -541,7 +580,14 @@ def solve_sa(
                     temperature=float(temperature),
                     acceptance_rate_window=window_acceptance,
                     delta_objective=delta_objective,
-                    metadata=metadata,
+                    evaluations=proposals,
+                    metadata=dict(watch_meta),
+                    metadata_factory=deferred_watch_metadata(
+                        best.watch_stats,
+                        _watch_values(),
+                        sequencing=debug_capture,
+                        profiler=profiler,
+                    ),
                 )
             )
         if shake_boosted and shake_threshold is not None:
@@ -592,6 +638,12 @@ def solve_sa(
                 }
                 for name, stats in operator_stats.items()
             }
+        if adaptive is not None:
+            meta["operators_adaptive"] = adaptive.state()
+        if profiler is not None:
+            meta["phase_timings"] = profiler.summary()
+        if profile_artifacts:
+            meta["profile_artifacts"] = profile_artifacts
         kpi_result = compute_kpis(pb, assignments)
         kpi_totals = kpi_result.to_dict()
         meta["kpi_totals"] = {
@@ -633,7 +685,14 @@ def solve_sa(
                     "temperature0": float(temperature0),
                     "operators": registry.weights(),
                     "assignment_delta_slots": int(best_assignment_delta),
+                    **(
+                        {"operators_adaptive": meta["operators_adaptive"]}
+                        if adaptive is not None
+                        else {}
+                    ),
+                    **({"phase_timings": meta["phase_timings"]} if profiler is not None else {}),
                 },
+                artifacts=profile_artifacts or None,
                 kpis=kpi_totals,
                 tuner_meta=tuner_meta,
             )
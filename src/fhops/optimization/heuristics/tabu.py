@@ -5,7 +5,8 @@ from __future__ import annotations
 import random as _random
 import time
 from collections import deque
-from contextlib import nullcontext
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -14,22 +15,23 @@ import pandas as pd
 
 from fhops.evaluation import compute_kpis
 from fhops.optimization.heuristics.common import (
+    RestartPool,
     Schedule,
-    build_watch_metadata_from_debug,
+    deferred_watch_metadata,
     evaluate_candidates,
     evaluate_schedule,
-    evaluate_schedule_with_debug,
     generate_neighbors,
-    init_greedy_schedule,
+    greedy_seed,
     resolve_objective_weight_overrides,
 )
 from fhops.optimization.heuristics.registry import OperatorRegistry
 from fhops.optimization.operational_problem import (
-    build_operational_problem,
+    OperationalProblem,
+    get_operational_problem,
     override_objective_weights,
 )
 from fhops.scenario.contract import Problem
-from fhops.telemetry import RunTelemetryLogger
+from fhops.telemetry import CProfileReport, PhaseProfiler, RunTelemetryLogger
 from fhops.telemetry.watch import Snapshot, SnapshotSink
 
 TABU_DEFAULT_OPERATOR_WEIGHTS: dict[str, float] = {
@@ -53,7 +55,11 @@ def _diff_moves(
     current_plan: dict[str, dict[tuple[int, str], str | None]],
     candidate_plan: dict[str, dict[tuple[int, str], str | None]],
 ) -> tuple[tuple[str, int, str, str | None, str | None], ...]:
-    """Return a canonical list of move tuples describing differences between two plans."""
+    """Return a canonical list of move tuples describing differences between two plans.
+
+    Only used for neighbours without a ``Schedule.move`` descriptor (custom operators that build
+    schedules directly); built-in operators record their move when proposing it.
+    """
     moves: list[tuple[str, int, str, str | None, str | None]] = []
     for machine_id, assignments in candidate_plan.items():
         current_assignments = current_plan.get(machine_id, {})
@@ -64,6 +70,110 @@ def _diff_moves(
     return tuple(sorted(moves))
 
 
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value: int) -> int:
+    """Return the SplitMix64 finaliser of ``value`` (the Zobrist key of an encoded attribute)."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class TabuMemory:
+    """Attribute-level tabu memory with Zobrist solution hashes.
+
+    A move attribute is one ``(machine, shift, block)`` assignment encoded as a single integer.
+    Accepting a move makes the assignments it removed tabu for ``tenure`` iterations (so the move
+    cannot be undone straight away) and records the new solution's hash for the same period, so
+    neighbours that lead back to a recently visited solution are rejected as well. Checks cost
+    O(move size); expired entries are purged every ``tenure`` iterations.
+    """
+
+    def __init__(self, ctx: OperationalProblem, tenure: int) -> None:
+        self.tenure = max(1, tenure)
+        self._machine_index = ctx.machine_index
+        self._shift_index = ctx.shift_index
+        self._block_index = ctx.block_index
+        self._shift_count = len(ctx.shift_keys)
+        self._block_codes = len(ctx.block_index) + 1
+        self._attribute_expiry: dict[int, int] = {}
+        self._hash_expiry: dict[int, int] = {}
+        self._next_purge = self.tenure
+
+    def attribute(self, machine_id: str, day: int, shift_id: str, block_id: str | None) -> int:
+        """Encode an assignment as ``(machine * shifts + shift) * (blocks + 1) + block``."""
+        slot = (
+            self._machine_index[machine_id] * self._shift_count + self._shift_index[(day, shift_id)]
+        )
+        block_code = 0 if block_id is None else self._block_index[block_id] + 1
+        return slot * self._block_codes + block_code
+
+    def solution_hash(self, schedule: Schedule) -> int:
+        """Return the Zobrist hash of every non-idle assignment in ``schedule``."""
+        value = 0
+        for machine_id, assignments in schedule.plan.items():
+            for (day, shift_id), block_id in assignments.items():
+                if block_id is not None:
+                    value ^= _mix64(self.attribute(machine_id, day, shift_id, block_id))
+        return value
+
+    def updated_hash(self, base_hash: int, parent: Schedule, schedule: Schedule) -> int:
+        """Return the hash of ``schedule`` given ``base_hash``, the hash of ``parent``.
+
+        Only ``schedule.changed_slots`` (the move, its sanitisation and any repairs) are rehashed;
+        schedules without that record are hashed in full.
+        """
+        slots = schedule.changed_slots
+        if slots is None:
+            return self.solution_hash(schedule)
+        value = base_hash
+        for machine_id, day, shift_id in slots:
+            key = (day, shift_id)
+            old_block = parent.plan.get(machine_id, {}).get(key)
+            new_block = schedule.plan.get(machine_id, {}).get(key)
+            if old_block == new_block:
+                continue
+            if old_block is not None:
+                value ^= _mix64(self.attribute(machine_id, day, shift_id, old_block))
+            if new_block is not None:
+                value ^= _mix64(self.attribute(machine_id, day, shift_id, new_block))
+        return value
+
+    def is_tabu_move(self, move: Iterable[Sequence[Any]], step: int) -> bool:
+        """Return whether ``move`` restores an assignment that is still tabu at ``step``."""
+        expiry = self._attribute_expiry
+        for machine_id, day, shift_id, _, new_block in move:
+            if expiry.get(self.attribute(machine_id, day, shift_id, new_block), 0) > step:
+                return True
+        return False
+
+    def was_visited(self, solution_hash: int, step: int) -> bool:
+        """Return whether the solution hashed as ``solution_hash`` was reached within tenure."""
+        return self._hash_expiry.get(solution_hash, 0) > step
+
+    def record(self, move: Iterable[Sequence[Any]], solution_hash: int, step: int) -> None:
+        """Make the assignments removed by ``move`` and the reached solution tabu until expiry."""
+        until = step + self.tenure
+        expiry = self._attribute_expiry
+        for machine_id, day, shift_id, old_block, _ in move:
+            expiry[self.attribute(machine_id, day, shift_id, old_block)] = until
+        self._hash_expiry[solution_hash] = until
+        if step >= self._next_purge:
+            self._attribute_expiry = {key: end for key, end in expiry.items() if end > step}
+            self._hash_expiry = {key: end for key, end in self._hash_expiry.items() if end > step}
+            self._next_purge = step + self.tenure
+
+    def clear(self) -> None:
+        """Forget every tabu attribute and visited solution."""
+        self._attribute_expiry.clear()
+        self._hash_expiry.clear()
+
+    def __len__(self) -> int:
+        return len(self._attribute_expiry)
+
+
 def solve_tabu(
     pb: Problem,
     *,
@@ -84,6 +194,8 @@ def solve_tabu(
     use_local_repairs: bool = False,
     objective_weight_overrides: dict[str, float] | None = None,
     milp_objective: float | None = None,
+    phase_timings: bool = False,
+    profile_out: str | Path | None = None,
 ) -> dict[str, Any]:
     """Run Tabu Search using the shared operator registry.
 
@@ -104,9 +216,10 @@ def solve_tabu(
     max_workers : int | None
         Worker threads for evaluating batched neighbours (``None`` keeps sequential evaluation).
     tabu_tenure : int | None
-        Explicit tenure length. ``None`` auto-sizes the tabu queue based on machine count.
+        Iterations a removed assignment stays tabu. ``None`` auto-sizes it from the machine count.
     stall_limit : int, default=1_000_000
-        Max consecutive non-improving iterations before giving up.
+        Consecutive non-improving iterations before restarting from the restart pool (greedy seed
+        variants and the best schedules seen so far).
     telemetry_log : str | pathlib.Path | None
         Optional telemetry JSONL path for recording solver progress and metrics.
     telemetry_context : dict[str, Any] | None
@@ -118,7 +231,8 @@ def solve_tabu(
     watch_metadata : dict[str, str] | None
         Metadata merged into each snapshot (scenario/solver labels, run IDs, etc.).
     watch_debug : bool, default=False
-        When ``True`` include sequencing debug metadata in watch output (adds evaluation overhead).
+        When ``True`` include sequencing diagnostics in watch snapshots. The counters come from
+        the scoring pass itself, so this no longer triggers extra evaluations.
     use_local_repairs : bool, default=False
         Enable dirty-slot repairs while scoring neighbours. The final plan is always re-evaluated
         with a full repair before reporting.
@@ -129,6 +243,12 @@ def solve_tabu(
     milp_objective : float | None, optional
         Reference MILP objective for reporting the current gap (best - MILP) in watch telemetry and
         result metadata. ``None`` skips gap reporting.
+    phase_timings : bool, default=False
+        Accumulate per-phase seconds and call counts (see :func:`solve_sa`); reported in
+        ``meta["phase_timings"]``, the telemetry run record, and snapshot metadata.
+    profile_out : str | pathlib.Path | None, optional
+        Run the search loop under :mod:`cProfile` and write the stats (plus ``<path>.txt``) here.
+        Implies ``phase_timings``; paths are listed in ``meta["profile_artifacts"]``.
 
     Returns
     -------
@@ -181,6 +301,9 @@ def solve_tabu(
         config_snapshot["milp_objective"] = float(milp_objective)
     if resolved_weight_overrides:
         config_snapshot["objective_weight_overrides"] = resolved_weight_overrides
+    profiler = PhaseProfiler() if phase_timings or profile_out else None
+    if profiler is not None:
+        config_snapshot["phase_timings"] = True
     context_payload = dict(telemetry_context or {})
     scenario = pb.scenario
     timeline = getattr(scenario, "timeline", None)
@@ -226,48 +349,46 @@ def solve_tabu(
     last_watch_best: float | None = None
     last_emitted_step: int | None = None
 
-    ctx = build_operational_problem(pb)
+    seed_ctx = ctx = get_operational_problem(pb)
     if resolved_weight_overrides:
         ctx = override_objective_weights(ctx, resolved_weight_overrides)
     debug_capture = bool(watch_debug and watch_sink)
+    capture_watch = bool(watch_sink)
     local_repairs = bool(use_local_repairs)
     objective_weights_snapshot = ctx.bundle.objective_weights.model_dump()
 
-    def _score_schedule(
-        schedule: Schedule,
-        *,
-        capture: bool | None = None,
-    ) -> tuple[float, dict[str, Any] | None]:
-        flag = debug_capture if capture is None else capture
-        if flag:
-            return evaluate_schedule_with_debug(
-                pb,
-                schedule,
-                ctx,
-                capture_debug=True,
-                limit_repairs_to_dirty=True,
-            )
-        return evaluate_schedule(pb, schedule, ctx, limit_repairs_to_dirty=True), None
+    def _score_schedule(schedule: Schedule) -> float:
+        return evaluate_schedule(
+            pb,
+            schedule,
+            ctx,
+            limit_repairs_to_dirty=True,
+            capture_watch=capture_watch,
+            profiler=profiler,
+        )
 
-    with telemetry_logger if telemetry_logger else nullcontext() as run_logger:
-        current = init_greedy_schedule(pb, ctx)
-        current_score, current_debug_stats = _score_schedule(current)
+    with ExitStack() as stack:
+        run_logger = stack.enter_context(telemetry_logger if telemetry_logger else nullcontext())
+        profile_report = (
+            stack.enter_context(CProfileReport(profile_out)) if profile_out is not None else None
+        )
+        restart_pool = RestartPool(pb, seed_ctx, rng)
+        current = greedy_seed(pb, seed_ctx)
+        current_score = _score_schedule(current)
         initial_score = current_score
         best = current
         best_score = current_score
-        best_debug_stats = dict(current_debug_stats) if current_debug_stats else None
         rolling_scores.append(float(current_score))
 
         tenure = tabu_tenure if tabu_tenure is not None else max(10, len(pb.scenario.machines))
-        tabu_queue: deque[tuple[tuple[str, int, str, str | None, str | None], ...]] = deque(
-            maxlen=tenure
-        )
-        tabu_set: set[tuple[tuple[str, int, str, str | None, str | None], ...]] = set()
+        memory = TabuMemory(ctx, tenure)
+        current_hash = memory.solution_hash(current)
 
         batch_arg = batch_size if batch_size and batch_size > 0 else None
         worker_arg = max_workers if max_workers and max_workers > 1 else None
 
         proposals = 0
+        evaluated = 0
         improvements = 0
         stalls = 0
         restarts = 0
@@ -280,6 +401,7 @@ def solve_tabu(
             nonlocal last_watch_best, last_emitted_step
             if not watch_sink:
                 return
+            watch_started = time.perf_counter()
             rolling_mean = (
                 float(sum(rolling_scores) / len(rolling_scores))
                 if rolling_scores
@@ -296,19 +418,14 @@ def solve_tabu(
             )
             last_watch_best = float(best_score)
             last_emitted_step = iteration
-            metadata = {
-                **watch_meta,
-                "iterations_since_improvement": str(stalls),
-                "tabu_tenure": str(tenure),
-                "restarts": str(restarts),
+            values: dict[str, float | int | None] = {
+                "iterations_since_improvement": stalls,
+                "tabu_tenure": tenure,
+                "restarts": restarts,
             }
-            if debug_capture:
-                metadata.update(build_watch_metadata_from_debug(current_debug_stats))
-            elif getattr(current, "watch_stats", None):
-                metadata.update(build_watch_metadata_from_debug(current.watch_stats))
             if milp_objective is not None:
-                metadata["milp_objective"] = f"{milp_objective:.3f}"
-                metadata["milp_gap"] = f"{best_score - milp_objective:.3f}"
+                values["milp_objective"] = float(milp_objective)
+                values["milp_gap"] = float(best_score - milp_objective)
             watch_sink(
                 Snapshot(
                     scenario=watch_scenario,
@@ -327,9 +444,18 @@ def solve_tabu(
                     temperature=None,
                     acceptance_rate_window=window_acceptance,
                     delta_objective=delta_objective,
-                    metadata=metadata,
+                    evaluations=evaluated,
+                    metadata=dict(watch_meta),
+                    metadata_factory=deferred_watch_metadata(
+                        current.watch_stats,
+                        values,
+                        sequencing=debug_capture,
+                        profiler=profiler,
+                    ),
                 )
             )
+            if profiler is not None:
+                profiler.add("watch", time.perf_counter() - watch_started)
 
         last_iteration = 0
         for step in range(1, iters + 1):
@@ -341,6 +467,7 @@ def solve_tabu(
                 operator_stats,
                 ctx,
                 batch_size=batch_arg,
+                profiler=profiler,
             )
             evaluations = evaluate_candidates(
                 pb,
@@ -348,9 +475,12 @@ def solve_tabu(
                 ctx,
                 worker_arg,
                 limit_repairs_to_dirty=local_repairs,
+                capture_watch=capture_watch,
+                profiler=profiler,
             )
             if not evaluations:
                 break
+            evaluated += len(evaluations)
             if workers_total:
                 current_workers_busy = min(workers_total, len(evaluations)) if evaluations else 0
 
@@ -358,50 +488,39 @@ def solve_tabu(
             fallback_candidate_tuple: tuple[Any, ...] | None = None
             for candidate, score in sorted(evaluations, key=lambda item: item[1], reverse=True):
                 proposals += 1
-                move_sig = _diff_moves(current.plan, candidate.plan)
-                is_tabu = move_sig in tabu_set
+                move_sig = (
+                    candidate.move
+                    if candidate.move is not None
+                    else _diff_moves(current.plan, candidate.plan)
+                )
+                candidate_hash = memory.updated_hash(current_hash, current, candidate)
+                # A candidate the sanitizer reduced to ``current`` stays put rather than cycling.
+                is_tabu = memory.is_tabu_move(move_sig, step) or (
+                    candidate_hash != current_hash and memory.was_visited(candidate_hash, step)
+                )
                 aspiration = score > best_score
                 if not is_tabu or aspiration:
-                    best_candidate_tuple = (candidate, score, move_sig)
+                    best_candidate_tuple = (candidate, score, move_sig, candidate_hash)
                     break
                 if fallback_candidate_tuple is None:
-                    fallback_candidate_tuple = (candidate, score, move_sig)
+                    fallback_candidate_tuple = (candidate, score, move_sig, candidate_hash)
 
             if best_candidate_tuple is None:
                 if fallback_candidate_tuple is None:
                     break
-                # Forced diversification: relax tabu constraint by expiring the oldest entry.
-                if len(tabu_queue) >= tenure:
-                    expired = tabu_queue.popleft()
-                    tabu_set.discard(expired)
+                # Forced diversification: every neighbour is tabu, so take the best one anyway.
                 best_candidate_tuple = fallback_candidate_tuple
 
-            candidate, score, move_sig = best_candidate_tuple
+            candidate, score, move_sig, current_hash = best_candidate_tuple
             current = candidate
             current_score = score
-            if debug_capture:
-                current_score, current_debug_stats = _score_schedule(current, capture=True)
-            else:
-                current_debug_stats = None
             rolling_scores.append(float(current_score))
-
-            if move_sig in tabu_set:
-                tabu_set.discard(move_sig)
-                try:
-                    tabu_queue.remove(move_sig)
-                except ValueError:
-                    pass
-            if len(tabu_queue) >= tenure:
-                expired = tabu_queue.popleft()
-                tabu_set.discard(expired)
-            tabu_queue.append(move_sig)
-            tabu_set.add(move_sig)
+            memory.record(move_sig, current_hash, step)
 
             best_improved = False
             if current_score > best_score:
                 best = current
                 best_score = current_score
-                best_debug_stats = dict(current_debug_stats) if current_debug_stats else None
                 stalls = 0
                 improvements += 1
                 best_improved = True
@@ -413,15 +532,16 @@ def solve_tabu(
             if run_logger and telemetry_logger and telemetry_logger.step_interval:
                 if step == 1 or step == iters or step % telemetry_logger.step_interval == 0:
                     acceptance_rate = (improvements / proposals) if proposals else None
-                    run_logger.log_step(
-                        step=step,
-                        objective=float(current_score),
-                        best_objective=float(best_score),
-                        temperature=None,
-                        acceptance_rate=acceptance_rate,
-                        proposals=proposals,
-                        accepted_moves=improvements,
-                    )
+                    with profiler.phase("telemetry") if profiler is not None else nullcontext():
+                        run_logger.log_step(
+                            step=step,
+                            objective=float(current_score),
+                            best_objective=float(best_score),
+                            temperature=None,
+                            acceptance_rate=acceptance_rate,
+                            proposals=proposals,
+                            accepted_moves=improvements,
+                        )
 
             if watch_sink and (step == 1 or step == iters or (step % watch_interval_value == 0)):
                 emit_snapshot(step)
@@ -429,41 +549,22 @@ def solve_tabu(
             if stalls >= stall_limit:
                 restarts += 1
                 stalls = 0
-                current = best
-                current_score = best_score
-                current_debug_stats = dict(best_debug_stats) if best_debug_stats else None
-                tabu_queue.clear()
-                tabu_set.clear()
+                restart_pool.record(best, best_score)
+                current = restart_pool.draw()
+                current_score = _score_schedule(current)
+                current_hash = memory.solution_hash(current)
+                memory.clear()
                 continue
 
+        profile_artifacts = profile_report.stop() if profile_report is not None else []
+
         if watch_sink and last_iteration and last_emitted_step != last_iteration:
             emit_snapshot(last_iteration)
 
-        if debug_capture:
-            best_score, best_debug_stats = evaluate_schedule_with_debug(
-                pb,
-                best,
-                ctx,
-                capture_debug=True,
-                limit_repairs_to_dirty=False,
-            )
-        else:
-            best_score = evaluate_schedule(pb, best, ctx, limit_repairs_to_dirty=False)
+        # Re-score with a full repair pass for final reporting.
+        best_score = evaluate_schedule(pb, best, ctx, limit_repairs_to_dirty=False)
         current_score = evaluate_schedule(pb, current, ctx, limit_repairs_to_dirty=False)
 
-        if local_repairs:
-            if debug_capture:
-                best_score, best_debug_stats = evaluate_schedule_with_debug(
-                    pb,
-                    best,
-                    ctx,
-                    capture_debug=True,
-                    limit_repairs_to_dirty=False,
-                )
-            else:
-                best_score = evaluate_schedule(pb, best, ctx, limit_repairs_to_dirty=False)
-            current_score = evaluate_schedule(pb, current, ctx, limit_repairs_to_dirty=False)
-
         rows = []
         for machine_id, plan in best.plan.items():
             for (day, shift_id), block_id in plan.items():
@@ -498,6 +599,10 @@ def solve_tabu(
         meta["objective_weights"] = objective_weights_snapshot
         if operator_stats:
             meta["operators_stats"] = operator_stats
+        if profiler is not None:
+            meta["phase_timings"] = profiler.summary()
+        if profile_artifacts:
+            meta["profile_artifacts"] = profile_artifacts
 
         kpi_result = compute_kpis(pb, assignments)
         kpi_totals = kpi_result.to_dict()
@@ -537,7 +642,9 @@ def solve_tabu(
                     "improvements": improvements,
                     "stall_limit": stall_limit,
                     "tabu_tenure": tenure,
+                    **({"phase_timings": meta["phase_timings"]} if profiler is not None else {}),
                 },
+                artifacts=profile_artifacts or None,
                 kpis=kpi_totals,
                 tuner_meta=tuner_meta,
             )
@@ -549,4 +656,4 @@ def solve_tabu(
     return {"objective": float(best_score), "assignments": assignments, "meta": meta}
 
 
-__all__ = ["solve_tabu", "TabuConfig"]
+__all__ = ["solve_tabu", "TabuConfig", "TabuMemory"]
@@ -6,15 +6,20 @@ from collections import defaultdict
 
 import pyomo.environ as pyo
 
-from fhops.optimization.mip.constraints.system_sequencing import apply_system_sequencing_constraints
+from fhops.optimization.mip.constraints.system_sequencing import (
+    SequencingFormulation,
+    apply_system_sequencing_constraints,
+)
 from fhops.optimization.operational_problem import build_operational_problem
 from fhops.scenario.contract import Problem
-from fhops.scheduling.mobilisation import MachineMobilisation, build_distance_lookup
+from fhops.scheduling.mobilisation import MachineMobilisation
 
 __all__ = ["build_model"]
 
 
-def build_model(pb: Problem) -> pyo.ConcreteModel:
+def build_model(
+    pb: Problem, *, sequencing_formulation: SequencingFormulation = "prefix"
+) -> pyo.ConcreteModel:
     """Build the core FHOPS MIP model.
 
     Parameters
@@ -23,6 +28,11 @@ def build_model(pb: Problem) -> pyo.ConcreteModel:
         :class:`fhops.scenario.contract.Problem` produced by ``Problem.from_scenario``.  The helper
         must include the full shift list (``pb.shifts``) so the model can build the `(machine, block,
         day, shift)` assignment tensor.
+    sequencing_formulation:
+        ``"prefix"`` (default) sums production over every earlier shift inside each harvest-system
+        precedence row; ``"cumulative"`` introduces per-(block, role, shift) running totals so the
+        precedence family grows linearly with the horizon. Both give the same optimal objective; see
+        :func:`fhops.optimization.mip.constraints.system_sequencing.apply_system_sequencing_constraints`.
 
     Returns
     -------
@@ -63,7 +73,8 @@ def build_model(pb: Problem) -> pyo.ConcreteModel:
     mobil_params: dict[str, MachineMobilisation] = {}
     if mobilisation is not None:
         mobil_params = {param.machine_id: param for param in mobilisation.machine_params}
-    distance_lookup = build_distance_lookup(mobilisation)
+    distance_matrix = system_ctx.distance_matrix
+    block_index = system_ctx.block_index
 
     availability = {(c.machine_id, c.day): int(c.available) for c in sc.calendar}
     shift_availability = (
@@ -176,7 +187,7 @@ def build_model(pb: Problem) -> pyo.ConcreteModel:
             params = mobil_params.get(mach)
             if params is None or prev_blk == curr_blk:
                 return 0.0
-            distance = distance_lookup.get((prev_blk, curr_blk), 0.0)
+            distance = distance_matrix.item(block_index[prev_blk], block_index[curr_blk])
             threshold = params.walk_threshold_m
             cost = params.setup_cost
             if distance <= threshold:
@@ -289,6 +300,7 @@ def build_model(pb: Problem) -> pyo.ConcreteModel:
         shift_tuples,
         system_ctx=system_ctx,
         sequencing_enabled=sequencing_enabled,
+        formulation=sequencing_formulation,
     )
 
     for lock in locked_assignments:
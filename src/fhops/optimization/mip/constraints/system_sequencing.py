@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Literal
 
 import pyomo.environ as pyo
 
@@ -12,6 +14,9 @@ from fhops.optimization.operational_problem import (
 )
 from fhops.scenario.contract import Problem
 
+SequencingFormulation = Literal["prefix", "cumulative"]
+SEQUENCING_FORMULATIONS: tuple[SequencingFormulation, ...] = ("prefix", "cumulative")
+
 
 def apply_system_sequencing_constraints(
     model: pyo.ConcreteModel,
@@ -19,9 +24,25 @@ def apply_system_sequencing_constraints(
     shift_sequence: list[tuple[int, str]],
     system_ctx: OperationalProblem | None = None,
     sequencing_enabled: bool = True,
+    formulation: SequencingFormulation = "prefix",
 ) -> None:
-    """Attach role filters and precedence constraints derived from harvest systems."""
-
+    """Attach role filters and precedence constraints derived from harvest systems.
+
+    ``formulation`` selects how cumulative role output enters the precedence rows:
+
+    * ``"prefix"`` re-sums ``prod``/``x`` over every earlier shift in each row, so non-zeros grow
+      quadratically with the number of shifts.
+    * ``"cumulative"`` adds ``seq_cum_prod[block, role, shift]`` (and ``seq_cum_assign`` for
+      head-start rows) linked by one recurrence per shift, so each precedence row references a
+      handful of cumulative variables and non-zeros grow linearly. The projection onto ``x``/``prod``
+      is unchanged, so optimal objectives match the prefix form.
+    """
+
+    if formulation not in SEQUENCING_FORMULATIONS:
+        raise ValueError(
+            f"Unknown sequencing formulation '{formulation}'. "
+            f"Supported values: {', '.join(SEQUENCING_FORMULATIONS)}."
+        )
     if not sequencing_enabled:
         return
 
@@ -75,6 +96,81 @@ def apply_system_sequencing_constraints(
     if not prereq_index:
         return
 
+    loader_roles = ctx.loader_roles
+    loader_batches = ctx.loader_batch_volume
+    landing_for_block = ctx.bundle.landing_for_block
+    headstart_buffers = {key: value for key, value in ctx.role_headstarts.items() if value > 0.0}
+
+    landing_blocks: dict[str, list[str]] = defaultdict(list)
+    landing_loader_roles: dict[str, set[str]] = defaultdict(set)
+    landing_loader_upstream: dict[str, set[str]] = defaultdict(set)
+    block_loader_roles: dict[str, set[str]] = defaultdict(set)
+    block_loader_upstream: dict[str, set[str]] = defaultdict(set)
+
+    for blk, landing_id in landing_for_block.items():
+        if landing_id is not None:
+            landing_blocks[landing_id].append(blk)
+    for blk, role in loader_roles:
+        landing_id_for_block = landing_for_block.get(blk)
+        if not landing_id_for_block:
+            continue
+        landing_loader_roles[landing_id_for_block].add(role)
+        prereqs = prereq_roles.get((blk, role))
+        if prereqs:
+            landing_loader_upstream[landing_id_for_block].update(prereqs)
+            block_loader_upstream[blk].update(prereqs)
+        block_loader_roles[blk].add(role)
+
+    shift_position = {shift: idx for idx, shift in enumerate(ordered_shifts)}
+    cumulative = formulation == "cumulative"
+    if cumulative:
+        prod_pairs: set[tuple[str, str]] = set()
+        for blk, role, prereq in prereq_index:
+            prod_pairs.update({(blk, role), (blk, prereq)})
+        for landing_id, role_set in landing_loader_roles.items():
+            landing_roles = role_set | landing_loader_upstream.get(landing_id, set())
+            prod_pairs.update(
+                (blk, role) for blk in landing_blocks.get(landing_id, []) for role in landing_roles
+            )
+        assign_pairs = {
+            (blk, role_key)
+            for (blk, role), buffer in headstart_buffers.items()
+            for role_key in (role, *prereq_roles.get((blk, role), ()))
+        }
+        _add_cumulative_variables(
+            model, "seq_cum_prod", "prod", sorted(prod_pairs), ordered_shifts, machines_by_role
+        )
+        _add_cumulative_variables(
+            model, "seq_cum_assign", "x", sorted(assign_pairs), ordered_shifts, machines_by_role
+        )
+
+    def output_through(mdl, blk: str, roles: Iterable[str], position: int) -> Any:
+        """Production of ``roles`` on ``blk`` over shifts ``0..position`` (0 when negative)."""
+
+        if position < 0:
+            return 0.0
+        if cumulative:
+            shift_key = ordered_shifts[position]
+            return sum(mdl.seq_cum_prod[blk, role, shift_key] for role in roles)
+        upto = ordered_shifts[: position + 1]
+        return sum(
+            mdl.prod[mach, blk, s]
+            for role in roles
+            for mach in machines_by_role.get(role, [])
+            for s in upto
+        )
+
+    def assignments_through(mdl, blk: str, role: str, position: int) -> Any:
+        """Assignments of ``role`` to ``blk`` over shifts ``0..position``."""
+
+        if cumulative:
+            return mdl.seq_cum_assign[blk, role, ordered_shifts[position]]
+        return sum(
+            mdl.x[mach, blk, s]
+            for mach in machines_by_role.get(role, [])
+            for s in ordered_shifts[: position + 1]
+        )
+
     model.system_sequencing_index = pyo.Set(initialize=prereq_index, dimen=3)
 
     def sequencing_rule(mdl, blk, role, prereq, day, shift_id):
@@ -83,6 +179,13 @@ def apply_system_sequencing_constraints(
         if not machines_role or not prereq_machines:
             return pyo.Constraint.Skip
         shift_key = (day, shift_id)
+        if cumulative:
+            position = shift_position.get(shift_key)
+            if position is None:
+                return pyo.Constraint.Skip
+            return output_through(mdl, blk, (role,), position) <= output_through(
+                mdl, blk, (prereq,), position - 1
+            )
         lhs = sum(
             mdl.prod[mach, blk, s]
             for mach in machines_role
@@ -99,9 +202,6 @@ def apply_system_sequencing_constraints(
         model.system_sequencing_index, model.S, rule=sequencing_rule
     )
 
-    loader_roles = ctx.loader_roles
-    loader_batches = ctx.loader_batch_volume
-    landing_for_block = ctx.bundle.landing_for_block
     loader_index = [
         (blk, role, prereq)
         for (blk, role), prereqs in prereq_roles.items()
@@ -117,6 +217,15 @@ def apply_system_sequencing_constraints(
             if not machines_role or not prereq_machines:
                 return pyo.Constraint.Skip
             shift_key = (day, shift_id)
+            buffer = loader_batches.get(blk, 0.0)
+            if cumulative:
+                position = shift_position.get(shift_key)
+                if position is None:
+                    return pyo.Constraint.Skip
+                return (
+                    output_through(mdl, blk, (role,), position)
+                    <= output_through(mdl, blk, (prereq,), position - 1) - buffer
+                )
             lhs = sum(
                 mdl.prod[mach, blk, s]
                 for mach in machines_role
@@ -127,14 +236,12 @@ def apply_system_sequencing_constraints(
                 for mach in prereq_machines
                 for s in shifts_before.get(shift_key, [])
             )
-            buffer = loader_batches.get(blk, 0.0)
             return lhs <= rhs - buffer
 
         model.system_loader_buffer = pyo.Constraint(
             model.system_loader_index, model.S, rule=loader_buffer_rule
         )
 
-    headstart_buffers = {key: value for key, value in ctx.role_headstarts.items() if value > 0.0}
     activation_roles = set(loader_roles) | set(headstart_buffers.keys())
 
     role_active_defined = False
@@ -196,6 +303,15 @@ def apply_system_sequencing_constraints(
             buffer = headstart_buffers.get((blk, role), 0.0)
             if buffer <= 0.0:
                 return pyo.Constraint.Skip
+            if cumulative:
+                position = shift_position.get(shift_key)
+                if position is None:
+                    return pyo.Constraint.Skip
+                if position == 0:
+                    return sum(mdl.x[mach, blk, shift_key] for mach in machines_role) == 0
+                return assignments_through(mdl, blk, role, position - 1) + buffer <= (
+                    assignments_through(mdl, blk, prereq, position - 1)
+                )
             before = shifts_before.get(shift_key, [])
             if not before:
                 return sum(mdl.x[mach, blk, (day, shift_id)] for mach in machines_role) == 0
@@ -223,6 +339,15 @@ def apply_system_sequencing_constraints(
             if not prereq_set:
                 return pyo.Constraint.Skip
             shift_key = (day, shift_id)
+            if cumulative:
+                position = shift_position.get(shift_key)
+                if position is None:
+                    return pyo.Constraint.Skip
+                if position == 0:
+                    return mdl.role_active[blk, role, day, shift_id] == 0
+                return buffer * mdl.role_active[blk, role, day, shift_id] <= output_through(
+                    mdl, blk, prereq_set, position - 1
+                )
             before = shifts_before.get(shift_key, [])
             if not before:
                 return mdl.role_active[blk, role, day, shift_id] == 0
@@ -238,26 +363,6 @@ def apply_system_sequencing_constraints(
             model.loader_activation_index, rule=loader_batch_rule
         )
 
-    landing_blocks: dict[str, list[str]] = defaultdict(list)
-    landing_loader_roles: dict[str, set[str]] = defaultdict(set)
-    landing_loader_upstream: dict[str, set[str]] = defaultdict(set)
-    block_loader_roles: dict[str, set[str]] = defaultdict(set)
-    block_loader_upstream: dict[str, set[str]] = defaultdict(set)
-
-    for blk, landing_id in landing_for_block.items():
-        if landing_id is not None:
-            landing_blocks[landing_id].append(blk)
-    for blk, role in loader_roles:
-        landing_id_for_block = landing_for_block.get(blk)
-        if not landing_id_for_block:
-            continue
-        landing_loader_roles[landing_id_for_block].add(role)
-        prereqs = prereq_roles.get((blk, role))
-        if prereqs:
-            landing_loader_upstream[landing_id_for_block].update(prereqs)
-            block_loader_upstream[blk].update(prereqs)
-        block_loader_roles[blk].add(role)
-
     landing_loader_prereqs: dict[tuple[str, str], set[str]] = {}
     for blk, role in loader_roles:
         landing_id_for_block = landing_for_block.get(blk)
@@ -292,6 +397,17 @@ def apply_system_sequencing_constraints(
             if not loader_machines or not upstream_machines:
                 return pyo.Constraint.Skip
             shift_key = (day, shift_id)
+            if cumulative:
+                position = shift_position.get(shift_key)
+                if position is None:
+                    return pyo.Constraint.Skip
+                lhs = sum(
+                    output_through(mdl, blk, loader_role_set, position) for blk in loader_blocks
+                )
+                rhs = sum(
+                    output_through(mdl, blk, upstream_role_set, position) for blk in loader_blocks
+                )
+                return lhs <= rhs
             upto = shifts_up_to.get(shift_key, [])
             if not upto:
                 return pyo.Constraint.Skip
@@ -343,4 +459,43 @@ def apply_system_sequencing_constraints(
         )
 
 
-__all__ = ["apply_system_sequencing_constraints"]
+def _add_cumulative_variables(
+    model: pyo.ConcreteModel,
+    name: str,
+    source: str,
+    pairs: list[tuple[str, str]],
+    ordered_shifts: list[tuple[int, str]],
+    machines_by_role: dict[str, list[str]],
+) -> None:
+    """Attach ``name[block, role, shift]`` running totals of ``source`` plus their recurrence."""
+
+    if not pairs:
+        return
+    index = pyo.Set(initialize=pairs, dimen=2)
+    model.add_component(f"{name}_index", index)
+    variable = pyo.Var(index, model.S, domain=pyo.NonNegativeReals, initialize=0.0)
+    model.add_component(name, variable)
+    prev_shift = {
+        shift: ordered_shifts[idx - 1] if idx > 0 else None
+        for idx, shift in enumerate(ordered_shifts)
+    }
+
+    def recurrence_rule(mdl, blk, role, day, shift_id):
+        shift_key = (day, shift_id)
+        if shift_key not in prev_shift:
+            return pyo.Constraint.Skip
+        values = getattr(mdl, source)
+        previous = prev_shift[shift_key]
+        carried = variable[blk, role, previous] if previous is not None else 0.0
+        return variable[blk, role, shift_key] == carried + sum(
+            values[mach, blk, shift_key] for mach in machines_by_role.get(role, [])
+        )
+
+    model.add_component(f"{name}_balance", pyo.Constraint(index, model.S, rule=recurrence_rule))
+
+
+__all__ = [
+    "SEQUENCING_FORMULATIONS",
+    "SequencingFormulation",
+    "apply_system_sequencing_constraints",
+]
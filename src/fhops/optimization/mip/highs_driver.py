@@ -8,6 +8,7 @@ import pandas as pd
 import pyomo.environ as pyo
 
 from fhops.optimization.mip.builder import build_model
+from fhops.optimization.mip.constraints.system_sequencing import SequencingFormulation
 from fhops.scenario.contract import Problem
 
 __all__ = ["solve_mip"]
@@ -74,11 +75,19 @@ def _set_appsi_controls(solver, time_limit: int, debug: bool) -> bool:
 
 
 def solve_mip(
-    pb: Problem, time_limit: int = 60, driver: str = "auto", debug: bool = False
+    pb: Problem,
+    time_limit: int = 60,
+    driver: str = "auto",
+    debug: bool = False,
+    *,
+    sequencing_formulation: SequencingFormulation = "prefix",
 ) -> Mapping[str, object]:
-    """Build and solve the FHOPS MIP."""
+    """Build and solve the FHOPS MIP.
+
+    ``sequencing_formulation`` is forwarded to :func:`build_model`.
+    """
     driver_clean = driver.lower()
-    model = build_model(pb)
+    model = build_model(pb, sequencing_formulation=sequencing_formulation)
 
     if driver_clean == "auto":
         try:
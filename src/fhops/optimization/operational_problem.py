@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from dataclasses import replace as dc_replace
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
 
 from fhops.model.milp.data import OperationalMilpBundle, build_operational_bundle
 from fhops.scenario.contract import Problem
-from fhops.scheduling.mobilisation import MachineMobilisation, build_distance_lookup
+from fhops.scheduling.mobilisation import (
+    DistanceMatrix,
+    MachineMobilisation,
+    build_distance_lookup,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - circular import guard
+    from fhops.optimization.heuristics.registry import Move
     from fhops.optimization.heuristics.sa import Schedule
 
     Sanitizer = Callable[[Schedule], Schedule]
+    MoveSanitizer = Callable[[Schedule, Move], Schedule]
 else:  # pragma: no cover - runtime placeholder
 
     class Schedule:  # type: ignore[too-many-ancestors]
         ...
 
     Sanitizer = Callable[[object], object]
+    MoveSanitizer = Callable[[object, object], object]
+
+_T = TypeVar("_T")
 
 
 @dataclass(frozen=True)
@@ -37,6 +49,7 @@ class OperationalProblem:
     locked_assignments: Mapping[tuple[str, int], str]
     mobilisation_params: Mapping[str, MachineMobilisation]
     distance_lookup: Mapping[tuple[str, str], float]
+    distance_matrix: np.ndarray
     blocks_with_explicit_system: frozenset[str]
     role_headstarts: Mapping[tuple[str, str], float]
     loader_batch_volume: Mapping[str, float]
@@ -45,62 +58,172 @@ class OperationalProblem:
     terminal_roles: Mapping[str, frozenset[str]]
     shift_keys: tuple[tuple[int, str], ...]
     shift_index: Mapping[tuple[int, str], int]
+    role_priority: Mapping[str, int]
+    machine_order: tuple[str, ...]
+    machine_index: Mapping[str, int]
+    block_index: Mapping[str, int]
+    rate_matrix: np.ndarray
+    compatible_blocks: np.ndarray
+    blocks_for_machine: Mapping[str, tuple[str, ...]]
+    machines_for_block: Mapping[str, tuple[str, ...]]
+    block_shift_span: Mapping[str, tuple[int, int]]
+    _derived: dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def cached(self, key: str, factory: Callable[[], _T]) -> _T:
+        """Return a derived structure memoised on this context, building it on first use.
+
+        Derived caches are dropped by :func:`override_objective_weights` (``dataclasses.replace``
+        starts with an empty cache), so factories may depend on any context field.
+        """
+
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = factory()
+            return self._derived.setdefault(key, value)
+
+    def _slot_admitter(
+        self,
+    ) -> Callable[
+        [str, str | None, int, str, str | None, dict[tuple[int, str, str], int]], str | None
+    ]:
+        """Return the per-slot sanitizer rule shared by the full and move sanitizers.
+
+        Landing capacity is first-come in machine order, so ``landing_usage`` must be fed the slots
+        of each ``(day, shift)`` in the plan's machine order.
+        """
 
-    def build_sanitizer(self, schedule_cls: type[Schedule]) -> Sanitizer:
-        """Return a schedule sanitizer enforcing locks, availability, and landing caps."""
-
-        bundle = self.bundle
-        machine_roles = bundle.machine_roles
-        allowed_roles = self.allowed_roles
         locked = self.locked_assignments
-        shift_availability = bundle.availability_shift
-        day_availability = bundle.availability_day
+        allowed_roles = self.allowed_roles
+        shift_availability = self.bundle.availability_shift
+        day_availability = self.bundle.availability_day
         blackout = self.blackout_shifts
-        landing_of = bundle.landing_for_block
-        landing_cap = bundle.landing_capacity
+        landing_of = self.bundle.landing_for_block
+        landing_cap = self.bundle.landing_capacity
+
+        def admit(
+            machine_id: str,
+            role: str | None,
+            day: int,
+            shift_id: str,
+            block_id: str | None,
+            landing_usage: dict[tuple[int, str, str], int],
+        ) -> str | None:
+            lock_key = (machine_id, day)
+            if lock_key in locked:
+                return locked[lock_key]
+            if block_id is None:
+                return None
+            allowed = allowed_roles.get(block_id)
+            if (
+                shift_availability.get((machine_id, day, shift_id), 1) == 0
+                or day_availability.get((machine_id, day), 1) == 0
+                or (machine_id, day, shift_id) in blackout
+                or (allowed is not None and role not in allowed)
+            ):
+                return None
+            landing_id = landing_of.get(block_id)
+            if landing_id is not None:
+                cap = landing_cap.get(landing_id, 0)
+                key = (day, shift_id, landing_id)
+                used = landing_usage.get(key, 0)
+                if cap > 0 and used >= cap:
+                    return None
+                landing_usage[key] = used + 1
+            return block_id
+
+        return admit
+
+    def _sanitize_plan(
+        self, plan: Mapping[str, Mapping[tuple[int, str], str | None]]
+    ) -> dict[str, dict[tuple[int, str], str | None]]:
+        admit = self._slot_admitter()
+        machine_roles = self.bundle.machine_roles
+        landing_usage: dict[tuple[int, str, str], int] = {}
+        return {
+            machine_id: {
+                (day, shift_id): admit(
+                    machine_id,
+                    machine_roles.get(machine_id),
+                    day,
+                    shift_id,
+                    block_id,
+                    landing_usage,
+                )
+                for (day, shift_id), block_id in assignments.items()
+            }
+            for machine_id, assignments in plan.items()
+        }
+
+    def build_sanitizer(self, schedule_cls: type[Schedule]) -> Sanitizer:
+        """Return a schedule sanitizer enforcing locks, availability, and landing caps."""
 
         def sanitizer(schedule: Schedule) -> Schedule:
-            landing_usage: dict[tuple[int, str, str], int] = {}
-            plan: dict[str, dict[tuple[int, str], str | None]] = {}
-            for machine_id, assignments in schedule.plan.items():
-                role = machine_roles.get(machine_id)
-                plan[machine_id] = {}
-                for (day, shift_id), block_id in assignments.items():
-                    lock_key = (machine_id, day)
-                    if lock_key in locked:
-                        plan[machine_id][(day, shift_id)] = locked[lock_key]
-                        continue
-                    shift_available = shift_availability.get((machine_id, day, shift_id), 1)
-                    day_available = day_availability.get((machine_id, day), 1)
-                    if block_id is None:
-                        if shift_available == 0 or day_available == 0:
-                            plan[machine_id][(day, shift_id)] = None
-                        else:
-                            plan[machine_id][(day, shift_id)] = None
-                        continue
-                    allowed = allowed_roles.get(block_id)
-                    if (
-                        shift_available == 0
-                        or day_available == 0
-                        or (machine_id, day, shift_id) in blackout
-                        or (allowed is not None and role not in allowed)
-                    ):
-                        plan[machine_id][(day, shift_id)] = None
-                        continue
-                    landing_id = landing_of.get(block_id)
-                    if landing_id is not None:
-                        cap = landing_cap.get(landing_id, 0)
-                        key = (day, shift_id, landing_id)
-                        used = landing_usage.get(key, 0)
-                        if cap > 0 and used >= cap:
-                            plan[machine_id][(day, shift_id)] = None
-                            continue
-                        landing_usage[key] = used + 1
-                    plan[machine_id][(day, shift_id)] = block_id
-            return schedule_cls(plan=plan)
+            return schedule_cls(plan=self._sanitize_plan(schedule.plan))
 
         return sanitizer
 
+    def build_move_sanitizer(self, schedule_cls: type[Schedule]) -> MoveSanitizer:
+        """Return ``(parent, move) -> schedule`` matching ``sanitizer(parent with move applied)``.
+
+        The sanitized parent plan is computed once per parent and copied for each move; only the
+        ``(day, shift)`` columns the move touches are re-sanitized (landing caps couple machines
+        within a shift, but nothing couples different shifts). Moves that add machines or slots the
+        parent lacks fall back to the full sanitizer. The result's ``changed_slots`` lists every
+        slot that may differ from ``parent`` (left ``None`` on the fallback).
+        """
+
+        admit = self._slot_admitter()
+        machine_roles = self.bundle.machine_roles
+        state: dict[str, Any] = {"parent": None, "base": None, "base_changes": set()}
+
+        def move_sanitizer(parent: Schedule, move: Move) -> Schedule:
+            plan = parent.plan
+            overlay = {(change[0], change[1], change[2]): change[4] for change in move}
+            if any(
+                (day, shift_id) not in plan.get(machine_id, ())
+                for machine_id, day, shift_id in overlay
+            ):
+                patched = {
+                    machine_id: dict(assignments) for machine_id, assignments in plan.items()
+                }
+                for (machine_id, day, shift_id), block_id in overlay.items():
+                    patched.setdefault(machine_id, {})[(day, shift_id)] = block_id
+                return schedule_cls(plan=self._sanitize_plan(patched))
+            if state["parent"] is not parent:
+                state["parent"] = parent
+                state["base"] = self._sanitize_plan(plan)
+                state["base_changes"] = {
+                    (machine_id, day, shift_id)
+                    for machine_id, assignments in plan.items()
+                    for (day, shift_id), block_id in assignments.items()
+                    if state["base"][machine_id][(day, shift_id)] != block_id
+                }
+            base: dict[str, dict[tuple[int, str], str | None]] = state["base"]
+            changed_slots: set[tuple[str, int, str]] = set(state["base_changes"])
+            candidate = {machine_id: assignments.copy() for machine_id, assignments in base.items()}
+            landing_usage: dict[tuple[int, str, str], int] = {}
+            for day, shift_id in {(day, shift_id) for _, day, shift_id in overlay}:
+                key = (day, shift_id)
+                for machine_id, assignments in plan.items():
+                    if key not in assignments:
+                        continue
+                    block_id = overlay.get((machine_id, day, shift_id), assignments[key])
+                    admitted = admit(
+                        machine_id,
+                        machine_roles.get(machine_id),
+                        day,
+                        shift_id,
+                        block_id,
+                        landing_usage,
+                    )
+                    candidate[machine_id][key] = admitted
+                    if admitted != assignments[key]:
+                        changed_slots.add((machine_id, day, shift_id))
+            return schedule_cls(plan=candidate, changed_slots=changed_slots)
+
+        return move_sanitizer
+
 
 def build_operational_problem(pb: Problem) -> OperationalProblem:
     """Construct an :class:`OperationalProblem` for the provided :class:`Problem`."""
@@ -127,6 +250,17 @@ def build_operational_problem(pb: Problem) -> OperationalProblem:
         for shift in sorted(pb.shifts, key=lambda s: (s.day, s.shift_id))
     )
     shift_index = {key: idx for idx, key in enumerate(shift_keys)}
+    role_priority = _build_role_priority(bundle)
+    machine_order = tuple(
+        sorted(
+            bundle.machines,
+            key=lambda machine_id: (
+                role_priority.get(bundle.machine_roles.get(machine_id) or "", 999),
+                machine_id,
+            ),
+        )
+    )
+    lookup = _build_rate_tables(bundle)
     return OperationalProblem(
         problem=pb,
         bundle=bundle,
@@ -137,6 +271,7 @@ def build_operational_problem(pb: Problem) -> OperationalProblem:
         locked_assignments=locked,
         mobilisation_params=mobilisation_params,
         distance_lookup=distance_lookup,
+        distance_matrix=_build_distance_matrix(bundle, distance_lookup),
         blocks_with_explicit_system=explicit_blocks,
         role_headstarts=headstarts,
         loader_batch_volume=loader_batch_volume,
@@ -145,9 +280,36 @@ def build_operational_problem(pb: Problem) -> OperationalProblem:
         terminal_roles=terminal_roles,
         shift_keys=shift_keys,
         shift_index=shift_index,
+        role_priority=role_priority,
+        machine_order=machine_order,
+        machine_index=lookup.machine_index,
+        block_index=lookup.block_index,
+        rate_matrix=lookup.rate_matrix,
+        compatible_blocks=lookup.compatible_blocks,
+        blocks_for_machine=lookup.blocks_for_machine,
+        machines_for_block=lookup.machines_for_block,
+        block_shift_span=_build_block_shift_spans(bundle, shift_keys),
     )
 
 
+def get_operational_problem(pb: Problem) -> OperationalProblem:
+    """Return a memoised :class:`OperationalProblem` for ``pb``.
+
+    The context is built on first request and stored on the problem instance, so the heuristic
+    solvers and evaluation helpers called repeatedly on the same problem (multi-start, tuning
+    sweeps, playback, KPIs, ensembles) share one set of lookups. Treat ``pb`` as immutable once it
+    has been passed here; callers needing a private copy should use
+    :func:`build_operational_problem`.
+    """
+
+    ctx = pb._operational_context
+    if isinstance(ctx, OperationalProblem) and ctx.problem is pb:
+        return ctx
+    ctx = build_operational_problem(pb)
+    pb._operational_context = ctx
+    return ctx
+
+
 def override_objective_weights(
     ctx: OperationalProblem,
     overrides: Mapping[str, float],
@@ -242,6 +404,88 @@ def _derive_role_metadata(
     )
 
 
+def _build_distance_matrix(
+    bundle: OperationalMilpBundle, distance_lookup: Mapping[tuple[str, str], float]
+) -> np.ndarray:
+    """Dense distances aligned with ``block_index`` (zero where no distance is recorded)."""
+
+    if not distance_lookup:
+        matrix = np.zeros((len(bundle.blocks), len(bundle.blocks)), dtype=np.float64)
+    else:
+        matrix = DistanceMatrix.from_mapping(distance_lookup).reindex(bundle.blocks).dense()
+    matrix.setflags(write=False)
+    return matrix
+
+
+@dataclass(frozen=True)
+class _RateTables:
+    machine_index: dict[str, int]
+    block_index: dict[str, int]
+    rate_matrix: np.ndarray
+    compatible_blocks: np.ndarray
+    blocks_for_machine: dict[str, tuple[str, ...]]
+    machines_for_block: dict[str, tuple[str, ...]]
+
+
+def _build_rate_tables(bundle: OperationalMilpBundle) -> _RateTables:
+    """Densify production rates into machine × block arrays plus compatibility lists."""
+
+    machine_index = {machine_id: idx for idx, machine_id in enumerate(bundle.machines)}
+    block_index = {block_id: idx for idx, block_id in enumerate(bundle.blocks)}
+    rate_matrix = np.zeros((len(machine_index), len(block_index)), dtype=np.float64)
+    for (machine_id, block_id), rate_value in bundle.production_rates.items():
+        m_idx = machine_index.get(machine_id)
+        b_idx = block_index.get(block_id)
+        if m_idx is None or b_idx is None:
+            continue
+        rate_matrix[m_idx, b_idx] = rate_value
+    compatible = rate_matrix > 0.0
+    compatible.flags.writeable = False
+    rate_matrix.flags.writeable = False
+    blocks_for_machine = {
+        machine_id: tuple(bundle.blocks[idx] for idx in np.flatnonzero(compatible[m_idx]))
+        for machine_id, m_idx in machine_index.items()
+    }
+    machines_for_block = {
+        block_id: tuple(bundle.machines[idx] for idx in np.flatnonzero(compatible[:, b_idx]))
+        for block_id, b_idx in block_index.items()
+    }
+    return _RateTables(
+        machine_index=machine_index,
+        block_index=block_index,
+        rate_matrix=rate_matrix,
+        compatible_blocks=compatible,
+        blocks_for_machine=blocks_for_machine,
+        machines_for_block=machines_for_block,
+    )
+
+
+def _build_block_shift_spans(
+    bundle: OperationalMilpBundle,
+    shift_keys: tuple[tuple[int, str], ...],
+) -> dict[str, tuple[int, int]]:
+    """Map each block to the ``[start, stop)`` slice of ``shift_keys`` inside its window."""
+
+    shift_days = [day for day, _ in shift_keys]
+    spans: dict[str, tuple[int, int]] = {}
+    for block_id, (earliest, latest) in bundle.windows.items():
+        start = bisect_left(shift_days, earliest)
+        stop = bisect_right(shift_days, latest)
+        spans[block_id] = (start, max(start, stop))
+    return spans
+
+
+def _build_role_priority(bundle: OperationalMilpBundle) -> dict[str, int]:
+    priority: dict[str, int] = {}
+    for system in bundle.systems.values():
+        for idx, role_cfg in enumerate(system.roles):
+            role = role_cfg.role
+            if not role:
+                continue
+            priority[role] = min(priority.get(role, idx), idx)
+    return priority
+
+
 def _build_loader_metadata(
     bundle: OperationalMilpBundle,
 ) -> tuple[dict[str, float], frozenset[tuple[str, str]]]:
@@ -0,0 +1,299 @@
+"""Long-lived solver worker pool with per-worker problem caches.
+
+Benchmark sweeps, tuners, and multi-start runs submit many short solves against a handful of
+scenarios. :class:`SolverPool` keeps one set of worker processes alive for the whole sweep and
+sends each job as a lightweight reference — a scenario path, or a token for a :class:`Problem`
+pickled once to a pool-owned temporary file — plus the solver name and keyword arguments. Every
+worker loads a given problem (and its memoised
+:class:`~fhops.optimization.operational_problem.OperationalProblem`) once and reuses it for all
+later jobs, instead of receiving and re-deriving the full problem per task.
+
+With ``max_workers=1`` the pool runs jobs in the calling process (returning completed futures), so
+callers can use one code path for sequential and parallel execution.
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from fhops.scenario.contract import Problem
+
+__all__ = [
+    "DEFAULT_CACHE_SIZE",
+    "SOLVERS",
+    "SolverPool",
+    "shared_solver_pool",
+    "shutdown_shared_solver_pool",
+]
+
+DEFAULT_CACHE_SIZE = 8
+
+#: Solver names accepted by :meth:`SolverPool.submit` (resolved lazily inside the workers).
+SOLVERS: dict[str, str] = {
+    "sa": "fhops.optimization.heuristics.sa:solve_sa",
+    "ils": "fhops.optimization.heuristics.ils:solve_ils",
+    "tabu": "fhops.optimization.heuristics.tabu:solve_tabu",
+}
+
+ProblemSource = Problem | str | Path
+Task = str | Callable[..., Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _ProblemRef:
+    """Picklable handle to a problem: a scenario file or a pickled :class:`Problem`."""
+
+    key: str
+    path: str
+    pickled: bool
+
+
+# Per-process cache (one per worker; the parent uses it for in-process pools).
+_problems: OrderedDict[str, Problem] = OrderedDict()
+_cache_size = DEFAULT_CACHE_SIZE
+
+
+def _init_worker(cache_size: int) -> None:
+    global _cache_size
+    _cache_size = cache_size
+    _problems.clear()
+
+
+def _problem_for(ref: _ProblemRef) -> Problem:
+    problem = _problems.get(ref.key)
+    if problem is not None:
+        _problems.move_to_end(ref.key)
+        return problem
+    if ref.pickled:
+        with open(ref.path, "rb") as handle:
+            problem = pickle.load(handle)
+    else:
+        from fhops.scenario.io import load_scenario
+
+        problem = Problem.from_scenario(load_scenario(ref.path))
+    from fhops.optimization.operational_problem import get_operational_problem
+
+    get_operational_problem(problem)
+    _problems[ref.key] = problem
+    while len(_problems) > _cache_size:
+        _problems.popitem(last=False)
+    return problem
+
+
+def _resolve_task(task: Task) -> Callable[..., Any]:
+    if callable(task):
+        return task
+    spec = SOLVERS.get(task.lower())
+    if spec is None:
+        raise ValueError(f"Unknown solver '{task}'. Options: {', '.join(sorted(SOLVERS))}")
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _run_job(
+    source: _ProblemRef | Problem,
+    task: Task,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    timed: bool,
+) -> Any:
+    func = _resolve_task(task)
+    pb = source if isinstance(source, Problem) else _problem_for(source)
+    start = time.perf_counter()
+    result = func(pb, *args, **kwargs)
+    return (result, time.perf_counter() - start) if timed else result
+
+
+class SolverPool:
+    """Worker processes that cache problems across solve jobs.
+
+    Parameters
+    ----------
+    max_workers:
+        Worker process count (defaults to ``os.cpu_count()``). ``1`` runs jobs in-process.
+    cache_size:
+        Problems each worker keeps loaded (least-recently used are dropped first).
+
+    Jobs are ``task(problem, *args, **kwargs)`` where ``task`` is a name from :data:`SOLVERS` or a
+    picklable module-level callable. Arguments must be picklable when ``max_workers > 1``; stream
+    watch snapshots through :class:`fhops.telemetry.watch.ProcessSnapshotRelay` rather than passing
+    a live watch sink. Scenario paths are keyed by resolved path and modification time, so edits
+    between submissions are picked up.
+    """
+
+    def __init__(self, max_workers: int | None = None, *, cache_size: int = DEFAULT_CACHE_SIZE):
+        if cache_size <= 0:
+            raise ValueError("cache_size must be positive")
+        self.max_workers = max(1, max_workers if max_workers is not None else os.cpu_count() or 1)
+        self.cache_size = cache_size
+        self._executor: ProcessPoolExecutor | None = None
+        self._tmpdir: Path | None = None
+        # id(problem) -> (problem, ref); holding the problem keeps the id stable.
+        self._pickled: OrderedDict[int, tuple[Problem, _ProblemRef]] = OrderedDict()
+        # Pickle path -> queued/running jobs reading it; evicted files wait in ``_retired``
+        # until their last job finishes.
+        self._outstanding: dict[str, int] = {}
+        self._retired: set[str] = set()
+        self._files_lock = threading.Lock()
+        if self.max_workers > 1:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(cache_size,),
+            )
+
+    @property
+    def in_process(self) -> bool:
+        """``True`` when jobs run synchronously in the calling process."""
+
+        return self._executor is None
+
+    def __enter__(self) -> SolverPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def submit(self, problem: ProblemSource, task: Task, /, *args: Any, **kwargs: Any) -> Future:
+        """Schedule ``task(problem, *args, **kwargs)`` and return its future."""
+
+        return self._submit(problem, task, args, kwargs, timed=False)
+
+    def submit_timed(
+        self, problem: ProblemSource, task: Task, /, *args: Any, **kwargs: Any
+    ) -> Future:
+        """Like :meth:`submit`, resolving to ``(result, runtime_seconds)`` measured in the worker."""
+
+        return self._submit(problem, task, args, kwargs, timed=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers and remove pickled problems."""
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+        self._pickled.clear()
+        with self._files_lock:
+            self._outstanding.clear()
+            self._retired.clear()
+
+    def _submit(
+        self,
+        problem: ProblemSource,
+        task: Task,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        *,
+        timed: bool,
+    ) -> Future:
+        if self._executor is None:
+            future: Future = Future()
+            try:
+                source = problem if isinstance(problem, Problem) else self._ref(problem)
+                future.set_result(_run_job(source, task, args, kwargs, timed))
+            except Exception as exc:  # surfaced through the future, as in worker processes
+                future.set_exception(exc)
+            return future
+        ref = self._ref(problem)
+        if not ref.pickled:
+            return self._executor.submit(_run_job, ref, task, args, kwargs, timed)
+        with self._files_lock:
+            self._outstanding[ref.path] = self._outstanding.get(ref.path, 0) + 1
+        future = self._executor.submit(_run_job, ref, task, args, kwargs, timed)
+        future.add_done_callback(lambda _: self._release(ref.path))
+        return future
+
+    def _release(self, path: str) -> None:
+        """Drop one job's hold on a pickle, deleting it if it was evicted and now unused."""
+
+        with self._files_lock:
+            remaining = self._outstanding.get(path, 0) - 1
+            if remaining > 0:
+                self._outstanding[path] = remaining
+                return
+            self._outstanding.pop(path, None)
+            if path not in self._retired:
+                return
+            self._retired.discard(path)
+        Path(path).unlink(missing_ok=True)
+
+    def _ref(self, problem: ProblemSource) -> _ProblemRef:
+        if isinstance(problem, Problem):
+            cached = self._pickled.get(id(problem))
+            if cached is not None:
+                self._pickled.move_to_end(id(problem))
+                return cached[1]
+            if self._tmpdir is None:
+                self._tmpdir = Path(tempfile.mkdtemp(prefix="fhops-pool-"))
+            token = uuid.uuid4().hex
+            path = self._tmpdir / f"{token}.pkl"
+            # Ship the problem without its memoised context; workers rebuild it once.
+            detached = problem.model_copy()
+            detached._operational_context = None
+            with path.open("wb") as handle:
+                pickle.dump(detached, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            ref = _ProblemRef(key=f"problem:{token}", path=str(path), pickled=True)
+            self._pickled[id(problem)] = (problem, ref)
+            while len(self._pickled) > self.cache_size:
+                _, (_, stale) = self._pickled.popitem(last=False)
+                self._retire(stale.path)
+            return ref
+        path = Path(problem).expanduser().resolve()
+        stamp = path.stat().st_mtime_ns
+        return _ProblemRef(key=f"path:{path}:{stamp}", path=str(path), pickled=False)
+
+    def _retire(self, path: str) -> None:
+        """Delete an evicted pickle now, or once the jobs still queued against it finish."""
+
+        with self._files_lock:
+            if self._outstanding.get(path):
+                self._retired.add(path)
+                return
+        Path(path).unlink(missing_ok=True)
+
+
+_shared: SolverPool | None = None
+
+
+def shared_solver_pool(max_workers: int | None = None) -> SolverPool:
+    """Return the process-wide pool, (re)starting it when the worker count changes.
+
+    Benchmark, tuning, and multi-start helpers share this pool so consecutive calls in one process
+    reuse warm workers and their problem caches.
+    """
+
+    global _shared
+    wanted = max(1, max_workers if max_workers is not None else os.cpu_count() or 1)
+    if _shared is None or _shared.max_workers != wanted:
+        shutdown_shared_solver_pool()
+        _shared = SolverPool(wanted)
+    return _shared
+
+
+def shutdown_shared_solver_pool() -> None:
+    """Stop the process-wide pool (registered with :mod:`atexit`)."""
+
+    global _shared
+    if _shared is not None:
+        _shared.shutdown()
+    _shared = None
+
+
+atexit.register(shutdown_shared_solver_pool)
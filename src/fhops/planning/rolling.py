@@ -28,7 +28,7 @@ from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import timedelta
 from numbers import Number
-from typing import Protocol
+from typing import Protocol, TypeVar
 
 import pandas as pd
 
@@ -194,6 +194,13 @@ def slice_scenario_for_window(
     the window, and clamps block availability to the sub-horizon. It also trims mobilisation
     distances to the surviving block set to satisfy scenario validation.
 
+    The slice is copy-on-write: rows that the window does not change (machines, landings, timeline,
+    production rates, blocks whose availability already fits the window, calendar entries when the
+    window starts on day 1, and the mobilisation config when no distance is dropped) are shared with
+    ``base`` rather than copied, and the result is assembled without re-running validation since
+    every row was already validated on ``base``. Treat shared rows as read-only; replace list fields
+    wholesale (as the solver hooks do for ``locked_assignments``) instead of mutating them.
+
     Parameters
     ----------
     base:
@@ -207,38 +214,40 @@ def slice_scenario_for_window(
     Returns
     -------
     Scenario
-        A deep-copied scenario with ``num_days == window.horizon_days`` and calendars/locks rebased
-        to start at day 1.
+        A scenario with ``num_days == window.horizon_days`` and calendars/locks rebased to start at
+        day 1.
     """
 
     start = window.start_day
     end = window.end_day
-    copy = base.model_copy(deep=True)
-    copy.num_days = window.horizon_days
-
-    if copy.start_date:
-        copy.start_date = copy.start_date + timedelta(days=start - 1)
-
-    copy.calendar = _rebase_calendar(copy.calendar, start, end)
-    copy.shift_calendar = _rebase_shift_calendar(copy.shift_calendar, start, end)
 
     filtered_blocks, kept_blocks = _filter_and_rebase_blocks(base, start, end, window.horizon_days)
-    copy.blocks = filtered_blocks
-    copy.production_rates = [rate for rate in copy.production_rates if rate.block_id in kept_blocks]
-    copy.mobilisation = _filter_mobilisation(copy.mobilisation, kept_blocks)
-
-    copy.locked_assignments = _rebase_locks(
-        locked_assignments or copy.locked_assignments or [], start, end
-    )
-
-    return copy
+    if len(kept_blocks) == len(base.blocks):
+        production_rates = list(base.production_rates)
+    else:
+        production_rates = [rate for rate in base.production_rates if rate.block_id in kept_blocks]
+
+    update: dict[str, object] = {
+        "num_days": window.horizon_days,
+        "calendar": _rebase_calendar(base.calendar, start, end),
+        "shift_calendar": _rebase_shift_calendar(base.shift_calendar, start, end),
+        "blocks": filtered_blocks,
+        "production_rates": production_rates,
+        "mobilisation": _filter_mobilisation(base.mobilisation, kept_blocks),
+        "locked_assignments": _rebase_locks(
+            locked_assignments or base.locked_assignments or [], start, end
+        ),
+    }
+    if base.start_date:
+        update["start_date"] = base.start_date + timedelta(days=start - 1)
+    return base.model_copy(update=update)
 
 
 def _rebase_calendar(entries: list[CalendarEntry], start: int, end: int) -> list[CalendarEntry]:
     rebased: list[CalendarEntry] = []
     for entry in entries:
         if start <= entry.day <= end:
-            rebased.append(entry.model_copy(update={"day": entry.day - start + 1}))
+            rebased.append(_rebase_day(entry, start))
     return rebased
 
 
@@ -250,10 +259,21 @@ def _rebase_shift_calendar(
     rebased: list[ShiftCalendarEntry] = []
     for entry in entries:
         if start <= entry.day <= end:
-            rebased.append(entry.model_copy(update={"day": entry.day - start + 1}))
+            rebased.append(_rebase_day(entry, start))
     return rebased
 
 
+_DayRow = TypeVar("_DayRow", CalendarEntry, ShiftCalendarEntry, ScheduleLock)
+
+
+def _rebase_day(entry: _DayRow, start: int) -> _DayRow:
+    """Shift ``entry.day`` so ``start`` maps to day 1, sharing the row when no shift is needed."""
+
+    if start == 1:
+        return entry
+    return entry.model_copy(update={"day": entry.day - start + 1})
+
+
 def _filter_and_rebase_blocks(
     base: Scenario, start: int, end: int, horizon_days: int
 ) -> tuple[list[Block], set[str]]:
@@ -266,9 +286,14 @@ def _filter_and_rebase_blocks(
         if latest < start or earliest > end:
             continue
 
-        rebased = block.model_copy(deep=True)
-        rebased.earliest_start = max(1, earliest - (start - 1))
-        rebased.latest_finish = min(horizon_days, latest - (start - 1))
+        window_start = max(1, earliest - (start - 1))
+        window_finish = min(horizon_days, latest - (start - 1))
+        if block.earliest_start == window_start and block.latest_finish == window_finish:
+            rebased = block
+        else:
+            rebased = block.model_copy(
+                update={"earliest_start": window_start, "latest_finish": window_finish}
+            )
         filtered_blocks.append(rebased)
         kept_ids.add(rebased.id)
     return filtered_blocks, kept_ids
@@ -277,15 +302,25 @@ def _filter_and_rebase_blocks(
 def _filter_mobilisation(
     mobilisation: MobilisationConfig | None, kept_blocks: set[str]
 ) -> MobilisationConfig | None:
-    if mobilisation is None or mobilisation.distances is None:
+    if mobilisation is None:
         return mobilisation
 
-    filtered_distances: list[BlockDistance] = []
-    for dist in mobilisation.distances:
-        if dist.from_block in kept_blocks and dist.to_block in kept_blocks:
-            filtered_distances.append(dist)
+    update: dict[str, object] = {}
+    matrix = mobilisation.distance_matrix
+    if matrix is not None and any(block_id not in kept_blocks for block_id in matrix.block_ids):
+        update["distance_matrix"] = matrix.subset(kept_blocks)
 
-    return mobilisation.model_copy(update={"distances": filtered_distances})
+    if mobilisation.distances is not None:
+        filtered_distances: list[BlockDistance] = []
+        for dist in mobilisation.distances:
+            if dist.from_block in kept_blocks and dist.to_block in kept_blocks:
+                filtered_distances.append(dist)
+        if len(filtered_distances) != len(mobilisation.distances):
+            update["distances"] = filtered_distances
+
+    if not update:
+        return mobilisation
+    return mobilisation.model_copy(update=update)
 
 
 def _rebase_locks(locks: Sequence[ScheduleLock], start: int, end: int) -> list[ScheduleLock] | None:
@@ -295,7 +330,7 @@ def _rebase_locks(locks: Sequence[ScheduleLock], start: int, end: int) -> list[S
     rebased: list[ScheduleLock] = []
     for lock in locks:
         if start <= lock.day <= end:
-            rebased.append(lock.model_copy(update={"day": lock.day - start + 1}))
+            rebased.append(_rebase_day(lock, start))
     return rebased
 
 
@@ -538,7 +573,7 @@ def _lift_locks_to_base(
     lifted: list[ScheduleLock] = []
     for lock in locks:
         if 1 <= lock.day <= lock_days:
-            lifted.append(lock.model_copy(update={"day": start_day + lock.day - 1}, deep=True))
+            lifted.append(lock.model_copy(update={"day": start_day + lock.day - 1}))
     return lifted
 
 
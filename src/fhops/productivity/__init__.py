@@ -197,7 +197,27 @@ from .stoilov2021 import (
     estimate_skidder_harvester_productivity_with_delays,
 )
 
+# isort: split
+# Imported last: the batch kernels pull coefficients from processor_loader, whose costing
+# dependency imports this package.
+from .batch import (
+    PRODUCTIVITY_COLUMN,
+    BatchEstimator,
+    BatchEstimatorRegistry,
+    batch_registry,
+    estimate_productivity_batch,
+    list_batch_models,
+    register_scalar_estimator,
+)
+
 __all__ = [
+    "PRODUCTIVITY_COLUMN",
+    "BatchEstimator",
+    "BatchEstimatorRegistry",
+    "batch_registry",
+    "estimate_productivity_batch",
+    "list_batch_models",
+    "register_scalar_estimator",
     "Fncy12ProductivityVariant",
     "LahrsenModel",
     "ProductivityEstimate",
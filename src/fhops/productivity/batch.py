@@ -0,0 +1,749 @@
+"""Vectorised (array-in/array-out) productivity estimators dispatchable by model name.
+
+The scalar helpers elsewhere in :mod:`fhops.productivity` evaluate one stand per call and return a
+dataclass or float. The estimators registered here evaluate the same regressions over whole
+columns of stand/block attributes: inputs are NumPy arrays, scalars (broadcast), or DataFrame
+columns; validation is applied column-wise with the scalar helpers' messages; and results come
+back as a :class:`pandas.DataFrame` aligned with the input rows.
+
+Use :func:`estimate_productivity_batch` to evaluate a model by name and
+:data:`batch_registry` to list/extend the available models.
+"""
+
+from __future__ import annotations
+
+import math
+import warnings
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from fhops.core.errors import FHOPSValueError
+from fhops.productivity.cable_logging import (
+    _MCNEEL_RUNNING_COEFFICIENTS,
+    _RUNNING_SKYLINE_VARIANTS,
+    _TR125_LATERAL_RANGE,
+    _TR125_MULTI_COEFFICIENTS,
+    _TR125_MULTI_SLOPE_RANGE,
+    _TR125_SINGLE_COEFFICIENTS,
+    _TR125_SINGLE_SLOPE_RANGE,
+)
+from fhops.productivity.eriksson2014 import _FINAL_FELLING_MODEL, _THINNING_MODEL
+from fhops.productivity.forwarder_bc import _ADV1N12_COEFFICIENTS
+from fhops.productivity.ghaffariyan2019 import (
+    _LARGE_FORWARDER_COEFFICIENTS,
+    _SMALL_FORWARDER_COEFFICIENTS,
+)
+from fhops.productivity.grapple_bc import (
+    _SR54_COEFFICIENTS,
+    _TR75_BUNCHED_COEFFICIENTS,
+    _TR75_HANDFELLED_COEFFICIENTS,
+)
+from fhops.productivity.lahrsen2025 import _COEFFICIENTS as _LAHRSEN_COEFFICIENTS
+from fhops.productivity.lahrsen2025 import LahrsenModel, _range_bounds
+from fhops.productivity.processor_loader import (
+    _BERRY_BASE_INTERCEPT,
+    _BERRY_BASE_SLOPE,
+    _BERRY_DEFAULT_UTILISATION,
+    _LOADER_BUNCHED_MULTIPLIER,
+    _LOADER_DISTANCE_EXP,
+    _LOADER_HAND_MULTIPLIER,
+    _LOADER_INTERCEPT,
+    _LOADER_PIECE_EXP,
+    _TREE_FORM_PRODUCTIVITY_MULTIPLIERS,
+)
+from fhops.productivity.skidder_ft import ADV6N7DeckingMode, get_adv6n7_metadata
+
+BatchColumns = Mapping[str, np.ndarray]
+BatchKernel = Callable[[BatchColumns], Mapping[str, np.ndarray]]
+
+PRODUCTIVITY_COLUMN = "productivity_m3_per_pmh"
+
+
+@dataclass(frozen=True)
+class BatchEstimator:
+    """Registry entry describing a vectorised productivity model.
+
+    Attributes
+    ----------
+    name:
+        Model identifier (matches the CLI model names where one exists).
+    machine_role:
+        Canonical machine role the model applies to.
+    required:
+        Input columns that must be supplied.
+    optional:
+        Input columns with their default values (broadcast when omitted).
+    kernel:
+        Callable receiving ``float64`` input columns and returning output columns; must include
+        ``productivity_m3_per_pmh``.
+    reference:
+        Short citation for the regression.
+    """
+
+    name: str
+    machine_role: str
+    required: tuple[str, ...]
+    kernel: BatchKernel
+    optional: Mapping[str, float] = field(default_factory=dict)
+    reference: str = ""
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        """All input column names (required first)."""
+
+        return self.required + tuple(self.optional)
+
+
+class BatchEstimatorRegistry:
+    """Name-keyed collection of :class:`BatchEstimator` entries."""
+
+    def __init__(self) -> None:
+        self._estimators: dict[str, BatchEstimator] = {}
+
+    def register(self, estimator: BatchEstimator, *, replace: bool = False) -> BatchEstimator:
+        if estimator.name in self._estimators and not replace:
+            raise ValueError(f"Batch estimator '{estimator.name}' is already registered.")
+        self._estimators[estimator.name] = estimator
+        return estimator
+
+    def get(self, name: str) -> BatchEstimator:
+        try:
+            return self._estimators[name]
+        except KeyError:
+            allowed = ", ".join(sorted(self._estimators))
+            raise ValueError(
+                f"Unknown batch productivity model '{name}'. Expected one of: {allowed}."
+            ) from None
+
+    def names(self) -> tuple[str, ...]:
+        return tuple(sorted(self._estimators))
+
+    def for_role(self, machine_role: str) -> tuple[BatchEstimator, ...]:
+        return tuple(
+            estimator
+            for name, estimator in sorted(self._estimators.items())
+            if estimator.machine_role == machine_role
+        )
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._estimators
+
+
+batch_registry = BatchEstimatorRegistry()
+
+
+def estimate_productivity_batch(
+    model: str,
+    inputs: pd.DataFrame | Mapping[str, Any] | None = None,
+    /,
+    **columns: Any,
+) -> pd.DataFrame:
+    """Evaluate ``model`` over columns of inputs and return one result row per input row.
+
+    Parameters
+    ----------
+    model:
+        Registered model name (see :data:`batch_registry`).
+    inputs:
+        DataFrame or mapping of input columns (extra columns are ignored).
+    **columns:
+        Additional or overriding inputs; scalars are broadcast to the batch length.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Output columns (always including ``productivity_m3_per_pmh``) indexed like ``inputs``.
+
+    Raises
+    ------
+    ValueError
+        When a required input is missing, lengths disagree, or any row fails the model's
+        validation (the message names the first offending row).
+    """
+
+    estimator = batch_registry.get(model)
+    index, arrays = _coerce_inputs(estimator, inputs, columns)
+    outputs = estimator.kernel(arrays)
+    return pd.DataFrame(dict(outputs), index=index)
+
+
+def _coerce_inputs(
+    estimator: BatchEstimator,
+    inputs: pd.DataFrame | Mapping[str, Any] | None,
+    overrides: Mapping[str, Any],
+) -> tuple[pd.Index, dict[str, np.ndarray]]:
+    source: dict[str, Any] = {}
+    index: pd.Index | None = None
+    if isinstance(inputs, pd.DataFrame):
+        index = inputs.index
+        source.update({name: inputs[name] for name in estimator.inputs if name in inputs})
+    elif inputs is not None:
+        source.update({name: inputs[name] for name in estimator.inputs if name in inputs})
+    unknown = sorted(set(overrides) - set(estimator.inputs))
+    if unknown:
+        raise ValueError(
+            f"Unexpected inputs for batch model '{estimator.name}': {', '.join(unknown)}"
+        )
+    source.update(overrides)
+    missing = [name for name in estimator.required if name not in source]
+    if missing:
+        raise ValueError(
+            f"Missing inputs for batch model '{estimator.name}': {', '.join(sorted(missing))}"
+        )
+
+    raw = {name: np.asarray(value, dtype=np.float64) for name, value in source.items()}
+    lengths = {array.shape[0] for array in raw.values() if array.ndim > 0}
+    if index is not None:
+        lengths.add(len(index))
+    if len(lengths) > 1:
+        raise ValueError(
+            f"Input columns for batch model '{estimator.name}' have mismatched lengths {sorted(lengths)}."
+        )
+    size = lengths.pop() if lengths else 1
+    defaults = {name: math.nan for name in estimator.required} | dict(estimator.optional)
+    arrays = {
+        name: np.broadcast_to(raw.get(name, np.float64(default)), (size,))
+        for name, default in defaults.items()
+    }
+    return (index if index is not None else pd.RangeIndex(size)), arrays
+
+
+def _check(bad: np.ndarray, message: str, *, error: type[ValueError] = ValueError) -> None:
+    """Raise ``message`` (annotated with the first offending row) if any ``bad`` entry is set."""
+
+    if bad.any():
+        row = int(np.flatnonzero(bad)[0])
+        raise error(f"{message} (first offending row: {row})")
+
+
+def _warn_out_of_range(name: str, values: np.ndarray, value_range: tuple[float, float]) -> None:
+    lower, upper = value_range
+    outside = (values < lower) | (values > upper)
+    if outside.any():
+        warnings.warn(
+            f"{int(outside.sum())} value(s) for {name} lie outside the calibrated range "
+            f"[{lower}, {upper}].",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+
+def _m3_per_pmh_from_minutes(payload_m3: np.ndarray, cycle_minutes: np.ndarray) -> np.ndarray:
+    _check(payload_m3 <= 0, "payload_m3 must be > 0")
+    _check(cycle_minutes <= 0, "cycle_minutes must be > 0")
+    return payload_m3 * (60.0 / cycle_minutes)
+
+
+# ---------------------------------------------------------------------------------------------
+# Feller-buncher: Lahrsen (2025)
+# ---------------------------------------------------------------------------------------------
+
+_LAHRSEN_INPUTS = ("avg_stem_size", "volume_per_ha", "stem_density", "ground_slope")
+
+
+def _lahrsen_kernel(model: LahrsenModel) -> BatchKernel:
+    coeffs = _LAHRSEN_COEFFICIENTS[model]
+
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        strict = bool(np.all(columns["validate_ranges"] != 0))
+        in_range = np.ones(len(columns["avg_stem_size"]), dtype=bool)
+        for name in _LAHRSEN_INPUTS:
+            values = columns[name]
+            _check(values <= 0, f"{name} must be positive", error=FHOPSValueError)
+            bounds = _range_bounds(model, name)
+            lo, hi = bounds.get("min"), bounds.get("max")
+            if lo is None or hi is None:
+                continue
+            outside = (values < lo) | (values > hi)
+            if strict:
+                _check(
+                    outside,
+                    f"{name} outside Lahrsen (2025) observed range [{lo}, {hi}]",
+                    error=FHOPSValueError,
+                )
+            in_range &= ~outside
+        predicted = (
+            coeffs.intercept
+            + coeffs.stem_size * columns["avg_stem_size"]
+            + coeffs.volume_per_ha * columns["volume_per_ha"]
+            + coeffs.stem_density * columns["stem_density"]
+            + coeffs.ground_slope * columns["ground_slope"]
+        )
+        return {PRODUCTIVITY_COLUMN: predicted, "in_range": in_range}
+
+    return kernel
+
+
+for _lahrsen_model in LahrsenModel:
+    batch_registry.register(
+        BatchEstimator(
+            name=f"lahrsen2025-{_lahrsen_model.value}",
+            machine_role="feller_buncher",
+            required=_LAHRSEN_INPUTS,
+            optional={"validate_ranges": 1.0},
+            kernel=_lahrsen_kernel(_lahrsen_model),
+            reference="Lahrsen 2025 (BC feller-buncher)",
+        )
+    )
+
+
+# ---------------------------------------------------------------------------------------------
+# Processor: Berry (2019)
+# ---------------------------------------------------------------------------------------------
+
+
+def _berry2019_kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+    piece_size = columns["piece_size_m3"]
+    category = columns["tree_form_category"]
+    crew = columns["crew_multiplier"]
+    delay = columns["delay_multiplier"]
+    automatic = columns["automatic_bucking_multiplier"]
+    ratio = columns["carrier_productivity_ratio"]
+    _check(piece_size <= 0, "piece_size_m3 must be > 0")
+    categories = np.array(sorted(_TREE_FORM_PRODUCTIVITY_MULTIPLIERS), dtype=np.float64)
+    _check(~np.isin(category, categories), "tree_form_category must be 0, 1, or 2")
+    _check(crew <= 0, "crew_multiplier must be > 0")
+    _check(~((delay > 0.0) & (delay <= 1.0)), "delay_multiplier must lie in (0, 1]")
+    _check(automatic <= 0, "automatic_bucking_multiplier must be > 0")
+
+    multipliers = np.array(
+        [_TREE_FORM_PRODUCTIVITY_MULTIPLIERS[int(key)] for key in categories], dtype=np.float64
+    )
+    tree_multiplier = multipliers[np.searchsorted(categories, category)]
+    base = _BERRY_BASE_SLOPE * piece_size + _BERRY_BASE_INTERCEPT
+    ratio = np.where(ratio > 0, ratio, np.where(ratio == 0, 1.0, 0.0))
+    delay_free = base * tree_multiplier * crew * automatic * ratio
+    return {
+        "base_productivity_m3_per_pmh": base,
+        "tree_form_multiplier": tree_multiplier,
+        "delay_free_productivity_m3_per_pmh": delay_free,
+        PRODUCTIVITY_COLUMN: delay_free * delay,
+    }
+
+
+batch_registry.register(
+    BatchEstimator(
+        name="berry2019",
+        machine_role="processor",
+        required=("piece_size_m3",),
+        optional={
+            "tree_form_category": 0.0,
+            "crew_multiplier": 1.0,
+            "delay_multiplier": _BERRY_DEFAULT_UTILISATION,
+            "automatic_bucking_multiplier": 1.0,
+            "carrier_productivity_ratio": 1.0,
+        },
+        kernel=_berry2019_kernel,
+        reference="Berry 2019 (Kinleith NZ processor)",
+    )
+)
+
+
+# ---------------------------------------------------------------------------------------------
+# Forwarders: Ghaffariyan et al. (2019), Eriksson & Lindroos (2014), ADV1N12
+# ---------------------------------------------------------------------------------------------
+
+
+def _ghaffariyan_kernel(large: bool) -> BatchKernel:
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        distance = columns["extraction_distance_m"]
+        slope_factor = columns["slope_factor"]
+        _check(distance <= 0, "extraction_distance_m must be > 0")
+        _check(slope_factor <= 0, "slope_factor must be > 0")
+        if large:
+            scale, exponent = _LARGE_FORWARDER_COEFFICIENTS
+            base = scale / (distance**exponent)
+        else:
+            intercept, log_coeff = _SMALL_FORWARDER_COEFFICIENTS
+            base = intercept - log_coeff * np.log(distance)
+        productivity = base * slope_factor
+        _check(productivity <= 0, "derived productivity must be > 0")
+        return {PRODUCTIVITY_COLUMN: productivity}
+
+    return kernel
+
+
+def _eriksson_kernel(model: Any) -> BatchKernel:
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        distance = columns["mean_extraction_distance_m"]
+        stem = columns["mean_stem_size_m3"]
+        load = columns["load_capacity_m3"]
+        _check(distance <= 0, "mean_extraction_distance_m must be > 0")
+        _check(stem <= 0, "mean_stem_size_m3 must be > 0")
+        _check(load <= 0, "load_capacity_m3 must be > 0")
+        ln_mfd = np.log(distance)
+        ln_productivity = (
+            model.intercept
+            + model.coeff_ln_mfd_sq * (ln_mfd**2)
+            + model.coeff_ln_mean_stem * np.log(stem)
+            + model.coeff_ln_mfd_load * np.log(distance * load)
+        )
+        return {PRODUCTIVITY_COLUMN: np.exp(ln_productivity + (model.rmse**2) / 2.0)}
+
+    return kernel
+
+
+def _adv1n12_forwarder_kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+    distance = columns["extraction_distance_m"]
+    _check(distance <= 0, "extraction_distance_m must be > 0")
+    scale, decay = _ADV1N12_COEFFICIENTS
+    return {PRODUCTIVITY_COLUMN: scale * np.exp(-decay * distance)}
+
+
+def _register_forwarders() -> None:
+    for name, large, reference in (
+        ("ghaffariyan-small", False, "Ghaffariyan et al. 2019 (14 t forwarder)"),
+        ("ghaffariyan-large", True, "Ghaffariyan et al. 2019 (20 t forwarder)"),
+    ):
+        batch_registry.register(
+            BatchEstimator(
+                name=name,
+                machine_role="forwarder",
+                required=("extraction_distance_m",),
+                optional={"slope_factor": 1.0},
+                kernel=_ghaffariyan_kernel(large),
+                reference=reference,
+            )
+        )
+    for name, spec, reference in (
+        (
+            "eriksson-final-felling",
+            _FINAL_FELLING_MODEL,
+            "Eriksson & Lindroos 2014 (Final Felling)",
+        ),
+        ("eriksson-thinning", _THINNING_MODEL, "Eriksson & Lindroos 2014 (Thinning)"),
+    ):
+        batch_registry.register(
+            BatchEstimator(
+                name=name,
+                machine_role="forwarder",
+                required=("mean_extraction_distance_m", "mean_stem_size_m3", "load_capacity_m3"),
+                kernel=_eriksson_kernel(spec),
+                reference=reference,
+            )
+        )
+    batch_registry.register(
+        BatchEstimator(
+            name="adv1n12-shortwood",
+            machine_role="forwarder",
+            required=("extraction_distance_m",),
+            kernel=_adv1n12_forwarder_kernel,
+            reference="FPInnovations Advantage Vol. 1 No. 12 (Valmet 646 shortwood forwarder)",
+        )
+    )
+
+
+_register_forwarders()
+
+
+# ---------------------------------------------------------------------------------------------
+# Grapple yarders: SR-54, TR-75
+# ---------------------------------------------------------------------------------------------
+
+
+def _grapple_inputs(columns: BatchColumns) -> tuple[np.ndarray, np.ndarray]:
+    volume = columns["turn_volume_m3"]
+    distance = columns["yarding_distance_m"]
+    _check(volume <= 0, "turn_volume_m3 must be > 0")
+    _check(distance < 0, "yarding_distance_m must be >= 0")
+    return volume, distance
+
+
+def _sr54_kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+    volume, distance = _grapple_inputs(columns)
+    fixed, distance_coeff, volume_coeff = _SR54_COEFFICIENTS
+    cycle = fixed + distance * (distance_coeff + volume_coeff * volume)
+    return {"cycle_minutes": cycle, PRODUCTIVITY_COLUMN: 60.0 * volume / cycle}
+
+
+def _tr75_kernel(coefficients: Mapping[str, float]) -> BatchKernel:
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        volume, distance = _grapple_inputs(columns)
+        cycle = (
+            coefficients["fixed_time_min"]
+            + coefficients["outhaul_intercept_min"]
+            + coefficients["outhaul_distance_coeff"] * distance
+            + coefficients["inhaul_intercept_min"]
+            + coefficients["inhaul_distance_coeff"] * distance
+        )
+        return {"cycle_minutes": cycle, PRODUCTIVITY_COLUMN: 60.0 * volume / cycle}
+
+    return kernel
+
+
+_GRAPPLE_INPUTS = ("turn_volume_m3", "yarding_distance_m")
+batch_registry.register(
+    BatchEstimator(
+        name="sr54",
+        machine_role="grapple_yarder",
+        required=_GRAPPLE_INPUTS,
+        kernel=_sr54_kernel,
+        reference="MacDonald 1988 (SR-54)",
+    )
+)
+batch_registry.register(
+    BatchEstimator(
+        name="tr75-bunched",
+        machine_role="grapple_yarder",
+        required=_GRAPPLE_INPUTS,
+        kernel=_tr75_kernel(_TR75_BUNCHED_COEFFICIENTS),
+        reference="Peterson 1987 (TR-75, bunched)",
+    )
+)
+batch_registry.register(
+    BatchEstimator(
+        name="tr75-handfelled",
+        machine_role="grapple_yarder",
+        required=_GRAPPLE_INPUTS,
+        kernel=_tr75_kernel(_TR75_HANDFELLED_COEFFICIENTS),
+        reference="Peterson 1987 (TR-75, hand-felled)",
+    )
+)
+
+
+# ---------------------------------------------------------------------------------------------
+# Skyline yarders: TR-125, McNeel (2000)
+# ---------------------------------------------------------------------------------------------
+
+
+def _tr125_kernel(
+    intercept: float, slope_coeff: float, lateral_coeff: float, slope_range: tuple[float, float]
+) -> BatchKernel:
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        slope = columns["slope_distance_m"]
+        lateral = columns["lateral_distance_m"]
+        _check(slope <= 0, "slope_distance_m must be > 0")
+        _check(lateral <= 0, "lateral_distance_m must be > 0")
+        _warn_out_of_range("slope_distance_m", slope, slope_range)
+        _warn_out_of_range("lateral_distance_m", lateral, _TR125_LATERAL_RANGE)
+        cycle = intercept + slope_coeff * slope + lateral_coeff * lateral
+        return {
+            "cycle_minutes": cycle,
+            PRODUCTIVITY_COLUMN: _m3_per_pmh_from_minutes(columns["payload_m3"], cycle),
+        }
+
+    return kernel
+
+
+def _mcneel_kernel(variant_key: str) -> BatchKernel:
+    variant = _RUNNING_SKYLINE_VARIANTS[variant_key]
+    z1 = variant["z1"]
+    coeffs = _MCNEEL_RUNNING_COEFFICIENTS
+
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        horizontal = columns["horizontal_distance_m"]
+        lateral = columns["lateral_distance_m"]
+        vertical = columns["vertical_distance_m"]
+        pieces = np.where(
+            np.isnan(columns["pieces_per_cycle"]),
+            variant["pieces_per_cycle"],
+            columns["pieces_per_cycle"],
+        )
+        volume = np.where(
+            np.isnan(columns["piece_volume_m3"]),
+            variant["piece_volume_m3"],
+            columns["piece_volume_m3"],
+        )
+        _check(volume <= 0, "piece_volume_m3 must be > 0")
+        _check(horizontal <= 0, "horizontal_distance_m must be > 0")
+        _check(lateral < 0, "lateral_distance_m must be >= 0")
+        _check(vertical < 0, "vertical_distance_m must be >= 0")
+        _check(pieces <= 0, "pieces_per_cycle must be > 0")
+        cycle = np.maximum(
+            coeffs["intercept"]
+            + coeffs["horizontal"] * horizontal
+            + coeffs["vertical"] * vertical
+            + coeffs["vertical_z1"] * z1 * vertical
+            + coeffs["lateral"] * lateral
+            + coeffs["pieces"] * pieces
+            + coeffs["z1"] * z1,
+            0.0,
+        )
+        return {
+            "cycle_minutes": cycle,
+            PRODUCTIVITY_COLUMN: _m3_per_pmh_from_minutes(pieces * volume, cycle),
+        }
+
+    return kernel
+
+
+def _register_skyline() -> None:
+    for name, coeffs, slope_range in (
+        ("tr125-single-span", _TR125_SINGLE_COEFFICIENTS, _TR125_SINGLE_SLOPE_RANGE),
+        ("tr125-multi-span", _TR125_MULTI_COEFFICIENTS, _TR125_MULTI_SLOPE_RANGE),
+    ):
+        batch_registry.register(
+            BatchEstimator(
+                name=name,
+                machine_role="skyline_yarder",
+                required=("slope_distance_m", "lateral_distance_m"),
+                optional={"payload_m3": 1.6},
+                kernel=_tr125_kernel(*coeffs, slope_range),
+                reference="FPInnovations TR-125",
+            )
+        )
+    for variant_key in ("yarder_a", "yarder_b"):
+        batch_registry.register(
+            BatchEstimator(
+                name=f"mcneel-running-{variant_key.replace('_', '-')}",
+                machine_role="skyline_yarder",
+                required=("horizontal_distance_m", "lateral_distance_m", "vertical_distance_m"),
+                optional={"pieces_per_cycle": math.nan, "piece_volume_m3": math.nan},
+                kernel=_mcneel_kernel(variant_key),
+                reference="McNeel 2000 (running skyline)",
+            )
+        )
+
+
+_register_skyline()
+
+
+# ---------------------------------------------------------------------------------------------
+# Grapple skidder: ADV6N7; loader-forwarder: TN-261
+# ---------------------------------------------------------------------------------------------
+
+
+def _adv6n7_kernel(decking_mode: ADV6N7DeckingMode) -> BatchKernel:
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        metadata = get_adv6n7_metadata()
+        distance = columns["skidding_distance_m"]
+        payload = np.where(
+            np.isnan(columns["payload_m3"]), metadata.default_payload_m3, columns["payload_m3"]
+        )
+        utilised = np.where(
+            np.isnan(columns["utilisation"]), metadata.default_utilisation, columns["utilisation"]
+        )
+        delay = np.where(
+            np.isnan(columns["delay_minutes"]),
+            metadata.default_delay_minutes,
+            columns["delay_minutes"],
+        )
+        _check(distance <= 0, "Skidding distance must be > 0")
+        _check(payload <= 0, "Payload per cycle must be > 0")
+        _check(utilised <= 0, "Utilisation must be > 0")
+        _check(delay < 0, "Delay minutes must be >= 0")
+        cycle = metadata.cycle_intercepts[decking_mode] + metadata.cycle_distance_coeff * distance
+        _check(cycle <= 0, "Derived cycle time must be > 0")
+        productivity = 60.0 * payload * utilised / (cycle + delay)
+        return {"cycle_minutes": cycle, PRODUCTIVITY_COLUMN: productivity}
+
+    return kernel
+
+
+def _tn261_kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+    piece_size = columns["piece_size_m3"]
+    distance = columns["external_distance_m"]
+    delay = columns["delay_multiplier"]
+    _check(piece_size <= 0, "piece_size_m3 must be > 0")
+    _check(distance <= 0, "external_distance_m must be > 0")
+    _check(~((delay > 0.0) & (delay <= 1.0)), "delay_multiplier must lie in (0, 1]")
+    factor = columns["slope_percent"] / 100.0
+    slope_mult = np.where(
+        factor >= 0,
+        np.maximum(0.6, 1.0 - 0.3 * factor),
+        np.minimum(1.15, 1.0 + 0.15 * np.abs(factor)),
+    )
+    bunched_mult = np.where(
+        columns["bunched"] != 0, _LOADER_BUNCHED_MULTIPLIER, _LOADER_HAND_MULTIPLIER
+    )
+    delay_free = (
+        math.exp(_LOADER_INTERCEPT)
+        * (piece_size**_LOADER_PIECE_EXP)
+        * (distance**_LOADER_DISTANCE_EXP)
+        * slope_mult
+        * bunched_mult
+    )
+    return {
+        "delay_free_productivity_m3_per_pmh": delay_free,
+        PRODUCTIVITY_COLUMN: delay_free * delay,
+    }
+
+
+for _decking_mode in ADV6N7DeckingMode:
+    batch_registry.register(
+        BatchEstimator(
+            name=f"adv6n7-{_decking_mode.value.replace('_', '-')}",
+            machine_role="grapple_skidder",
+            required=("skidding_distance_m",),
+            optional={
+                "payload_m3": math.nan,
+                "utilisation": math.nan,
+                "delay_minutes": math.nan,
+            },
+            kernel=_adv6n7_kernel(_decking_mode),
+            reference="FPInnovations Advantage Vol. 6 No. 7 (Cat 535B grapple skidder)",
+        )
+    )
+batch_registry.register(
+    BatchEstimator(
+        name="tn261",
+        machine_role="loader",
+        required=("piece_size_m3", "external_distance_m"),
+        optional={"slope_percent": 0.0, "bunched": 1.0, "delay_multiplier": 1.0},
+        kernel=_tn261_kernel,
+        reference="FPInnovations TN-261 (loader-forwarder)",
+    )
+)
+
+
+def list_batch_models(machine_role: str | None = None) -> tuple[str, ...]:
+    """Return registered batch model names, optionally filtered by canonical machine role."""
+
+    if machine_role is None:
+        return batch_registry.names()
+    return tuple(estimator.name for estimator in batch_registry.for_role(machine_role))
+
+
+def register_scalar_estimator(
+    name: str,
+    func: Callable[..., Any],
+    *,
+    machine_role: str,
+    required: Iterable[str],
+    optional: Mapping[str, float] | None = None,
+    output: str | None = None,
+    reference: str = "",
+) -> BatchEstimator:
+    """Register a scalar helper under the batch API by evaluating it row by row.
+
+    Intended for models that have not been vectorised yet; ``output`` names the result attribute
+    to read when ``func`` returns a dataclass instead of a float.
+    """
+
+    required = tuple(required)
+    optional = dict(optional or {})
+    names = required + tuple(optional)
+
+    def kernel(columns: BatchColumns) -> dict[str, np.ndarray]:
+        size = len(columns[names[0]]) if names else 0
+        values = np.empty(size, dtype=np.float64)
+        for row in range(size):
+            result = func(**{key: float(columns[key][row]) for key in names})
+            values[row] = float(getattr(result, output) if output else result)
+        return {PRODUCTIVITY_COLUMN: values}
+
+    return batch_registry.register(
+        BatchEstimator(
+            name=name,
+            machine_role=machine_role,
+            required=required,
+            optional=optional,
+            kernel=kernel,
+            reference=reference,
+        )
+    )
+
+
+__all__ = [
+    "PRODUCTIVITY_COLUMN",
+    "BatchEstimator",
+    "BatchEstimatorRegistry",
+    "batch_registry",
+    "estimate_productivity_batch",
+    "list_batch_models",
+    "register_scalar_estimator",
+]
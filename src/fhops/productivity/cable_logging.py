@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import contextlib
-import json
 import warnings
 from collections.abc import Mapping
 from dataclasses import dataclass
@@ -11,7 +10,7 @@ from enum import StrEnum
 from functools import lru_cache
 
 from fhops.reference import get_appendix5_profile, load_fncy12_dataset
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _FEET_PER_METER = 3.28084
 _CUBIC_FEET_PER_CUBIC_METER = 35.3146667
@@ -24,9 +23,23 @@ _RUNNING_SKYLINE_VARIANTS = {
     "yarder_b": {"pieces_per_cycle": 3.0, "piece_volume_m3": 1.6, "z1": 1.0},
 }
 
+# McNeel (2000) running-skyline cycle-minute regression terms.
+_MCNEEL_RUNNING_COEFFICIENTS: dict[str, float] = {
+    "intercept": 10.167,
+    "horizontal": 0.00490,
+    "vertical": 0.01836,
+    "vertical_z1": -0.011080,
+    "lateral": 0.080542,
+    "pieces": 0.109484,
+    "z1": -1.18,
+}
+
 _TR125_SINGLE_SLOPE_RANGE = (10.0, 350.0)
 _TR125_MULTI_SLOPE_RANGE = (10.0, 420.0)
 _TR125_LATERAL_RANGE = (0.0, 50.0)
+# (intercept, slope-distance, lateral-distance) cycle-minute coefficients for TR-125 Eq. 1/2.
+_TR125_SINGLE_COEFFICIENTS = (2.76140, 0.00449, 0.03750)
+_TR125_MULTI_COEFFICIENTS = (2.43108, 0.00910, 0.02563)
 
 
 class Fncy12ProductivityVariant(StrEnum):
@@ -256,7 +269,8 @@ def estimate_cable_yarder_cycle_time_tr125_single_span(
     _validate_positive(lateral_distance_m, "lateral_distance_m")
     _warn_if_out_of_range("slope_distance_m", slope_distance_m, _TR125_SINGLE_SLOPE_RANGE)
     _warn_if_out_of_range("lateral_distance_m", lateral_distance_m, _TR125_LATERAL_RANGE)
-    return 2.76140 + 0.00449 * slope_distance_m + 0.03750 * lateral_distance_m
+    intercept, slope_coeff, lateral_coeff = _TR125_SINGLE_COEFFICIENTS
+    return intercept + slope_coeff * slope_distance_m + lateral_coeff * lateral_distance_m
 
 
 def estimate_cable_yarder_productivity_tr125_single_span(
@@ -302,7 +316,8 @@ def estimate_cable_yarder_cycle_time_tr125_multi_span(
     _validate_positive(lateral_distance_m, "lateral_distance_m")
     _warn_if_out_of_range("slope_distance_m", slope_distance_m, _TR125_MULTI_SLOPE_RANGE)
     _warn_if_out_of_range("lateral_distance_m", lateral_distance_m, _TR125_LATERAL_RANGE)
-    return 2.43108 + 0.00910 * slope_distance_m + 0.02563 * lateral_distance_m
+    intercept, slope_coeff, lateral_coeff = _TR125_MULTI_COEFFICIENTS
+    return intercept + slope_coeff * slope_distance_m + lateral_coeff * lateral_distance_m
 
 
 def estimate_cable_yarder_productivity_tr125_multi_span(
@@ -382,14 +397,15 @@ def estimate_running_skyline_cycle_time_mcneel2000_minutes(
     pieces = pieces_per_cycle if pieces_per_cycle is not None else variant["pieces_per_cycle"]
     _validate_positive(pieces, "pieces_per_cycle")
     z1 = variant["z1"]
+    coeffs = _MCNEEL_RUNNING_COEFFICIENTS
     cycle_minutes = (
-        10.167
-        + 0.00490 * horizontal_distance_m
-        + 0.01836 * vertical_distance_m
-        - 0.011080 * z1 * vertical_distance_m
-        + 0.080542 * lateral_distance_m
-        + 0.109484 * pieces
-        - 1.18 * z1
+        coeffs["intercept"]
+        + coeffs["horizontal"] * horizontal_distance_m
+        + coeffs["vertical"] * vertical_distance_m
+        + coeffs["vertical_z1"] * z1 * vertical_distance_m
+        + coeffs["lateral"] * lateral_distance_m
+        + coeffs["pieces"] * pieces
+        + coeffs["z1"] * z1
     )
     return max(cycle_minutes, 0.0)
 
@@ -930,8 +946,7 @@ def _load_tr127_models() -> Mapping[int, _TR127Regression]:
     """Load TR-127 regression definitions (cached) from the bundled JSON dataset."""
     if not _TR127_REGRESSIONS_PATH.exists():
         raise FileNotFoundError(f"TR127 regression data not found: {_TR127_REGRESSIONS_PATH}")
-    with _TR127_REGRESSIONS_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(_TR127_REGRESSIONS_PATH)
     models: dict[int, _TR127Regression] = {}
     for entry in payload:
         predictors = tuple(
@@ -1173,8 +1188,7 @@ def _load_tn173_systems() -> Mapping[str, TN173System]:
     """Load TN-173 skyline system metadata from the bundled JSON dataset."""
     if not _TN173_PATH.exists():
         raise FileNotFoundError(f"TN173 dataset not found: {_TN173_PATH}")
-    with _TN173_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(_TN173_PATH)
 
     systems: dict[str, TN173System] = {}
     for entry in payload.get("systems", []):
@@ -72,6 +72,8 @@ _MODEL_TO_LOAD: dict[ForwarderBCModel, KelloggLoadType] = {
 
 _ADV6N10_MODELS = {ForwarderBCModel.ADV6N10_SHORTWOOD}
 _ADV1N12_MODELS = {ForwarderBCModel.ADV1N12_SHORTWOOD}
+# (a, b) for the ADV1N12 regression: productivity = a * exp(-b * extraction distance).
+_ADV1N12_COEFFICIENTS = (8.4438, 0.004)
 _ERIKSSON_MODELS = {
     ForwarderBCModel.ERIKSSON_FINAL_FELLING,
     ForwarderBCModel.ERIKSSON_THINNING,
@@ -283,7 +285,8 @@ def estimate_forwarder_productivity_bc(
             raise ValueError("extraction_distance_m is required for ADV1N12 model")
         if extraction_distance_m <= 0:
             raise ValueError("extraction_distance_m must be > 0")
-        value = 8.4438 * math.exp(-0.004 * extraction_distance_m)
+        scale, decay = _ADV1N12_COEFFICIENTS
+        value = scale * math.exp(-decay * extraction_distance_m)
         params_adv1n12: ForwarderParamDict = {"extraction_distance_m": extraction_distance_m}
         return ForwarderBCResult(
             model=model,
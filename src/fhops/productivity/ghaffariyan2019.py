@@ -14,6 +14,11 @@ class ALPACASlopeClass(StrEnum):
     OVER_TWENTY = ">20"  # >20%
 
 
+# (a, b) for Equation 2, the 14 t forwarder: productivity = a - b * ln(distance).
+_SMALL_FORWARDER_COEFFICIENTS = (44.32, 2.72)
+# (a, b) for Equation 3, the 20 t forwarder: productivity = a / distance ** b.
+_LARGE_FORWARDER_COEFFICIENTS = (87.65, 0.126)
+
 _ALPACA_SLOPE_MULTIPLIERS: dict[ALPACASlopeClass, float] = {
     ALPACASlopeClass.FLAT: 1.0,
     ALPACASlopeClass.TEN_TO_TWENTY: 0.75,
@@ -75,7 +80,8 @@ def estimate_forwarder_productivity_small_forwarder_thinning(
 
     _validate_inputs(extraction_distance_m, slope_factor)
 
-    base_productivity = 44.32 - 2.72 * math.log(extraction_distance_m)
+    intercept, log_coeff = _SMALL_FORWARDER_COEFFICIENTS
+    base_productivity = intercept - log_coeff * math.log(extraction_distance_m)
     productivity = base_productivity * slope_factor
     if productivity <= 0:
         raise ValueError("derived productivity must be > 0")
@@ -108,7 +114,8 @@ def estimate_forwarder_productivity_large_forwarder_thinning(
 
     _validate_inputs(extraction_distance_m, slope_factor)
 
-    base_productivity = 87.65 / (extraction_distance_m**0.126)
+    scale, exponent = _LARGE_FORWARDER_COEFFICIENTS
+    base_productivity = scale / (extraction_distance_m**exponent)
     productivity = base_productivity * slope_factor
     if productivity <= 0:
         raise ValueError("derived productivity must be > 0")
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, cast
 
-from fhops.resources import data_path
+from fhops.core.cache import memoised
+from fhops.resources import data_path, load_json
 
 
 def _validate_inputs(turn_volume_m3: float, yarding_distance_m: float) -> None:
@@ -19,6 +19,10 @@ def _validate_inputs(turn_volume_m3: float, yarding_distance_m: float) -> None:
         raise ValueError("yarding_distance_m must be >= 0")
 
 
+# (fixed minutes, distance, distance x turn volume) cycle-minute coefficients for SR-54.
+_SR54_COEFFICIENTS = (1.60, 0.00455, 0.00030)
+
+
 def _minutes_per_turn_sr54(turn_volume_m3: float, yarding_distance_m: float) -> float:
     """Return cycle time (minutes/turn) for MacDonald (1988) Grapple 1 regression.
 
@@ -27,7 +31,8 @@ def _minutes_per_turn_sr54(turn_volume_m3: float, yarding_distance_m: float) ->
     A fixed 1.35 min (hook/unhook/deck + moves + minor delays) is included per Table 10.
     """
 
-    return 1.60 + yarding_distance_m * (0.00455 + 0.00030 * turn_volume_m3)
+    fixed, distance_coeff, volume_coeff = _SR54_COEFFICIENTS
+    return fixed + yarding_distance_m * (distance_coeff + volume_coeff * turn_volume_m3)
 
 
 def _minutes_per_turn_tr75(
@@ -49,6 +54,23 @@ def _minutes_per_turn_tr75(
     )
 
 
+# TR-75 Table 6 coefficients (minutes), shared with the batch estimators.
+_TR75_BUNCHED_COEFFICIENTS: dict[str, float] = {
+    "fixed_time_min": 0.69,
+    "outhaul_intercept_min": 0.0296,
+    "outhaul_distance_coeff": 0.0027,
+    "inhaul_intercept_min": 0.0,
+    "inhaul_distance_coeff": 0.0044,
+}
+_TR75_HANDFELLED_COEFFICIENTS: dict[str, float] = {
+    "fixed_time_min": 0.74,
+    "outhaul_intercept_min": 0.0323,
+    "outhaul_distance_coeff": 0.0026,
+    "inhaul_intercept_min": 0.0247,
+    "inhaul_distance_coeff": 0.0035,
+}
+
+
 def _productivity(turn_volume_m3: float, cycle_time_min: float) -> float:
     """Convert turn volume (m³) and cycle time (minutes) to m³/PMH."""
     return 60.0 * turn_volume_m3 / cycle_time_min
@@ -104,14 +126,7 @@ def estimate_grapple_yarder_productivity_tr75_bunched(
     """
 
     _validate_inputs(turn_volume_m3, yarding_distance_m)
-    cycle_time = _minutes_per_turn_tr75(
-        yarding_distance_m,
-        fixed_time_min=0.69,
-        outhaul_intercept_min=0.0296,
-        outhaul_distance_coeff=0.0027,
-        inhaul_intercept_min=0.0,
-        inhaul_distance_coeff=0.0044,
-    )
+    cycle_time = _minutes_per_turn_tr75(yarding_distance_m, **_TR75_BUNCHED_COEFFICIENTS)
     return _productivity(turn_volume_m3, cycle_time)
 
 
@@ -135,14 +150,7 @@ def estimate_grapple_yarder_productivity_tr75_handfelled(
     """
 
     _validate_inputs(turn_volume_m3, yarding_distance_m)
-    cycle_time = _minutes_per_turn_tr75(
-        yarding_distance_m,
-        fixed_time_min=0.74,
-        outhaul_intercept_min=0.0323,
-        outhaul_distance_coeff=0.0026,
-        inhaul_intercept_min=0.0247,
-        inhaul_distance_coeff=0.0035,
-    )
+    cycle_time = _minutes_per_turn_tr75(yarding_distance_m, **_TR75_HANDFELLED_COEFFICIENTS)
     return _productivity(turn_volume_m3, cycle_time)
 
 
@@ -250,8 +258,7 @@ def _load_tn157_cases() -> Mapping[str, TN157Case]:
     """Load TN-157 case studies (cached) from the bundled JSON dataset."""
     if not _TN157_PATH.exists():
         raise FileNotFoundError(f"TN157 dataset not found: {_TN157_PATH}")
-    with _TN157_PATH.open(encoding="utf-8") as fh:
-        payload = cast(dict[str, Any], json.load(fh))
+    payload = cast(dict[str, Any], load_json(_TN157_PATH))
 
     cases: dict[str, TN157Case] = {}
     raw_entries = payload.get("case_studies") or []
@@ -485,8 +492,7 @@ def _load_tn147_cases() -> Mapping[str, TN147Case]:
     """Load TN-147 case studies (cached) from the bundled JSON dataset."""
     if not _TN147_PATH.exists():
         raise FileNotFoundError(f"TN147 dataset not found: {_TN147_PATH}")
-    with _TN147_PATH.open(encoding="utf-8") as fh:
-        payload = cast(dict[str, Any], json.load(fh))
+    payload = cast(dict[str, Any], load_json(_TN147_PATH))
     raw_entries = payload.get("case_studies") or []
     entries: list[dict[str, Any]] = [
         cast(dict[str, Any], entry) for entry in raw_entries if isinstance(entry, dict)
@@ -707,8 +713,7 @@ def _load_tr122_treatments() -> Mapping[str, TR122Treatment]:
     """Load TR-122 treatment metadata from the bundled JSON dataset."""
     if not _TR122_PATH.exists():
         raise FileNotFoundError(f"TR122 dataset not found: {_TR122_PATH}")
-    with _TR122_PATH.open(encoding="utf-8") as fh:
-        payload = cast(dict[str, Any], json.load(fh))
+    payload = cast(dict[str, Any], load_json(_TR122_PATH))
     treatments: dict[str, TR122Treatment] = {}
     cycle_data = payload.get("cycle_distribution", {})
     for entry_obj in payload.get("treatments", []):
@@ -872,8 +877,7 @@ def _load_adv5n28_blocks() -> Mapping[str, ADV5N28Block]:
     """Load ADV5N28 skyline-conversion blocks from the bundled JSON dataset."""
     if not _ADV5N28_PATH.exists():
         raise FileNotFoundError(f"ADV5N28 dataset not found: {_ADV5N28_PATH}")
-    with _ADV5N28_PATH.open(encoding="utf-8") as fh:
-        payload = cast(dict[str, Any], json.load(fh))
+    payload = cast(dict[str, Any], load_json(_ADV5N28_PATH))
 
     blocks: dict[str, ADV5N28Block] = {}
     for entry_obj in payload.get("blocks", []):
@@ -1031,8 +1035,7 @@ def get_adv1n35_metadata() -> ADV1N35Metadata:
     """
     if not _ADV1N35_PATH.exists():
         raise FileNotFoundError(f"ADV1N35 dataset not found: {_ADV1N35_PATH}")
-    with _ADV1N35_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(_ADV1N35_PATH)
     coeffs = payload["regressions"]["cycle_time"].get("coefficients", {})
     defaults = payload["regressions"]["productivity"]["defaults"]
     note = (
@@ -1053,6 +1056,7 @@ def get_adv1n35_metadata() -> ADV1N35Metadata:
     )
 
 
+@memoised("productivity.adv1n35")
 def estimate_grapple_yarder_productivity_adv1n35(
     *,
     turn_volume_m3: float,
@@ -1163,8 +1167,7 @@ def get_adv1n40_metadata() -> ADV1N40Metadata:
     """
     if not _ADV1N40_PATH.exists():
         raise FileNotFoundError(f"ADV1N40 dataset not found: {_ADV1N40_PATH}")
-    with _ADV1N40_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(_ADV1N40_PATH)
     coeffs = payload["regressions"]["cycle_time"]["coefficients"]
     defaults = payload["regressions"]["productivity"]["defaults"]
     note = (
@@ -1187,6 +1190,7 @@ def get_adv1n40_metadata() -> ADV1N40Metadata:
     )
 
 
+@memoised("productivity.adv1n40")
 def estimate_grapple_yarder_productivity_adv1n40(
     *,
     turn_volume_m3: float,
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import StrEnum
 
 import numpy as np
 
+from fhops.core.cache import memoised
 from fhops.core.errors import FHOPSValueError
 from fhops.productivity.ranges import load_lahrsen_ranges
 
@@ -124,6 +125,12 @@ def _check_range(
     violations.append(msg)
 
 
+def _copy_estimate(estimate: ProductivityEstimate) -> ProductivityEstimate:
+    ranges = {key: dict(bounds) for key, bounds in estimate.ranges.items()}
+    return replace(estimate, ranges=ranges)
+
+
+@memoised("productivity.lahrsen2025", copy=_copy_estimate)
 def estimate_productivity(
     *,
     avg_stem_size: float,
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import math
 from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, Literal, cast
 
+from fhops.core.cache import memoised
 from fhops.costing.inflation import inflate_value
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 JSONDict = dict[str, Any]
 JSONDictMap = dict[str, JSONDict]
@@ -41,7 +41,7 @@ _CARRIER_PROFILE_PATH = _REFERENCE_ROOT / "processor_carrier_profiles.json"
 def _load_berry_dataset() -> JSONDict:
     """Load the Berry (2019) skyline processor dataset from ``data/productivity``."""
     try:
-        return json.loads(_BERRY_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_BERRY_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"Berry (2019) processor data missing: {_BERRY_DATA_PATH}") from exc
 
@@ -50,7 +50,7 @@ def _load_berry_dataset() -> JSONDict:
 def _load_adv5n6_dataset() -> JSONDict:
     """Load the ADV5N6 (coastal BC) processor dataset."""
     try:
-        return json.loads(_ADV5N6_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_ADV5N6_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"ADV5N6 processor data missing: {_ADV5N6_DATA_PATH}") from exc
 
@@ -59,7 +59,7 @@ def _load_adv5n6_dataset() -> JSONDict:
 def _load_adv7n3_dataset() -> JSONDict:
     """Load the ADV7N3 processor dataset (Hyundai 210 vs JD 892)."""
     try:
-        return json.loads(_ADV7N3_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_ADV7N3_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"ADV7N3 processor data missing: {_ADV7N3_DATA_PATH}") from exc
 
@@ -68,7 +68,7 @@ def _load_adv7n3_dataset() -> JSONDict:
 def _load_tn166_dataset() -> JSONDict:
     """Load the TN-166 telescopic-boom processor dataset."""
     try:
-        return json.loads(_TN166_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_TN166_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"TN-166 processor data missing: {_TN166_DATA_PATH}") from exc
 
@@ -77,7 +77,7 @@ def _load_tn166_dataset() -> JSONDict:
 def _load_barko450_dataset() -> JSONDict:
     """Load the TN-46 Barko 450 loader dataset."""
     try:
-        return json.loads(_BARKO450_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_BARKO450_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"Barko 450 loader data missing: {_BARKO450_DATA_PATH}") from exc
 
@@ -86,7 +86,7 @@ def _load_barko450_dataset() -> JSONDict:
 def _load_kizha2020_dataset() -> JSONDict:
     """Load the Kizha et al. (2020) loader dataset (hot vs cold yarding)."""
     try:
-        return json.loads(_KIZHA2020_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_KIZHA2020_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Kizha et al. (2020) loader data missing: {_KIZHA2020_DATA_PATH}"
@@ -97,7 +97,7 @@ def _load_kizha2020_dataset() -> JSONDict:
 def _load_hypro775_dataset() -> JSONDict:
     """Load the HYPRO 775 tractor-processor dataset."""
     try:
-        return json.loads(_HYPRO775_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_HYPRO775_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"HYPRO 775 processor data missing: {_HYPRO775_DATA_PATH}") from exc
 
@@ -106,7 +106,7 @@ def _load_hypro775_dataset() -> JSONDict:
 def _load_labelle_huss_dataset() -> JSONDict:
     """Load the Labelle & Huß (2018) automatic bucking uplift dataset."""
     try:
-        return json.loads(_LABELLE_HUSS_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_LABELLE_HUSS_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Labelle & Huß (2018) automatic bucking data missing: {_LABELLE_HUSS_DATA_PATH}"
@@ -117,7 +117,7 @@ def _load_labelle_huss_dataset() -> JSONDict:
 def _load_tn103_dataset() -> JSONDict:
     """Load the TN-103 Caterpillar DL221 processor dataset."""
     try:
-        return json.loads(_TN103_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_TN103_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"TN-103 processor data missing: {_TN103_DATA_PATH}") from exc
 
@@ -126,7 +126,7 @@ def _load_tn103_dataset() -> JSONDict:
 def _load_tr87_dataset() -> JSONDict:
     """Load the TR-87 Timberjack TJ90 processor dataset."""
     try:
-        return json.loads(_TR87_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_TR87_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"TR-87 processor data missing: {_TR87_DATA_PATH}") from exc
 
@@ -135,7 +135,7 @@ def _load_tr87_dataset() -> JSONDict:
 def _load_tr106_dataset() -> JSONDict:
     """Load the TR-106 lodgepole pine processor dataset."""
     try:
-        return json.loads(_TR106_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_TR106_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"TR-106 processor data missing: {_TR106_DATA_PATH}") from exc
 
@@ -144,7 +144,7 @@ def _load_tr106_dataset() -> JSONDict:
 def _load_visser_dataset() -> JSONDict:
     """Load the Visser & Tolan (2015) processor dataset."""
     try:
-        return json.loads(_VISSER2015_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_VISSER2015_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Visser & Tolan (2015) processor data missing: {_VISSER2015_DATA_PATH}"
@@ -155,7 +155,7 @@ def _load_visser_dataset() -> JSONDict:
 def _load_spinelli2010_dataset() -> JSONDict:
     """Load the Spinelli et al. (2010) processor dataset."""
     try:
-        return json.loads(_SPINELLI2010_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_SPINELLI2010_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Spinelli et al. (2010) processor data missing: {_SPINELLI2010_DATA_PATH}"
@@ -166,7 +166,7 @@ def _load_spinelli2010_dataset() -> JSONDict:
 def _load_bertone2025_dataset() -> JSONDict:
     """Load the Bertone & Manzone (2025) excavator-processor dataset."""
     try:
-        return json.loads(_BERTONE2025_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_BERTONE2025_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Bertone & Manzone (2025) processor data missing: {_BERTONE2025_DATA_PATH}"
@@ -177,7 +177,7 @@ def _load_bertone2025_dataset() -> JSONDict:
 def _load_borz2023_dataset() -> JSONDict:
     """Load the Borz et al. (2023) Romanian processor dataset."""
     try:
-        return cast(JSONDict, json.loads(_BORZ2023_DATA_PATH.read_text(encoding="utf-8")))
+        return cast(JSONDict, load_json(_BORZ2023_DATA_PATH))
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Borz et al. (2023) landing processor data missing: {_BORZ2023_DATA_PATH}"
@@ -188,7 +188,7 @@ def _load_borz2023_dataset() -> JSONDict:
 def _load_nakagawa2010_dataset() -> JSONDict:
     """Load the Nakagawa et al. (2010) Japanese landing processor dataset."""
     try:
-        return json.loads(_NAKAGAWA2010_DATA_PATH.read_text(encoding="utf-8"))
+        return load_json(_NAKAGAWA2010_DATA_PATH)
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Nakagawa et al. (2010) processor data missing: {_NAKAGAWA2010_DATA_PATH}"
@@ -306,7 +306,7 @@ def get_labelle_huss_automatic_bucking_adjustment() -> AutomaticBuckingAdjustmen
 def _load_berry_log_grade_payload() -> JSONDict:
     """Load Berry (2019) log grade emmeans for per-grade processing times."""
     try:
-        return cast(JSONDict, json.loads(_BERRY_LOG_GRADES_PATH.read_text(encoding="utf-8")))
+        return cast(JSONDict, load_json(_BERRY_LOG_GRADES_PATH))
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Berry (2019) log grade emmeans data missing: {_BERRY_LOG_GRADES_PATH}"
@@ -350,7 +350,7 @@ def get_berry_log_grade_metadata() -> JSONDict:
 def _load_carrier_profiles_raw() -> JSONDictMap:
     """Load processor carrier profile metadata (purpose-built vs excavator)."""
     try:
-        data = cast(JSONDict, json.loads(_CARRIER_PROFILE_PATH.read_text(encoding="utf-8")))
+        data = cast(JSONDict, load_json(_CARRIER_PROFILE_PATH))
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(f"Carrier profile data missing: {_CARRIER_PROFILE_PATH}") from exc
     carriers_raw = data.get("carriers")
@@ -732,6 +732,7 @@ class ProcessorProductivityResult:
     carrier_profile: ProcessorCarrierProfile | None = None
 
 
+@memoised("productivity.berry2019")
 def estimate_processor_productivity_berry2019(
     *,
     piece_size_m3: float,
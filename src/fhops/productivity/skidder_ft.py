@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import math
 from dataclasses import dataclass, field
 from enum import StrEnum
 from functools import lru_cache
 from typing import Any, cast
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 
 class Han2018SkidderMethod(StrEnum):
@@ -129,9 +128,7 @@ _ADV6N7_PATH = data_path("reference", "fpinnovations", "adv6n7_caterpillar535b.j
 def _load_skidder_speed_profiles() -> dict[str, dict[str, Any]]:
     """Load GNSS-derived skidder speed profiles for travel-time overrides."""
     try:
-        data = cast(
-            dict[str, Any], json.loads(_SKIDDER_SPEED_PROFILE_PATH.read_text(encoding="utf-8"))
-        )
+        data = cast(dict[str, Any], load_json(_SKIDDER_SPEED_PROFILE_PATH))
     except FileNotFoundError as exc:  # pragma: no cover - configuration error
         raise FileNotFoundError(
             f"Skidder speed profile data missing: {_SKIDDER_SPEED_PROFILE_PATH}"
@@ -151,7 +148,7 @@ def get_adv6n7_metadata() -> ADV6N7Metadata:
     """Load and cache the ADV6N7 regression metadata from the bundled JSON file."""
     if not _ADV6N7_PATH.exists():
         raise FileNotFoundError(f"ADV6N7 dataset not found: {_ADV6N7_PATH}")
-    payload = cast(dict[str, Any], json.loads(_ADV6N7_PATH.read_text(encoding="utf-8")))
+    payload = cast(dict[str, Any], load_json(_ADV6N7_PATH))
     regressions: dict[str, Any] = payload["regressions"]
     cycle_entries: dict[str, dict[str, Any]] = regressions["cycle_time"]["equations"]
     intercepts: dict[ADV6N7DeckingMode, float] = {}
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any, cast
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _ADV2N21_PATH = data_path("reference", "fpinnovations", "adv2n21_partial_cut.json")
 
@@ -45,7 +44,7 @@ class ADV2N21Treatment:
 def _load_adv2n21_payload() -> dict[str, Any]:
     if not _ADV2N21_PATH.exists():
         raise FileNotFoundError(f"ADV2N21 dataset missing: {_ADV2N21_PATH}")
-    return cast(dict[str, Any], json.loads(_ADV2N21_PATH.read_text(encoding="utf-8")))
+    return cast(dict[str, Any], load_json(_ADV2N21_PATH))
 
 
 def _build_stand_snapshot(data: dict | None) -> ADV2N21StandSnapshot | None:
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_PATH = data_path("reference", "fpinnovations", "adv6n25_helicopters.json")
 
@@ -60,7 +59,7 @@ def _parse_helicopter(entry: Mapping[str, Any]) -> ADV6N25Helicopter:
 def load_adv6n25_dataset() -> ADV6N25Dataset:
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"ADV6N25 dataset missing: {_DATA_PATH}")
-    payload = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_DATA_PATH)
     helicopters = tuple(_parse_helicopter(entry) for entry in payload.get("helicopters", []))
     return ADV6N25Dataset(
         source=payload.get("source", {}),
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import math
 import re
 from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 DATA_PATH = data_path("reference", "arnvik", "appendix5_stands.json")
 
@@ -72,8 +71,7 @@ def _parse_slope(value: str) -> float | None:
 def load_appendix5_stands() -> Sequence[Appendix5Stand]:
     if not DATA_PATH.exists():
         raise FileNotFoundError(f"Appendix 5 dataset missing: {DATA_PATH}")
-    with DATA_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(DATA_PATH)
     return tuple(
         Appendix5Stand(
             author=entry.get("author", ""),
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_PATH = data_path("reference", "fpinnovations", "fncy12_tmy45_mini_mak.json")
 
@@ -75,7 +74,7 @@ def _support_ratio(payload: Mapping[str, Any], key: str) -> float | None:
 def load_fncy12_dataset() -> Fncy12Dataset:
     if not _DATA_PATH.exists():  # pragma: no cover - validates repo layout
         raise FileNotFoundError(f"FNCY12 dataset missing: {_DATA_PATH}")
-    payload = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_DATA_PATH)
     productivity = payload.get("productivity", {})
     months = tuple(
         _parse_month(entry)
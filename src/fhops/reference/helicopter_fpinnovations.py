@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 if TYPE_CHECKING:  # pragma: no cover - import-time typing helper
     from fhops.productivity.cable_logging import HelicopterLonglineModel
@@ -135,7 +134,7 @@ def _maybe_float(value: Any) -> float | None:
 def load_helicopter_fpinnovations_dataset() -> HelicopterFPInnovationsDataset:
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"Missing helicopter dataset: {_DATA_PATH}")
-    payload = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_DATA_PATH)
     sources_payload = payload.get("sources", {})
     sources = {
         source_id: _parse_source(source_id, source_payload)
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 DATA_PATH = data_path("reference", "partial_cut_profiles.json")
 
@@ -25,8 +24,7 @@ class PartialCutProfile:
 def load_partial_cut_profiles() -> dict[str, PartialCutProfile]:
     if not DATA_PATH.exists():
         raise FileNotFoundError(f"Missing partial-cut profile dataset: {DATA_PATH}")
-    with DATA_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(DATA_PATH)
     profiles: dict[str, PartialCutProfile] = {}
     for entry in payload.get("profiles", []):
         profile_id = entry.get("id")
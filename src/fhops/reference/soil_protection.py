@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_PATH = data_path("reference", "soil_protection_profiles.json")
 
@@ -30,7 +29,7 @@ class SoilProfile:
 def load_soil_profiles() -> Mapping[str, SoilProfile]:
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"Soil profile dataset missing: {_DATA_PATH}")
-    payload = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_DATA_PATH)
     profiles: dict[str, SoilProfile] = {}
     for entry in payload.get("profiles", []):
         profile = SoilProfile(
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_ROOT = data_path("reference", "fpinnovations")
 _ADV15N3_PATH = _DATA_ROOT / "adv15n3_support.json"
@@ -40,7 +39,7 @@ class CompactionRisk:
 def load_adv15n3_support() -> tuple[str, Mapping[str, TractorDriveEfficiency]]:
     if not _ADV15N3_PATH.exists():
         raise FileNotFoundError(f"Missing ADV15N3 dataset: {_ADV15N3_PATH}")
-    payload = json.loads(_ADV15N3_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_ADV15N3_PATH)
     baseline_id = payload.get("baseline_drive_id")
     drives_payload = payload.get("drives") or []
     drives: dict[str, TractorDriveEfficiency] = {}
@@ -99,7 +98,7 @@ def adv15n3_drive_ids() -> tuple[str, ...]:
 def load_adv4n7_compaction() -> tuple[str, Mapping[str, CompactionRisk]]:
     if not _ADV4N7_PATH.exists():
         raise FileNotFoundError(f"Missing ADV4N7 dataset: {_ADV4N7_PATH}")
-    payload = json.loads(_ADV4N7_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_ADV4N7_PATH)
     default_risk = payload.get("default_risk_id", "some")
     risks_payload = payload.get("risk_levels") or []
     risks: dict[str, CompactionRisk] = {}
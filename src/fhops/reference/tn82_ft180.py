@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_PATH = data_path("reference", "fpinnovations", "tn82_ft180_jd550.json")
 
@@ -72,7 +71,7 @@ def _parse_machine(entry: Mapping[str, Any]) -> TN82Machine:
 def load_tn82_dataset() -> TN82Dataset:
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"TN82 dataset missing: {_DATA_PATH}")
-    payload = json.loads(_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_DATA_PATH)
     machines = tuple(_parse_machine(entry) for entry in payload.get("machines", []))
     return TN82Dataset(
         source=payload.get("source", {}),
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_PATH = data_path("reference", "fpinnovations", "tn98_handfalling.json")
 
@@ -48,8 +47,7 @@ class TN98HandfallingDataset:
 def _load_raw_payload() -> Mapping[str, Any]:
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"TN98 dataset missing: {_DATA_PATH}")
-    with _DATA_PATH.open(encoding="utf-8") as handle:
-        return json.load(handle)
+    return load_json(_DATA_PATH)
 
 
 def _parse_regressions(payload: Mapping[str, Any]) -> Mapping[str, TN98Regression]:
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 DATA_PATH = data_path("reference", "fpinnovations", "tr119_yarding_productivity.json")
 
@@ -25,8 +24,7 @@ class Tr119Treatment:
 def load_tr119_treatments() -> Sequence[Tr119Treatment]:
     if not DATA_PATH.exists():
         raise FileNotFoundError(f"Missing TR119 dataset: {DATA_PATH}")
-    with DATA_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(DATA_PATH)
     return tuple(
         Tr119Treatment(
             treatment=entry["treatment"],
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import re
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _DATA_PATH = data_path("reference", "fpinnovations", "tr28_subgrade_machines.json")
 _STATION_LENGTH_M = 30.48
@@ -71,8 +70,7 @@ def load_tr28_machines() -> Sequence[TR28Machine]:
 
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"TR-28 dataset missing: {_DATA_PATH}")
-    with _DATA_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(_DATA_PATH)
     machines: list[TR28Machine] = []
     for entry in payload.get("machines", []):
         movement = entry.get("movement") or {}
@@ -108,8 +106,7 @@ def get_tr28_source_metadata() -> Mapping[str, Any]:
 
     if not _DATA_PATH.exists():
         raise FileNotFoundError(f"TR-28 dataset missing: {_DATA_PATH}")
-    with _DATA_PATH.open(encoding="utf-8") as fh:
-        payload = json.load(fh)
+    payload = load_json(_DATA_PATH)
     return payload.get("source", {})
 
 
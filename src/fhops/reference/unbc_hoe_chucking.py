@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from functools import lru_cache
 
-from fhops.resources import data_path
+from fhops.resources import data_path, load_json
 
 _HOE_DATA_PATH = data_path("reference", "unbc_hoe_chucking.json")
 _PROC_DATA_PATH = data_path("reference", "unbc_processing_costs.json")
@@ -29,7 +28,7 @@ class UNBCHoeChuckingScenario:
 def load_unbc_hoe_chucking_data() -> tuple[UNBCHoeChuckingScenario, ...]:
     if not _HOE_DATA_PATH.exists():  # pragma: no cover - configuration error
         raise FileNotFoundError(f"Missing UNBC hoe-chucking data: {_HOE_DATA_PATH}")
-    payload = json.loads(_HOE_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_HOE_DATA_PATH)
     scenarios: list[UNBCHoeChuckingScenario] = []
     for entry in payload.get("scenarios", []):
         scenarios.append(
@@ -86,7 +85,7 @@ class UNBCConstructionCost:
 def load_unbc_processing_costs() -> tuple[UNBCProcessingCostScenario, ...]:
     if not _PROC_DATA_PATH.exists():  # pragma: no cover - configuration error
         raise FileNotFoundError(f"Missing UNBC processing cost data: {_PROC_DATA_PATH}")
-    payload = json.loads(_PROC_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_PROC_DATA_PATH)
     scenarios: list[UNBCProcessingCostScenario] = []
     for entry in payload.get("scenarios", []):
         scenarios.append(
@@ -114,7 +113,7 @@ def load_unbc_processing_costs() -> tuple[UNBCProcessingCostScenario, ...]:
 def load_unbc_construction_costs() -> tuple[UNBCConstructionCost, ...]:
     if not _PROC_DATA_PATH.exists():  # pragma: no cover - configuration error
         raise FileNotFoundError(f"Missing UNBC processing cost data: {_PROC_DATA_PATH}")
-    payload = json.loads(_PROC_DATA_PATH.read_text(encoding="utf-8"))
+    payload = load_json(_PROC_DATA_PATH)
     entries = []
     for entry in payload.get("construction", []):
         entries.append(
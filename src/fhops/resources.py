@@ -1,8 +1,44 @@
-"""Helpers for locating FHOPS package data in source and wheel installs."""
+"""Helpers for locating FHOPS package data in source and wheel installs.
+
+Reference JSON under ``data/`` can optionally be precompiled into a single versioned bundle
+(``data/reference.bundle``, see :func:`build_reference_bundle`). When the bundle exists, loaders
+that read through :func:`load_json` take their tables from it instead of parsing JSON: the file is
+memory-mapped once, each table is unpickled only when first requested, and derived tables (for
+example CPI-inflated machine rates) are stored ready to use. Every table records the size, mtime,
+and SHA-256 of its source files, so edited data silently falls back to the JSON on disk.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import importlib
+import json
+import mmap
+import os
+import pickle
+import struct
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
+
+BUNDLE_FILENAME = "reference.bundle"
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_ENV_VAR = "FHOPS_REFERENCE_BUNDLE"
+
+_MAGIC = b"FHOPSRB\x00"
+_HEADER = struct.Struct("<8sII")  # magic, format version, index length
+_DISABLED_VALUES = {"0", "off", "false", "no", "none"}
+
+# Derived tables: name -> (source files relative to data/, "module:builder").
+# Builders must read their inputs from the JSON sources (never from the bundle).
+DERIVED_TABLES: dict[str, tuple[tuple[str, ...], str]] = {
+    "costing/machine_rates@inflated": (
+        ("machine_rates.json", "costing/cpi_canada_all_items_2002_100.json"),
+        "fhops.costing.machine_rates:_build_default_machine_rates",
+    ),
+}
 
 
 def data_path(*parts: str) -> Path:
@@ -35,3 +71,245 @@ def data_path(*parts: str) -> Path:
     if repo_data.exists():
         return repo_data.joinpath(*parts)
     return Path(__file__).resolve().parent.joinpath("data", *parts)
+
+
+@dataclass(frozen=True)
+class _SourceStamp:
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    @classmethod
+    def capture(cls, root: Path, relative: str) -> _SourceStamp:
+        file = root / relative
+        stat = file.stat()
+        digest = hashlib.sha256(file.read_bytes()).hexdigest()
+        return cls(relative, stat.st_size, stat.st_mtime_ns, digest)
+
+    def is_current(self, root: Path) -> bool:
+        """Cheap ``stat`` check first; fall back to hashing when only the mtime moved."""
+
+        try:
+            stat = (root / self.path).stat()
+        except OSError:
+            return False
+        if stat.st_size != self.size:
+            return False
+        if stat.st_mtime_ns == self.mtime_ns:
+            return True
+        return hashlib.sha256((root / self.path).read_bytes()).hexdigest() == self.sha256
+
+
+class ReferenceBundle:
+    """Read-only view over a compiled reference bundle.
+
+    The file layout is a fixed header, a JSON index mapping table names to payload offsets and
+    source stamps, then the pickled payloads. Opening the bundle reads only the header and index;
+    :meth:`get` unpickles a single table (fresh objects on every call) after confirming its
+    sources are unchanged.
+    """
+
+    def __init__(self, path: str | Path, *, root: Path | None = None) -> None:
+        from fhops import __version__
+
+        self.path = Path(path)
+        self.root = (root if root is not None else data_path()).resolve()
+        with self.path.open("rb") as handle:
+            self._buffer: mmap.mmap | bytes
+            try:
+                self._buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):  # empty file or mmap unsupported
+                self._buffer = handle.read()
+        magic, version, index_length = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path} is not an FHOPS reference bundle.")
+        if version != BUNDLE_FORMAT_VERSION:
+            raise ValueError(
+                f"{self.path} uses bundle format {version}; expected {BUNDLE_FORMAT_VERSION}."
+            )
+        start = _HEADER.size
+        index = json.loads(bytes(self._buffer[start : start + index_length]))
+        if index.get("fhops_version") != __version__:
+            raise ValueError(
+                f"{self.path} was built by FHOPS {index.get('fhops_version')}; "
+                f"rebuild it for {__version__}."
+            )
+        self._payload_start = start + index_length
+        self._tables: dict[str, dict[str, Any]] = index["tables"]
+        self._fresh: dict[str, bool] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tables
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def tables(self) -> tuple[str, ...]:
+        return tuple(self._tables)
+
+    def table_name(self, path: Path) -> str | None:
+        """Return the table name for a data file path (``None`` when outside the data root)."""
+
+        # data_path() results are already resolved; avoid the realpath cost for them.
+        if not path.is_absolute():
+            path = path.resolve()
+        try:
+            return path.relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def is_fresh(self, name: str) -> bool:
+        """Return ``True`` when ``name`` is bundled and none of its sources changed."""
+
+        fresh = self._fresh.get(name)
+        if fresh is None:
+            entry = self._tables.get(name)
+            fresh = entry is not None and all(
+                _SourceStamp(**stamp).is_current(self.root) for stamp in entry["sources"]
+            )
+            self._fresh[name] = fresh
+        return fresh
+
+    def get(self, name: str) -> Any:
+        """Materialise table ``name`` (``KeyError`` when missing or stale)."""
+
+        if not self.is_fresh(name):
+            raise KeyError(name)
+        entry = self._tables[name]
+        offset = self._payload_start + entry["offset"]
+        return pickle.loads(memoryview(self._buffer)[offset : offset + entry["length"]])
+
+
+def _json_sources(root: Path) -> list[str]:
+    return sorted(
+        path.relative_to(root).as_posix()
+        for path in root.rglob("*.json")
+        if not any(part.startswith(".") for part in path.relative_to(root).parts)
+    )
+
+
+def _resolve_builder(spec: str) -> Callable[[], Any]:
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def build_reference_bundle(
+    output: str | Path | None = None,
+    *,
+    root: Path | None = None,
+    derived: Mapping[str, tuple[Iterable[str], str]] | None = None,
+) -> Path:
+    """Compile every JSON file under ``data/`` plus derived tables into a single bundle.
+
+    Parameters
+    ----------
+    output:
+        Destination file (defaults to ``data/reference.bundle``).
+    root:
+        Data directory to compile (defaults to :func:`data_path`).
+    derived:
+        Derived tables to precompute (defaults to :data:`DERIVED_TABLES`).
+
+    Returns
+    -------
+    pathlib.Path
+        The written bundle path. The file is written atomically via a temporary sibling.
+    """
+
+    from fhops import __version__
+
+    root = root if root is not None else data_path()
+    output = Path(output) if output is not None else root / BUNDLE_FILENAME
+    derived = derived if derived is not None else DERIVED_TABLES
+    tables: dict[str, dict[str, Any]] = {}
+    payloads: list[bytes] = []
+    offset = 0
+
+    def add(name: str, value: Any, sources: Iterable[str]) -> None:
+        nonlocal offset
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        tables[name] = {
+            "offset": offset,
+            "length": len(blob),
+            "sources": [_SourceStamp.capture(root, source).__dict__ for source in sources],
+        }
+        payloads.append(blob)
+        offset += len(blob)
+
+    for relative in _json_sources(root):
+        add(relative, json.loads((root / relative).read_text(encoding="utf-8")), [relative])
+    for name, (sources, builder) in derived.items():
+        add(name, _resolve_builder(builder)(), sources)
+
+    index = json.dumps(
+        {"fhops_version": __version__, "tables": tables}, sort_keys=True, separators=(",", ":")
+    ).encode()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.tmp")
+    with tmp.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, BUNDLE_FORMAT_VERSION, len(index)))
+        handle.write(index)
+        for blob in payloads:
+            handle.write(blob)
+    tmp.replace(output)
+    reference_bundle.cache_clear()
+    return output
+
+
+@lru_cache(maxsize=1)
+def reference_bundle() -> ReferenceBundle | None:
+    """Return the active reference bundle, or ``None`` when absent, disabled, or incompatible.
+
+    ``FHOPS_REFERENCE_BUNDLE`` may point at an alternate bundle file or be set to ``0``/``off`` to
+    force plain JSON loading. Call ``reference_bundle.cache_clear()`` after changing it.
+    """
+
+    override = os.environ.get(BUNDLE_ENV_VAR, "").strip()
+    if override.lower() in _DISABLED_VALUES:
+        return None
+    path = Path(override) if override else data_path(BUNDLE_FILENAME)
+    if not path.is_file():
+        return None
+    try:
+        return ReferenceBundle(path)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+
+def bundled_table(name: str) -> Any | None:
+    """Return derived table ``name`` from the bundle, or ``None`` when unavailable or stale."""
+
+    bundle = reference_bundle()
+    if bundle is None or not bundle.is_fresh(name):
+        return None
+    return bundle.get(name)
+
+
+def load_json(path: str | Path) -> Any:
+    """Parse a reference JSON file, served from the compiled bundle when it is current.
+
+    Paths outside the data directory (for example test fixtures) are always read from disk.
+    """
+
+    path = Path(path)
+    bundle = reference_bundle()
+    if bundle is not None:
+        name = bundle.table_name(path)
+        if name is not None and bundle.is_fresh(name):
+            return bundle.get(name)
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+__all__ = [
+    "BUNDLE_ENV_VAR",
+    "BUNDLE_FILENAME",
+    "BUNDLE_FORMAT_VERSION",
+    "DERIVED_TABLES",
+    "ReferenceBundle",
+    "build_reference_bundle",
+    "bundled_table",
+    "data_path",
+    "load_json",
+    "reference_bundle",
+]
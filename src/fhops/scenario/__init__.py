@@ -11,6 +11,7 @@ from .contract import (
     Scenario,
 )
 from .io import load_scenario, read_csv
+from .production_rates import derive_production_rates
 
 __all__ = [
     "Day",
@@ -23,4 +24,5 @@ __all__ = [
     "Problem",
     "load_scenario",
     "read_csv",
+    "derive_production_rates",
 ]
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from datetime import date
 from enum import StrEnum
+from typing import Any
 
-from pydantic import BaseModel, ValidationInfo, field_validator, model_validator
+from pydantic import BaseModel, PrivateAttr, ValidationInfo, field_validator, model_validator
 
 from fhops.costing.machine_rates import compose_default_rental_rate_for_role, normalize_machine_role
 from fhops.scheduling import MobilisationConfig, TimelineConfig
@@ -499,12 +500,9 @@ class Scenario(BaseModel):
                     )
         return value
 
-    @model_validator(mode="after")
-    def _cross_validate(self) -> Scenario:
-        block_ids = {block.id for block in self.blocks}
-        landing_ids = {landing.id for landing in self.landings}
-        machine_ids = {machine.id for machine in self.machines}
-
+    def _check_table_references(
+        self, block_ids: set[str], landing_ids: set[str], machine_ids: set[str]
+    ) -> None:
         for block in self.blocks:
             if block.landing_id not in landing_ids:
                 raise ValueError(
@@ -545,6 +543,17 @@ class Scenario(BaseModel):
             if rate.block_id not in block_ids:
                 raise ValueError(f"Production rate references unknown block_id={rate.block_id}")
 
+    @model_validator(mode="after")
+    def _cross_validate(self, info: ValidationInfo) -> Scenario:
+        block_ids = {block.id for block in self.blocks}
+        landing_ids = {landing.id for landing in self.landings}
+        machine_ids = {machine.id for machine in self.machines}
+
+        # The scenario loaders check these tables column-wise before building the models and pass
+        # ``context={"references_checked": True}``; skip the per-row pass in that case.
+        if not (info.context and info.context.get("references_checked")):
+            self._check_table_references(block_ids, landing_ids, machine_ids)
+
         mobilisation = self.mobilisation
         if mobilisation and mobilisation.distances:
             for dist in mobilisation.distances:
@@ -553,6 +562,17 @@ class Scenario(BaseModel):
                         "Mobilisation distance references unknown block_id "
                         f"{dist.from_block}->{dist.to_block}"
                     )
+        if mobilisation and mobilisation.distance_matrix is not None:
+            unknown_blocks = [
+                block_id
+                for block_id in mobilisation.distance_matrix.block_ids
+                if block_id not in block_ids
+            ]
+            if unknown_blocks:
+                raise ValueError(
+                    "Mobilisation distance matrix references unknown block_id(s) "
+                    f"{', '.join(unknown_blocks[:5])}"
+                )
         if mobilisation and mobilisation.machine_params:
             for param in mobilisation.machine_params:
                 if param.machine_id not in machine_ids:
@@ -659,6 +679,8 @@ class Problem(BaseModel):
     scenario: Scenario
     days: list[Day]
     shifts: list[ShiftInstance]
+    # Memoised OperationalProblem (see fhops.optimization.operational_problem).
+    _operational_context: Any = PrivateAttr(default=None)
 
     @classmethod
     def from_scenario(cls, scenario: Scenario) -> Problem:
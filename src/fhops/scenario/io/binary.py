@@ -0,0 +1,182 @@
+"""Compact single-file binary scenario format (``.fhops``).
+
+A compiled scenario stores everything :func:`~fhops.scenario.io.load_scenario` would assemble from
+the YAML + CSV tree in one file: a fixed header, JSON metadata (the non-tabular scenario fields plus
+a segment index), one Arrow IPC stream per row table, and the mobilisation distance matrix as raw
+``float64``. Loading memory-maps the file, so Arrow columns and the distance matrix are read
+without copying; rows are still validated through the scenario models, with cross-table checks
+done column-wise.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pydantic import TypeAdapter
+
+from fhops.scenario.contract.models import (
+    Block,
+    CalendarEntry,
+    Landing,
+    Machine,
+    ProductionRate,
+    Scenario,
+    ShiftCalendarEntry,
+)
+from fhops.scenario.io.columnar import REFERENCES_CHECKED, check_table_references
+from fhops.scheduling.mobilisation import DistanceMatrix
+
+__all__ = ["BINARY_FORMAT_VERSION", "BINARY_SUFFIX", "load_scenario_binary", "save_scenario_binary"]
+
+BINARY_SUFFIX = ".fhops"
+BINARY_FORMAT_VERSION = 1
+
+_MAGIC = b"FHOPSSC\x00"
+_HEADER = struct.Struct("<8sII")  # magic, format version, metadata length
+
+_TABLES: dict[str, type[Any]] = {
+    "blocks": Block,
+    "machines": Machine,
+    "landings": Landing,
+    "calendar": CalendarEntry,
+    "shift_calendar": ShiftCalendarEntry,
+    "production_rates": ProductionRate,
+}
+_MATRIX_SEGMENT = "mobilisation.distance_matrix"
+
+
+def _table_bytes(rows: list[dict[str, Any]], model: type[Any]) -> bytes:
+    names = list(model.model_fields)
+    table = pa.Table.from_pydict({name: [row[name] for row in rows] for name in names})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def save_scenario_binary(scenario: Scenario, path: str | Path) -> Path:
+    """Write ``scenario`` to a single ``.fhops`` file (atomically) and return the path.
+
+    GeoJSON and distance CSV references are stored as the strings recorded on the scenario; the
+    mobilisation distance matrix itself is embedded, so the source files are not needed to load.
+    """
+
+    path = Path(path)
+    metadata = scenario.model_dump(mode="json", exclude=set(_TABLES))
+    segments: dict[str, dict[str, Any]] = {}
+    payloads: list[bytes] = []
+    offset = 0
+
+    def add(name: str, blob: bytes, **extra: Any) -> None:
+        nonlocal offset
+        segments[name] = {"offset": offset, "length": len(blob), **extra}
+        blob += b"\x00" * (-len(blob) % 8)  # keep every segment 8-byte aligned
+        payloads.append(blob)
+        offset += len(blob)
+
+    for name, model in _TABLES.items():
+        rows = getattr(scenario, name)
+        if rows is None:
+            continue
+        add(name, _table_bytes([row.model_dump(mode="json") for row in rows], model))
+    mobilisation = scenario.mobilisation
+    matrix = mobilisation.distance_matrix if mobilisation else None
+    if mobilisation is not None and matrix is not None and mobilisation.distances is None:
+        # The dump materialises the matrix as rows; the raw segment below replaces them.
+        metadata["mobilisation"]["distances"] = None
+    if matrix is not None:
+        values = np.ascontiguousarray(matrix.values, dtype="<f8")
+        add(_MATRIX_SEGMENT, values.tobytes(), block_ids=list(matrix.block_ids))
+    metadata["segments"] = segments
+
+    # Align the payload start so the embedded float64 matrix can be viewed in place.
+    header = json.dumps(metadata, separators=(",", ":")).encode()
+    header += b" " * (-(_HEADER.size + len(header)) % 8)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, BINARY_FORMAT_VERSION, len(header)))
+        handle.write(header)
+        for blob in payloads:
+            handle.write(blob)
+    tmp.replace(path)
+    return path
+
+
+def _read_buffer(path: Path) -> mmap.mmap | bytes:
+    with path.open("rb") as handle:
+        try:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # empty file or mmap unsupported
+            return handle.read()
+
+
+def load_scenario_binary(path: str | Path) -> Scenario:
+    """Load a scenario written by :func:`save_scenario_binary`.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a compiled FHOPS scenario, uses another format version, or fails the
+        scenario validation rules.
+    """
+
+    path = Path(path)
+    buffer = _read_buffer(path)
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{path} is not a compiled FHOPS scenario.")
+    magic, version, metadata_length = _HEADER.unpack_from(buffer, 0)
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not a compiled FHOPS scenario.")
+    if version != BINARY_FORMAT_VERSION:
+        raise ValueError(
+            f"{path} uses scenario format {version}; expected {BINARY_FORMAT_VERSION}."
+        )
+    start = _HEADER.size
+    metadata: dict[str, Any] = json.loads(bytes(buffer[start : start + metadata_length]))
+    payload_start = start + metadata_length
+    segments: dict[str, dict[str, Any]] = metadata.pop("segments")
+    view = memoryview(buffer)
+
+    def segment(name: str) -> memoryview:
+        entry = segments[name]
+        offset = payload_start + entry["offset"]
+        return view[offset : offset + entry["length"]]
+
+    payload = dict(metadata)
+    frames: dict[str, pd.DataFrame] = {}
+    for name, model in _TABLES.items():
+        if name not in segments:
+            continue
+        table = pa.ipc.open_stream(pa.py_buffer(segment(name))).read_all()
+        names = table.column_names
+        columns = [column.to_pylist() for column in table.columns]
+        rows = [dict(zip(names, values)) for values in zip(*columns)]
+        payload[name] = TypeAdapter(list[model]).validate_python(rows)  # type: ignore[valid-type]
+        frames[name] = table.to_pandas()
+
+    if _MATRIX_SEGMENT in segments:
+        block_ids = segments[_MATRIX_SEGMENT]["block_ids"]
+        values = np.frombuffer(segment(_MATRIX_SEGMENT), dtype="<f8")
+        matrix = DistanceMatrix(tuple(block_ids), values.reshape(len(block_ids), len(block_ids)))
+        payload["mobilisation"] = {**payload["mobilisation"], "distance_matrix": matrix}
+
+    num_days = int(payload["num_days"])
+    if num_days >= 1:
+        check_table_references(
+            num_days,
+            blocks=frames["blocks"],
+            landings=frames["landings"],
+            machines=frames["machines"],
+            calendar=frames["calendar"],
+            production_rates=frames["production_rates"],
+            shift_calendar=frames.get("shift_calendar"),
+        )
+    return Scenario.model_validate(payload, context=REFERENCES_CHECKED)
@@ -0,0 +1,121 @@
+"""Column-wise helpers shared by the scenario loaders.
+
+The scenario tables are validated row by row through Pydantic (field types and ranges), but the
+cross-table checks — foreign keys and horizon bounds — only need whole columns. Running them here
+with hash-based membership tests lets :class:`~fhops.scenario.contract.models.Scenario` skip its
+per-row pass (see the ``references_checked`` validation context).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["REFERENCES_CHECKED", "check_table_references", "frame_records"]
+
+#: Validation context telling :class:`Scenario` that :func:`check_table_references` already ran.
+REFERENCES_CHECKED = {"references_checked": True}
+
+
+def frame_records(frame: pd.DataFrame) -> list[dict[str, object]]:
+    """Return ``frame`` as row dictionaries (same values as ``to_dict("records")``, faster)."""
+
+    columns = [str(column) for column in frame.columns]
+    values = [frame.iloc[:, pos].tolist() for pos in range(len(columns))]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+
+def _days(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame.columns:
+        return np.zeros(len(frame), dtype=np.float64)
+    return pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _unknown(frame: pd.DataFrame, column: str, known: pd.Series) -> np.ndarray:
+    return ~frame[column].isin(known).to_numpy(dtype=bool)
+
+
+def _first(mask: np.ndarray) -> int | None:
+    hits = np.flatnonzero(mask)
+    return int(hits[0]) if hits.size else None
+
+
+def _day(value: Any) -> int:
+    return int(value)
+
+
+def check_table_references(
+    num_days: int,
+    *,
+    blocks: pd.DataFrame,
+    landings: pd.DataFrame,
+    machines: pd.DataFrame,
+    calendar: pd.DataFrame,
+    production_rates: pd.DataFrame,
+    shift_calendar: pd.DataFrame | None = None,
+) -> None:
+    """Check foreign keys and horizon bounds of the row tables column-wise.
+
+    Call this after the rows passed model validation. Errors match the first failure (and the
+    message) :class:`Scenario` would report from its per-row checks.
+
+    Raises
+    ------
+    ValueError
+        If a block references an unknown landing or ends past ``num_days``, or a calendar, shift
+        calendar, or production-rate row references an unknown machine/block or day.
+    """
+
+    landing_ids = landings["id"]
+    machine_ids = machines["id"]
+    block_ids = blocks["id"]
+
+    bad_landing = _unknown(blocks, "landing_id", landing_ids)
+    late_start = _days(blocks, "earliest_start") > num_days
+    late_finish = _days(blocks, "latest_finish") > num_days
+    row = _first(bad_landing | late_start | late_finish)
+    if row is not None:
+        block = blocks.iloc[row]
+        if bad_landing[row]:
+            raise ValueError(
+                f"Block {block['id']} references unknown landing_id={block['landing_id']}"
+            )
+        field = "earliest_start" if late_start[row] else "latest_finish"
+        raise ValueError(f"Block {block['id']} {field} exceeds num_days={num_days}")
+
+    bad_machine = _unknown(calendar, "machine_id", machine_ids)
+    past_horizon = _days(calendar, "day") > num_days
+    row = _first(bad_machine | past_horizon)
+    if row is not None:
+        entry = calendar.iloc[row]
+        if bad_machine[row]:
+            raise ValueError(f"Calendar entry references unknown machine_id={entry['machine_id']}")
+        raise ValueError(
+            f"Calendar entry day {_day(entry['day'])} exceeds scenario horizon num_days={num_days}"
+        )
+
+    if shift_calendar is not None and len(shift_calendar):
+        bad_machine = _unknown(shift_calendar, "machine_id", machine_ids)
+        past_horizon = _days(shift_calendar, "day") > num_days
+        row = _first(bad_machine | past_horizon)
+        if row is not None:
+            entry = shift_calendar.iloc[row]
+            if bad_machine[row]:
+                raise ValueError(
+                    f"Shift calendar entry references unknown machine_id={entry['machine_id']}"
+                )
+            raise ValueError(
+                f"Shift calendar entry day {_day(entry['day'])} exceeds scenario horizon "
+                f"num_days={num_days}"
+            )
+
+    bad_machine = _unknown(production_rates, "machine_id", machine_ids)
+    bad_block = _unknown(production_rates, "block_id", block_ids)
+    row = _first(bad_machine | bad_block)
+    if row is not None:
+        rate = production_rates.iloc[row]
+        if bad_machine[row]:
+            raise ValueError(f"Production rate references unknown machine_id={rate['machine_id']}")
+        raise ValueError(f"Production rate references unknown block_id={rate['block_id']}")
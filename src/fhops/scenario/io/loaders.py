@@ -26,6 +26,8 @@ from fhops.scenario.contract.models import (
     ScheduleLock,
     ShiftCalendarEntry,
 )
+from fhops.scenario.io.binary import BINARY_SUFFIX, load_scenario_binary
+from fhops.scenario.io.columnar import REFERENCES_CHECKED, check_table_references, frame_records
 from fhops.scenario.io.mobilisation import populate_mobilisation_distances
 from fhops.scheduling.mobilisation import MobilisationConfig
 from fhops.scheduling.timeline.models import TimelineConfig
@@ -33,9 +35,14 @@ from fhops.validation.ranges import validate_block_ranges
 
 __all__ = ["load_scenario", "read_csv"]
 
+# libyaml's C parser is roughly 10x faster on large scenario files; fall back when unavailable.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def read_csv(path: Path) -> pd.DataFrame:
-    """Load a CSV file using pandas with UTF-8 defaults."""
+    """Load a scenario table using pandas (CSV with UTF-8 defaults; Parquet by file suffix)."""
+    if Path(path).suffix.lower() in {".parquet", ".pq"}:
+        return pd.read_parquet(path)
     return pd.read_csv(path)
 
 
@@ -125,7 +132,8 @@ def load_scenario(yaml_path: str | Path) -> Scenario:
     Parameters
     ----------
     yaml_path:
-        Path to the ``scenario.yaml`` file that references the component CSVs.
+        Path to the ``scenario.yaml`` file that references the component CSVs, or to a compiled
+        ``.fhops`` binary scenario (see :func:`fhops.scenario.io.binary.save_scenario_binary`).
 
     Returns
     -------
@@ -143,10 +151,15 @@ def load_scenario(yaml_path: str | Path) -> Scenario:
     * re-roots GeoJSON paths relative to the scenario directory, and
     * ensures every optional extra (timeline, mobilisation config, objective weights) is copied into
       the resulting Scenario instance.
+
+    Rows are validated per table through Pydantic; foreign keys and horizon bounds are checked
+    column-wise (:func:`~fhops.scenario.io.columnar.check_table_references`) instead of row by row.
     """
     base_path = Path(yaml_path).resolve()
+    if base_path.suffix.lower() == BINARY_SUFFIX:
+        return load_scenario_binary(base_path)
     with base_path.open("r", encoding="utf-8") as handle:
-        meta = yaml.safe_load(handle)
+        meta = yaml.load(handle, Loader=_YAML_LOADER)
     root = base_path.parent
     data_section = meta.get("data", {})
 
@@ -156,26 +169,21 @@ def load_scenario(yaml_path: str | Path) -> Scenario:
             raise FileNotFoundError(candidate)
         return candidate
 
-    blocks_raw = cast(list[dict[str, object]], read_csv(require("blocks")).to_dict("records"))
+    blocks_df = read_csv(require("blocks"))
+    blocks_raw = frame_records(blocks_df)
     _normalise_optional_block_fields(blocks_raw)
     blocks = TypeAdapter(list[Block]).validate_python(blocks_raw)
-    machines = TypeAdapter(list[Machine]).validate_python(
-        read_csv(require("machines")).to_dict("records")
-    )
-    landings = TypeAdapter(list[Landing]).validate_python(
-        read_csv(require("landings")).to_dict("records")
-    )
-    calendar = TypeAdapter(list[CalendarEntry]).validate_python(
-        read_csv(require("calendar")).to_dict("records")
-    )
-    rates = TypeAdapter(list[ProductionRate]).validate_python(
-        read_csv(require("prod_rates")).to_dict("records")
-    )
+    machines_df = read_csv(require("machines"))
+    machines = TypeAdapter(list[Machine]).validate_python(frame_records(machines_df))
+    landings_df = read_csv(require("landings"))
+    landings = TypeAdapter(list[Landing]).validate_python(frame_records(landings_df))
+    calendar_df = read_csv(require("calendar"))
+    calendar = TypeAdapter(list[CalendarEntry]).validate_python(frame_records(calendar_df))
+    rates_df = read_csv(require("prod_rates"))
+    rates = TypeAdapter(list[ProductionRate]).validate_python(frame_records(rates_df))
     road_construction = None
     if "road_construction" in data_section:
-        road_rows = cast(
-            list[dict[str, object]], read_csv(require("road_construction")).to_dict("records")
-        )
+        road_rows = frame_records(read_csv(require("road_construction")))
         _normalise_road_rows(road_rows)
         road_construction = TypeAdapter(list[RoadConstruction]).validate_python(road_rows)
     elif "road_construction" in meta:
@@ -183,33 +191,50 @@ def load_scenario(yaml_path: str | Path) -> Scenario:
             meta["road_construction"]
         )
     shift_calendar = None
+    shift_df = None
     if "shift_calendar" in data_section:
+        shift_df = read_csv(require("shift_calendar"))
         shift_calendar = TypeAdapter(list[ShiftCalendarEntry]).validate_python(
-            read_csv(require("shift_calendar")).to_dict("records")
+            frame_records(shift_df)
         )
     elif "shift_calendar" in meta:
         shift_calendar = TypeAdapter(list[ShiftCalendarEntry]).validate_python(
             meta["shift_calendar"]
         )
+        shift_df = pd.DataFrame([entry.model_dump() for entry in shift_calendar])
 
     harvest_systems_payload: dict[str, object] | None = None
     if "harvest_systems" in data_section:
         harvest_systems_path = require("harvest_systems")
         with harvest_systems_path.open("r", encoding="utf-8") as handle:
-            harvest_systems_payload = yaml.safe_load(handle) or {}
+            harvest_systems_payload = yaml.load(handle, Loader=_YAML_LOADER) or {}
     elif "harvest_systems" in meta:
         harvest_systems_payload = meta["harvest_systems"]
 
-    scenario = Scenario(
-        name=meta["name"],
-        num_days=int(meta["num_days"]),
-        start_date=meta.get("start_date"),
-        blocks=blocks,
-        machines=machines,
-        landings=landings,
-        calendar=calendar,
-        shift_calendar=shift_calendar,
-        production_rates=rates,
+    num_days = int(meta["num_days"])
+    if num_days >= 1:  # otherwise let the model report the invalid horizon
+        check_table_references(
+            num_days,
+            blocks=blocks_df,
+            landings=landings_df,
+            machines=machines_df,
+            calendar=calendar_df,
+            production_rates=rates_df,
+            shift_calendar=shift_df,
+        )
+    scenario = Scenario.model_validate(
+        {
+            "name": meta["name"],
+            "num_days": num_days,
+            "start_date": meta.get("start_date"),
+            "blocks": blocks,
+            "machines": machines,
+            "landings": landings,
+            "calendar": calendar,
+            "shift_calendar": shift_calendar,
+            "production_rates": rates,
+        },
+        context=REFERENCES_CHECKED,
     )
     if road_construction is not None:
         scenario = scenario.model_copy(update={"road_construction": road_construction})
@@ -234,9 +259,7 @@ def load_scenario(yaml_path: str | Path) -> Scenario:
 
     if "crew_assignments" in data_section:
         crew_df = read_csv(require("crew_assignments"))
-        crew_assignments = TypeAdapter(list[CrewAssignment]).validate_python(
-            crew_df.to_dict("records")
-        )
+        crew_assignments = TypeAdapter(list[CrewAssignment]).validate_python(frame_records(crew_df))
         scenario = scenario.model_copy(update={"crew_assignments": crew_assignments})
 
     block_geo = meta.get("geo_block_path") or data_section.get("geo_block_path")
@@ -277,7 +300,7 @@ def load_scenario(yaml_path: str | Path) -> Scenario:
         )
         scenario = scenario.model_copy(update={"harvest_systems": harvest_systems})
 
-    _emit_block_range_warnings(cast(list[dict[str, object]], blocks_raw), scenario.name)
+    _emit_block_range_warnings(blocks_raw, scenario.name)
     return scenario
 
 
@@ -5,9 +5,7 @@ from __future__ import annotations
 from collections.abc import Mapping
 from pathlib import Path
 
-import pandas as pd
-
-from fhops.scheduling.mobilisation import BlockDistance, MobilisationConfig
+from fhops.scheduling.mobilisation import DistanceMatrix, MobilisationConfig
 
 
 def populate_mobilisation_distances(
@@ -16,11 +14,15 @@ def populate_mobilisation_distances(
     data_section: Mapping[str, str] | None,
     mobilisation: MobilisationConfig | None,
 ) -> MobilisationConfig | None:
-    """Ensure mobilisation config has distances loaded from CSV when available."""
+    """Ensure mobilisation config has distances loaded from CSV/``.npy`` when available.
+
+    The file is read column-wise into a :class:`~fhops.scheduling.mobilisation.DistanceMatrix`
+    (``.npy`` matrices are memory-mapped) rather than materialising one ``BlockDistance`` per row.
+    """
 
     if mobilisation is None:
         return None
-    if mobilisation.distances:
+    if mobilisation.distances or mobilisation.distance_matrix is not None:
         return mobilisation
 
     candidate_paths: list[Path] = []
@@ -44,28 +46,16 @@ def populate_mobilisation_distances(
     if path_to_use is None:
         return mobilisation
 
-    df = pd.read_csv(path_to_use)
-    required = {"from_block", "to_block", "distance_m"}
-    if not required.issubset(df.columns):
-        raise ValueError(
-            f"Mobilisation distance file {path_to_use} is missing required columns {required}."
-        )
-
-    distances = [
-        BlockDistance(
-            from_block=str(row["from_block"]),
-            to_block=str(row["to_block"]),
-            distance_m=float(row["distance_m"]),
-        )
-        for _, row in df.iterrows()
-    ]
+    matrix = DistanceMatrix.load(path_to_use)
 
     try:
         relative_path = str(path_to_use.relative_to(base_path))
     except ValueError:  # pragma: no cover - path not relative
         relative_path = str(path_to_use)
 
-    return mobilisation.model_copy(update={"distances": distances, "distance_csv": relative_path})
+    return mobilisation.model_copy(
+        update={"distance_matrix": matrix, "distance_csv": relative_path}
+    )
 
 
 __all__ = ["populate_mobilisation_distances"]
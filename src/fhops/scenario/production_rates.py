@@ -0,0 +1,552 @@
+"""Derive a scenario's (machine, block) production-rate table from block attributes.
+
+Blocks carry stand descriptors (stem size, volume, density, slope) and harvest systems name the
+productivity model each role should use (``SystemJob.productivity_overrides``). This module joins
+the two: blocks are grouped by (role, model, fixed inputs), every group is evaluated in one call to
+the vectorised estimators in :mod:`fhops.productivity.batch`, and the resulting m³/PMH values are
+scaled to work units per day for every eligible machine.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from fhops import __version__
+from fhops.costing.machine_rates import normalize_machine_role
+from fhops.productivity.batch import (
+    PRODUCTIVITY_COLUMN,
+    batch_registry,
+    estimate_productivity_batch,
+)
+from fhops.scenario.contract.models import ProductionRate, Scenario
+from fhops.scheduling.systems import (
+    HarvestSystem,
+    default_system_registry,
+    system_productivity_overrides,
+)
+
+__all__ = [
+    "BLOCK_INPUT_COLUMNS",
+    "DEFAULT_ROLE_MODELS",
+    "DerivedRates",
+    "ProductionRateCache",
+    "RoleRateModel",
+    "block_attribute_frame",
+    "derive_production_rates",
+]
+
+
+@dataclass(frozen=True)
+class RoleRateModel:
+    """Batch model (plus fixed inputs) applied to a role when its harvest system names none."""
+
+    model: str
+    constants: Mapping[str, float] = field(default_factory=dict)
+
+
+DEFAULT_ROLE_MODELS: Mapping[str, RoleRateModel] = {
+    "feller_buncher": RoleRateModel("lahrsen2025-daily", {"validate_ranges": 0.0}),
+    "processor": RoleRateModel("berry2019"),
+    "grapple_skidder": RoleRateModel("adv6n7-skidder-loader"),
+    "forwarder": RoleRateModel("ghaffariyan-small"),
+    "loader": RoleRateModel("tn261"),
+    "grapple_yarder": RoleRateModel("sr54"),
+    "skyline_yarder": RoleRateModel("tr125-single-span"),
+}
+
+# Batch-model input name -> column of :func:`block_attribute_frame` that supplies it.
+BLOCK_INPUT_COLUMNS: Mapping[str, str] = {
+    "avg_stem_size": "avg_stem_size_m3",
+    "volume_per_ha": "volume_per_ha_m3",
+    "stem_density": "stem_density_per_ha",
+    "ground_slope": "ground_slope_percent",
+    "piece_size_m3": "avg_stem_size_m3",
+    "mean_stem_size_m3": "avg_stem_size_m3",
+    "slope_percent": "ground_slope_percent",
+    "extraction_distance_m": "extraction_distance_m",
+    "mean_extraction_distance_m": "extraction_distance_m",
+    "skidding_distance_m": "extraction_distance_m",
+    "yarding_distance_m": "extraction_distance_m",
+    "slope_distance_m": "extraction_distance_m",
+    "horizontal_distance_m": "extraction_distance_m",
+    "external_distance_m": "loader_distance_m",
+}
+
+# Harvest-system override keys that select a model, and the prefixes that pin model inputs.
+_MODEL_KEYS = {
+    "processor": "processor_model",
+    "grapple_skidder": "grapple_skidder_model",
+    "forwarder": "forwarder_model",
+    "loader": "loader_model",
+    "grapple_yarder": "grapple_yarder_model",
+    "skyline_yarder": "skyline_model",
+}
+_OVERRIDE_PREFIXES = {
+    "processor": ("processor_",),
+    "grapple_skidder": ("skidder_adv6n7_", "skidder_"),
+    "forwarder": ("forwarder_",),
+    "loader": ("loader_",),
+    "grapple_yarder": ("grapple_yarder_",),
+    "skyline_yarder": ("skyline_",),
+}
+_OVERRIDE_ALIASES = {
+    "skidder_extraction_distance_m": "skidding_distance_m",
+    "loader_distance_m": "external_distance_m",
+}
+
+# Batch kernels annotate errors with the offending row; drop it when evaluating one row at a time.
+_FIRST_ROW_SUFFIX = re.compile(r" \(first offending row: \d+\)$")
+
+_BLOCK_COLUMNS = (
+    "harvest_system_id",
+    "work_required",
+    "avg_stem_size_m3",
+    "volume_per_ha_m3",
+    "stem_density_per_ha",
+    "ground_slope_percent",
+)
+
+
+def block_attribute_frame(scenario: Scenario) -> pd.DataFrame:
+    """Return block attributes (indexed by block id) used as batch-model inputs.
+
+    Besides the stand descriptors declared on :class:`~fhops.scenario.contract.Block`, the frame
+    derives ``area_ha`` (``work_required / volume_per_ha_m3``) and approximate extraction and
+    loader distances from a square block served from its edge, mirroring the geometry used by
+    ``scripts/rebuild_reference_datasets.py``. Missing descriptors become ``NaN``.
+    """
+
+    blocks = scenario.blocks
+    frame = pd.DataFrame(
+        {name: [getattr(block, name) for block in blocks] for name in _BLOCK_COLUMNS},
+        index=pd.Index([block.id for block in blocks], name="block_id"),
+    )
+    numeric = [name for name in _BLOCK_COLUMNS if name != "harvest_system_id"]
+    frame[numeric] = frame[numeric].astype(np.float64)
+    volume = frame["volume_per_ha_m3"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        area = np.where(volume > 0, frame["work_required"].to_numpy() / volume, np.nan)
+    extraction = np.clip(np.sqrt(np.maximum(area, 0.01) * 10_000.0) / 2.0 + 40.0, 120.0, 900.0)
+    extraction = np.where(np.isnan(area), np.nan, extraction)
+    frame["area_ha"] = area
+    frame["extraction_distance_m"] = extraction
+    frame["loader_distance_m"] = np.clip(extraction * 0.55, 80.0, 360.0)
+    return frame
+
+
+def _cache_key(row: list[float]) -> tuple[float | None, ...]:
+    # NaN marks "use the model default" for optional inputs; map it to None so keys compare equal.
+    return tuple(None if value != value else value for value in row)
+
+
+class ProductionRateCache:
+    """Memo of batch-model results keyed by ``(model, input values)``.
+
+    Identical stands (same model and inputs) are evaluated once per cache lifetime; the cache can
+    be persisted as JSON with :meth:`save` and reloaded with :meth:`load` between runs. Saved files
+    record the FHOPS version that wrote them, and :meth:`load` discards files from other versions
+    so rates never outlive a coefficient change.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, dict[tuple[float | None, ...], float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._values.values())
+
+    def lookup(self, model: str, rows: np.ndarray) -> np.ndarray:
+        """Return cached values for ``rows`` (``NaN`` where missing) and update hit counts."""
+
+        entries = self._values.get(model, {})
+        values = np.fromiter(
+            (entries.get(_cache_key(row), np.nan) for row in rows.tolist()),
+            dtype=np.float64,
+            count=len(rows),
+        )
+        found = int(np.count_nonzero(~np.isnan(values)))
+        self.hits += found
+        self.misses += len(rows) - found
+        return values
+
+    def store(self, model: str, rows: np.ndarray, values: np.ndarray) -> None:
+        entries = self._values.setdefault(model, {})
+        for row, value in zip(rows.tolist(), values.tolist(), strict=True):
+            entries[_cache_key(row)] = value
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "fhops_version": __version__,
+            "models": {
+                model: [[*key, value] for key, value in entries.items()]
+                for model, entries in self._values.items()
+            },
+        }
+        path.write_text(json.dumps(payload))
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> ProductionRateCache:
+        """Load a cache written by :meth:`save`.
+
+        A missing file, or one saved by another FHOPS version, yields an empty cache.
+        """
+
+        cache = cls()
+        path = Path(path)
+        if not path.exists():
+            return cache
+        payload = json.loads(path.read_text())
+        if payload.get("fhops_version") != __version__:
+            return cache
+        for model, rows in payload["models"].items():
+            cache._values[model] = {tuple(row[:-1]): float(row[-1]) for row in rows}
+        return cache
+
+
+@dataclass(frozen=True)
+class DerivedRates:
+    """Output of :func:`derive_production_rates`.
+
+    Attributes
+    ----------
+    rates:
+        One row per (machine, block) pair with ``machine_id``, ``block_id``, ``rate`` (work units
+        per day), ``role``, ``model``, and ``productivity_m3_per_pmh``.
+    groups:
+        One row per evaluated (role, model, fixed inputs) group with the harvest systems it covers,
+        block counts, cache hits, and the reason when blocks were skipped.
+    """
+
+    rates: pd.DataFrame
+    groups: pd.DataFrame
+
+    def production_rates(self) -> list[ProductionRate]:
+        """Return the table as :class:`~fhops.scenario.contract.ProductionRate` records."""
+
+        return [
+            ProductionRate(machine_id=machine_id, block_id=block_id, rate=rate)
+            for machine_id, block_id, rate in zip(
+                self.rates["machine_id"].tolist(),
+                self.rates["block_id"].tolist(),
+                self.rates["rate"].tolist(),
+                strict=True,
+            )
+        ]
+
+    def to_csv(self, path: str | Path) -> Path:
+        """Write a ``prod_rates.csv``-compatible table (``machine_id,block_id,rate``)."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.rates[["machine_id", "block_id", "rate"]].to_csv(path, index=False)
+        return path
+
+
+@dataclass
+class _Group:
+    role: str
+    model: str
+    constants: tuple[tuple[str, float], ...]
+    systems: set[str] = field(default_factory=set)
+    blocks: list[str] = field(default_factory=list)
+    reason: str | None = None
+
+
+def _role_matches(machine_role: str, job_role: str) -> bool:
+    if machine_role == job_role:
+        return True
+    if machine_role == "skyline_yarder" and job_role.startswith("skyline_"):
+        return True
+    return machine_role == "grapple_yarder" and job_role.startswith("grapple_yarder")
+
+
+def _resolve_model(
+    role: str,
+    overrides: Mapping[str, float | str],
+    default: RoleRateModel | None,
+) -> tuple[str | None, dict[str, float], str | None]:
+    """Return ``(model, constants, reason)`` for a role within one harvest system."""
+
+    requested = overrides.get(_MODEL_KEYS.get(role, ""))
+    model: str | None = None
+    reason: str | None = None
+    if isinstance(requested, str):
+        candidate = requested
+        if requested == "mcneel-running":
+            variant = str(overrides.get("skyline_running_variant", "yarder_a"))
+            candidate = f"mcneel-running-{variant.replace('_', '-')}"
+        elif requested == "adv6n7":
+            mode = str(overrides.get("skidder_adv6n7_decking_mode", "skidder_loader"))
+            candidate = f"adv6n7-{mode.replace('_', '-')}"
+        if candidate in batch_registry:
+            model = candidate
+        else:
+            reason = f"system model '{requested}' has no batch estimator; used role default"
+    constants: dict[str, float] = {}
+    if model is None:
+        if default is None:
+            return None, {}, "no batch model for role"
+        model = default.model
+        constants.update(default.constants)
+    inputs = set(batch_registry.get(model).inputs)
+    for key, value in overrides.items():
+        name = _OVERRIDE_ALIASES.get(key)
+        if name is None:
+            prefix = next(
+                (prefix for prefix in _OVERRIDE_PREFIXES.get(role, ()) if key.startswith(prefix)),
+                None,
+            )
+            if prefix is None:
+                continue
+            name = key[len(prefix) :]
+        if name in inputs and isinstance(value, int | float):
+            constants[name] = float(value)
+    return model, constants, reason
+
+
+def _productivity(model: str, columns: dict[str, np.ndarray]) -> np.ndarray:
+    result = estimate_productivity_batch(model, columns)
+    return result[PRODUCTIVITY_COLUMN].to_numpy(dtype=np.float64)
+
+
+def _evaluate(model: str, columns: dict[str, np.ndarray]) -> tuple[np.ndarray, str | None]:
+    """Evaluate ``model`` on ``columns``; rows the model rejects come back as ``NaN``.
+
+    A rejected batch is re-evaluated row by row so one invalid stand (e.g. a flat block for a
+    model that needs a positive slope) does not abort its whole group. The first rejection
+    message is returned alongside the values.
+    """
+
+    try:
+        return _productivity(model, columns), None
+    except ValueError:
+        pass
+    size = len(next(iter(columns.values())))
+    values = np.full(size, np.nan)
+    reason: str | None = None
+    for row in range(size):
+        try:
+            values[row] = _productivity(
+                model, {name: column[row : row + 1] for name, column in columns.items()}
+            )[0]
+        except ValueError as exc:
+            if reason is None:
+                reason = _FIRST_ROW_SUFFIX.sub("", str(exc))
+    return values, reason
+
+
+def derive_production_rates(
+    scenario: Scenario,
+    *,
+    block_attributes: pd.DataFrame | None = None,
+    role_models: Mapping[str, RoleRateModel] | None = None,
+    hours_per_day: float | None = None,
+    workers: int = 1,
+    cache: ProductionRateCache | None = None,
+) -> DerivedRates:
+    """Compute the (machine, block) production-rate table for ``scenario`` in one pass.
+
+    Parameters
+    ----------
+    scenario:
+        Scenario whose blocks, machines, and harvest systems drive the derivation. Systems fall
+        back to :func:`~fhops.scheduling.systems.default_system_registry` when none are declared.
+    block_attributes:
+        Optional frame indexed by block id whose columns replace or extend
+        :func:`block_attribute_frame` (e.g. measured extraction distances).
+    role_models:
+        Per-role defaults used when a block's harvest system does not name a batch model; merged
+        over :data:`DEFAULT_ROLE_MODELS`.
+    hours_per_day:
+        Productive hours per day used to scale m³/PMH into daily rates. ``None`` uses each
+        machine's ``daily_hours``.
+    workers:
+        Number of processes used to evaluate groups; ``1`` evaluates in-process.
+    cache:
+        Optional :class:`ProductionRateCache`; repeated inputs are served from it and new results
+        are stored back.
+
+    Returns
+    -------
+    DerivedRates
+        The rate table plus a per-group summary.
+
+    Notes
+    -----
+    Numeric system overrides pin model inputs for every block in that system and take precedence
+    over block attributes. Blocks missing an input the model needs, or whose inputs the model
+    rejects (such as a zero slope for Lahrsen 2025), are skipped (no rate is emitted) and counted
+    in the group summary; machines without a role are ignored.
+    """
+
+    attributes = block_attribute_frame(scenario)
+    if block_attributes is not None:
+        extra = block_attributes.reindex(attributes.index)
+        for name in extra.columns:
+            attributes[name] = extra[name]
+    defaults = {**DEFAULT_ROLE_MODELS, **dict(role_models or {})}
+    systems: Mapping[str, HarvestSystem] = scenario.harvest_systems or default_system_registry()
+
+    machines_by_role: dict[str, list[Any]] = {}
+    for machine in scenario.machines:
+        role = normalize_machine_role(machine.role)
+        if role:
+            machines_by_role.setdefault(role, []).append(machine)
+
+    groups: dict[tuple[str, str, tuple[tuple[str, float], ...]], _Group] = {}
+    resolved: dict[tuple[str | None, str], tuple[str | None, dict[str, float], str | None]] = {}
+    block_systems = attributes["harvest_system_id"].tolist()
+    for block_id, system_id in zip(attributes.index.tolist(), block_systems, strict=True):
+        system = systems.get(system_id) if isinstance(system_id, str) else None
+        for role in machines_by_role:
+            if system is not None and not any(
+                _role_matches(role, job.machine_role) for job in system.jobs
+            ):
+                continue
+            key = (system.system_id if system is not None else None, role)
+            if key not in resolved:
+                overrides = (
+                    system_productivity_overrides(system, role) if system is not None else None
+                )
+                resolved[key] = _resolve_model(role, overrides or {}, defaults.get(role))
+            model, constants, reason = resolved[key]
+            group_key = (role, model or "", tuple(sorted(constants.items())))
+            group = groups.get(group_key)
+            if group is None:
+                group = groups[group_key] = _Group(role, model or "", group_key[2], reason=reason)
+            if key[0] is not None:
+                group.systems.add(key[0])
+            group.blocks.append(block_id)
+
+    # Assemble one input matrix per group and evaluate only unique, uncached rows.
+    pending: dict[tuple[Any, ...], tuple[str, np.ndarray]] = {}
+    prepared: dict[tuple[Any, ...], tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    summary: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for group_key, group in groups.items():
+        row: dict[str, Any] = {
+            "role": group.role,
+            "model": group.model or None,
+            "systems": ", ".join(sorted(group.systems)) or None,
+            "blocks": len(group.blocks),
+            "evaluated": 0,
+            "cached": 0,
+            "skipped": 0,
+            "reason": group.reason,
+        }
+        summary[group_key] = row
+        if not group.model:
+            row["skipped"] = len(group.blocks)
+            continue
+        estimator = batch_registry.get(group.model)
+        constants = dict(group.constants)
+        subset = attributes.loc[group.blocks]
+        matrix = np.empty((len(subset), len(estimator.inputs)), dtype=np.float64)
+        missing: list[str] = []
+        for col, name in enumerate(estimator.inputs):
+            if name in constants:
+                matrix[:, col] = constants[name]
+            elif name in subset.columns:
+                matrix[:, col] = subset[name].to_numpy(dtype=np.float64)
+            elif name in BLOCK_INPUT_COLUMNS:
+                matrix[:, col] = subset[BLOCK_INPUT_COLUMNS[name]].to_numpy(dtype=np.float64)
+            elif name in estimator.optional:
+                matrix[:, col] = estimator.optional[name]
+            else:
+                matrix[:, col] = np.nan
+                missing.append(name)
+        required = np.array([name in estimator.required for name in estimator.inputs], dtype=bool)
+        usable = ~np.isnan(matrix[:, required]).any(axis=1)
+        if not usable.all():
+            row["skipped"] = int(np.count_nonzero(~usable))
+            if missing:
+                row["reason"] = f"missing inputs: {', '.join(missing)}"
+            elif row["reason"] is None:
+                row["reason"] = "blocks missing stand attributes"
+        block_ids = np.asarray(group.blocks, dtype=object)[usable]
+        unique, inverse = np.unique(matrix[usable], axis=0, return_inverse=True)
+        values = (
+            cache.lookup(group.model, unique) if cache is not None else np.full(len(unique), np.nan)
+        )
+        todo = np.isnan(values)
+        row["cached"] = int(np.count_nonzero(~todo))
+        row["evaluated"] = int(np.count_nonzero(todo))
+        prepared[group_key] = (block_ids, inverse.reshape(-1), values)
+        if todo.any():
+            pending[group_key] = (group.model, unique[todo])
+
+    def columns_for(model: str, rows: np.ndarray) -> dict[str, np.ndarray]:
+        names = batch_registry.get(model).inputs
+        return {name: rows[:, col] for col, name in enumerate(names)}
+
+    computed: dict[tuple[Any, ...], tuple[np.ndarray, str | None]] = {}
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                key: executor.submit(_evaluate, model, columns_for(model, rows))
+                for key, (model, rows) in pending.items()
+            }
+            computed = {key: future.result() for key, future in futures.items()}
+    else:
+        computed = {
+            key: _evaluate(model, columns_for(model, rows))
+            for key, (model, rows) in pending.items()
+        }
+
+    frames: list[pd.DataFrame] = []
+    for group_key, (block_ids, inverse, values) in prepared.items():
+        group = groups[group_key]
+        if group_key in computed:
+            fresh, rejection = computed[group_key]
+            values[np.isnan(values)] = fresh
+            accepted = ~np.isnan(fresh)
+            if cache is not None:
+                cache.store(group.model, pending[group_key][1][accepted], fresh[accepted])
+            if rejection is not None:
+                row = summary[group_key]
+                rejected = np.isnan(values[inverse])
+                row["skipped"] += int(np.count_nonzero(rejected))
+                note = f"rejected by model: {rejection}"
+                row["reason"] = f"{row['reason']}; {note}" if row["reason"] else note
+                block_ids, inverse = block_ids[~rejected], inverse[~rejected]
+        productivity = values[inverse]
+        for machine in machines_by_role[group.role]:
+            hours = machine.daily_hours if hours_per_day is None else hours_per_day
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "machine_id": machine.id,
+                        "block_id": block_ids,
+                        "rate": productivity * hours,
+                        "role": group.role,
+                        "model": group.model,
+                        PRODUCTIVITY_COLUMN: productivity,
+                    }
+                )
+            )
+
+    columns = ["machine_id", "block_id", "rate", "role", "model", PRODUCTIVITY_COLUMN]
+    rates = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    block_order = {block_id: pos for pos, block_id in enumerate(attributes.index.tolist())}
+    machine_order = {machine.id: pos for pos, machine in enumerate(scenario.machines)}
+    if len(rates):
+        order = np.lexsort(
+            (
+                rates["machine_id"].map(machine_order).to_numpy(),
+                rates["block_id"].map(block_order).to_numpy(),
+            )
+        )
+        rates = rates.iloc[order].reset_index(drop=True)
+    return DerivedRates(rates=rates[columns], groups=pd.DataFrame(list(summary.values())))
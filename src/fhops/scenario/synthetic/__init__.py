@@ -2,6 +2,7 @@
 
 from .generator import (
     SAMPLING_PRESETS,
+    TABLE_FORMATS,
     BlackoutBias,
     SyntheticDatasetBundle,
     SyntheticDatasetConfig,
@@ -13,6 +14,7 @@ from .generator import (
 )
 
 __all__ = [
+    "TABLE_FORMATS",
     "SyntheticScenarioSpec",
     "SyntheticDatasetConfig",
     "SyntheticDatasetBundle",
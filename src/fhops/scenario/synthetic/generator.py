@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import random
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from copy import deepcopy
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, TypeVar, cast
 
+import numpy as np
 import pandas as pd
 import yaml
 
@@ -19,7 +19,6 @@ from fhops.productivity import load_lahrsen_ranges
 from fhops.scenario.contract import (
     Block,
     CalendarEntry,
-    CrewAssignment,
     Landing,
     Machine,
     ProductionRate,
@@ -53,23 +52,23 @@ def _default_operating_cost_for_role(role: str | None, *, usage_hours: int | Non
     return round(composed[0], 2)
 
 
-def _sample_metric(rng: random.Random, entry: dict[str, float]) -> float:
+def _sample_metric(rng: np.random.Generator, entry: dict[str, float], size: int) -> np.ndarray:
     lower = entry.get("min")
     upper = entry.get("max")
     if lower is None or upper is None:
-        return float(entry.get("mean", 0.0))
-    return round(rng.uniform(lower, upper), 3)
+        return np.full(size, float(entry.get("mean", 0.0)))
+    return np.round(rng.uniform(lower, upper, size), 3)
 
 
-def _sample_block_metrics(rng: random.Random, section: str) -> dict[str, float]:
+def _sample_block_metrics(rng: np.random.Generator, section: str, size: int) -> dict[str, Any]:
     ranges = _LAHRSEN_RANGES.get(section, _LAHRSEN_RANGES["daily"])
-    avg_stem = _sample_metric(rng, ranges["avg_stem_size_m3"])
-    volume = _sample_metric(rng, ranges["volume_per_ha_m3"])
-    density = _sample_metric(rng, ranges["stem_density_per_ha"])
-    slope = _sample_metric(rng, ranges["ground_slope_percent"])
+    avg_stem = _sample_metric(rng, ranges["avg_stem_size_m3"], size)
+    volume = _sample_metric(rng, ranges["volume_per_ha_m3"], size)
+    density = _sample_metric(rng, ranges["stem_density_per_ha"], size)
+    slope = _sample_metric(rng, ranges["ground_slope_percent"], size)
 
-    def _sigma(val: float) -> float:
-        return round(max(val * 0.2, 0.0), 3)
+    def _sigma(val: np.ndarray) -> np.ndarray:
+        return np.round(np.maximum(val * 0.2, 0.0), 3)
 
     return {
         "avg_stem_size_m3": avg_stem,
@@ -198,13 +197,15 @@ def _as_range(value: tuple[int, int] | int) -> tuple[int, int]:
 
 
 def _weighted_choice(
-    rng: random.Random, pool: list[str], weights: list[float] | None
-) -> str | None:
-    if not pool:
-        return None
+    rng: np.random.Generator, pool: Sequence[str], weights: Sequence[float] | None, size: int
+) -> np.ndarray:
+    """Draw ``size`` pool entries, weighted when ``weights`` matches the pool length."""
+
+    values = np.asarray(pool, dtype=object)
     if weights and len(weights) == len(pool):
-        return rng.choices(pool, weights=weights, k=1)[0]
-    return rng.choice(pool)
+        probabilities = np.asarray(weights, dtype=float)
+        return rng.choice(values, size=size, p=probabilities / probabilities.sum())
+    return rng.choice(values, size=size)
 
 
 def _normalise_mix(mix: dict[str, float]) -> dict[str, float]:
@@ -233,11 +234,12 @@ def _coerce_float(value: object | None, default: float = 0.0) -> float:
         return default
 
 
-def _derive_road_construction_entries(blocks: Sequence[Block]) -> list[RoadConstruction]:
+def _derive_road_construction_entries(
+    system_ids: Iterable[str | None],
+) -> list[RoadConstruction]:
     entries: list[RoadConstruction] = []
     seen_systems: set[str] = set()
-    for block in blocks:
-        system_id = block.harvest_system_id
+    for system_id in system_ids:
         if not system_id or system_id in seen_systems:
             continue
         defaults = get_system_road_defaults(system_id)
@@ -272,7 +274,9 @@ def _derive_road_construction_entries(blocks: Sequence[Block]) -> list[RoadConst
 def _attach_system_road_entries(scenario: Scenario) -> Scenario:
     if scenario.road_construction:
         return scenario
-    entries = _derive_road_construction_entries(scenario.blocks)
+    entries = _derive_road_construction_entries(
+        block.harvest_system_id for block in scenario.blocks
+    )
     if not entries:
         return scenario
     return scenario.model_copy(update={"road_construction": entries})
@@ -321,17 +325,110 @@ class SyntheticDatasetConfig:
     block_metric_section: str = "daily"
 
 
+TABLE_FORMATS = ("csv", "parquet")
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _write_table(frame: pd.DataFrame, data_dir: Path, stem: str, table_format: str) -> str:
+    """Write ``frame`` as ``data/<stem>.<format>`` and return the scenario-relative path."""
+
+    filename = f"{stem}.{table_format}"
+    if table_format == "parquet":
+        frame.to_parquet(data_dir / filename, index=False)
+    else:
+        frame.to_csv(data_dir / filename, index=False)
+    return f"data/{filename}"
+
+
 @dataclass
 class SyntheticDatasetBundle:
-    """Container for generated scenario tables and helpers to persist them."""
+    """Container for generated scenario tables and helpers to persist them.
 
-    scenario: Scenario
+    The tables are plain DataFrames. The validated :class:`Scenario` is assembled from them (one
+    Pydantic validation pass) the first time :attr:`scenario` is accessed, so generating a bundle
+    never builds per-row models. The cached scenario does not follow later edits to the tables;
+    call :meth:`validate` to rebuild it. :meth:`write` validates the current tables before anything
+    is written. Use :meth:`from_scenario` to wrap an already validated scenario.
+    """
+
+    name: str
+    num_days: int
     blocks: pd.DataFrame
     machines: pd.DataFrame
     landings: pd.DataFrame
     calendar: pd.DataFrame
     production_rates: pd.DataFrame
+    timeline: TimelineConfig | None = None
+    harvest_systems: dict[str, HarvestSystem] | None = None
+    crew_assignments: pd.DataFrame | None = None
+    road_construction: list[RoadConstruction] = field(default_factory=list)
     metadata: dict[str, object] | None = None
+    scenario_machines: pd.DataFrame | None = None
+    """Machine table used for the in-memory scenario (defaults to :attr:`machines`)."""
+    _scenario: Scenario | None = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_scenario(
+        cls,
+        scenario: Scenario,
+        *,
+        blocks: pd.DataFrame,
+        machines: pd.DataFrame,
+        landings: pd.DataFrame,
+        calendar: pd.DataFrame,
+        production_rates: pd.DataFrame,
+        metadata: dict[str, object] | None = None,
+    ) -> SyntheticDatasetBundle:
+        """Wrap a validated ``scenario`` and the tables it was built from.
+
+        ``scenario`` seeds the cache, so :attr:`scenario` returns it without revalidating.
+        """
+
+        bundle = cls(
+            name=scenario.name,
+            num_days=scenario.num_days,
+            blocks=blocks,
+            machines=machines,
+            landings=landings,
+            calendar=calendar,
+            production_rates=production_rates,
+            timeline=scenario.timeline,
+            harvest_systems=scenario.harvest_systems,
+            road_construction=list(scenario.road_construction or []),
+            metadata=metadata,
+        )
+        bundle._scenario = scenario
+        return bundle
+
+    @property
+    def scenario(self) -> Scenario:
+        """The validated scenario built from the bundle tables (cached after first access)."""
+
+        if self._scenario is None:
+            return self.validate()
+        return self._scenario
+
+    def validate(self) -> Scenario:
+        """Validate the current tables, cache the resulting scenario and return it."""
+
+        machines = self.scenario_machines if self.scenario_machines is not None else self.machines
+        crew = self.crew_assignments
+        self._scenario = Scenario.model_validate(
+            {
+                "name": self.name,
+                "num_days": self.num_days,
+                "blocks": _records(self.blocks),
+                "machines": _records(machines),
+                "landings": _records(self.landings),
+                "calendar": _records(self.calendar),
+                "production_rates": _records(self.production_rates),
+                "timeline": self.timeline,
+                "harvest_systems": self.harvest_systems,
+                "crew_assignments": _records(crew) if crew is not None else None,
+                "road_construction": self.road_construction or None,
+            }
+        )
+        return self._scenario
 
     def write(
         self,
@@ -339,75 +436,69 @@ class SyntheticDatasetBundle:
         *,
         include_yaml: bool = True,
         metadata_path: Path | None = None,
+        table_format: str = "csv",
     ) -> Path:
+        """Write the tables (``csv`` or ``parquet``), ``scenario.yaml``, and metadata to ``out_dir``.
+
+        The tables are validated first (:meth:`validate`), so an invalid scenario raises before
+        any file is written.
+        """
+
+        if table_format not in TABLE_FORMATS:
+            raise ValueError(
+                f"Unsupported table format {table_format!r}; expected one of {TABLE_FORMATS}."
+            )
+        self.validate()
         out_dir = Path(out_dir)
         data_dir = out_dir / "data"
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        self.blocks.to_csv(data_dir / "blocks.csv", index=False)
-        self.machines.to_csv(data_dir / "machines.csv", index=False)
-        self.landings.to_csv(data_dir / "landings.csv", index=False)
-        self.calendar.to_csv(data_dir / "calendar.csv", index=False)
-        self.production_rates.to_csv(data_dir / "prod_rates.csv", index=False)
-        road_entries = list(self.scenario.road_construction or [])
-        if road_entries:
+        data_section: dict[str, str] = {
+            "blocks": _write_table(self.blocks, data_dir, "blocks", table_format),
+            "machines": _write_table(self.machines, data_dir, "machines", table_format),
+            "landings": _write_table(self.landings, data_dir, "landings", table_format),
+            "calendar": _write_table(self.calendar, data_dir, "calendar", table_format),
+            "prod_rates": _write_table(self.production_rates, data_dir, "prod_rates", table_format),
+        }
+        if self.road_construction:
             road_records: list[dict[str, object]] = []
-            for entry in road_entries:
+            for entry in self.road_construction:
                 record = entry.model_dump(exclude_none=True)
                 profiles = record.get("soil_profile_ids")
                 if isinstance(profiles, list):
                     record["soil_profile_ids"] = "|".join(str(pid) for pid in profiles)
                 road_records.append(record)
-            pd.DataFrame.from_records(road_records).to_csv(
-                data_dir / "road_construction.csv", index=False
+            data_section["road_construction"] = _write_table(
+                pd.DataFrame.from_records(road_records), data_dir, "road_construction", table_format
+            )
+        if self.crew_assignments is not None:
+            data_section["crew_assignments"] = _write_table(
+                self.crew_assignments, data_dir, "crew_assignments", table_format
             )
 
         scenario_path = out_dir / "scenario.yaml"
         if include_yaml:
-            data_section: dict[str, str] = {
-                "blocks": "data/blocks.csv",
-                "machines": "data/machines.csv",
-                "landings": "data/landings.csv",
-                "calendar": "data/calendar.csv",
-                "prod_rates": "data/prod_rates.csv",
-            }
-            if road_entries:
-                data_section["road_construction"] = "data/road_construction.csv"
-            if self.scenario.crew_assignments is not None:
-                crew_path = data_dir / "crew_assignments.csv"
-                crew_records = [
-                    assignment.model_dump(exclude_none=True)
-                    for assignment in self.scenario.crew_assignments
-                ]
-                pd.DataFrame.from_records(crew_records).to_csv(crew_path, index=False)
-                data_section["crew_assignments"] = "data/crew_assignments.csv"
             payload: dict[str, object] = {
-                "name": self.scenario.name,
-                "num_days": self.scenario.num_days,
-                "schema_version": self.scenario.schema_version,
+                "name": self.name,
+                "num_days": self.num_days,
+                "schema_version": Scenario.model_fields["schema_version"].default,
                 "data": data_section,
             }
-            if self.scenario.timeline is not None:
-                payload["timeline"] = self.scenario.timeline.model_dump(exclude_none=True)
-            if self.scenario.harvest_systems is not None:
+            if self.timeline is not None:
+                payload["timeline"] = self.timeline.model_dump(exclude_none=True)
+            if self.harvest_systems is not None:
                 payload["harvest_systems"] = {
-                    key: asdict(system) for key, system in self.scenario.harvest_systems.items()
+                    key: asdict(system) for key, system in self.harvest_systems.items()
                 }
-            if self.scenario.objective_weights is not None:
-                payload["objective_weights"] = self.scenario.objective_weights.model_dump(
-                    exclude_none=True
-                )
-            if self.scenario.mobilisation is not None:
-                payload["mobilisation"] = self.scenario.mobilisation.model_dump(exclude_none=True)
 
             with scenario_path.open("w", encoding="utf-8") as handle:
-                yaml.safe_dump(payload, handle, sort_keys=False)
+                yaml.dump(payload, handle, Dumper=_YAML_DUMPER, sort_keys=False)
         meta_out = metadata_path
         if meta_out is None and self.metadata is not None:
             meta_out = out_dir / "metadata.yaml"
         if meta_out is not None and self.metadata is not None:
             with Path(meta_out).open("w", encoding="utf-8") as handle:
-                yaml.safe_dump(self.metadata, handle, sort_keys=False)
+                yaml.dump(self.metadata, handle, Dumper=_YAML_DUMPER, sort_keys=False)
         return scenario_path
 
 
@@ -583,13 +674,30 @@ def sampling_config_for(config: SyntheticDatasetConfig) -> SamplingConfig:
     return SamplingConfig.model_validate(data)
 
 
-def _sample_int(rng: random.Random, bounds: tuple[int, int] | int) -> int:
+def _sample_int(rng: np.random.Generator, bounds: tuple[int, int] | int) -> int:
     low, high = _as_range(bounds)
-    return rng.randint(int(low), int(high))
+    return int(rng.integers(int(low), int(high), endpoint=True))
+
+
+def _sample_float(rng: np.random.Generator, bounds: tuple[float, float]) -> float:
+    return float(rng.uniform(float(bounds[0]), float(bounds[1])))
 
 
-def _sample_float(rng: random.Random, bounds: tuple[float, float]) -> float:
-    return rng.uniform(float(bounds[0]), float(bounds[1]))
+def _value_counts(frame: pd.DataFrame, column: str) -> dict[str, int]:
+    if column not in frame.columns:
+        return {}
+    return dict(Counter(str(value) for value in frame[column].dropna()))
+
+
+def _records(frame: pd.DataFrame) -> list[dict[str, Any]]:
+    """Return frame rows as dicts with missing (``NaN``) cells dropped."""
+
+    columns = list(frame.columns)
+    rows = zip(*(frame[column].tolist() for column in columns), strict=True)
+    return [
+        {key: value for key, value in zip(columns, row, strict=True) if value == value}
+        for row in rows
+    ]
 
 
 def generate_random_dataset(
@@ -598,10 +706,17 @@ def generate_random_dataset(
     seed: int = 123,
     systems: dict[str, HarvestSystem] | None = None,
 ) -> SyntheticDatasetBundle:
-    """Generate a random synthetic dataset bundle (scenario + CSV tables)."""
+    """Generate a random synthetic dataset bundle (scenario tables + metadata).
+
+    Tables are drawn column-wise from NumPy generators spawned from ``seed``, so a given seed is
+    reproducible but differs from bundles produced by FHOPS releases before the vectorised
+    generator. The validated :class:`Scenario` is only built when ``bundle.scenario`` is accessed.
+    """
 
-    rng = random.Random(seed)
-    feature_rng = random.Random(seed + 10_001)
+    # Independent streams for structural draws (counts, windows, rates) and block features.
+    rng, feature_rng = (
+        np.random.default_rng(stream) for stream in np.random.SeedSequence(seed % 2**64).spawn(2)
+    )
     tier_defaults = TIER_DEFAULTS.get((config.tier or "").lower(), {})
     num_blocks = _sample_int(rng, config.num_blocks)
     num_days = _sample_int(rng, config.num_days)
@@ -695,36 +810,29 @@ def generate_random_dataset(
     else:
         system_mix = _maybe_numeric_dict(tier_defaults.get("system_mix"))
     normalised_mix = _normalise_mix(system_mix) if system_mix else None
-    blocks_records: list[dict[str, object]] = []
-    for idx in range(num_blocks):
-        landing_id = rng.choice(landing_ids)
-        work_required = round(_sample_float(rng, config.work_required), 3)
-        earliest = rng.randint(1, num_days)
-        latest = rng.randint(earliest, num_days)
-        terrain = (
-            _weighted_choice(feature_rng, terrain_pool, terrain_weights) if terrain_pool else None
-        )
-        prescription = (
-            _weighted_choice(feature_rng, prescription_pool, prescription_weights)
-            if prescription_pool
-            else None
+    block_ids = np.array([f"B{idx + 1}" for idx in range(num_blocks)], dtype=object)
+    earliest = rng.integers(1, num_days, size=num_blocks, endpoint=True)
+    blocks_columns: dict[str, Any] = {
+        "id": block_ids,
+        "landing_id": rng.choice(np.asarray(landing_ids, dtype=object), size=num_blocks),
+        "work_required": np.round(
+            rng.uniform(config.work_required[0], config.work_required[1], num_blocks), 3
+        ),
+        "earliest_start": earliest,
+        "latest_finish": rng.integers(earliest, num_days, endpoint=True),
+        **_sample_block_metrics(feature_rng, config.block_metric_section, num_blocks),
+    }
+    if terrain_pool:
+        blocks_columns["terrain"] = _weighted_choice(
+            feature_rng, terrain_pool, terrain_weights, num_blocks
         )
-        stand_metrics = _sample_block_metrics(feature_rng, config.block_metric_section)
-        blocks_records.append(
-            {
-                "id": f"B{idx + 1}",
-                "landing_id": landing_id,
-                "work_required": work_required,
-                "earliest_start": earliest,
-                "latest_finish": latest,
-                **stand_metrics,
-                **({"terrain": terrain} if terrain is not None else {}),
-                **({"prescription": prescription} if prescription is not None else {}),
-            }
+    if prescription_pool:
+        blocks_columns["prescription"] = _weighted_choice(
+            feature_rng, prescription_pool, prescription_weights, num_blocks
         )
+    blocks_frame = pd.DataFrame(blocks_columns)
 
     role_pool = config.role_pool or []
-    machines_records: list[dict[str, object]] = []
     base_crews = crew_pool or [f"crew-{idx + 1}" for idx in range(num_machines)]
     crew_capabilities: dict[str, list[str]] = {}
     base_capabilities: dict[str, list[str]] = {}
@@ -745,13 +853,15 @@ def generate_random_dataset(
                 base_capabilities[base] = []
                 continue
             lower = pick_low if pick_low > 0 else 1
-            pick = feature_rng.randint(lower, pick_high)
+            pick = int(feature_rng.integers(lower, pick_high, endpoint=True))
             pick = max(1 if pick_low > 0 else 0, pick)
             pick = min(max_pick, pick)
             if pick == 0:
                 base_capabilities[base] = []
                 continue
-            base_capabilities[base] = sorted(feature_rng.sample(capability_pool, k=pick))
+            base_capabilities[base] = sorted(
+                str(item) for item in feature_rng.choice(capability_pool, size=pick, replace=False)
+            )
     crew_ids: list[str] = []
     if base_crews:
         counts: dict[str, int] = {}
@@ -769,20 +879,20 @@ def generate_random_dataset(
                     crew_id = f"{base}-{counts[base]}"
             crew_ids.append(crew_id)
             crew_capabilities[crew_id] = list(base_capabilities.get(base, []))
+    machines_records: list[dict[str, object]] = []
     for idx in range(num_machines):
         raw_role = role_pool[idx % len(role_pool)] if role_pool else None
         role = normalize_machine_role(raw_role)
-        assigned_crew = crew_ids[idx] if crew_ids else None
-        rental_rate = _default_operating_cost_for_role(role)
         machines_records.append(
             {
                 "id": f"M{idx + 1}",
                 "role": role,
-                "crew": assigned_crew,
+                "crew": crew_ids[idx] if crew_ids else None,
                 "daily_hours": float(config.machine_daily_hours),
-                "operating_cost": rental_rate,
+                "operating_cost": _default_operating_cost_for_role(role),
             }
         )
+    machine_ids = np.array([record["id"] for record in machines_records], dtype=object)
 
     landings_records = [
         {
@@ -792,33 +902,29 @@ def generate_random_dataset(
         for landing_id in landing_ids
     ]
 
-    calendar_records: list[dict[str, object]] = []
-    for machine_record in machines_records:
-        for day in range(1, num_days + 1):
-            available = 1 if rng.random() <= config.availability_probability else 0
-            calendar_records.append(
-                {
-                    "machine_id": machine_record["id"],
-                    "day": day,
-                    "available": available,
-                }
-            )
-
-    production_records: list[dict[str, object]] = []
-    for machine_record in machines_records:
-        for block_record in blocks_records:
-            rate = round(_sample_float(rng, config.production_rate), 3)
-            production_records.append(
-                {
-                    "machine_id": machine_record["id"],
-                    "block_id": block_record["id"],
-                    "rate": rate,
-                }
-            )
+    # Machine-major (machine, day) and (machine, block) tables drawn in one call each.
+    availability = rng.random((num_machines, num_days)) <= config.availability_probability
+    calendar_frame = pd.DataFrame(
+        {
+            "machine_id": np.repeat(machine_ids, num_days),
+            "day": np.tile(np.arange(1, num_days + 1), num_machines),
+            "available": availability.astype(np.int64).ravel(),
+        }
+    )
+    rates = rng.uniform(
+        config.production_rate[0], config.production_rate[1], (num_machines, num_blocks)
+    )
+    production_frame = pd.DataFrame(
+        {
+            "machine_id": np.repeat(machine_ids, num_blocks),
+            "block_id": np.tile(block_ids, num_machines),
+            "rate": np.round(rates, 3).ravel(),
+        }
+    )
 
     shift_def = ShiftDefinition(
         name="S1",
-        hours=float(_sample_float(rng, config.shift_hours)),
+        hours=_sample_float(rng, config.shift_hours),
         shifts_per_day=config.shifts_per_day,
     )
     blackouts: list[BlackoutWindow] = []
@@ -848,90 +954,60 @@ def generate_random_dataset(
             day_cursor += 1
     timeline = TimelineConfig(shifts=[shift_def], blackouts=blackouts)
 
-    blocks = [Block(**cast(dict[str, Any], record)) for record in blocks_records]
-    machines = [Machine(**cast(dict[str, Any], record)) for record in machines_records]
-    landings = [Landing(**cast(dict[str, Any], record)) for record in landings_records]
-    calendar = [CalendarEntry(**cast(dict[str, Any], record)) for record in calendar_records]
-    production_rates = [
-        ProductionRate(**cast(dict[str, Any], record)) for record in production_records
-    ]
-
-    crew_assignment_models: list[CrewAssignment] | None = None
-    if crew_pool:
-        assignments: list[CrewAssignment] = []
-        for machine in machines:
-            crew_id_value = machine.crew
-            if crew_id_value is None:
-                continue
-            crew_id = str(crew_id_value)
-            capabilities = crew_capabilities.get(crew_id, [])
-            notes = None
-            if capabilities:
-                notes = f"capabilities={','.join(capabilities)}"
-            assignments.append(
-                CrewAssignment(
-                    crew_id=crew_id,
-                    machine_id=machine.id,
-                    primary_role=machine.role,
-                    notes=notes,
-                )
-            )
-        crew_assignment_models = assignments or None
-
-    scenario = Scenario(
-        name=config.name,
-        num_days=num_days,
-        blocks=blocks,
-        machines=machines,
-        landings=landings,
-        calendar=calendar,
-        production_rates=production_rates,
-        timeline=timeline,
-        crew_assignments=crew_assignment_models,
-    )
-
     if systems is None:
         systems = {}
+    machines_frame = pd.DataFrame.from_records(machines_records)
+    scenario_machines: pd.DataFrame | None = None
     if systems:
         roles = sorted({job.machine_role for system in systems.values() for job in system.jobs})
         if roles:
-            updated_machines = [
-                machine.model_copy(
-                    update={
-                        "role": normalize_machine_role(roles[idx % len(roles)]),
-                        "operating_cost": _default_operating_cost_for_role(roles[idx % len(roles)]),
-                    }
-                )
-                for idx, machine in enumerate(scenario.machines)
-            ]
-            scenario = scenario.model_copy(update={"machines": updated_machines})
-        updated_blocks = []
-        system_ids = list(systems.keys())
+            # The scenario runs the system roles; machines.csv keeps the configured role pool.
+            system_roles = [roles[idx % len(roles)] for idx in range(num_machines)]
+            scenario_machines = machines_frame.assign(
+                role=[normalize_machine_role(role) or role for role in system_roles],
+                operating_cost=[_default_operating_cost_for_role(role) for role in system_roles],
+            )
+        system_ids = np.asarray(list(systems.keys()), dtype=object)
         system_weights = None
         if normalised_mix:
             available_mix = {key: normalised_mix.get(key, 0.0) for key in system_ids}
             if any(weight > 0 for weight in available_mix.values()):
                 system_weights = [available_mix[system_id] for system_id in system_ids]
             # zero-weight fallback -> round robin
-        salvage_system_ids = {"ground_salvage_grapple", "cable_salvage_grapple"}
-        for idx, block in enumerate(scenario.blocks):
-            if system_weights:
-                system_id = feature_rng.choices(system_ids, weights=system_weights, k=1)[0]
-            else:
-                system_id = system_ids[idx % len(system_ids)]
-            block_updates: dict[str, object] = {"harvest_system_id": system_id}
-            if system_id in salvage_system_ids:
-                block_updates["salvage_processing_mode"] = SalvageProcessingMode.STANDARD_MILL
-            updated_blocks.append(block.model_copy(update=block_updates))
-            blocks_records[idx]["harvest_system_id"] = system_id
-            if system_id in salvage_system_ids:
-                blocks_records[idx]["salvage_processing_mode"] = (
-                    SalvageProcessingMode.STANDARD_MILL.value
-                )
-        scenario = scenario.model_copy(
-            update={"blocks": updated_blocks, "harvest_systems": systems}
-        )
-    scenario = _attach_system_road_entries(scenario)
+        if system_weights:
+            assigned = _weighted_choice(feature_rng, list(system_ids), system_weights, num_blocks)
+        else:
+            assigned = system_ids[np.arange(num_blocks) % len(system_ids)]
+        blocks_frame["harvest_system_id"] = assigned
+        salvage = np.isin(assigned, ["ground_salvage_grapple", "cable_salvage_grapple"])
+        if salvage.any():
+            blocks_frame.loc[salvage, "salvage_processing_mode"] = (
+                SalvageProcessingMode.STANDARD_MILL.value
+            )
+
+    crew_assignments: pd.DataFrame | None = None
+    if crew_pool:
+        crew_records = [
+            {
+                "crew_id": str(record["crew"]),
+                "machine_id": record["id"],
+                "primary_role": record["role"],
+                "notes": (
+                    f"capabilities={','.join(crew_capabilities[str(record['crew'])])}"
+                    if crew_capabilities.get(str(record["crew"]))
+                    else None
+                ),
+            }
+            for record in machines_records
+            if record["crew"] is not None
+        ]
+        if crew_records:
+            crew_assignments = pd.DataFrame.from_records(crew_records)
+    road_construction = (
+        _derive_road_construction_entries(blocks_frame["harvest_system_id"])
+        if "harvest_system_id" in blocks_frame.columns
+        else []
+    )
     sampling_config = sampling_config_for(config)
 
     metadata: dict[str, object] = {
@@ -939,26 +1015,14 @@ def generate_random_dataset(
         "tier": (config.tier or "custom"),
         "seed": seed,
         "counts": {
-            "blocks": len(blocks_records),
+            "blocks": len(blocks_frame),
             "machines": len(machines_records),
             "landings": len(landings_records),
-            "calendar": len(calendar_records),
-            "production_rates": len(production_records),
+            "calendar": len(calendar_frame),
+            "production_rates": len(production_frame),
         },
-        "terrain_counts": dict(
-            Counter(
-                record.get("terrain")
-                for record in blocks_records
-                if record.get("terrain") is not None
-            )
-        ),
-        "prescription_counts": dict(
-            Counter(
-                record.get("prescription")
-                for record in blocks_records
-                if record.get("prescription") is not None
-            )
-        ),
+        "terrain_counts": _value_counts(blocks_frame, "terrain"),
+        "prescription_counts": _value_counts(blocks_frame, "prescription"),
         "crew_capabilities": crew_capabilities,
         "blackouts": [blackout.model_dump(exclude_none=True) for blackout in blackouts],
         "shifts_per_day": config.shifts_per_day,
@@ -985,13 +1049,19 @@ def generate_random_dataset(
     }
 
     return SyntheticDatasetBundle(
-        scenario=scenario,
-        blocks=pd.DataFrame.from_records(blocks_records),
-        machines=pd.DataFrame.from_records(machines_records),
+        name=config.name,
+        num_days=num_days,
+        blocks=blocks_frame,
+        machines=machines_frame,
         landings=pd.DataFrame.from_records(landings_records),
-        calendar=pd.DataFrame.from_records(calendar_records),
-        production_rates=pd.DataFrame.from_records(production_records),
+        calendar=calendar_frame,
+        production_rates=production_frame,
+        timeline=timeline,
+        harvest_systems=systems or None,
+        crew_assignments=crew_assignments,
+        road_construction=road_construction,
         metadata=metadata,
+        scenario_machines=scenario_machines,
     )
 
 
@@ -1001,6 +1071,7 @@ __all__ = [
     "SyntheticDatasetBundle",
     "BlackoutBias",
     "SAMPLING_PRESETS",
+    "TABLE_FORMATS",
     "generate_basic",
     "generate_with_systems",
     "generate_random_dataset",
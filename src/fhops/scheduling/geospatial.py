@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import heapq
 import json
-import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
+import pandas as pd
+
+from fhops.scheduling.mobilisation import DistanceMatrix
+
 try:  # Optional dependency; we fall back to a lightweight parser if unavailable.
     import geopandas as gpd
 except ModuleNotFoundError:  # pragma: no cover - exercised when geopandas not installed
@@ -21,6 +26,22 @@ except ModuleNotFoundError:  # pragma: no cover - exercised when shapely not ins
 else:
     shape = cast(Any, _shape)
 
+try:  # Optional dependency; NumPy/heap fallbacks are used when SciPy is unavailable.
+    from scipy.sparse import csr_matrix as _csr_matrix
+    from scipy.sparse.csgraph import dijkstra as _dijkstra
+    from scipy.spatial import cKDTree as _cKDTree
+except ModuleNotFoundError:  # pragma: no cover - exercised when scipy not installed
+    csr_matrix: Any | None = None
+    dijkstra: Any | None = None
+    KDTree: Any | None = None
+else:
+    csr_matrix = cast(Any, _csr_matrix)
+    dijkstra = cast(Any, _dijkstra)
+    KDTree = cast(Any, _cKDTree)
+
+DISTANCE_COLUMNS = ("from_block", "to_block", "distance_m")
+DEFAULT_CHUNK_ROWS = 512
+
 
 @dataclass(frozen=True)
 class BlockGeometry:
@@ -55,16 +76,7 @@ def load_block_geometries(geojson_path: Path | str) -> list[BlockGeometry]:
     if not isinstance(features, list) or not features:
         raise ValueError("GeoJSON must contain a non-empty 'features' collection.")
 
-    crs_props = (
-        data.get("crs", {}).get("properties", {}) if isinstance(data.get("crs"), dict) else {}
-    )
-    crs_name = crs_props.get("name") if isinstance(crs_props, dict) else None
-    if not crs_name:
-        raise ValueError(
-            "GeoJSON must declare a projected CRS when geopandas/shapely are unavailable."
-        )
-    if any(token in crs_name for token in ("4326", "WGS84", "CRS84")):
-        raise ValueError("GeoJSON must use a projected CRS (e.g., UTM) for distance calculations.")
+    _require_projected_crs(data, label="GeoJSON")
 
     geometries: list[BlockGeometry] = []
     for feature in features:
@@ -85,20 +97,315 @@ def load_block_geometries(geojson_path: Path | str) -> list[BlockGeometry]:
     return geometries
 
 
+def block_coordinates(
+    geometries: Iterable[BlockGeometry],
+) -> tuple[tuple[str, ...], np.ndarray]:
+    """Return block ids and an ``(n, 2)`` centroid coordinate array."""
+
+    geom_list = list(geometries)
+    block_ids = tuple(geom.block_id for geom in geom_list)
+    coords = np.array([geom.centroid for geom in geom_list], dtype=np.float64).reshape(-1, 2)
+    return block_ids, coords
+
+
+def pairwise_distances(coords: np.ndarray, targets: np.ndarray | None = None) -> np.ndarray:
+    """Dense Euclidean distances between ``coords`` rows and ``targets`` rows (default: itself)."""
+
+    targets = coords if targets is None else targets
+    delta = coords[:, None, :] - targets[None, :, :]
+    return np.hypot(delta[..., 0], delta[..., 1])
+
+
 def compute_distance_matrix(geometries: Iterable[BlockGeometry]) -> dict[tuple[str, str], float]:
     """Compute Euclidean distance (metres) between block centroids."""
-    geom_list = list(geometries)
-    matrix: dict[tuple[str, str], float] = {}
-    for i, src in enumerate(geom_list):
-        sx, sy = src.centroid
-        for j, dst in enumerate(geom_list):
-            if j < i:
+    table = compute_distance_table(geometries)
+    block_ids = table.block_ids
+    values = table.values.tolist()
+    return {
+        (src, dst): values[i][j]
+        for i, src in enumerate(block_ids)
+        for j, dst in enumerate(block_ids)
+    }
+
+
+def compute_distance_table(
+    geometries: Iterable[BlockGeometry], *, road_network: RoadNetwork | None = None
+) -> DistanceMatrix:
+    """Dense block distance matrix (Euclidean, or shortest path over ``road_network``)."""
+
+    block_ids, coords = block_coordinates(geometries)
+    if road_network is None:
+        values = pairwise_distances(coords)
+    else:
+        values = road_network.block_distances(coords, np.arange(len(coords)))
+    np.fill_diagonal(values, 0.0)
+    return DistanceMatrix(block_ids, values)
+
+
+def iter_distance_pairs(
+    geometries: Iterable[BlockGeometry],
+    *,
+    max_distance_m: float | None = None,
+    road_network: RoadNetwork | None = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    use_kdtree: bool = True,
+) -> Iterator[pd.DataFrame]:
+    """Yield ``from_block``/``to_block``/``distance_m`` frames, one per block chunk.
+
+    Only ``chunk_rows`` source blocks are expanded at a time, so memory stays bounded by
+    ``chunk_rows * n`` regardless of district size. With ``max_distance_m`` only pairs within the
+    threshold are emitted; candidate pairs come from a SciPy KD-tree when available (``use_kdtree``)
+    and from a thresholded dense chunk otherwise. Self pairs are never emitted.
+    """
+
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be positive.")
+    if max_distance_m is not None and max_distance_m < 0:
+        raise ValueError("max_distance_m must be non-negative.")
+    block_ids, coords = block_coordinates(geometries)
+    ids = np.asarray(block_ids, dtype=object)
+    count = len(ids)
+    snapped = road_network.snap(coords) if road_network is not None and count else None
+    tree = None
+    if max_distance_m is not None and use_kdtree and KDTree is not None and count:
+        tree = KDTree(coords)
+
+    for start in range(0, count, chunk_rows):
+        stop = min(start + chunk_rows, count)
+        sources = np.arange(start, stop)
+        if tree is not None:
+            neighbours = tree.query_ball_point(coords[start:stop], r=max_distance_m)
+            lengths = np.fromiter((len(hits) for hits in neighbours), dtype=np.intp)
+            rows = np.repeat(sources, lengths)
+            cols = np.fromiter(
+                (hit for hits in neighbours for hit in hits), dtype=np.intp, count=lengths.sum()
+            )
+            if road_network is None:
+                dist = np.hypot(*(coords[rows] - coords[cols]).T)
+            else:
+                dense = road_network.block_distances(coords, sources, snapped=snapped)
+                dist = dense[rows - start, cols]
+        else:
+            if road_network is None:
+                dense = pairwise_distances(coords[start:stop], coords)
+            else:
+                dense = road_network.block_distances(coords, sources, snapped=snapped)
+            mask = np.ones(dense.shape, dtype=bool)
+            if max_distance_m is not None:
+                mask &= dense <= max_distance_m
+            local_rows, cols = np.nonzero(mask)
+            rows = local_rows + start
+            dist = dense[local_rows, cols]
+        keep = rows != cols
+        if max_distance_m is not None:
+            keep &= dist <= max_distance_m
+        yield pd.DataFrame(
+            {
+                "from_block": ids[rows[keep]],
+                "to_block": ids[cols[keep]],
+                "distance_m": dist[keep],
+            },
+            columns=list(DISTANCE_COLUMNS),
+        )
+
+
+def write_distance_pairs(frames: Iterable[pd.DataFrame], output: Path | str) -> int:
+    """Stream distance frames to CSV or Parquet (by suffix); returns the number of rows written."""
+
+    path = Path(output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    total = 0
+    if path.suffix.lower() in {".parquet", ".pq"}:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [("from_block", pa.string()), ("to_block", pa.string()), ("distance_m", pa.float64())]
+        )
+        with pq.ParquetWriter(path, schema) as writer:
+            for frame in frames:
+                writer.write_table(pa.Table.from_pandas(frame, schema=schema, preserve_index=False))
+                total += len(frame)
+        return total
+
+    with path.open("w", newline="") as handle:
+        handle.write(",".join(DISTANCE_COLUMNS) + "\n")
+        for frame in frames:
+            frame.to_csv(handle, index=False, header=False)
+            total += len(frame)
+    return total
+
+
+@dataclass(frozen=True)
+class RoadNetwork:
+    """Undirected road graph (projected CRS) used for shortest-path block distances.
+
+    ``nodes`` holds vertex coordinates and ``indptr``/``indices``/``weights`` the CSR adjacency
+    (segment lengths in metres). Blocks attach to their nearest vertex with a straight-line access
+    leg; pairs the network cannot connect fall back to the straight-line distance.
+    """
+
+    nodes: np.ndarray
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_geojson(cls, path: Path | str, *, precision: int = 3) -> RoadNetwork:
+        """Build the graph from LineString/MultiLineString features, merging shared vertices.
+
+        Vertices are matched after rounding coordinates to ``precision`` decimals.
+        """
+
+        data = json.loads(Path(path).read_text())
+        _require_projected_crs(
+            data,
+            label="Road network GeoJSON",
+            missing="has no CRS; declare a projected CRS (e.g., UTM) in its 'crs' member",
+        )
+        features = data.get("features")
+        if not isinstance(features, list) or not features:
+            raise ValueError("Road network GeoJSON must contain a non-empty 'features' collection.")
+        starts: list[np.ndarray] = []
+        ends: list[np.ndarray] = []
+        for feature in features:
+            geometry = feature.get("geometry") if isinstance(feature, dict) else None
+            if not isinstance(geometry, dict):
+                continue
+            geom_type = geometry.get("type")
+            coordinates = geometry.get("coordinates")
+            if geom_type == "LineString":
+                lines = [coordinates]
+            elif geom_type == "MultiLineString":
+                lines = list(coordinates or [])
+            else:
+                continue
+            for line in lines:
+                vertices = np.asarray(line, dtype=np.float64).reshape(-1, 2)[:, :2]
+                if len(vertices) < 2:
+                    continue
+                starts.append(vertices[:-1])
+                ends.append(vertices[1:])
+        if not starts:
+            raise ValueError("Road network GeoJSON did not contain any LineString segments.")
+        seg_start = np.round(np.concatenate(starts), precision)
+        seg_end = np.round(np.concatenate(ends), precision)
+        nodes, inverse = np.unique(np.vstack([seg_start, seg_end]), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        count = len(seg_start)
+        return cls.from_edges(
+            nodes,
+            inverse[:count],
+            inverse[count:],
+            np.hypot(*(seg_end - seg_start).T),
+        )
+
+    @classmethod
+    def from_edges(
+        cls, nodes: np.ndarray, start: np.ndarray, end: np.ndarray, length: np.ndarray
+    ) -> RoadNetwork:
+        """Build the CSR adjacency from undirected edges, keeping the shortest parallel edge."""
+
+        src = np.concatenate([start, end]).astype(np.intp)
+        dst = np.concatenate([end, start]).astype(np.intp)
+        weight = np.concatenate([length, length]).astype(np.float64)
+        keep = src != dst
+        src, dst, weight = src[keep], dst[keep], weight[keep]
+        order = np.lexsort((weight, dst, src))
+        src, dst, weight = src[order], dst[order], weight[order]
+        first = np.ones(len(src), dtype=bool)
+        first[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        src, dst, weight = src[first], dst[first], weight[first]
+        indptr = np.zeros(len(nodes) + 1, dtype=np.intp)
+        np.add.at(indptr, src + 1, 1)
+        return cls(
+            nodes=np.asarray(nodes, dtype=np.float64),
+            indptr=np.cumsum(indptr),
+            indices=dst,
+            weights=weight,
+        )
+
+    def snap(self, coords: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return the nearest vertex and straight-line access distance for each coordinate."""
+
+        nearest = np.empty(len(coords), dtype=np.intp)
+        access = np.empty(len(coords), dtype=np.float64)
+        for start in range(0, len(coords), DEFAULT_CHUNK_ROWS):
+            chunk = pairwise_distances(coords[start : start + DEFAULT_CHUNK_ROWS], self.nodes)
+            idx = chunk.argmin(axis=1)
+            nearest[start : start + len(idx)] = idx
+            access[start : start + len(idx)] = chunk[np.arange(len(idx)), idx]
+        return nearest, access
+
+    def shortest_paths(self, sources: np.ndarray) -> np.ndarray:
+        """Network distances from each source vertex to every vertex (``inf`` if unreachable)."""
+
+        if dijkstra is not None and csr_matrix is not None:
+            graph = csr_matrix(
+                (self.weights, self.indices, self.indptr), shape=(len(self.nodes),) * 2
+            )
+            return np.atleast_2d(dijkstra(graph, directed=True, indices=sources))
+        result = np.full((len(sources), len(self.nodes)), np.inf)
+        for row, source in enumerate(sources):
+            result[row] = self._dijkstra(int(source))
+        return result
+
+    def block_distances(
+        self,
+        coords: np.ndarray,
+        sources: np.ndarray,
+        *,
+        snapped: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """Distances from blocks ``sources`` to all blocks at ``coords`` via the network.
+
+        ``snapped`` reuses a previous :meth:`snap` result for ``coords`` across chunks.
+        """
+
+        nearest, access = snapped if snapped is not None else self.snap(coords)
+        unique_nodes, inverse = np.unique(nearest[sources], return_inverse=True)
+        paths = self.shortest_paths(unique_nodes)[inverse.reshape(-1)][:, nearest]
+        routed = access[sources, None] + paths + access[None, :]
+        straight = pairwise_distances(coords[sources], coords)
+        return np.where(np.isfinite(routed), routed, straight)
+
+    def _dijkstra(self, source: int) -> np.ndarray:
+        dist = np.full(len(self.nodes), np.inf)
+        dist[source] = 0.0
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        weights = self.weights.tolist()
+        best = dist.tolist()
+        heap: list[tuple[float, int]] = [(0.0, source)]
+        while heap:
+            current, node = heapq.heappop(heap)
+            if current > best[node]:
                 continue
-            dx, dy = dst.centroid
-            distance = math.hypot(sx - dx, sy - dy)
-            matrix[(src.block_id, dst.block_id)] = distance
-            matrix[(dst.block_id, src.block_id)] = distance
-    return matrix
+            for pos in range(indptr[node], indptr[node + 1]):
+                candidate = current + weights[pos]
+                neighbour = indices[pos]
+                if candidate < best[neighbour]:
+                    best[neighbour] = candidate
+                    heapq.heappush(heap, (candidate, neighbour))
+        return np.asarray(best, dtype=np.float64)
+
+
+def _require_projected_crs(
+    data: dict[str, Any],
+    *,
+    label: str,
+    missing: str = "must declare a projected CRS when geopandas/shapely are unavailable",
+) -> None:
+    """Reject GeoJSON without a ``crs`` member (``{label} {missing}``) or with a geographic one."""
+
+    crs_props = (
+        data.get("crs", {}).get("properties", {}) if isinstance(data.get("crs"), dict) else {}
+    )
+    crs_name = crs_props.get("name") if isinstance(crs_props, dict) else None
+    if not crs_name:
+        raise ValueError(f"{label} {missing}.")
+    if any(token in crs_name for token in ("4326", "WGS84", "CRS84")):
+        raise ValueError(f"{label} must use a projected CRS (e.g., UTM) for distance calculations.")
 
 
 def _compute_centroid_fallback(geometry: dict[str, Any]) -> tuple[float, float]:
@@ -170,4 +477,14 @@ def _polygon_centroid_with_area(coordinates: Any) -> tuple[tuple[float, float],
     return ((cx, cy), abs(area))
 
 
-__all__ = ["BlockGeometry", "load_block_geometries", "compute_distance_matrix"]
+__all__ = [
+    "BlockGeometry",
+    "RoadNetwork",
+    "block_coordinates",
+    "compute_distance_matrix",
+    "compute_distance_table",
+    "iter_distance_pairs",
+    "load_block_geometries",
+    "pairwise_distances",
+    "write_distance_pairs",
+]
@@ -1,15 +1,20 @@
 """Mobilisation distance and setup cost utilities."""
 
+from .distance_matrix import DistanceLookup, DistanceMatrix
 from .models import (
     BlockDistance,
     MachineMobilisation,
     MobilisationConfig,
     build_distance_lookup,
+    distance_matrix_for,
 )
 
 __all__ = [
     "BlockDistance",
+    "DistanceLookup",
+    "DistanceMatrix",
     "MachineMobilisation",
     "MobilisationConfig",
     "build_distance_lookup",
+    "distance_matrix_for",
 ]
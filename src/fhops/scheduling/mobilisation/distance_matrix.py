@@ -0,0 +1,265 @@
+"""Dense block-to-block distance matrix backing mobilisation cost lookups."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["DistanceLookup", "DistanceMatrix"]
+
+_REQUIRED_COLUMNS = ("from_block", "to_block", "distance_m")
+
+
+def block_ids_path(path: Path) -> Path:
+    """Return the sidecar file holding block ids for a ``.npy`` distance matrix."""
+
+    return path.with_name(f"{path.stem}.blocks.txt")
+
+
+@dataclass(frozen=True, eq=False)
+class DistanceMatrix:
+    """Block-indexed ``float64`` distance matrix in metres.
+
+    ``values[i, j]`` is the distance from ``block_ids[i]`` to ``block_ids[j]``; ``NaN`` marks pairs
+    with no recorded distance (consumers treat those as zero). The array may be a read-only
+    memory map when loaded via :meth:`from_npy`.
+    """
+
+    block_ids: tuple[str, ...]
+    values: np.ndarray
+    index: Mapping[str, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        values = np.asarray(self.values, dtype=np.float64)
+        size = len(self.block_ids)
+        if values.shape != (size, size):
+            raise ValueError(
+                f"Distance matrix shape {values.shape} does not match {size} block ids."
+            )
+        index = {block_id: pos for pos, block_id in enumerate(self.block_ids)}
+        if len(index) != size:
+            raise ValueError("Distance matrix block ids must be unique.")
+        if size and np.any(values < 0):
+            raise ValueError("distance_m must be non-negative")
+        object.__setattr__(self, "block_ids", tuple(self.block_ids))
+        object.__setattr__(self, "values", values)
+        object.__setattr__(self, "index", index)
+
+    @classmethod
+    def from_pairs(
+        cls,
+        from_blocks: Sequence[str] | np.ndarray,
+        to_blocks: Sequence[str] | np.ndarray,
+        distances: Sequence[float] | np.ndarray,
+    ) -> DistanceMatrix:
+        """Build a symmetric matrix from pairwise rows.
+
+        Later rows overwrite earlier ones, and every listed block gets a zero self-distance unless a
+        row sets one explicitly (mirroring the historical dictionary lookup).
+        """
+
+        sources = np.asarray(from_blocks, dtype=object)
+        targets = np.asarray(to_blocks, dtype=object)
+        dist = np.asarray(distances, dtype=np.float64)
+        if not (len(sources) == len(targets) == len(dist)):
+            raise ValueError("Distance rows must have matching from/to/distance lengths.")
+        if np.any(dist < 0):
+            raise ValueError("distance_m must be non-negative")
+        # Interleave (from, to) and (to, from) so the row order matches the legacy insert order.
+        rows = np.empty(2 * len(dist), dtype=object)
+        cols = np.empty(2 * len(dist), dtype=object)
+        rows[0::2], rows[1::2] = sources, targets
+        cols[0::2], cols[1::2] = targets, sources
+        block_order = pd.unique(rows) if len(rows) else np.empty(0, dtype=object)
+        size = len(block_order)
+        values = np.full((size, size), np.nan)
+        if size:
+            positions = pd.Index(block_order).get_indexer(rows)
+            col_positions = pd.Index(block_order).get_indexer(cols)
+            flat = positions * size + col_positions
+            # Keep the last write per cell (reverse, take first unique occurrence).
+            reversed_flat = flat[::-1]
+            _, first = np.unique(reversed_flat, return_index=True)
+            cells = reversed_flat[first]
+            values.flat[cells] = np.repeat(dist, 2)[::-1][first]
+            diagonal = np.diagonal(values).copy()
+            np.fill_diagonal(values, np.where(np.isnan(diagonal), 0.0, diagonal))
+        return cls(tuple(str(block_id) for block_id in block_order), values)
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[tuple[str, str], float]) -> DistanceMatrix:
+        """Build a matrix from an explicit ``(from, to) -> distance`` mapping (no symmetrisation)."""
+
+        if isinstance(mapping, DistanceLookup):
+            return mapping.matrix
+        keys = list(mapping)
+        block_order = pd.unique(np.asarray([block for key in keys for block in key], dtype=object))
+        size = len(block_order)
+        values = np.full((size, size), np.nan)
+        if size:
+            order = pd.Index(block_order)
+            rows = order.get_indexer([key[0] for key in keys])
+            cols = order.get_indexer([key[1] for key in keys])
+            values[rows, cols] = np.fromiter(mapping.values(), dtype=np.float64, count=len(keys))
+        return cls(tuple(str(block_id) for block_id in block_order), values)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, *, source: str = "frame") -> DistanceMatrix:
+        """Build a matrix from a ``from_block``/``to_block``/``distance_m`` table."""
+
+        required = set(_REQUIRED_COLUMNS)
+        if not required.issubset(frame.columns):
+            raise ValueError(
+                f"Mobilisation distance file {source} is missing required columns {required}."
+            )
+        return cls.from_pairs(
+            frame["from_block"].astype(str).to_numpy(dtype=object),
+            frame["to_block"].astype(str).to_numpy(dtype=object),
+            frame["distance_m"].to_numpy(dtype=np.float64),
+        )
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> DistanceMatrix:
+        """Load a long-format distance CSV."""
+
+        path = Path(path)
+        frame = pd.read_csv(path, dtype={"from_block": str, "to_block": str})
+        return cls.from_frame(frame, source=str(path))
+
+    @classmethod
+    def from_npy(
+        cls,
+        path: str | Path,
+        *,
+        block_ids: Iterable[str] | None = None,
+        mmap: bool = True,
+    ) -> DistanceMatrix:
+        """Load a square ``.npy`` matrix, memory-mapped read-only by default.
+
+        Block ids default to the ``<stem>.blocks.txt`` sidecar written by :meth:`save_npy`.
+        """
+
+        path = Path(path)
+        if block_ids is None:
+            sidecar = block_ids_path(path)
+            if not sidecar.exists():
+                raise FileNotFoundError(
+                    f"Distance matrix {path} has no block id sidecar at {sidecar}."
+                )
+            block_ids = [line for line in sidecar.read_text().splitlines() if line]
+        values = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+        return cls(tuple(str(block_id) for block_id in block_ids), values)
+
+    @classmethod
+    def load(cls, path: str | Path, *, mmap: bool = True) -> DistanceMatrix:
+        """Load a distance table from ``.npy``, Parquet, or CSV depending on the file suffix."""
+
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix == ".npy":
+            return cls.from_npy(path, mmap=mmap)
+        if suffix in {".parquet", ".pq"}:
+            return cls.from_frame(pd.read_parquet(path), source=str(path))
+        return cls.from_csv(path)
+
+    def save_npy(self, path: str | Path) -> Path:
+        """Write the matrix to ``path`` plus the block id sidecar; returns the matrix path."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, np.ascontiguousarray(self.values), allow_pickle=False)
+        block_ids_path(path).write_text("\n".join(self.block_ids) + "\n")
+        return path
+
+    def __len__(self) -> int:
+        return len(self.block_ids)
+
+    def get(self, from_block: str, to_block: str, default: float = 0.0) -> float:
+        """Return the distance between two blocks, ``default`` when unknown."""
+
+        row = self.index.get(from_block)
+        col = self.index.get(to_block)
+        if row is None or col is None:
+            return default
+        value = self.values.item(row, col)
+        return default if value != value else value
+
+    def positions(self, block_ids: Iterable[str]) -> np.ndarray:
+        """Return matrix positions for ``block_ids`` (``-1`` for unknown blocks)."""
+
+        index = self.index
+        return np.fromiter((index.get(block_id, -1) for block_id in block_ids), dtype=np.intp)
+
+    def reindex(self, block_ids: Sequence[str]) -> DistanceMatrix:
+        """Return a matrix over ``block_ids`` (unknown blocks get ``NaN`` rows/columns)."""
+
+        block_ids = tuple(block_ids)
+        if block_ids == self.block_ids:
+            return self
+        positions = self.positions(block_ids)
+        known = positions >= 0
+        if known.all():
+            values = self.values[np.ix_(positions, positions)]
+        else:
+            values = np.full((len(block_ids), len(block_ids)), np.nan)
+            inner = np.flatnonzero(known)
+            values[np.ix_(inner, inner)] = self.values[np.ix_(positions[known], positions[known])]
+        return DistanceMatrix(block_ids, values)
+
+    def subset(self, keep: Iterable[str]) -> DistanceMatrix:
+        """Restrict the matrix to the blocks in ``keep`` while preserving block order."""
+
+        keep_set = set(keep)
+        return self.reindex([block_id for block_id in self.block_ids if block_id in keep_set])
+
+    def dense(self, fill: float = 0.0) -> np.ndarray:
+        """Return a writable copy with unknown distances replaced by ``fill``."""
+
+        return np.where(np.isnan(self.values), fill, self.values)
+
+    def as_lookup(self) -> DistanceLookup:
+        """Return a read-only ``(from, to) -> distance`` mapping view over the matrix."""
+
+        return DistanceLookup(self)
+
+
+class DistanceLookup(Mapping[tuple[str, str], float]):
+    """Mapping view over a :class:`DistanceMatrix` exposing only known (non-``NaN``) pairs."""
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, matrix: DistanceMatrix) -> None:
+        self.matrix = matrix
+
+    def __getitem__(self, key: tuple[str, str]) -> float:
+        matrix = self.matrix
+        row = matrix.index.get(key[0])
+        col = matrix.index.get(key[1])
+        if row is None or col is None:
+            raise KeyError(key)
+        value = matrix.values.item(row, col)
+        if value != value:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: tuple[str, str], default: float | None = None) -> float | None:  # type: ignore[override]
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        block_ids = self.matrix.block_ids
+        rows, cols = np.nonzero(~np.isnan(self.matrix.values))
+        for row, col in zip(rows.tolist(), cols.tolist(), strict=True):
+            yield (block_ids[row], block_ids[col])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.matrix.values)))
+
+    def __repr__(self) -> str:
+        return f"DistanceLookup(blocks={len(self.matrix)}, pairs={len(self)})"
@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, field_validator
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_validator,
+    model_serializer,
+)
+
+from fhops.scheduling.mobilisation.distance_matrix import DistanceMatrix
 
 __all__ = [
     "BlockDistance",
     "MachineMobilisation",
     "MobilisationConfig",
     "build_distance_lookup",
+    "distance_matrix_for",
 ]
 
 
@@ -45,12 +59,21 @@ class MachineMobilisation(BaseModel):
 
 
 class MobilisationConfig(BaseModel):
-    """Complete mobilisation configuration for a scenario."""
+    """Complete mobilisation configuration for a scenario.
+
+    Distances come either from the inline ``distances`` rows or from ``distance_matrix``, the
+    dense table the scenario loader reads straight from ``distance_csv`` (CSV or ``.npy``). When
+    both are present the matrix wins. The matrix itself is not serialised; when only the matrix is
+    set, dumps materialise it as ``distances`` rows so ``model_validate(model_dump())`` keeps them.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     machine_params: list[MachineMobilisation]
     distances: list[BlockDistance] | None = None
     default_walk_threshold_m: float = 1000.0
     distance_csv: str | None = None
+    distance_matrix: DistanceMatrix | None = Field(default=None, exclude=True, repr=False)
 
     @field_validator("default_walk_threshold_m")
     @classmethod
@@ -59,17 +82,67 @@ class MobilisationConfig(BaseModel):
             raise ValueError("default_walk_threshold_m must be non-negative")
         return value
 
-
-def build_distance_lookup(config: MobilisationConfig | None) -> dict[tuple[str, str], float]:
-    """Return symmetric distance lookup from mobilisation config."""
-
-    if config is None or not config.distances:
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        data = handler(self)
+        if self.distance_matrix is not None and data.get("distances", ()) is None:
+            data["distances"] = _matrix_rows(self.distance_matrix)
+        return data
+
+
+def _matrix_rows(matrix: DistanceMatrix) -> list[dict[str, Any]]:
+    """Return ``distances`` rows that :meth:`DistanceMatrix.from_pairs` rebuilds into ``matrix``.
+
+    Each unordered pair is listed once (inline rows are symmetric); zero self-distances are
+    implied by ``from_pairs`` and only emitted for blocks that appear in no other pair.
+    """
+
+    values = matrix.values
+    block_ids = matrix.block_ids
+    # Prefer the upper triangle, falling back to the mirrored cell when only that one is known.
+    upper = np.where(np.isnan(values), values.T, values)
+    known = ~np.isnan(upper)
+    rows, cols = np.nonzero(np.triu(known, k=1))
+    paired = np.zeros(len(block_ids), dtype=bool)
+    paired[rows] = True
+    paired[cols] = True
+    diagonal = np.diagonal(upper)
+    self_rows = np.flatnonzero(~np.isnan(diagonal) & ((diagonal != 0.0) | ~paired))
+    pairs = [*zip(rows.tolist(), cols.tolist(), strict=True), *((i, i) for i in self_rows.tolist())]
+    return [
+        {
+            "from_block": block_ids[row],
+            "to_block": block_ids[col],
+            "distance_m": float(upper[row, col]),
+        }
+        for row, col in pairs
+    ]
+
+
+def distance_matrix_for(config: MobilisationConfig | None) -> DistanceMatrix | None:
+    """Return the distance matrix for ``config`` (building it from inline rows when needed)."""
+
+    if config is None:
+        return None
+    if config.distance_matrix is not None:
+        return config.distance_matrix
+    if not config.distances:
+        return None
+    return DistanceMatrix.from_pairs(
+        [dist.from_block for dist in config.distances],
+        [dist.to_block for dist in config.distances],
+        [dist.distance_m for dist in config.distances],
+    )
+
+
+def build_distance_lookup(config: MobilisationConfig | None) -> Mapping[tuple[str, str], float]:
+    """Return symmetric distance lookup from mobilisation config.
+
+    The result is a read-only mapping view over :func:`distance_matrix_for`; no per-pair
+    dictionary is materialised.
+    """
+
+    matrix = distance_matrix_for(config)
+    if matrix is None:
         return {}
-
-    lookup: dict[tuple[str, str], float] = {}
-    for dist in config.distances:
-        lookup[(dist.from_block, dist.to_block)] = dist.distance_m
-        lookup[(dist.to_block, dist.from_block)] = dist.distance_m
-        lookup.setdefault((dist.from_block, dist.from_block), 0.0)
-        lookup.setdefault((dist.to_block, dist.to_block), 0.0)
-    return lookup
+    return matrix.as_lookup()
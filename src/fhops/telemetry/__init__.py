@@ -1,6 +1,13 @@
 """Telemetry utilities for recording FHOPS run data."""
 
 from .jsonl import append_jsonl, load_jsonl
+from .profiling import CProfileReport, PhaseProfiler
 from .run_logger import RunTelemetryLogger
 
-__all__ = ["append_jsonl", "load_jsonl", "RunTelemetryLogger"]
+__all__ = [
+    "append_jsonl",
+    "load_jsonl",
+    "CProfileReport",
+    "PhaseProfiler",
+    "RunTelemetryLogger",
+]
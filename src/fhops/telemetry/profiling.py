@@ -0,0 +1,171 @@
+"""Low-overhead phase timers and cProfile reports for heuristic solver runs."""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+#: Phases instrumented by the heuristic solvers, in display order.
+SOLVER_PHASES: tuple[str, ...] = (
+    "neighbours",
+    "sanitize",
+    "repair",
+    "evaluate",
+    "telemetry",
+    "watch",
+)
+
+
+class _Phase:
+    """Re-entrant timing frame; ``child`` accumulates time spent in nested phases."""
+
+    __slots__ = ("profiler", "name", "started", "child")
+
+    def __init__(self, profiler: PhaseProfiler, name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.started = 0.0
+        self.child = 0.0
+
+    def __enter__(self) -> None:
+        self.profiler._stack().append(self)
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        elapsed = time.perf_counter() - self.started
+        stack = self.profiler._stack()
+        stack.pop()
+        self.profiler.add(self.name, elapsed - self.child)
+        if stack:
+            stack[-1].child += elapsed
+
+
+class PhaseProfiler:
+    """Accumulate exclusive wall-clock seconds and call counts per named solver phase.
+
+    Phases nest: time spent in an inner phase (e.g. ``sanitize`` inside ``neighbours``) is
+    attributed to the inner phase only, so the per-phase seconds add up to the instrumented total.
+    Timings from worker threads (batched evaluation) are accumulated under a lock; each thread keeps
+    its own nesting stack.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started = time.perf_counter()
+
+    def _stack(self) -> list[_Phase]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager timing one call of ``name``."""
+        return _Phase(self, name)
+
+    def add(self, name: str, seconds: float, calls: int = 1) -> None:
+        """Record ``calls`` calls of ``name`` taking ``seconds`` in total."""
+        with self._lock:
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            self.calls[name] = self.calls.get(name, 0) + calls
+
+    def wrap(self, name: str, func: Callable[..., T]) -> Callable[..., T]:
+        """Return ``func`` instrumented as phase ``name``."""
+
+        def _timed(*args: Any, **kwargs: Any) -> T:
+            with self.phase(name):
+                return func(*args, **kwargs)
+
+        return _timed
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return ``{phase: {"seconds", "calls", "share"}}`` plus an ``other`` remainder.
+
+        ``share`` is the fraction of wall-clock time since the profiler was created; ``other``
+        covers the uninstrumented remainder (solver bookkeeping, RNG, acceptance tests).
+        """
+        wall = max(time.perf_counter() - self._started, 1e-12)
+        with self._lock:
+            seconds = dict(self.seconds)
+            calls = dict(self.calls)
+        ordered = [name for name in SOLVER_PHASES if name in seconds]
+        ordered += sorted(name for name in seconds if name not in SOLVER_PHASES)
+        payload = {
+            name: {
+                "seconds": round(seconds[name], 6),
+                "calls": calls.get(name, 0),
+                "share": round(seconds[name] / wall, 4),
+            }
+            for name in ordered
+        }
+        other = max(0.0, wall - sum(seconds.values()))
+        payload["other"] = {
+            "seconds": round(other, 6),
+            "calls": 0,
+            "share": round(other / wall, 4),
+        }
+        return payload
+
+    def watch_metadata(self) -> dict[str, str]:
+        """Return compact ``phase_<name>`` strings (``"<seconds>s/<calls>"``) for snapshots."""
+        with self._lock:
+            return {
+                f"phase_{name}": f"{seconds:.3f}s/{self.calls.get(name, 0)}"
+                for name, seconds in self.seconds.items()
+            }
+
+
+class CProfileReport(AbstractContextManager["CProfileReport"]):
+    """Run a block under :mod:`cProfile` and write reports to ``path``.
+
+    :meth:`stop` writes the binary stats to ``path`` (load with ``pstats``/``snakeviz``) and a text
+    report of the top ``limit`` functions by cumulative time to ``path`` with ``.txt`` appended,
+    returning both paths so callers can record them as run artifacts. Solvers stop the report
+    explicitly once the search loop ends; leaving the context (e.g. on an error) stops it as well.
+    """
+
+    def __init__(self, path: str | Path, *, limit: int = 40) -> None:
+        self.path = Path(path)
+        self.limit = limit
+        self.artifacts: list[str] = []
+        self._profile: cProfile.Profile | None = None
+
+    def __enter__(self) -> CProfileReport:
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def stop(self) -> list[str]:
+        """Stop profiling (idempotent), write the reports, and return their paths."""
+        profile, self._profile = self._profile, None
+        if profile is None:
+            return self.artifacts
+        profile.disable()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(str(self.path))
+        buffer = io.StringIO()
+        pstats.Stats(profile, stream=buffer).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            self.limit
+        )
+        report_path = self.path.with_name(f"{self.path.name}.txt")
+        report_path.write_text(buffer.getvalue(), encoding="utf-8")
+        self.artifacts = [str(self.path), str(report_path)]
+        return self.artifacts
+
+
+__all__ = ["CProfileReport", "PhaseProfiler", "SOLVER_PHASES"]
@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-__all__ = ["persist_run", "persist_tuner_summary"]
+__all__ = ["load_perf_results", "persist_perf_run", "persist_run", "persist_tuner_summary"]
 
 
 _SCHEMA = """
@@ -58,8 +58,37 @@ CREATE TABLE IF NOT EXISTS tuner_summaries (
     scenario_best_json TEXT,
     created_at TEXT
 );
+CREATE TABLE IF NOT EXISTS perf_runs (
+    perf_run_id TEXT PRIMARY KEY,
+    created_at TEXT,
+    git_commit TEXT,
+    label TEXT,
+    context_json TEXT
+);
+CREATE TABLE IF NOT EXISTS perf_results (
+    perf_run_id TEXT NOT NULL,
+    scenario TEXT NOT NULL,
+    case_name TEXT NOT NULL,
+    calls INTEGER,
+    seconds REAL,
+    ops_per_sec REAL,
+    alloc_kib REAL,
+    peak_kib REAL,
+    PRIMARY KEY (perf_run_id, scenario, case_name),
+    FOREIGN KEY (perf_run_id) REFERENCES perf_runs(perf_run_id) ON DELETE CASCADE
+);
 """
 
+_PERF_COLUMNS = (
+    "scenario",
+    "case_name",
+    "calls",
+    "seconds",
+    "ops_per_sec",
+    "alloc_kib",
+    "peak_kib",
+)
+
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     conn.executescript(_SCHEMA)
@@ -225,3 +254,98 @@ def persist_tuner_summary(
         conn.close()
 
     return payload
+
+
+def persist_perf_run(
+    sqlite_path: str | Path,
+    record: Mapping[str, Any],
+    results: Sequence[Mapping[str, Any]],
+) -> dict[str, Any]:
+    """Persist a ``fhops bench perf`` run and its per-case results; return the enriched record."""
+
+    path = Path(sqlite_path)
+    if not path.parent.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = dict(record)
+    perf_run_id = payload.setdefault("perf_run_id", uuid4().hex)
+    payload.setdefault("created_at", datetime.now(UTC).isoformat(timespec="seconds"))
+
+    conn = sqlite3.connect(path)
+    try:
+        _ensure_schema(conn)
+        with conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO perf_runs (
+                    perf_run_id, created_at, git_commit, label, context_json
+                )
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    perf_run_id,
+                    payload.get("created_at"),
+                    payload.get("git_commit"),
+                    payload.get("label"),
+                    _json_dumps(payload.get("context")),
+                ),
+            )
+            conn.execute("DELETE FROM perf_results WHERE perf_run_id = ?", (perf_run_id,))
+            conn.executemany(
+                f"""
+                INSERT INTO perf_results (perf_run_id, {", ".join(_PERF_COLUMNS)})
+                VALUES (?, {", ".join("?" for _ in _PERF_COLUMNS)})
+                """,
+                [
+                    (perf_run_id, *(result.get(column) for column in _PERF_COLUMNS))
+                    for result in results
+                ],
+            )
+    finally:
+        conn.close()
+
+    return payload
+
+
+def load_perf_results(
+    sqlite_path: str | Path,
+    baseline: str | None = None,
+    *,
+    exclude_run: str | None = None,
+) -> tuple[dict[str, Any] | None, list[dict[str, Any]]]:
+    """Return a stored perf run and its results.
+
+    ``baseline`` matches a ``perf_run_id``, a git commit prefix or a label (latest match wins);
+    ``None`` selects the most recent run other than ``exclude_run``. Returns ``(None, [])`` when
+    the store or a matching run does not exist.
+    """
+
+    path = Path(sqlite_path)
+    if not path.exists():
+        return None, []
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    try:
+        _ensure_schema(conn)
+        query = "SELECT * FROM perf_runs WHERE perf_run_id != ?"
+        params: list[Any] = [exclude_run or ""]
+        if baseline:
+            query += " AND (perf_run_id = ? OR git_commit LIKE ? OR label = ?)"
+            params.extend([baseline, f"{baseline}%", baseline])
+        query += " ORDER BY created_at DESC, rowid DESC LIMIT 1"
+        row = conn.execute(query, params).fetchone()
+        if row is None:
+            return None, []
+        run = dict(row)
+        context_json = run.pop("context_json", None)
+        run["context"] = json.loads(context_json) if context_json else {}
+        results = [
+            dict(result)
+            for result in conn.execute(
+                f"SELECT {', '.join(_PERF_COLUMNS)} FROM perf_results WHERE perf_run_id = ?",
+                (run["perf_run_id"],),
+            )
+        ]
+        return run, results
+    finally:
+        conn.close()
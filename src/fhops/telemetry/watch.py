@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 import queue
-from collections.abc import Iterable, Iterator
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Protocol
+from typing import Any, Protocol
 
 
 @dataclass(slots=True)
 class Snapshot:
-    """Immutable payload emitted by heuristic runners for live dashboards."""
+    """Payload emitted by heuristic runners for live dashboards.
+
+    Solvers keep emission cheap by passing numbers plus an optional ``metadata_factory``; the
+    consumer calls :meth:`resolve_metadata` when it actually renders the snapshot, so string
+    formatting happens on the watch thread at the refresh rate rather than in the search loop.
+    Resolving mutates the snapshot in place: the factory output is merged into ``metadata`` and
+    ``metadata_factory`` is cleared. Treat every other field as read-only once emitted.
+    """
 
     scenario: str
     solver: str
@@ -29,8 +40,20 @@ class Snapshot:
     temperature: float | None = None
     acceptance_rate_window: float | None = None
     delta_objective: float | None = None
+    evaluations: int | None = None  # candidate schedules scored so far in this run
+    worker: str | None = None  # set by ProcessSnapshotSink for snapshots from worker processes
     timestamp: datetime = field(default_factory=datetime.utcnow)
     metadata: dict[str, str] = field(default_factory=dict)
+    metadata_factory: Callable[[], Mapping[str, str]] | None = field(default=None, compare=False)
+
+    def resolve_metadata(self) -> dict[str, str]:
+        """Merge the deferred ``metadata_factory`` output into ``metadata`` (once) and return it."""
+
+        factory = self.metadata_factory
+        if factory is not None:
+            self.metadata_factory = None
+            self.metadata.update(factory())
+        return self.metadata
 
     @property
     def progress_ratio(self) -> float | None:
@@ -58,6 +81,7 @@ class WatchConfig:
     include_restarts: bool = True
     include_acceptance_rate: bool = True
     sparkline_points: int = 24
+    queue_size: int = 1024  # snapshots buffered between refreshes before the oldest are dropped
 
 
 # Default no-op sink used when watch mode is disabled.
@@ -66,32 +90,160 @@ def null_sink(snapshot: Snapshot) -> None:
 
 
 class SnapshotBus:
-    """Thread-safe queue-based transport for snapshot events."""
+    """Bounded, non-blocking transport for snapshot events.
+
+    Publishing appends to a ``deque(maxlen=maxsize)`` (atomic under the GIL) and never waits on the
+    consumer, so a slow terminal can neither stall a solver nor grow its memory. When the consumer
+    falls behind, the oldest snapshots are discarded and counted in :attr:`dropped`; dashboards
+    only render the latest state per run anyway.
+    """
 
-    def __init__(self) -> None:
-        self._queue: queue.Queue[Snapshot] = queue.Queue()
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self._buffer: deque[Snapshot] = deque(maxlen=maxsize)
+        self._ready = threading.Event()
+        #: Snapshots discarded because the buffer was full.
+        self.dropped = 0
 
     def sink(self) -> SnapshotSink:
-        """Return a sink that enqueues snapshots for later consumption."""
+        """Return a sink that publishes snapshots without blocking."""
 
-        def _enqueue(snapshot: Snapshot) -> None:
-            self._queue.put(snapshot)
+        buffer = self._buffer
 
-        return _enqueue
+        def _publish(snapshot: Snapshot) -> None:
+            if len(buffer) >= self.maxsize:
+                self.dropped += 1
+            buffer.append(snapshot)
+            self._ready.set()
+
+        return _publish
 
     def get(self, timeout: float | None = None) -> Snapshot:
-        """Blocking read of the next snapshot."""
+        """Blocking read of the next snapshot (raises :class:`queue.Empty` on timeout)."""
 
-        return self._queue.get(timeout=timeout)
+        while True:
+            try:
+                snapshot = self._buffer.popleft()
+            except IndexError:
+                self._ready.clear()
+                if self._buffer:
+                    continue
+                if not self._ready.wait(timeout):
+                    raise queue.Empty from None
+                continue
+            return snapshot
 
     def drain(self) -> Iterator[Snapshot]:
-        """Iterate over available snapshots without blocking."""
+        """Iterate over the snapshots available now without blocking.
+
+        Snapshots published while draining are left for the next call, so a busy producer cannot
+        keep the consumer looping.
+        """
+
+        for _ in range(len(self._buffer)):
+            try:
+                snapshot = self._buffer.popleft()
+            except IndexError:
+                break
+            yield snapshot
+
+
+@dataclass(slots=True)
+class ProcessSnapshotSink:
+    """Picklable sink that ships snapshots from worker processes to a :class:`ProcessSnapshotRelay`.
+
+    Deferred metadata is resolved in the worker (factories cannot cross process boundaries) and
+    the snapshot is tagged with the worker's process id. Publishing uses ``put_nowait``: a full
+    relay queue, or a relay that has already shut down, drops the snapshot instead of blocking or
+    failing the solver.
+    """
 
+    channel: Any
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        snapshot.resolve_metadata()
+        if snapshot.worker is None:
+            snapshot.worker = f"pid {os.getpid()}"
+        try:
+            self.channel.put_nowait(snapshot)
+        except (queue.Full, EOFError, OSError):
+            pass
+
+
+class ProcessSnapshotRelay:
+    """Forward snapshots from solver worker processes into an in-process sink.
+
+    The relay owns a bounded :func:`multiprocessing.Manager` queue. Its proxy pickles, so
+    :attr:`sink` can be passed as ``watch_sink`` to jobs running on
+    :class:`~fhops.optimization.pool.SolverPool` workers. A forwarder thread moves the snapshots
+    into ``target`` (typically :attr:`fhops.cli.watch_dashboard.LiveWatch.sink`).
+    """
+
+    def __init__(
+        self,
+        target: SnapshotSink,
+        *,
+        maxsize: int = 1024,
+        poll_interval: float = 0.1,
+    ) -> None:
+        self.target = target
+        self.maxsize = maxsize
+        self.poll_interval = poll_interval
+        self._manager: Any = None
+        self._channel: Any = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def sink(self) -> ProcessSnapshotSink:
+        """Picklable sink for worker processes (the relay must be started)."""
+
+        if self._channel is None:
+            raise RuntimeError("ProcessSnapshotRelay.start() must be called before using sink")
+        return ProcessSnapshotSink(self._channel)
+
+    def __enter__(self) -> ProcessSnapshotRelay:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if self._manager is not None:
+            return
+        self._manager = multiprocessing.Manager()
+        self._channel = self._manager.Queue(self.maxsize)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._forward, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Forward what is still queued, then stop the thread and the manager process."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, 5 * self.poll_interval))
+            self._thread = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+            self._channel = None
+
+    def _forward(self) -> None:
+        channel = self._channel
         while True:
             try:
-                yield self._queue.get_nowait()
+                snapshot = channel.get(timeout=self.poll_interval)
             except queue.Empty:
-                break
+                if self._stop.is_set():
+                    return
+                continue
+            except (EOFError, OSError):
+                return
+            self.target(snapshot)
 
 
 def summarize_snapshots(
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from fhops.optimization.heuristics import solve_sa
+from fhops.optimization.heuristics.adaptive import AdaptiveOperatorWeights
+from fhops.optimization.heuristics.registry import (
+    MoveOperator,
+    OperatorRegistry,
+    SwapOperator,
+)
+from fhops.scenario.contract import Problem
+from fhops.scenario.io.loaders import load_scenario
+
+
+def _registry() -> OperatorRegistry:
+    return OperatorRegistry.from_defaults([SwapOperator(), MoveOperator()])
+
+
+def test_adaptive_weights_favour_productive_operators():
+    registry = _registry()
+    adaptive = AdaptiveOperatorWeights(registry, segment=2, reaction=0.5, min_share=0.1)
+    stats = {"swap": {"seconds": 0.0}, "move": {"seconds": 0.0}}
+    closed = []
+    for _ in range(2):
+        adaptive.credit("swap", 10.0, 0.5)
+        adaptive.credit("move", -3.0, 0.5)
+        closed.append(adaptive.update(stats))
+    assert closed == [False, True]
+
+    weights = registry.weights()
+    assert weights["swap"] == pytest.approx(1.0)
+    assert weights["move"] == pytest.approx(0.5)
+    state = adaptive.state()
+    assert state["segments"] == 1
+    assert state["improvement"] == {"swap": 20.0, "move": 0.0}
+
+
+def test_adaptive_weights_respect_floor_and_disabled_operators():
+    registry = _registry()
+    registry.configure({"move": 0.0})
+    adaptive = AdaptiveOperatorWeights(registry, segment=1, reaction=1.0, min_share=0.2)
+    adaptive.credit("move", 50.0, 1.0)
+    adaptive.credit("swap", 0.0, 1.0)
+    adaptive.update({})
+    # With no improving operator nothing changes; disabled operators are never credited.
+    assert registry.weights() == {"swap": 1.0, "move": 0.0}
+
+    registry = _registry()
+    registry.configure({"swap": 2.0})
+    adaptive = AdaptiveOperatorWeights(registry, segment=1, reaction=1.0, min_share=0.2)
+    adaptive.credit("swap", 10.0, 1.0)
+    adaptive.credit("move", -5.0, 1.0)
+    assert adaptive.update({})
+    # The unproductive operator drops to the floor instead of being switched off.
+    assert registry.weights() == pytest.approx({"swap": 2.0, "move": 0.2 * 2.0})
+
+
+def test_solve_sa_reports_adaptive_state():
+    pb = Problem.from_scenario(load_scenario(Path("examples/tiny7/scenario.yaml")))
+    result = solve_sa(pb, iters=120, seed=4, adaptive_operators=True)
+    state = result["meta"]["operators_adaptive"]
+    assert state["segments"] == 2
+    assert set(state["weights"]) == set(state["initial_weights"])
+    assert all(weight > 0 for weight in state["weights"].values())
+    for name, weight in state["weights"].items():
+        assert result["meta"]["operators"][name] == weight
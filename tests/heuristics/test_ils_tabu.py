@@ -4,7 +4,10 @@ import json
 import sqlite3
 from pathlib import Path
 
+from fhops.optimization.heuristics import ils as ils_module
 from fhops.optimization.heuristics import solve_ils, solve_tabu
+from fhops.optimization.heuristics.common import evaluate_schedule, init_greedy_schedule
+from fhops.optimization.operational_problem import build_operational_problem
 from fhops.scenario.contract import Problem
 from fhops.scenario.io.loaders import load_scenario
 
@@ -94,6 +97,22 @@ def test_solve_ils_watch_sink_emits_snapshots():
     assert captured[-1].current_objective is not None
 
 
+def test_solve_ils_watch_counts_evaluated_candidates(monkeypatch):
+    pb = _load_problem()
+    evaluated: list[int] = []
+    original = ils_module.evaluate_candidates
+
+    def counting(*args, **kwargs):
+        results = original(*args, **kwargs)
+        evaluated.append(len(results))
+        return results
+
+    monkeypatch.setattr(ils_module, "evaluate_candidates", counting)
+    captured = []
+    solve_ils(pb, iters=5, seed=3, batch_size=4, watch_sink=captured.append, watch_interval=1)
+    assert captured[-1].evaluations == sum(evaluated) > 0
+
+
 def test_solve_tabu_watch_sink_emits_snapshots():
     pb = _load_problem()
     captured = []
@@ -111,3 +130,37 @@ def test_solve_tabu_watch_sink_emits_snapshots():
     assert captured, "Tabu should emit snapshots when watch sink is provided"
     assert captured[-1].solver == "tabu"
     assert captured[-1].rolling_objective is not None
+
+
+def test_watch_debug_reads_sequencing_stats_without_rescoring():
+    pb = _load_problem()
+    runs = {}
+    for watch_debug in (False, True):
+        captured = []
+        res = solve_tabu(
+            pb,
+            iters=30,
+            seed=7,
+            watch_sink=captured.append,
+            watch_debug=watch_debug,
+            phase_timings=True,
+        )
+        runs[watch_debug] = (captured[-1].resolve_metadata(), res["meta"]["phase_timings"])
+    plain, debug = runs[False][0], runs[True][0]
+    assert "seq_violation_count" in debug and "seq_violation_count" not in plain
+    assert debug["tabu_tenure"] == plain["tabu_tenure"]
+    # Sequencing diagnostics come from the scoring pass, so debug mode adds no evaluations.
+    assert runs[True][1]["evaluate"]["calls"] == runs[False][1]["evaluate"]["calls"]
+
+
+def test_sequencing_watch_stats_are_only_built_for_watched_runs():
+    pb = _load_problem()
+    ctx = build_operational_problem(pb)
+    schedule = init_greedy_schedule(pb, ctx)
+    evaluate_schedule(pb, schedule, ctx)
+    assert schedule.watch_stats is not None
+    assert "delivered_total" in schedule.watch_stats
+    assert "sequencing_violation_count" not in schedule.watch_stats
+
+    evaluate_schedule(pb, schedule, ctx, capture_watch=True)
+    assert "sequencing_violation_count" in schedule.watch_stats
@@ -15,6 +15,7 @@ from fhops.scenario.contract import (
     Scenario,
 )
 from fhops.scenario.contract.models import ShiftCalendarEntry
+from fhops.telemetry.watch import ProcessSnapshotRelay
 
 
 def _build_problem() -> Problem:
@@ -119,3 +120,23 @@ def test_build_exploration_plan_custom_presets():
     seeds, presets = build_exploration_plan(3, base_seed=5, presets=["swap-only", "move-only"])
     assert seeds == [5, 1005, 2005]
     assert presets == [["swap-only"], ["move-only"], ["swap-only"]]
+
+
+def test_run_multi_start_streams_parallel_snapshots():
+    pb = _build_problem()
+    received = []
+    with ProcessSnapshotRelay(received.append) as relay:
+        run_multi_start(
+            pb,
+            [11, 22],
+            max_workers=2,
+            sa_kwargs={
+                "iters": 40,
+                "watch_sink": relay.sink,
+                "watch_interval": 10,
+                "watch_metadata": {"scenario": "multistart", "solver": "sa"},
+            },
+        )
+    assert {snap.solver for snap in received} == {"sa#0", "sa#1"}
+    assert all(snap.worker is not None for snap in received)
+    assert received[-1].evaluations is not None
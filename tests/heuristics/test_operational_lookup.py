@@ -0,0 +1,162 @@
+"""Tests for the dense lookup tables precomputed on OperationalProblem."""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+
+from fhops.evaluation.sequencing import build_role_priority
+from fhops.optimization.heuristics.common import (
+    RestartPool,
+    evaluate_schedule,
+    greedy_seed,
+    init_greedy_schedule,
+)
+from fhops.optimization.operational_problem import build_operational_problem
+from fhops.scenario.contract import Problem
+from fhops.scenario.contract.models import (
+    Block,
+    CalendarEntry,
+    Landing,
+    Machine,
+    ProductionRate,
+    Scenario,
+)
+from fhops.scenario.io import load_scenario
+from fhops.scheduling.systems import HarvestSystem, SystemJob
+
+
+def _build_problem() -> Problem:
+    system = HarvestSystem(
+        system_id="ground_seq",
+        jobs=[
+            SystemJob("fell", "feller_buncher", []),
+            SystemJob("process", "roadside_processor", ["fell"]),
+        ],
+    )
+    scenario = Scenario(
+        name="lookup-test",
+        num_days=4,
+        blocks=[
+            Block(
+                id="B1",
+                landing_id="L1",
+                work_required=60.0,
+                earliest_start=1,
+                latest_finish=2,
+                harvest_system_id="ground_seq",
+            ),
+            Block(
+                id="B2",
+                landing_id="L1",
+                work_required=40.0,
+                earliest_start=3,
+                latest_finish=4,
+                harvest_system_id="ground_seq",
+            ),
+        ],
+        machines=[
+            Machine(id="P1", role="roadside_processor"),
+            Machine(id="F1", role="feller_buncher"),
+        ],
+        landings=[Landing(id="L1", daily_capacity=2)],
+        calendar=[
+            CalendarEntry(machine_id=machine_id, day=day, available=1)
+            for machine_id in ("P1", "F1")
+            for day in (1, 2, 3, 4)
+        ],
+        production_rates=[
+            ProductionRate(machine_id="F1", block_id="B1", rate=30.0),
+            ProductionRate(machine_id="F1", block_id="B2", rate=20.0),
+            ProductionRate(machine_id="P1", block_id="B1", rate=25.0),
+            ProductionRate(machine_id="P1", block_id="B2", rate=0.0),
+        ],
+        harvest_systems={"ground_seq": system},
+    )
+    return Problem.from_scenario(scenario)
+
+
+def test_rate_tables_match_scenario_rates():
+    pb = _build_problem()
+    ctx = build_operational_problem(pb)
+
+    assert ctx.rate_matrix.shape == (2, 2)
+    p1, f1 = ctx.machine_index["P1"], ctx.machine_index["F1"]
+    b1, b2 = ctx.block_index["B1"], ctx.block_index["B2"]
+    assert ctx.rate_matrix[f1, b1] == 30.0
+    assert ctx.rate_matrix[p1, b2] == 0.0
+    assert np.array_equal(ctx.compatible_blocks, ctx.rate_matrix > 0.0)
+    assert ctx.blocks_for_machine["P1"] == ("B1",)
+    assert ctx.blocks_for_machine["F1"] == ("B1", "B2")
+    assert ctx.machines_for_block["B2"] == ("F1",)
+
+
+def test_block_shift_span_covers_window_slots():
+    pb = _build_problem()
+    ctx = build_operational_problem(pb)
+
+    for block_id, (start, stop) in ctx.block_shift_span.items():
+        earliest, latest = ctx.bundle.windows[block_id]
+        in_window = [
+            idx for idx, (day, _) in enumerate(ctx.shift_keys) if earliest <= day <= latest
+        ]
+        assert list(range(start, stop)) == in_window
+
+
+def test_machine_order_follows_role_priority():
+    pb = _build_problem()
+    ctx = build_operational_problem(pb)
+
+    priority = build_role_priority(ctx)
+    assert priority == dict(ctx.role_priority)
+    assert priority[ctx.bundle.machine_roles["F1"]] < priority[ctx.bundle.machine_roles["P1"]]
+    assert ctx.machine_order == ("F1", "P1")
+
+
+def test_greedy_seed_and_evaluation_are_stable_on_tiny7():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+
+    first = init_greedy_schedule(pb, ctx)
+    second = init_greedy_schedule(pb, ctx)
+    assert first.plan == second.plan
+    assert evaluate_schedule(pb, first, ctx) == evaluate_schedule(pb, second, ctx)
+
+
+def test_greedy_seed_is_memoised_and_copied():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+
+    first = greedy_seed(pb, ctx)
+    assert first.plan == init_greedy_schedule(pb, ctx).plan
+    evaluate_schedule(pb, first, ctx)  # repairs may rewrite the handed-out copy
+    assignments = next(iter(first.plan.values()))
+    assignments[next(iter(assignments))] = None
+
+    second = greedy_seed(pb, ctx)
+    assert second is not first
+    assert second.plan == init_greedy_schedule(pb, ctx).plan
+    assert greedy_seed(pb, ctx, variant=1).plan == greedy_seed(pb, ctx, variant=1).plan
+
+
+def test_restart_pool_draws_seeds_and_elites():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    pool = RestartPool(pb, ctx, random.Random(0), variants=1, elite_size=1)
+
+    elite = greedy_seed(pb, ctx)
+    assignments = next(iter(elite.plan.values()))
+    assignments[next(iter(assignments))] = None
+    pool.record(elite, 1.0)
+    pool.record(elite, 1.0)
+
+    allowed = [
+        greedy_seed(pb, ctx).plan,
+        greedy_seed(pb, ctx, variant=1).plan,
+        elite.plan,
+    ]
+    drawn = [pool.draw() for _ in range(30)]
+    assert all(schedule.plan in allowed for schedule in drawn)
+    assert any(schedule.plan == elite.plan for schedule in drawn)
+    assert all(schedule is not elite for schedule in drawn)
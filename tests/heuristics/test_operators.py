@@ -2,12 +2,23 @@ from __future__ import annotations
 
 import random
 
-from fhops.optimization.heuristics.common import Schedule, generate_neighbors
+from fhops.optimization.heuristics.common import (
+    Schedule,
+    _set_assignment,
+    generate_neighbors,
+    init_greedy_schedule,
+)
 from fhops.optimization.heuristics.registry import (
     BlockInsertionOperator,
+    CoverageInjectionOperator,
     CrossExchangeOperator,
     MobilisationShakeOperator,
+    OperatorContext,
     OperatorRegistry,
+    SlotChange,
+    SwapOperator,
+    _clone_schedule,
+    normalize_move,
 )
 from fhops.optimization.operational_problem import build_operational_problem
 from fhops.scenario.contract import (
@@ -20,6 +31,7 @@ from fhops.scenario.contract import (
     Scenario,
 )
 from fhops.scenario.contract.models import ScheduleLock, ShiftCalendarEntry
+from fhops.scenario.io import load_scenario
 from fhops.scheduling.systems import HarvestSystem, SystemJob
 
 
@@ -174,7 +186,14 @@ def test_block_insertion_moves_within_window():
     assert len(neighbors) == 1
     moved = neighbors[0]
     assert moved.plan["M1"][(1, "AM")] is None
-    assert moved.plan["M1"][(2, "AM")] == "B1"
+    # The target is drawn at random; any available in-window slot is a valid destination.
+    targets = [
+        (machine, shift_key)
+        for machine, machine_plan in moved.plan.items()
+        for shift_key, block_id in machine_plan.items()
+        if block_id == "B1"
+    ]
+    assert targets in ([("M1", (2, "AM"))], [("M2", (2, "AM"))])
 
 
 def test_cross_exchange_requires_capable_machines():
@@ -392,3 +411,141 @@ def test_generate_neighbors_defers_downstream_roles():
         assert min(loader_assignments) >= 3
     else:
         assert repaired.plan["L1"][(1, "AM")] is None
+
+
+def test_normalize_move_collapses_and_sorts():
+    move = normalize_move(
+        [
+            SlotChange("M2", 1, "AM", "B1", "B2"),
+            SlotChange("M1", 2, "AM", "B1", "B1"),
+            SlotChange("M1", 1, "AM", "B1", "B2"),
+            SlotChange("M1", 1, "AM", "B2", None),
+        ]
+    )
+    assert move == (
+        SlotChange("M1", 1, "AM", "B1", None),
+        SlotChange("M2", 1, "AM", "B1", "B2"),
+    )
+
+
+def test_move_sanitizer_matches_full_sanitizer():
+    pb = Problem.from_scenario(load_scenario("examples/med42/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    machines = [machine.id for machine in pb.scenario.machines]
+    blocks = [block.id for block in pb.scenario.blocks]
+    rng = random.Random(11)
+    plan = {
+        machine: {key: rng.choice([None, *blocks]) for key in ctx.shift_keys}
+        for machine in machines
+    }
+    parent = Schedule(plan=plan)
+    sanitize = ctx.build_sanitizer(Schedule)
+    sanitize_move = ctx.build_move_sanitizer(Schedule)
+    for _ in range(50):
+        changes = []
+        for _ in range(rng.randint(1, 3)):
+            machine = rng.choice(machines)
+            key = rng.choice(ctx.shift_keys)
+            changes.append(SlotChange(machine, *key, plan[machine][key], rng.choice(blocks)))
+        move = normalize_move(changes)
+        patched = {machine: dict(assignments) for machine, assignments in plan.items()}
+        for change in move:
+            patched[change.machine_id][(change.day, change.shift_id)] = change.new_block
+        assert sanitize_move(parent, move).plan == sanitize(Schedule(plan=patched)).plan
+
+
+def test_neighbours_record_move_descriptors():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    parent = init_greedy_schedule(pb, ctx)
+    registry = OperatorRegistry.from_defaults([SwapOperator()])
+    neighbours = generate_neighbors(pb, parent, registry, random.Random(5), {}, ctx)
+    assert neighbours
+    for change in neighbours[0].move or ():
+        assert parent.plan[change.machine_id][(change.day, change.shift_id)] == change.old_block
+        assert change.old_block != change.new_block
+
+
+def test_coverage_injection_prefers_fastest_idle_machine():
+    blocks = [
+        Block(id="B1", landing_id="L1", work_required=10.0, earliest_start=1, latest_finish=2),
+        Block(id="B2", landing_id="L1", work_required=30.0, earliest_start=2, latest_finish=2),
+    ]
+    machines = [Machine(id="M1", role="harvester"), Machine(id="M2", role="harvester")]
+    landings = [Landing(id="L1", daily_capacity=10)]
+    calendar = [
+        CalendarEntry(machine_id=machine.id, day=day, available=True)
+        for machine in machines
+        for day in (1, 2)
+    ]
+    shift_calendar = [
+        ShiftCalendarEntry(machine_id=machine.id, day=day, shift_id="AM", available=True)
+        for machine in machines
+        for day in (1, 2)
+    ]
+    production = [
+        ProductionRate(machine_id="M1", block_id="B1", rate=10.0),
+        ProductionRate(machine_id="M1", block_id="B2", rate=5.0),
+        ProductionRate(machine_id="M2", block_id="B2", rate=15.0),
+    ]
+    pb = _build_problem(
+        blocks=blocks,
+        machines=machines,
+        landings=landings,
+        calendar=calendar,
+        shift_calendar=shift_calendar,
+        production_rates=production,
+    )
+    schedule = _build_schedule(pb, {("M1", 1, "AM"): "B1"})
+
+    neighbors = _run_operator(pb, schedule, CoverageInjectionOperator(weight=1.0))
+    assert len(neighbors) == 1
+    # B2 has the largest deficit; only day 2 is in its window and M2 is the faster machine.
+    assert neighbors[0].plan["M2"][(2, "AM")] == "B2"
+    assert neighbors[0].plan["M1"][(1, "AM")] == "B1"
+
+
+def test_operator_index_is_dropped_when_schedule_changes():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    parent = init_greedy_schedule(pb, ctx)
+    registry = OperatorRegistry.from_defaults(
+        [BlockInsertionOperator(weight=1.0), CoverageInjectionOperator(weight=1.0)]
+    )
+    generate_neighbors(pb, parent, registry, random.Random(2), {}, ctx)
+    assert parent.operator_index
+    first = next(
+        (machine_id, key, block_id)
+        for machine_id, assignments in parent.plan.items()
+        for key, block_id in assignments.items()
+        if block_id is not None
+    )
+    machine_id, (day, shift_id), _ = first
+    _set_assignment(parent, machine_id, day, shift_id, None, ctx)
+    assert parent.operator_index == {}
+
+
+def test_full_clone_keeps_schedule_class_and_rebuilds_missing_rows():
+    class TaggedSchedule(Schedule):
+        pass
+
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    seed = init_greedy_schedule(pb, ctx)
+    schedule = TaggedSchedule(plan=seed.plan, matrix=dict(seed.matrix))
+    machine_id = next(iter(schedule.plan))
+    schedule.matrix[machine_id] = None  # type: ignore[assignment]
+    shift_keys = tuple((shift.day, shift.shift_id) for shift in pb.shifts)
+    context = OperatorContext(
+        problem=pb,
+        schedule=schedule,
+        sanitizer=lambda candidate: candidate,
+        rng=random.Random(0),
+        shift_keys=shift_keys,
+        shift_index={key: idx for idx, key in enumerate(shift_keys)},
+    )
+
+    clone = _clone_schedule(context)
+    assert isinstance(clone, TaggedSchedule)
+    assert clone.matrix[machine_id] == [schedule.plan[machine_id].get(key) for key in shift_keys]
+    assert clone.plan == schedule.plan and clone.plan[machine_id] is not schedule.plan[machine_id]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+from fhops.optimization.heuristics import solve_ils, solve_sa, solve_tabu
+from fhops.optimization.heuristics.common import deferred_watch_metadata
+from fhops.scenario.contract import Problem
+from fhops.scenario.io.loaders import load_scenario
+from fhops.telemetry import PhaseProfiler
+
+
+def _load_problem() -> Problem:
+    return Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+
+
+def test_phase_profiler_attributes_nested_time_exclusively():
+    profiler = PhaseProfiler()
+    sanitize = profiler.wrap("sanitize", lambda: time.sleep(0.01))
+    start = time.perf_counter()
+    with profiler.phase("neighbours"):
+        time.sleep(0.01)
+        sanitize()
+        sanitize()
+    elapsed = time.perf_counter() - start
+
+    summary = profiler.summary()
+    assert summary["neighbours"]["calls"] == 1
+    assert summary["sanitize"]["calls"] == 2
+    assert summary["sanitize"]["seconds"] >= 0.02
+    assert summary["neighbours"]["seconds"] >= 0.01
+    # Exclusive attribution: the nested sanitize time is not counted again under neighbours.
+    assert summary["neighbours"]["seconds"] + summary["sanitize"]["seconds"] <= elapsed
+    assert list(summary)[-1] == "other"
+    assert profiler.watch_metadata()["phase_sanitize"].endswith("s/2")
+
+
+def test_solve_sa_reports_phase_timings_and_profile(tmp_path: Path):
+    pb = _load_problem()
+    snapshots = []
+    telemetry_path = tmp_path / "runs.jsonl"
+    profile_path = tmp_path / "profiles" / "sa.prof"
+    res = solve_sa(
+        pb,
+        iters=40,
+        seed=3,
+        telemetry_log=telemetry_path,
+        watch_sink=snapshots.append,
+        watch_interval=10,
+        profile_out=profile_path,
+    )
+
+    timings = res["meta"]["phase_timings"]
+    for phase in ("neighbours", "sanitize", "repair", "evaluate", "telemetry", "watch"):
+        assert timings[phase]["calls"] > 0
+    assert timings["evaluate"]["calls"] >= 40
+    assert "phase_evaluate" in snapshots[-1].resolve_metadata()
+
+    artifacts = res["meta"]["profile_artifacts"]
+    assert artifacts == [str(profile_path), f"{profile_path}.txt"]
+    assert all(Path(artifact).exists() for artifact in artifacts)
+    record = json.loads(telemetry_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert record["extra"]["phase_timings"]["evaluate"]["calls"] == timings["evaluate"]["calls"]
+    assert record["artifacts"] == artifacts
+
+
+def test_phase_timings_are_opt_in_and_cover_ils_tabu():
+    pb = _load_problem()
+    assert "phase_timings" not in solve_sa(pb, iters=10, seed=1)["meta"]
+    ils = solve_ils(pb, iters=3, seed=1, phase_timings=True)
+    tabu = solve_tabu(pb, iters=10, seed=1, phase_timings=True)
+    assert ils["meta"]["phase_timings"]["evaluate"]["calls"] > 0
+    assert tabu["meta"]["phase_timings"]["neighbours"]["calls"] > 0
+
+
+def test_watch_metadata_freezes_phase_totals_at_emission():
+    profiler = PhaseProfiler()
+    profiler.add("evaluate", 0.5)
+    factory = deferred_watch_metadata(None, {"stalls": 1}, profiler=profiler)
+    profiler.add("evaluate", 2.0, calls=3)
+    assert factory() == {"stalls": "1", "phase_evaluate": "0.500s/1"}
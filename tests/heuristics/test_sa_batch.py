@@ -1,14 +1,25 @@
 from __future__ import annotations
 
 import json
+import random
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 import yaml
 
 from fhops.cli._utils import resolve_operator_presets
+from fhops.optimization.heuristics import common as heuristics_common
 from fhops.optimization.heuristics import solve_sa
+from fhops.optimization.heuristics.common import (
+    evaluate_candidates,
+    generate_neighbors,
+    init_greedy_schedule,
+    iter_candidate_scores,
+)
+from fhops.optimization.heuristics.registry import OperatorRegistry
+from fhops.optimization.operational_problem import get_operational_problem
 from fhops.scenario.contract import (
     Block,
     CalendarEntry,
@@ -74,6 +85,36 @@ def test_solve_sa_batch_matches_single():
     assert pytest.approx(base["objective"], rel=1e-6) == batched["objective"]
 
 
+def test_iter_candidate_scores_is_lazy(monkeypatch):
+    pb = Problem.from_scenario(load_scenario(Path("examples/tiny7/scenario.yaml")))
+    ctx = get_operational_problem(pb)
+    seed = init_greedy_schedule(pb, ctx)
+    candidates = generate_neighbors(
+        pb, seed, OperatorRegistry.from_defaults(), random.Random(3), {}, ctx, batch_size=6
+    )
+    assert len(candidates) > 2
+    eager = evaluate_candidates(pb, candidates, ctx)
+
+    scored: list[object] = []
+    original = heuristics_common.evaluate_schedule
+
+    def _counting(pb_arg, schedule, ctx_arg, **kwargs):
+        scored.append(schedule)
+        return original(pb_arg, schedule, ctx_arg, **kwargs)
+
+    monkeypatch.setattr(heuristics_common, "evaluate_schedule", _counting)
+    lazy = iter_candidate_scores(pb, candidates, ctx)
+    assert next(lazy) == eager[0]
+    lazy.close()
+    assert scored == [candidates[0]]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        speculative = list(
+            iter_candidate_scores(pb, candidates, ctx, executor=executor, lookahead=2)
+        )
+    assert speculative == eager
+
+
 def test_evaluate_candidates_empty():
     pb = _simple_problem()
     batched = solve_sa(pb, iters=1, seed=1, batch_size=0, max_workers=4)
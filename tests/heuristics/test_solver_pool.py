@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from fhops.optimization.heuristics import solve_sa
+from fhops.optimization.pool import SolverPool
+from fhops.scenario.contract import Problem
+from fhops.scenario.io import load_scenario
+
+TINY7 = Path("examples/tiny7/scenario.yaml")
+
+
+def _problem_id(pb: Problem) -> int:
+    return id(pb)
+
+
+def _slow_block_count(pb: Problem, delay: float) -> int:
+    time.sleep(delay)
+    return len(pb.scenario.blocks)
+
+
+def test_in_process_pool_matches_direct_solve():
+    pb = Problem.from_scenario(load_scenario(TINY7))
+    direct = solve_sa(pb, iters=150, seed=5)
+    with SolverPool(1) as pool:
+        assert pool.in_process
+        pooled = pool.submit(pb, "sa", iters=150, seed=5).result()
+        from_path, runtime = pool.submit_timed(TINY7, "sa", iters=150, seed=5).result()
+    assert pooled["objective"] == pytest.approx(direct["objective"])
+    assert from_path["objective"] == pytest.approx(direct["objective"])
+    assert runtime >= 0.0
+
+
+def test_worker_pool_reuses_loaded_problems():
+    pb = Problem.from_scenario(load_scenario(TINY7))
+    direct = solve_sa(pb, iters=150, seed=9)
+    with SolverPool(2) as pool:
+        futures = [pool.submit(TINY7, "sa", iters=150, seed=9) for _ in range(2)]
+        pickled = pool.submit(pb, "sa", iters=150, seed=9)
+        objectives = [future.result()["objective"] for future in [*futures, pickled]]
+        # A worker hands back the same cached problem object for repeated submissions.
+        ids = {pool.submit(TINY7, _problem_id).result() for _ in range(6)}
+    assert objectives == pytest.approx([direct["objective"]] * 3)
+    assert len(ids) <= 2
+
+
+def test_pool_reports_unknown_solver():
+    with SolverPool(1) as pool:
+        future = pool.submit(TINY7, "nope")
+        with pytest.raises(ValueError, match="Unknown solver"):
+            future.result()
+
+
+def test_evicted_pickles_outlive_queued_jobs():
+    scenario = load_scenario(TINY7)
+    first, second, third = (Problem.from_scenario(scenario) for _ in range(3))
+    with SolverPool(2, cache_size=1) as pool:
+        busy = [pool.submit(first, _slow_block_count, 0.5) for _ in range(2)]
+        queued = pool.submit(second, _slow_block_count, 0.0)
+        # Evicts ``second`` from the pool while its job is still waiting for a worker.
+        latest = pool.submit(third, _slow_block_count, 0.0)
+        counts = [future.result() for future in [*busy, queued, latest]]
+        assert pool._tmpdir is not None
+        # Retired pickles go once their last job's done-callback has run.
+        deadline = time.monotonic() + 5.0
+        while len(list(pool._tmpdir.iterdir())) > 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(list(pool._tmpdir.iterdir())) == 1
+    assert counts == [len(scenario.blocks)] * 4
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
+from random import Random
+
 from fhops.optimization.heuristics import solve_tabu
+from fhops.optimization.heuristics.common import (
+    Schedule,
+    evaluate_schedule,
+    generate_neighbors,
+    init_greedy_schedule,
+)
+from fhops.optimization.heuristics.registry import OperatorRegistry, SlotChange
+from fhops.optimization.heuristics.tabu import TabuMemory
+from fhops.optimization.operational_problem import build_operational_problem
 from fhops.scenario.contract import (
     Block,
     CalendarEntry,
@@ -11,6 +22,7 @@ from fhops.scenario.contract import (
     Scenario,
 )
 from fhops.scenario.contract.models import ShiftCalendarEntry
+from fhops.scenario.io import load_scenario
 
 
 def _problem() -> Problem:
@@ -78,3 +90,78 @@ def test_solve_tabu_records_restarts_when_stalled():
     meta = result["meta"]
     assert meta.get("restarts", 0) >= 1
     assert meta.get("iterations") == 200
+
+
+def test_tabu_memory_forbids_reverse_moves_until_expiry():
+    pb = _problem()
+    ctx = build_operational_problem(pb)
+    memory = TabuMemory(ctx, tenure=3)
+    parent = Schedule(plan={"M1": {(1, "AM"): "B1", (2, "AM"): None}, "M2": {}})
+    child = Schedule(plan={"M1": {(1, "AM"): "B2", (2, "AM"): None}, "M2": {}})
+    forward = (SlotChange("M1", 1, "AM", "B1", "B2"),)
+    reverse = (SlotChange("M1", 1, "AM", "B2", "B1"),)
+
+    parent_hash = memory.solution_hash(parent)
+    child_hash = memory.solution_hash(child)
+    assert parent_hash != child_hash
+    assert not memory.is_tabu_move(forward, step=1)
+
+    memory.record(forward, child_hash, step=1)
+    assert memory.is_tabu_move(reverse, step=2)
+    assert not memory.is_tabu_move(reverse, step=4)
+
+    memory.clear()
+    assert not memory.is_tabu_move(reverse, step=2)
+
+
+def test_tabu_memory_detects_revisited_solutions():
+    pb = _problem()
+    ctx = build_operational_problem(pb)
+    memory = TabuMemory(ctx, tenure=5)
+    empty = Schedule(plan={"M1": {(1, "AM"): None}, "M2": {(1, "AM"): None}})
+    filled = Schedule(plan={"M1": {(1, "AM"): None}, "M2": {(1, "AM"): "B2"}})
+    memory.record((), memory.solution_hash(empty), step=1)
+
+    # Filling then emptying the same slot lands back on the visited solution.
+    filled_hash = memory.solution_hash(filled)
+    assert not memory.was_visited(filled_hash, step=2)
+    emptied = Schedule(plan=empty.plan, changed_slots={("M2", 1, "AM")})
+    assert memory.was_visited(memory.updated_hash(filled_hash, filled, emptied), step=2)
+    assert not memory.was_visited(memory.solution_hash(empty), step=6)
+
+
+def test_solve_tabu_flags_revisited_solutions(monkeypatch):
+    checks: list[bool] = []
+    original = TabuMemory.was_visited
+
+    def spy(self, solution_hash, step):
+        visited = original(self, solution_hash, step)
+        checks.append(visited)
+        return visited
+
+    monkeypatch.setattr(TabuMemory, "was_visited", spy)
+    pb = _problem()
+    solve_tabu(pb, iters=100, seed=5, tabu_tenure=10)
+    assert checks
+    assert any(checks)
+
+
+def test_tabu_memory_updated_hash_matches_full_rehash():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    memory = TabuMemory(ctx, tenure=5)
+    registry = OperatorRegistry.from_defaults()
+    rng = Random(7)
+    current = init_greedy_schedule(pb, ctx)
+    evaluate_schedule(pb, current, ctx)
+    current_hash = memory.solution_hash(current)
+    for _ in range(20):
+        neighbours = generate_neighbors(pb, current, registry, rng, {}, ctx, batch_size=4)
+        if not neighbours:
+            continue
+        candidate = neighbours[0]
+        evaluate_schedule(pb, candidate, ctx)
+        assert candidate.changed_slots is not None
+        current_hash = memory.updated_hash(current_hash, current, candidate)
+        assert current_hash == memory.solution_hash(candidate)
+        current = candidate
@@ -29,3 +29,24 @@ def test_slice_scenario_rebases_calendars_and_locks():
     assert sliced.num_days == 14
     assert all(1 <= entry.day <= 14 for entry in sliced.calendar)
     assert all(rate.block_id in {b.id for b in sliced.blocks} for rate in sliced.production_rates)
+
+
+def test_slice_scenario_shares_unchanged_rows_and_leaves_base_intact():
+    scenario = load_scenario("examples/med42/scenario.yaml")
+    before = scenario.model_dump()
+    config = RollingHorizonConfig(
+        scenario=scenario, master_days=28, subproblem_days=14, lock_days=7
+    )
+    first, second = build_iteration_plan(config)[:2]
+
+    sliced = slice_scenario_for_window(scenario, first)
+    later = slice_scenario_for_window(scenario, second)
+
+    assert sliced.machines[0] is scenario.machines[0]
+    assert sliced.calendar[0] is scenario.calendar[0]
+    assert later.calendar[0] is not scenario.calendar[0]
+    assert later.calendar[0].day == 1
+    base_rates = {id(rate) for rate in scenario.production_rates}
+    assert all(id(rate) in base_rates for rate in later.production_rates)
+    type(scenario).model_validate(later.model_dump())
+    assert scenario.model_dump() == before
@@ -0,0 +1,74 @@
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from fhops.cli.benchmarks import BenchmarkScenario, benchmark_app
+from fhops.cli.perf import (
+    PerfResult,
+    compare_results,
+    record_perf_run,
+    run_perf_suite,
+)
+from fhops.telemetry.sqlite_store import load_perf_results
+
+TINY7 = BenchmarkScenario("tiny7", Path("examples/tiny7/scenario.yaml"))
+
+
+def test_run_perf_suite_reports_throughput_and_memory():
+    results = run_perf_suite([TINY7], ["evaluate_schedule", "sanitizer"], min_time=0.0, max_calls=3)
+    assert [result.case_name for result in results] == ["evaluate_schedule", "sanitizer"]
+    for result in results:
+        assert result.scenario == "tiny7"
+        assert 1 <= result.calls <= 3
+        assert result.ops_per_sec > 0
+        assert result.peak_kib >= 0
+
+
+def test_perf_runs_persist_and_flag_regressions(tmp_path):
+    sqlite_path = tmp_path / "runs.sqlite"
+    fast = PerfResult("tiny7", "evaluate_schedule", 100, 1.0, 100.0, 1.0, 2.0)
+    slow = PerfResult("tiny7", "evaluate_schedule", 80, 1.0, 80.0, 1.0, 2.0)
+
+    first = record_perf_run(sqlite_path, [fast], label="base", git_commit="abc1234")
+    second = record_perf_run(sqlite_path, [slow], git_commit="def5678")
+
+    run, rows = load_perf_results(sqlite_path, exclude_run=second["perf_run_id"])
+    assert run is not None and run["perf_run_id"] == first["perf_run_id"]
+    assert run["context"]["python"]
+    assert load_perf_results(sqlite_path, "abc")[0]["label"] == "base"
+    assert load_perf_results(sqlite_path, "missing") == (None, [])
+
+    report = compare_results([slow], rows, threshold=0.1)
+    assert report[0]["ratio"] == 0.8
+    assert report[0]["regressed"]
+    assert not compare_results([slow], rows, threshold=0.25)[0]["regressed"]
+    assert compare_results([slow], [], threshold=0.1)[0]["ratio"] is None
+
+
+def test_bench_perf_cli_writes_report(tmp_path):
+    sqlite_path = tmp_path / "runs.sqlite"
+    out_path = tmp_path / "perf.json"
+    runner = CliRunner()
+    args = [
+        "perf",
+        "--scenario",
+        str(TINY7.path),
+        "--case",
+        "evaluate_schedule",
+        "--min-time",
+        "0",
+        "--max-calls",
+        "2",
+        "--sqlite",
+        str(sqlite_path),
+        "--out",
+        str(out_path),
+    ]
+    assert runner.invoke(benchmark_app, args).exit_code == 0
+    result = runner.invoke(benchmark_app, args)
+    assert result.exit_code == 0, result.output
+    assert "Baseline:" in result.output
+    assert out_path.exists()
+
+    bad = runner.invoke(benchmark_app, ["perf", "--case", "nope", "--sqlite", str(sqlite_path)])
+    assert bad.exit_code != 0
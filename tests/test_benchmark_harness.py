@@ -127,6 +127,24 @@ def test_benchmark_suite_preset_comparison(tmp_path):
     assert all(sa_rows["best_heuristic_solver"] == "sa")
 
 
+def test_benchmark_suite_worker_pool_matches_sequential(tmp_path):
+    kwargs = dict(
+        time_limit=10,
+        sa_iters=150,
+        include_mip=False,
+        include_ils=True,
+        ils_iters=40,
+        include_tabu=True,
+        tabu_iters=80,
+    )
+    paths = [Path("examples/tiny7/scenario.yaml"), Path("examples/synthetic/small/scenario.yaml")]
+    sequential = run_benchmark_suite(paths, tmp_path / "seq", **kwargs)
+    pooled = run_benchmark_suite(paths, tmp_path / "pool", workers=2, **kwargs)
+    assert list(pooled["scenario"]) == list(sequential["scenario"])
+    assert list(pooled["solver"]) == list(sequential["solver"])
+    assert list(pooled["objective"]) == pytest.approx(list(sequential["objective"]))
+
+
 def test_synthetic_small_benchmark_kpi_bounds(tmp_path):
     summary = run_benchmark_suite(
         [Path("examples/synthetic/small/scenario.yaml")],
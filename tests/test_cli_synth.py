@@ -140,3 +140,45 @@ def test_synth_batch_generates_multiple(tmp_path: Path):
         (tmp_path / "bundle_small" / "metadata.yaml").read_text(encoding="utf-8")
     )
     assert small_meta["seed"] == 501
+
+
+def test_synth_batch_parallel_matches_sequential(tmp_path: Path):
+    plan = tmp_path / "plan.yaml"
+    plan.write_text(
+        """
+        - tier: small
+          output_dir: "{out}/a"
+        - tier: medium
+          output_dir: "{out}/b"
+          format: parquet
+        - tier: small
+          output_dir: "{out}/c"
+          seed: 42
+        """,
+        encoding="utf-8",
+    )
+
+    outputs = {}
+    for label, workers in (("seq", "1"), ("par", "2")):
+        out = tmp_path / label
+        plan_path = tmp_path / f"plan_{label}.yaml"
+        plan_path.write_text(plan.read_text().replace("{out}", str(out)), encoding="utf-8")
+        result = runner.invoke(
+            app, ["synth", "batch", str(plan_path), "--workers", workers, "--base-seed", "900"]
+        )
+        assert result.exit_code == 0, result.stdout
+        outputs[label] = out
+
+    seeds = [
+        yaml.safe_load((outputs["par"] / name / "metadata.yaml").read_text(encoding="utf-8"))[
+            "seed"
+        ]
+        for name in ("a", "b", "c")
+    ]
+    assert seeds == [900, 901, 42]
+    assert (outputs["par"] / "b" / "data" / "blocks.parquet").exists()
+    for name in ("a", "c"):
+        for table in ("blocks", "calendar", "prod_rates"):
+            seq = (outputs["seq"] / name / "data" / f"{table}.csv").read_text(encoding="utf-8")
+            par = (outputs["par"] / name / "data" / f"{table}.csv").read_text(encoding="utf-8")
+            assert seq == par
@@ -83,6 +83,34 @@ def test_tune_random_cli_runs_solver(tmp_path: Path):
     assert "created_at" in summary
 
 
+def test_tune_random_worker_pool_matches_sequential(tmp_path: Path):
+    summaries = []
+    for workers in ("1", "2"):
+        telemetry_log = tmp_path / f"workers{workers}" / "runs.jsonl"
+        result = runner.invoke(
+            app,
+            [
+                "tune-random",
+                "examples/tiny7/scenario.yaml",
+                "--telemetry-log",
+                str(telemetry_log),
+                "--runs",
+                "3",
+                "--iters",
+                "20",
+                "--base-seed",
+                "7",
+                "--workers",
+                workers,
+            ],
+        )
+        assert result.exit_code == 0, result.stdout
+        lines = telemetry_log.read_text(encoding="utf-8").strip().splitlines()
+        assert len(lines) == 4
+        summaries.append(json.loads(lines[-1])["scenario_best"])
+    assert summaries[0] == summaries[1]
+
+
 @pytest.mark.milp_refactor
 def test_tune_grid_cli_runs(tmp_path: Path):
     telemetry_log = tmp_path / "telemetry" / "runs.jsonl"
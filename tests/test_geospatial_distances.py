@@ -1,9 +1,20 @@
+import json
+import math
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
 from fhops.cli.geospatial import compute_distances
+from fhops.scheduling.geospatial import (
+    BlockGeometry,
+    RoadNetwork,
+    compute_distance_matrix,
+    compute_distance_table,
+    iter_distance_pairs,
+    load_block_geometries,
+    write_distance_pairs,
+)
 
 
 def test_compute_distances_cli_generates_symmetric_matrix(tmp_path):
@@ -25,3 +36,102 @@ def test_compute_distances_cli_generates_symmetric_matrix(tmp_path):
     for (src, dst), distance in lookup.items():
         if (dst, src) in lookup:
             assert pytest.approx(distance, rel=1e-6) == lookup[(dst, src)]
+
+
+def _square_geometries(count: int) -> list[BlockGeometry]:
+    return [
+        BlockGeometry(block_id=f"B{idx}", centroid=(float(idx % 5) * 100.0, float(idx // 5) * 70.0))
+        for idx in range(count)
+    ]
+
+
+def test_compute_distance_matrix_matches_pairwise_hypot():
+    geometries = load_block_geometries(Path("examples/med42/med42_blocks.geojson"))
+    matrix = compute_distance_matrix(geometries)
+    assert len(matrix) == len(geometries) ** 2
+    for src in geometries[:5]:
+        for dst in geometries:
+            expected = math.hypot(
+                src.centroid[0] - dst.centroid[0], src.centroid[1] - dst.centroid[1]
+            )
+            assert matrix[(src.block_id, dst.block_id)] == pytest.approx(expected, rel=1e-12)
+
+
+def test_distance_pairs_threshold_and_chunking(tmp_path):
+    geometries = _square_geometries(23)
+    full = pd.concat(iter_distance_pairs(geometries, chunk_rows=4), ignore_index=True)
+    assert len(full) == 23 * 22
+    near = pd.concat(
+        iter_distance_pairs(geometries, max_distance_m=150.0, chunk_rows=7), ignore_index=True
+    )
+    assert (near["distance_m"] <= 150.0).all()
+    expected = full[full["distance_m"] <= 150.0]
+    key = ["from_block", "to_block"]
+    assert (
+        near.sort_values(key)
+        .reset_index(drop=True)
+        .equals(expected.sort_values(key).reset_index(drop=True))
+    )
+
+    out_parquet = tmp_path / "near.parquet"
+    written = write_distance_pairs(
+        iter_distance_pairs(geometries, max_distance_m=150.0, chunk_rows=7), out_parquet
+    )
+    assert written == len(near)
+    assert pd.read_parquet(out_parquet).equals(near)
+
+
+def test_road_network_distances_follow_roads(tmp_path):
+    roads = {
+        "type": "FeatureCollection",
+        "crs": {"type": "name", "properties": {"name": "urn:ogc:def:crs:EPSG::26910"}},
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[0.0, 0.0], [0.0, 1000.0], [1000.0, 1000.0]],
+                },
+            },
+            {
+                "type": "Feature",
+                "properties": {},
+                "geometry": {
+                    "type": "MultiLineString",
+                    "coordinates": [[[1000.0, 1000.0], [1000.0, 0.0]]],
+                },
+            },
+        ],
+    }
+    roads_path = tmp_path / "roads.geojson"
+    roads_path.write_text(json.dumps(roads))
+    network = RoadNetwork.from_geojson(roads_path)
+    assert len(network.nodes) == 4
+
+    bare_path = tmp_path / "roads_no_crs.geojson"
+    bare_path.write_text(json.dumps({key: value for key, value in roads.items() if key != "crs"}))
+    with pytest.raises(ValueError, match="Road network GeoJSON has no CRS"):
+        RoadNetwork.from_geojson(bare_path)
+
+    geometries = [
+        BlockGeometry(block_id="A", centroid=(0.0, 10.0)),
+        BlockGeometry(block_id="B", centroid=(1000.0, 10.0)),
+        BlockGeometry(block_id="C", centroid=(5000.0, 5000.0)),
+    ]
+    table = compute_distance_table(geometries, road_network=network)
+    assert table.get("A", "B") == pytest.approx(3020.0)
+    assert table.get("B", "A") == pytest.approx(3020.0)
+    assert table.get("A", "A") == 0.0
+
+    out_csv = tmp_path / "road.csv"
+    compute_distances(
+        Path("examples/med42/med42_blocks.geojson"), out_csv, roads=roads_path, chunk_rows=8
+    )
+    df = pd.read_csv(out_csv)
+    straight = compute_distance_matrix(
+        load_block_geometries(Path("examples/med42/med42_blocks.geojson"))
+    )
+    assert all(
+        row.distance_m >= straight[(row.from_block, row.to_block)] - 1e-6 for row in df.itertuples()
+    )
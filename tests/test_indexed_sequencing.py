@@ -0,0 +1,91 @@
+"""Parity tests for the array-backed sequencing tracker."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from fhops.evaluation.sequencing import (
+    IndexedSequencingTracker,
+    SequencingTracker,
+    build_sequencing_layout,
+)
+from fhops.optimization.operational_problem import build_operational_problem
+from fhops.scenario.contract import Problem
+from fhops.scenario.io import load_scenario
+
+
+def _random_stream(ctx, seed: int) -> list[tuple[int, str, str, float]]:
+    rng = random.Random(seed)
+    blocks = list(ctx.bundle.blocks)
+    stream: list[tuple[int, str, str, float]] = []
+    for day, _ in ctx.shift_keys:
+        for machine_id in ctx.machine_order:
+            if rng.random() < 0.8:
+                stream.append((day, machine_id, rng.choice(blocks), rng.uniform(0.0, 40.0)))
+    stream.append((ctx.shift_keys[-1][0], ctx.machine_order[0], "UNKNOWN", 10.0))
+    return stream
+
+
+def _assert_snapshots_match(expected: dict, actual: dict) -> None:
+    assert expected.keys() == actual.keys()
+    for key, value in expected.items():
+        if isinstance(value, dict):
+            assert value.keys() == actual[key].keys()
+            for inner_key, inner_value in value.items():
+                assert actual[key][inner_key] == pytest.approx(inner_value)
+        elif isinstance(value, float):
+            assert actual[key] == pytest.approx(value)
+        else:
+            assert actual[key] == value
+
+
+@pytest.mark.parametrize("scenario", ["tiny7", "small21", "med42"])
+def test_indexed_tracker_matches_dict_tracker(scenario: str):
+    pb = Problem.from_scenario(load_scenario(f"examples/{scenario}/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    reference = SequencingTracker(ctx)
+    indexed = IndexedSequencingTracker(ctx)
+
+    for event in _random_stream(ctx, seed=7):
+        assert indexed.process(*event) == reference.process(*event)
+    reference.finalize()
+    indexed.finalize()
+
+    assert indexed.remaining_work == reference.remaining_work
+    assert indexed.completed_blocks == reference.completed_blocks
+    assert indexed.delivered_total == reference.delivered_total
+    _assert_snapshots_match(reference.debug_snapshot(), indexed.debug_snapshot())
+
+
+def test_snapshot_restore_and_reset_replay_identically():
+    pb = Problem.from_scenario(load_scenario("examples/small21/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+    stream = _random_stream(ctx, seed=3)
+    midpoint = len(stream) // 2
+    tracker = IndexedSequencingTracker(ctx)
+
+    for event in stream[:midpoint]:
+        tracker.process(*event)
+    state = tracker.snapshot()
+    first_tail = [tracker.process(*event) for event in stream[midpoint:]]
+    tracker.finalize()
+    first_debug = tracker.debug_snapshot()
+
+    tracker.restore(state)
+    assert [tracker.process(*event) for event in stream[midpoint:]] == first_tail
+    tracker.finalize()
+    assert tracker.debug_snapshot() == first_debug
+
+    tracker.reset()
+    fresh = IndexedSequencingTracker(ctx)
+    for event in stream:
+        assert tracker.process(*event) == fresh.process(*event)
+
+
+def test_sequencing_layout_is_cached_per_context():
+    pb = Problem.from_scenario(load_scenario("examples/tiny7/scenario.yaml"))
+    ctx = build_operational_problem(pb)
+
+    assert build_sequencing_layout(ctx) is build_sequencing_layout(ctx)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from fhops.evaluation import KPIEvaluator, compute_kpis, compute_makespan_metrics
+from fhops.evaluation.metrics.aggregates import shift_order_index
+from fhops.scenario.contract import Problem
+from fhops.scenario.io import load_scenario
+
+SCENARIO_PATH = Path("examples/med42/scenario.yaml")
+ASSIGNMENTS_PATH = Path("tests/fixtures/playback/med42_assignments.csv")
+
+
+@pytest.fixture(scope="module")
+def med42() -> tuple[Problem, pd.DataFrame]:
+    pb = Problem.from_scenario(load_scenario(SCENARIO_PATH))
+    return pb, pd.read_csv(ASSIGNMENTS_PATH)
+
+
+def test_evaluator_is_memoised_per_problem(med42: tuple[Problem, pd.DataFrame]) -> None:
+    pb, _ = med42
+    evaluator = KPIEvaluator.for_problem(pb)
+
+    assert KPIEvaluator.for_problem(pb) is evaluator
+    assert KPIEvaluator.for_problem(pb.model_copy()) is not evaluator
+
+
+def test_evaluate_many_matches_compute_kpis(med42: tuple[Problem, pd.DataFrame]) -> None:
+    pb, assignments = med42
+    perturbed = assignments.copy()
+    perturbed["_downtime"] = [int(idx % 7 == 0) for idx in range(len(perturbed))]
+    perturbed["_weather_severity"] = [0.3 if idx % 5 == 0 else 0.0 for idx in range(len(perturbed))]
+    truncated = assignments.iloc[: len(assignments) // 2]
+
+    batch = [assignments, perturbed, truncated]
+    results = KPIEvaluator(pb).evaluate_many(batch)
+
+    for frame, result in zip(batch, results, strict=True):
+        expected = compute_kpis(pb, frame)
+        assert list(result.to_dict().items()) == list(expected.to_dict().items())
+        pd.testing.assert_frame_equal(result.shift_calendar, expected.shift_calendar)
+        pd.testing.assert_frame_equal(result.day_calendar, expected.day_calendar)
+    assert "downtime_hours_total" in results[1]
+    assert results[2]["total_production"] <= results[0]["total_production"]
+
+
+def test_makespan_ranks_unknown_shifts_after_calendar(
+    med42: tuple[Problem, pd.DataFrame],
+) -> None:
+    pb, _ = med42
+    first_day, first_shift = pb.shifts[0].day, pb.shifts[0].shift_id
+    shift_df = pd.DataFrame(
+        [
+            {"day": first_day, "shift_id": first_shift, "production_units": 5.0},
+            {"day": first_day, "shift_id": "UNLISTED", "production_units": 1.0},
+            {"day": first_day + 1, "shift_id": first_shift, "production_units": 0.0},
+        ]
+    )
+
+    metrics = compute_makespan_metrics(pb, shift_df, shift_order=shift_order_index(pb))
+
+    assert metrics == {"makespan_day": first_day, "makespan_shift": "UNLISTED"}
+    assert compute_makespan_metrics(pb, shift_df) == metrics
@@ -15,10 +15,14 @@ from fhops.scenario.contract.models import (
     ProductionRate,
     Scenario,
 )
+from fhops.scenario.io import load_scenario
+from fhops.scenario.io.mobilisation import populate_mobilisation_distances
 from fhops.scheduling.mobilisation import (
     BlockDistance,
+    DistanceMatrix,
     MachineMobilisation,
     MobilisationConfig,
+    build_distance_lookup,
 )
 from fhops.scheduling.systems import HarvestSystem, SystemJob
 
@@ -186,3 +190,107 @@ def test_compute_kpis_reports_sequencing_metrics():
     assert kpis.get("sequencing_violation_days") == 1
     assert kpis.get("sequencing_clean_blocks") == 0
     assert str(kpis.get("sequencing_violation_breakdown")).startswith("missing_prereq=1")
+
+
+def _legacy_lookup(distances: list[BlockDistance]) -> dict[tuple[str, str], float]:
+    lookup: dict[tuple[str, str], float] = {}
+    for dist in distances:
+        lookup[(dist.from_block, dist.to_block)] = dist.distance_m
+        lookup[(dist.to_block, dist.from_block)] = dist.distance_m
+        lookup.setdefault((dist.from_block, dist.from_block), 0.0)
+        lookup.setdefault((dist.to_block, dist.to_block), 0.0)
+    return lookup
+
+
+def test_distance_matrix_matches_pairwise_lookup():
+    distances = [
+        BlockDistance(from_block="B1", to_block="B2", distance_m=200.0),
+        BlockDistance(from_block="B3", to_block="B3", distance_m=7.0),
+        BlockDistance(from_block="B2", to_block="B3", distance_m=50.0),
+        BlockDistance(from_block="B2", to_block="B1", distance_m=300.0),
+    ]
+    config = MobilisationConfig(machine_params=[], distances=distances)
+    lookup = build_distance_lookup(config)
+    assert dict(lookup) == _legacy_lookup(distances)
+    assert lookup[("B1", "B2")] == 300.0
+    assert lookup.get(("B1", "B3")) is None
+
+    matrix = DistanceMatrix.from_pairs(["B1"], ["B2"], [10.0])
+    assert matrix.values.dtype.name == "float64"
+    assert matrix.get("B1", "B9", 0.0) == 0.0
+    with pytest.raises(ValueError, match="non-negative"):
+        DistanceMatrix.from_pairs(["B1"], ["B2"], [-1.0])
+
+
+def test_populate_mobilisation_distances_loads_csv_and_npy(tmp_path):
+    frame = pd.DataFrame(
+        {
+            "from_block": ["B1", "B1", "B2"],
+            "to_block": ["B2", "B3", "B3"],
+            "distance_m": [120.0, 480.0, 90.0],
+        }
+    )
+    frame.to_csv(tmp_path / "distances.csv", index=False)
+    base = MobilisationConfig(machine_params=[], distance_csv="distances.csv")
+
+    loaded = populate_mobilisation_distances(tmp_path, "demo", None, base)
+    assert loaded is not None and loaded.distances is None
+    matrix = loaded.distance_matrix
+    assert matrix is not None
+    assert matrix.block_ids == ("B1", "B2", "B3")
+    assert matrix.get("B3", "B1") == 480.0
+    assert "distance_matrix" not in loaded.model_dump()
+
+    matrix.save_npy(tmp_path / "distances.npy")
+    npy_config = MobilisationConfig(machine_params=[], distance_csv="distances.npy")
+    mapped = populate_mobilisation_distances(tmp_path, "demo", None, npy_config)
+    assert mapped is not None and mapped.distance_matrix is not None
+    assert mapped.distance_matrix.block_ids == matrix.block_ids
+    assert (mapped.distance_matrix.dense() == matrix.dense()).all()
+    assert dict(build_distance_lookup(mapped)) == dict(build_distance_lookup(loaded))
+    assert mapped.distance_matrix.subset({"B1", "B3"}).block_ids == ("B1", "B3")
+
+
+@pytest.mark.parametrize("path", ["examples/tiny7/scenario.yaml", "examples/large84/scenario.yaml"])
+def test_scenario_dump_round_trips_loaded_distance_matrix(path):
+    scenario = load_scenario(path)
+    assert scenario.mobilisation is not None
+    assert scenario.mobilisation.distances is None
+    assert scenario.mobilisation.distance_matrix is not None
+
+    restored = Scenario.model_validate(scenario.model_dump())
+    assert dict(build_distance_lookup(restored.mobilisation)) == dict(
+        build_distance_lookup(scenario.mobilisation)
+    )
+    assert restored.model_dump() == scenario.model_dump()
+
+
+def test_distance_matrix_validates_against_scenario_blocks():
+    pb = build_problem()
+    mobilisation = pb.scenario.mobilisation
+    assert mobilisation is not None
+    payload = dict(pb.scenario)
+    payload["mobilisation"] = mobilisation.model_copy(
+        update={
+            "distances": None,
+            "distance_matrix": DistanceMatrix.from_pairs(["B1"], ["B9"], [10.0]),
+        }
+    )
+    with pytest.raises(ValueError, match="unknown block_id"):
+        Scenario(**payload)
+
+    payload["mobilisation"] = mobilisation.model_copy(
+        update={
+            "distances": None,
+            "distance_matrix": DistanceMatrix.from_pairs(["B1"], ["B2"], [2000.0]),
+        }
+    )
+    matrix_pb = Problem.from_scenario(Scenario(**payload))
+    model = build_model(matrix_pb)
+    for var in model.component_data_objects(pyo.Var):
+        var.value = 0
+    model.x["M1", "B1", _shift_tuple(matrix_pb, 1)].value = 1
+    model.x["M1", "B2", _shift_tuple(matrix_pb, 2)].value = 1
+    if hasattr(model, "y"):
+        model.y["M1", "B1", "B2", _shift_tuple(matrix_pb, 2)].value = 1
+    assert pyo.value(model.obj) == -105.0
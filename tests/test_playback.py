@@ -168,3 +168,45 @@ def test_schedule_to_records_matches_assignments_conversion():
     assert {(rec.machine_id, rec.day, rec.block_id) for rec in schedule_records} == {
         (rec.machine_id, rec.day, rec.block_id) for rec in assignment_records
     }
+
+
+def test_assignments_to_records_charges_mobilisation_and_honours_columns():
+    pb = regression_problem()
+    df = pd.DataFrame(
+        [
+            {"machine_id": "F1", "block_id": "B2", "day": 2, "production": 3.0, "_downtime": 0},
+            {
+                "machine_id": "F1",
+                "block_id": "B1",
+                "day": 1,
+                "_weather_severity": 0.25,
+                "_downtime": 0,
+            },
+            {"machine_id": "F1", "block_id": "B1", "day": 3, "_downtime": 1},
+        ]
+    )
+
+    records = list(assignments_to_records(pb, df))
+
+    assert [(rec.day, rec.block_id) for rec in records] == [(1, "B1"), (2, "B2"), (3, "B1")]
+    assert all(rec.shift_id == "S1" for rec in records)
+    # First assignment has no predecessor; B1<->B2 is beyond the walk threshold.
+    assert [rec.mobilisation_cost for rec in records] == [None, 6.0, 6.0]
+    assert records[0].weather_severity == pytest.approx(0.25)
+    assert records[1].production_units == pytest.approx(3.0)
+    assert records[1].metadata["production_source"] == "column"
+    assert records[2].downtime is True
+    assert records[0].downtime is False
+
+
+def test_assignments_to_records_reuses_operational_context():
+    pb = regression_problem()
+    df = pd.DataFrame(REFERENCE_ASSIGNMENTS)
+
+    first = [repr(rec) for rec in assignments_to_records(pb, df)]
+    context = pb._operational_context
+    second = [repr(rec) for rec in assignments_to_records(pb, df)]
+
+    assert context is not None
+    assert pb._operational_context is context
+    assert first == second
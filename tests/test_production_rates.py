@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from fhops.cli.dataset import dataset_app
+from fhops.productivity import (
+    estimate_grapple_yarder_productivity_tr75_bunched,
+    estimate_loader_forwarder_productivity_tn261,
+)
+from fhops.scenario.contract import (
+    Block,
+    CalendarEntry,
+    Landing,
+    Machine,
+    ProductionRate,
+    Scenario,
+)
+from fhops.scenario.io import load_scenario
+from fhops.scenario.production_rates import (
+    ProductionRateCache,
+    block_attribute_frame,
+    derive_production_rates,
+)
+from fhops.scheduling.systems import HarvestSystem, SystemJob
+
+
+def _stand(block_id: str, system_id: str, **extra) -> Block:
+    attrs = {
+        "avg_stem_size_m3": 0.45,
+        "volume_per_ha_m3": 300.0,
+        "stem_density_per_ha": 700.0,
+        "ground_slope_percent": 25.0,
+    }
+    attrs.update(extra)
+    return Block(
+        id=block_id, landing_id="L1", work_required=3000.0, harvest_system_id=system_id, **attrs
+    )
+
+
+def _cable_scenario() -> Scenario:
+    systems = {
+        "cable": HarvestSystem(
+            system_id="cable",
+            jobs=[
+                SystemJob("felling", "feller_buncher", []),
+                SystemJob(
+                    "primary_transport",
+                    "grapple_yarder",
+                    ["felling"],
+                    productivity_overrides={
+                        "grapple_yarder_model": "tr75-bunched",
+                        "grapple_yarder_turn_volume_m3": 2.5,
+                    },
+                ),
+                SystemJob("loading", "loader", ["primary_transport"]),
+            ],
+        ),
+        "yarder_default": HarvestSystem(
+            system_id="yarder_default",
+            jobs=[SystemJob("primary_transport", "grapple_yarder", [])],
+        ),
+    }
+    blocks = [
+        _stand("B1", "cable"),
+        _stand("B2", "cable"),
+        _stand("B3", "cable", avg_stem_size_m3=None),
+        _stand("B4", "yarder_default"),
+    ]
+    machines = [
+        Machine(id="FB", role="feller_buncher", daily_hours=10.0),
+        Machine(id="GY", role="grapple_yarder", daily_hours=10.0),
+        Machine(id="LD", role="loader", daily_hours=12.0),
+        Machine(id="X"),
+    ]
+    return Scenario(
+        name="rates",
+        num_days=1,
+        blocks=blocks,
+        machines=machines,
+        landings=[Landing(id="L1", daily_capacity=2)],
+        calendar=[CalendarEntry(machine_id=m.id, day=1, available=1) for m in machines],
+        production_rates=[ProductionRate(machine_id="FB", block_id="B1", rate=1.0)],
+        harvest_systems=systems,
+    )
+
+
+def test_derive_rates_matches_reference_dataset():
+    scenario = load_scenario("examples/med42/scenario.yaml")
+    derived = derive_production_rates(scenario)
+    reference = pd.read_csv("examples/med42/data/prod_rates.csv")
+    merged = reference.merge(derived.rates, on=["machine_id", "block_id"], suffixes=("", "_new"))
+    assert len(merged) == len(reference) == len(derived.rates)
+    processor = merged[merged["role"] == "processor"]
+    np.testing.assert_allclose(processor["rate_new"], processor["rate"], rtol=1e-8)
+    felling = merged[merged["role"] == "feller_buncher"]
+    np.testing.assert_allclose(felling["rate_new"], felling["rate"], rtol=1e-3)
+    assert set(derived.groups["model"]) == {
+        "lahrsen2025-daily",
+        "adv6n7-skidder-loader",
+        "berry2019",
+        "tn261",
+    }
+
+
+def test_derive_rates_applies_system_models_and_skips_incomplete_blocks():
+    scenario = _cable_scenario()
+    derived = derive_production_rates(scenario)
+    rates = derived.rates.set_index(["machine_id", "block_id"])
+    attributes = block_attribute_frame(scenario)
+    distance = attributes.at["B1", "extraction_distance_m"]
+
+    yarder = estimate_grapple_yarder_productivity_tr75_bunched(2.5, distance)
+    assert rates.at[("GY", "B1"), "model"] == "tr75-bunched"
+    assert rates.at[("GY", "B1"), "rate"] == pytest.approx(yarder * 10.0, rel=1e-12)
+    loader = estimate_loader_forwarder_productivity_tn261(
+        piece_size_m3=0.45,
+        external_distance_m=attributes.at["B1", "loader_distance_m"],
+        slope_percent=25.0,
+    )
+    assert rates.at[("LD", "B1"), "rate"] == pytest.approx(
+        loader.productivity_m3_per_pmh * 12.0, rel=1e-12
+    )
+    # B3 lacks stem size (feller-buncher/loader input); B4's default SR-54 has no turn volume.
+    assert ("FB", "B3") not in rates.index and ("LD", "B3") not in rates.index
+    assert ("GY", "B3") in rates.index
+    assert not any(machine == "X" for machine, _ in rates.index)
+    assert ("FB", "B4") not in rates.index and ("GY", "B4") not in rates.index
+    groups = derived.groups.set_index(["role", "model"])
+    assert groups.at[("grapple_yarder", "sr54"), "reason"] == "missing inputs: turn_volume_m3"
+    assert groups.at[("feller_buncher", "lahrsen2025-daily"), "skipped"] == 1
+    assert [rate.machine_id for rate in derived.production_rates()][:3] == ["FB", "GY", "LD"]
+
+
+def test_derive_rates_skips_blocks_rejected_by_model():
+    scenario = _cable_scenario()
+    flat = _stand("B5", "cable", ground_slope_percent=0.0)
+    scenario = scenario.model_copy(update={"blocks": [*scenario.blocks, flat]})
+    derived = derive_production_rates(scenario)
+    rates = derived.rates.set_index(["machine_id", "block_id"])
+    assert ("FB", "B5") not in rates.index
+    assert ("FB", "B1") in rates.index and ("GY", "B5") in rates.index
+    groups = derived.groups.set_index(["role", "model"])
+    felling = groups.loc[("feller_buncher", "lahrsen2025-daily")]
+    assert felling["skipped"] == 2
+    assert felling["reason"] == (
+        "blocks missing stand attributes; rejected by model: ground_slope must be positive"
+    )
+
+
+def test_derive_rates_cache_workers_and_cli(tmp_path):
+    scenario = load_scenario("examples/small21/scenario.yaml")
+    cache = ProductionRateCache()
+    first = derive_production_rates(scenario, cache=cache, workers=2)
+    assert cache.hits == 0 and cache.misses == len(cache)
+    cache_path = cache.save(tmp_path / "cache.json")
+    reloaded = ProductionRateCache.load(cache_path)
+    second = derive_production_rates(scenario, cache=reloaded)
+    assert reloaded.misses == 0 and int(second.groups["evaluated"].sum()) == 0
+    pd.testing.assert_frame_equal(first.rates, second.rates)
+
+    out = tmp_path / "prod_rates.csv"
+    result = CliRunner().invoke(
+        dataset_app,
+        ["derive-rates", "--dataset", "small21", "--out", str(out), "--no-interactive"],
+    )
+    assert result.exit_code == 0, result.output
+    written = pd.read_csv(out)
+    assert list(written.columns) == ["machine_id", "block_id", "rate"]
+    np.testing.assert_allclose(written["rate"], first.rates["rate"])
+
+
+def test_rate_cache_discards_files_from_other_versions(tmp_path, monkeypatch):
+    cache = ProductionRateCache()
+    cache.store("lahrsen2025-daily", np.array([[0.4, 300.0, 800.0, 20.0]]), np.array([45.0]))
+    path = cache.save(tmp_path / "cache.json")
+    assert len(ProductionRateCache.load(path)) == 1
+
+    monkeypatch.setattr("fhops.scenario.production_rates.__version__", "0.0.0-other")
+    assert len(ProductionRateCache.load(path)) == 0
@@ -0,0 +1,207 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fhops.core.errors import FHOPSValueError
+from fhops.productivity import (
+    ADV6N7DeckingMode,
+    ForwarderBCModel,
+    LahrsenModel,
+    estimate_cable_yarder_productivity_tr125_single_span,
+    estimate_forwarder_productivity_bc,
+    estimate_grapple_skidder_productivity_adv6n7,
+    estimate_grapple_yarder_productivity_sr54,
+    estimate_grapple_yarder_productivity_tr75_handfelled,
+    estimate_loader_forwarder_productivity_tn261,
+    estimate_processor_productivity_berry2019,
+    estimate_productivity,
+    estimate_productivity_batch,
+    estimate_running_skyline_productivity_mcneel2000,
+    list_batch_models,
+    register_scalar_estimator,
+)
+from fhops.productivity.batch import batch_registry
+
+RNG = np.random.default_rng(7)
+
+
+def test_lahrsen_batch_matches_scalar():
+    frame = pd.DataFrame(
+        {
+            "avg_stem_size": RNG.uniform(0.2, 1.2, 50),
+            "volume_per_ha": RNG.uniform(150.0, 400.0, 50),
+            "stem_density": RNG.uniform(400.0, 1500.0, 50),
+            "ground_slope": RNG.uniform(5.0, 30.0, 50),
+        },
+        index=[f"B{idx}" for idx in range(50)],
+    )
+    result = estimate_productivity_batch("lahrsen2025-daily", frame, validate_ranges=0.0)
+    assert list(result.index) == list(frame.index)
+    for block_id, row in frame.iterrows():
+        scalar = estimate_productivity(
+            **row.to_dict(), model=LahrsenModel.DAILY, validate_ranges=False
+        )
+        assert result.at[block_id, "productivity_m3_per_pmh"] == scalar.predicted_m3_per_pmh
+        assert bool(result.at[block_id, "in_range"]) == (not scalar.out_of_range)
+
+    with pytest.raises(FHOPSValueError, match="ground_slope must be positive"):
+        estimate_productivity_batch(
+            "lahrsen2025-daily", frame.assign(ground_slope=0.0), validate_ranges=0.0
+        )
+
+
+def test_processor_forwarder_and_yarder_batches_match_scalar():
+    pieces = RNG.uniform(0.2, 1.5, 20)
+    categories = RNG.integers(0, 3, 20)
+    berry = estimate_productivity_batch(
+        "berry2019", piece_size_m3=pieces, tree_form_category=categories, crew_multiplier=1.16
+    )
+    for idx in range(20):
+        scalar = estimate_processor_productivity_berry2019(
+            piece_size_m3=pieces[idx], tree_form_category=int(categories[idx]), crew_multiplier=1.16
+        )
+        assert berry["productivity_m3_per_pmh"][idx] == scalar.productivity_m3_per_pmh
+
+    distances = RNG.uniform(50.0, 600.0, 20)
+    for name, model in (
+        ("ghaffariyan-small", ForwarderBCModel.GHAFFARIYAN_SMALL),
+        ("ghaffariyan-large", ForwarderBCModel.GHAFFARIYAN_LARGE),
+        ("adv1n12-shortwood", ForwarderBCModel.ADV1N12_SHORTWOOD),
+    ):
+        batch = estimate_productivity_batch(name, extraction_distance_m=distances)
+        expected = [
+            estimate_forwarder_productivity_bc(model=model, extraction_distance_m=value)
+            for value in distances
+        ]
+        np.testing.assert_allclose(
+            batch["productivity_m3_per_pmh"],
+            [item.predicted_m3_per_pmh for item in expected],
+            rtol=1e-12,
+        )
+    eriksson = estimate_productivity_batch(
+        "eriksson-final-felling",
+        mean_extraction_distance_m=distances,
+        mean_stem_size_m3=0.4,
+        load_capacity_m3=12.0,
+    )
+    np.testing.assert_allclose(
+        eriksson["productivity_m3_per_pmh"],
+        [
+            estimate_forwarder_productivity_bc(
+                model=ForwarderBCModel.ERIKSSON_FINAL_FELLING,
+                mean_extraction_distance_m=value,
+                mean_stem_size_m3=0.4,
+                load_capacity_m3=12.0,
+            ).predicted_m3_per_pmh
+            for value in distances
+        ],
+        rtol=1e-12,
+    )
+
+    volumes = RNG.uniform(0.5, 3.0, 20)
+    sr54 = estimate_productivity_batch("sr54", turn_volume_m3=volumes, yarding_distance_m=distances)
+    tr75 = estimate_productivity_batch(
+        "tr75-handfelled", turn_volume_m3=volumes, yarding_distance_m=distances
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        tr125 = estimate_productivity_batch(
+            "tr125-single-span", slope_distance_m=distances, lateral_distance_m=20.0
+        )
+        tr125_scalar = [
+            estimate_cable_yarder_productivity_tr125_single_span(
+                slope_distance_m=value, lateral_distance_m=20.0
+            )
+            for value in distances
+        ]
+    mcneel = estimate_productivity_batch(
+        "mcneel-running-yarder-b",
+        horizontal_distance_m=distances,
+        lateral_distance_m=15.0,
+        vertical_distance_m=40.0,
+    )
+    for idx in range(20):
+        assert sr54["productivity_m3_per_pmh"][idx] == estimate_grapple_yarder_productivity_sr54(
+            volumes[idx], distances[idx]
+        )
+        assert tr75["productivity_m3_per_pmh"][
+            idx
+        ] == estimate_grapple_yarder_productivity_tr75_handfelled(volumes[idx], distances[idx])
+        assert tr125["productivity_m3_per_pmh"][idx] == tr125_scalar[idx]
+        assert mcneel["productivity_m3_per_pmh"][
+            idx
+        ] == estimate_running_skyline_productivity_mcneel2000(
+            horizontal_distance_m=distances[idx],
+            lateral_distance_m=15.0,
+            vertical_distance_m=40.0,
+            yarder_variant="yarder_b",
+        )
+
+
+def test_batch_loader_and_skidder_kernels_match_scalar():
+    distances = np.linspace(60.0, 900.0, 15)
+    skidder = estimate_productivity_batch("adv6n7-loader", skidding_distance_m=distances)
+    loader = estimate_productivity_batch(
+        "tn261",
+        piece_size_m3=0.6,
+        external_distance_m=distances,
+        slope_percent=np.linspace(-40.0, 60.0, 15),
+        bunched=0.0,
+    )
+    for idx, distance in enumerate(distances):
+        assert skidder["productivity_m3_per_pmh"][idx] == (
+            estimate_grapple_skidder_productivity_adv6n7(
+                skidding_distance_m=distance, decking_mode=ADV6N7DeckingMode.LOADER
+            ).productivity_m3_per_pmh
+        )
+        assert loader["productivity_m3_per_pmh"][idx] == pytest.approx(
+            estimate_loader_forwarder_productivity_tn261(
+                piece_size_m3=0.6,
+                external_distance_m=distance,
+                slope_percent=float(np.linspace(-40.0, 60.0, 15)[idx]),
+                bunched=False,
+            ).productivity_m3_per_pmh,
+            rel=1e-12,
+        )
+
+
+def test_batch_validation_and_registry():
+    with pytest.raises(ValueError, match=r"piece_size_m3 must be > 0 \(first offending row: 2\)"):
+        estimate_productivity_batch("berry2019", piece_size_m3=[0.5, 0.7, -1.0])
+    with pytest.raises(ValueError, match="Missing inputs"):
+        estimate_productivity_batch("sr54", turn_volume_m3=[1.0])
+    with pytest.raises(ValueError, match="mismatched lengths"):
+        estimate_productivity_batch("sr54", turn_volume_m3=[1.0, 2.0], yarding_distance_m=[1.0])
+    with pytest.raises(ValueError, match="Unknown batch productivity model"):
+        estimate_productivity_batch("not-a-model", piece_size_m3=1.0)
+    with pytest.warns(RuntimeWarning, match="1 value"):
+        estimate_productivity_batch(
+            "tr125-single-span", slope_distance_m=[100.0, 500.0], lateral_distance_m=10.0
+        )
+
+    assert "ghaffariyan-small" in list_batch_models("forwarder")
+    assert set(list_batch_models("feller_buncher")) == {
+        f"lahrsen2025-{model.value}" for model in LahrsenModel
+    }
+
+    name = "test-scalar-fallback"
+    try:
+        register_scalar_estimator(
+            name,
+            estimate_grapple_yarder_productivity_sr54,
+            machine_role="grapple_yarder",
+            required=("turn_volume_m3", "yarding_distance_m"),
+        )
+        fallback = estimate_productivity_batch(
+            name, turn_volume_m3=[1.0, 2.0], yarding_distance_m=100.0
+        )
+        native = estimate_productivity_batch(
+            "sr54", turn_volume_m3=[1.0, 2.0], yarding_distance_m=100.0
+        )
+        assert fallback["productivity_m3_per_pmh"].tolist() == (
+            native["productivity_m3_per_pmh"].tolist()
+        )
+    finally:
+        batch_registry._estimators.pop(name, None)
@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import os
+
 import pytest
 
-from fhops.resources import data_path
+from fhops.costing.machine_rates import _build_default_machine_rates, load_default_machine_rates
+from fhops.resources import (
+    BUNDLE_ENV_VAR,
+    ReferenceBundle,
+    build_reference_bundle,
+    data_path,
+    load_json,
+    reference_bundle,
+)
 
 
 def test_data_path_resolves_source_checkout_data() -> None:
@@ -20,3 +31,66 @@ def test_data_path_rejects_absolute_components() -> None:
 
     with pytest.raises(ValueError, match="relative"):
         data_path("/tmp", "processor_berry2019.json")
+
+
+@pytest.fixture
+def bundle_env(monkeypatch: pytest.MonkeyPatch):
+    """Point the bundle lookup at a test-specific file and reset the cached bundle."""
+
+    def activate(path):
+        monkeypatch.setenv(BUNDLE_ENV_VAR, str(path))
+        reference_bundle.cache_clear()
+
+    yield activate
+    monkeypatch.delenv(BUNDLE_ENV_VAR, raising=False)
+    reference_bundle.cache_clear()
+
+
+def test_reference_bundle_matches_json_sources(tmp_path, bundle_env) -> None:
+    """Bundled tables and pre-inflated machine rates must equal the JSON-derived values."""
+
+    bundle_path = build_reference_bundle(tmp_path / "reference.bundle")
+    expected_rates = _build_default_machine_rates()
+    bundle_env(bundle_path)
+
+    bundle = reference_bundle()
+    assert bundle is not None
+    assert "costing/machine_rates@inflated" in bundle
+    berry = data_path("productivity", "processor_berry2019.json")
+    assert bundle.is_fresh("productivity/processor_berry2019.json")
+    assert load_json(berry) == json.loads(berry.read_text(encoding="utf-8"))
+    assert load_json(berry) is not load_json(berry)
+    assert load_default_machine_rates() == expected_rates
+
+
+def test_reference_bundle_falls_back_when_sources_change(tmp_path, bundle_env) -> None:
+    """Edited, missing, or foreign files are read from disk instead of the stale bundle."""
+
+    root = tmp_path / "data"
+    (root / "nested").mkdir(parents=True)
+    (root / "a.json").write_text('{"value": 1}', encoding="utf-8")
+    (root / "nested" / "b.json").write_text("[1, 2]", encoding="utf-8")
+    bundle_path = build_reference_bundle(tmp_path / "ref.bundle", root=root, derived={})
+
+    bundle = ReferenceBundle(bundle_path, root=root)
+    assert bundle.tables() == ("a.json", "nested/b.json")
+    assert bundle.get("nested/b.json") == [1, 2]
+
+    # Touching a file without changing its content keeps it fresh (hash fallback).
+    os.utime(root / "a.json", ns=(1, 1))
+    assert ReferenceBundle(bundle_path, root=root).get("a.json") == {"value": 1}
+
+    (root / "a.json").write_text('{"value": 22}', encoding="utf-8")
+    stale = ReferenceBundle(bundle_path, root=root)
+    assert not stale.is_fresh("a.json")
+    with pytest.raises(KeyError):
+        stale.get("a.json")
+
+    bundle_env(tmp_path / "missing.bundle")
+    assert reference_bundle() is None
+    (tmp_path / "junk.bundle").write_bytes(b"not a bundle at all")
+    bundle_env(tmp_path / "junk.bundle")
+    assert reference_bundle() is None
+    bundle_env("off")
+    assert reference_bundle() is None
+    assert load_json(root / "a.json") == {"value": 22}
@@ -0,0 +1,137 @@
+import pytest
+from typer.testing import CliRunner
+
+from fhops.cli.dataset import dataset_app
+from fhops.core.cache import (
+    ResultCache,
+    active_result_cache,
+    disable_result_cache,
+    enable_result_cache,
+    make_key,
+    memoised,
+)
+from fhops.costing import compute_unit_cost
+from fhops.costing.machine_rates import compose_rental_rate, get_machine_rate
+from fhops.productivity import LahrsenModel, estimate_productivity
+
+
+@pytest.fixture
+def result_cache():
+    cache = enable_result_cache(maxsize=8)
+    yield cache
+    disable_result_cache()
+
+
+def test_memoised_helpers_hit_cache_and_return_copies(result_cache):
+    rate = get_machine_rate("feller_buncher")
+    assert rate is not None
+    total, breakdown = compose_rental_rate(rate, usage_hours=10_000)
+    breakdown["ownership"] = -1.0
+    again, fresh = compose_rental_rate(rate, usage_hours=10_000)
+    assert again == total and fresh["ownership"] != -1.0
+
+    estimate = compute_unit_cost(
+        rental_rate_smh=total,
+        utilisation=0.8,
+        productivity_m3_per_pmh=30.0,
+        rental_rate_breakdown=fresh,
+    )
+    assert estimate == compute_unit_cost(
+        rental_rate_smh=total,
+        utilisation=0.8,
+        productivity_m3_per_pmh=30.0,
+        rental_rate_breakdown=fresh,
+    )
+    kwargs = dict(avg_stem_size=0.4, volume_per_ha=300.0, stem_density=800.0, ground_slope=20.0)
+    first = estimate_productivity(**kwargs, model=LahrsenModel.DAILY)
+    first.ranges["ground_slope"]["max"] = -1.0  # type: ignore[index]
+    again_estimate = estimate_productivity(**kwargs, model=LahrsenModel.DAILY)
+    assert again_estimate is not first
+    assert again_estimate.ranges["ground_slope"]["max"] != -1.0
+    stats = result_cache.stats()
+    assert (stats.hits, stats.misses) == (3, 3)
+
+    disable_result_cache()
+    assert active_result_cache() is None
+    assert estimate_productivity(**kwargs, model=LahrsenModel.DAILY) == again_estimate
+
+
+def test_result_cache_lru_bypass_and_disk_persistence(tmp_path):
+    calls: list[object] = []
+
+    @memoised("test.square")
+    def square(value):
+        calls.append(value)
+        return value * value
+
+    path = tmp_path / "results.sqlite"
+    cache = enable_result_cache(maxsize=2, path=path)
+    try:
+        for value in (1, 2, 1, 3, 2):
+            square(value)
+        assert calls == [1, 2, 3]  # 2 was evicted from memory but reloaded from disk
+        stats = cache.stats()
+        assert (stats.evictions, stats.disk_hits, stats.size) == (2, 1, 2)
+        opaque = object()
+
+        @memoised("test.identity")
+        def identity(value):
+            calls.append(value)
+            return value
+
+        assert identity(opaque) is opaque and identity(opaque) is opaque  # not keyable: no caching
+        assert calls[-2:] == [opaque, opaque]
+    finally:
+        disable_result_cache()
+
+    reopened = ResultCache(path=path)
+    assert reopened.get_or_compute(make_key("test.square", (3,), {}), lambda: -1) == 9
+    assert reopened.stats().disk_hits == 1
+    reopened.close()
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+
+
+def test_result_cache_discards_results_from_other_versions(tmp_path, monkeypatch):
+    path = tmp_path / "results.sqlite"
+    key = make_key("test.version", (1,), {})
+    cache = ResultCache(path=path)
+    cache.get_or_compute(key, lambda: "old")
+    cache.close()
+
+    monkeypatch.setattr("fhops.core.cache.__version__", "0.0.0-other")
+    upgraded = ResultCache(path=path)
+    assert upgraded.get_or_compute(key, lambda: "new") == "new"
+    assert upgraded.stats().disk_hits == 0
+    upgraded.close()
+
+    again = ResultCache(path=path)
+    assert again.get_or_compute(key, lambda: "unused") == "new"
+    again.close()
+
+
+def test_dataset_cli_reports_cache_stats(tmp_path):
+    runner = CliRunner()
+    args = [
+        "--result-cache",
+        str(tmp_path / "cli.sqlite"),
+        "--cache-stats",
+        "estimate-cost",
+        "--machine-role",
+        "feller_buncher",
+        "--avg-stem-size",
+        "0.45",
+        "--volume-per-ha",
+        "320",
+        "--stem-density",
+        "750",
+        "--ground-slope",
+        "20",
+    ]
+    first = runner.invoke(dataset_app, args)
+    assert first.exit_code == 0, first.output
+    assert "0 hits" in first.output
+    second = runner.invoke(dataset_app, args)
+    assert second.exit_code == 0, second.output
+    assert "from disk" in second.output and "hit rate 100%" in second.output
+    assert active_result_cache() is None
@@ -1,7 +1,10 @@
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from fhops.scenario.contract import Scenario
 from fhops.scenario.io import load_scenario
 
 DATA_ROOT = Path("tests/data")
@@ -32,3 +35,53 @@ def test_invalid_fixture_raises_validation_error():
         load_scenario(DATA_ROOT / "invalid" / "scenario.yaml")
     msg = str(excinfo.value)
     assert "unknown landing_id" in msg or "ValidationError" in msg
+
+
+@pytest.mark.parametrize(
+    "scenario_path",
+    [DATA_ROOT / "typical" / "scenario.yaml", Path("examples/large84/scenario.yaml")],
+)
+def test_binary_scenario_round_trips(tmp_path, scenario_path):
+    from fhops.scenario.io.binary import save_scenario_binary
+
+    scenario = load_scenario(scenario_path)
+    compiled = load_scenario(save_scenario_binary(scenario, tmp_path / "scenario.fhops"))
+
+    assert compiled.model_dump() == scenario.model_dump()
+    if scenario.mobilisation is not None and scenario.mobilisation.distance_matrix is not None:
+        original = scenario.mobilisation.distance_matrix
+        restored = compiled.mobilisation.distance_matrix
+        assert restored.block_ids == original.block_ids
+        assert np.array_equal(restored.values, original.values, equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    ("table", "old", "new", "message"),
+    [
+        ("blocks.csv", "B2,L2,", "B2,L9,", "Block B2 references unknown landing_id=L9"),
+        ("blocks.csv", "B2,L2,4,2,5", "B2,L2,4,2,7", "Block B2 latest_finish exceeds num_days=5"),
+        ("calendar.csv", "M1,2,1", "M1,6,1", "Calendar entry day 6 exceeds scenario horizon"),
+        ("production_rates.csv", "M1,B2,3", "M7,B2,3", "unknown machine_id=M7"),
+        ("production_rates.csv", "M1,B2,3", "M1,B8,3", "unknown block_id=B8"),
+    ],
+)
+def test_columnar_reference_checks_match_model_errors(tmp_path, table, old, new, message):
+    for path in (DATA_ROOT / "typical").iterdir():
+        (tmp_path / path.name).write_bytes(path.read_bytes())
+    csv_path = tmp_path / table
+    csv_path.write_text(csv_path.read_text().replace(old, new, 1))
+
+    with pytest.raises(ValueError, match=message) as columnar:
+        load_scenario(tmp_path / "scenario.yaml")
+
+    tables = {
+        "blocks": "blocks.csv",
+        "machines": "machines.csv",
+        "landings": "landings.csv",
+        "calendar": "calendar.csv",
+        "production_rates": "production_rates.csv",
+    }
+    rows = {name: pd.read_csv(tmp_path / file).to_dict("records") for name, file in tables.items()}
+    with pytest.raises(ValueError) as per_row:
+        Scenario(name="typical", num_days=5, **rows)
+    assert str(columnar.value) in str(per_row.value)
@@ -0,0 +1,133 @@
+import pyomo.environ as pyo
+import pytest
+from pyomo.repn import generate_standard_repn
+
+from fhops.optimization.mip.builder import build_model
+from fhops.scenario.contract.models import (
+    Block,
+    CalendarEntry,
+    Landing,
+    Machine,
+    Problem,
+    ProductionRate,
+    Scenario,
+)
+from fhops.scheduling.systems import HarvestSystem, SystemJob
+
+ROLES = {"F1": "faller", "Y1": "yarder", "P1": "processor"}
+
+
+def _cable_problem(
+    num_days: int, *, headstart: float | None = None, block_count: int = 2
+) -> Problem:
+    system = HarvestSystem(
+        system_id="cable_sequence",
+        jobs=[
+            SystemJob(name="falling", machine_role="faller", prerequisites=[]),
+            SystemJob(name="yarding", machine_role="yarder", prerequisites=["falling"]),
+            SystemJob(name="processing", machine_role="processor", prerequisites=["yarding"]),
+        ],
+        role_headstart_shifts={"yarder": headstart} if headstart else None,
+    )
+    blocks = [
+        Block(
+            id=block_id,
+            landing_id="L1",
+            work_required=work,
+            earliest_start=1,
+            latest_finish=num_days,
+            harvest_system_id="cable_sequence",
+        )
+        for block_id, work in (("B1", 12.0), ("B2", 9.0))[:block_count]
+    ]
+    scenario = Scenario(
+        name="cable-formulation",
+        num_days=num_days,
+        blocks=blocks,
+        machines=[Machine(id=machine_id, role=role) for machine_id, role in ROLES.items()],
+        landings=[Landing(id="L1", daily_capacity=3)],
+        calendar=[
+            CalendarEntry(machine_id=machine_id, day=day, available=1)
+            for machine_id in ROLES
+            for day in range(1, num_days + 1)
+        ],
+        production_rates=[
+            ProductionRate(machine_id=machine_id, block_id=block.id, rate=rate)
+            for machine_id, rate in (("F1", 6.0), ("Y1", 4.0), ("P1", 5.0))
+            for block in blocks
+        ],
+        harvest_systems={"cable_sequence": system},
+    )
+    return Problem.from_scenario(scenario)
+
+
+def _sequencing_nonzeros(model: pyo.ConcreteModel) -> int:
+    families = ("system_", "seq_cum_")
+    return sum(
+        len(generate_standard_repn(con.body, quadratic=False).linear_vars)
+        for con in model.component_data_objects(pyo.Constraint, active=True)
+        if con.parent_component().name.startswith(families)
+    )
+
+
+@pytest.mark.parametrize(("headstart", "block_count"), [(None, 2), (1.0, 1)])
+def test_cumulative_formulation_matches_prefix_objective(
+    headstart: float | None, block_count: int
+) -> None:
+    highs = pytest.importorskip("pyomo.contrib.appsi.solvers.highs")
+    pb = _cable_problem(5, headstart=headstart, block_count=block_count)
+
+    objectives = {}
+    for formulation in ("prefix", "cumulative"):
+        model = build_model(pb, sequencing_formulation=formulation)
+        solver = highs.Highs()
+        results = solver.solve(model)
+        assert results.termination_condition == highs.TerminationCondition.optimal
+        objectives[formulation] = pyo.value(model.obj)
+
+    assert objectives["cumulative"] == pytest.approx(objectives["prefix"], abs=1e-6)
+    assert objectives["prefix"] > 0
+
+
+def test_cumulative_formulation_grows_linearly() -> None:
+    short_pb, long_pb = _cable_problem(10), _cable_problem(20)
+
+    prefix = [_sequencing_nonzeros(build_model(pb)) for pb in (short_pb, long_pb)]
+    cumulative = [
+        _sequencing_nonzeros(build_model(pb, sequencing_formulation="cumulative"))
+        for pb in (short_pb, long_pb)
+    ]
+
+    assert prefix[1] > 3.5 * prefix[0]
+    assert cumulative[1] < 2.5 * cumulative[0]
+    assert cumulative[1] < prefix[1]
+
+
+def test_cumulative_sequencing_rejects_out_of_order_production() -> None:
+    pb = _cable_problem(3)
+    model = build_model(pb, sequencing_formulation="cumulative")
+    shift1, shift2 = ((shift.day, shift.shift_id) for shift in pb.shifts[:2])
+    for var in model.prod.values():
+        var.value = 0.0
+    model.prod["Y1", "B1", shift1].value = 4.0
+    # Load the running totals implied by the recurrence for the prod values above.
+    for blk, role, day, shift_id in model.seq_cum_prod:
+        model.seq_cum_prod[blk, role, (day, shift_id)].value = sum(
+            model.prod[machine, blk, shift].value
+            for machine, machine_role in ROLES.items()
+            if machine_role == role
+            for shift in model.S
+            if shift <= (day, shift_id)
+        )
+    for con in model.seq_cum_prod_balance.values():
+        assert pyo.value(con.body) == pytest.approx(pyo.value(con.upper))
+
+    con = model.system_sequencing["B1", "yarder", "faller", *shift1]
+    assert pyo.value(con.body) > pyo.value(con.upper)
+    con = model.system_sequencing["B1", "yarder", "faller", *shift2]
+    assert pyo.value(con.body) > pyo.value(con.upper)
+
+
+def test_unknown_formulation_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown sequencing formulation"):
+        build_model(_cable_problem(2), sequencing_formulation="dense")  # type: ignore[arg-type]
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 from collections import Counter
+from dataclasses import replace
 from pathlib import Path
 
+import pandas as pd
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from fhops.scenario.contract import SalvageProcessingMode
 from fhops.scenario.io import load_scenario
 from fhops.scenario.synthetic import (
     BlackoutBias,
+    SyntheticDatasetBundle,
     SyntheticDatasetConfig,
     generate_random_dataset,
     sampling_config_for,
@@ -310,3 +314,103 @@ def test_sampling_config_override_merges(tmp_path: Path):
     assert sampling.samples == 20
     assert sampling.downtime.enabled is True
     assert sampling.downtime.probability == 0.5
+
+
+def test_random_dataset_is_seed_deterministic_and_validates_lazily(tmp_path: Path):
+    config = SyntheticDatasetConfig(
+        name="synthetic-det",
+        tier="medium",
+        num_blocks=(20, 30),
+        num_days=(15, 20),
+        num_machines=(3, 5),
+    )
+    systems = default_system_registry()
+    first = generate_random_dataset(config, seed=11, systems=systems)
+    second = generate_random_dataset(config, seed=11, systems=systems)
+    other = generate_random_dataset(config, seed=12, systems=systems)
+
+    for name in ("blocks", "machines", "landings", "calendar", "production_rates"):
+        pd.testing.assert_frame_equal(getattr(first, name), getattr(second, name))
+    assert not first.production_rates.equals(other.production_rates)
+    assert first.metadata == second.metadata
+
+    assert first._scenario is None  # tables only until the scenario is requested
+    scenario = first.scenario
+    assert first.scenario is scenario
+    assert len(scenario.calendar) == len(first.calendar)
+    assert len(scenario.production_rates) == len(first.production_rates)
+    assert [block.harvest_system_id for block in scenario.blocks] == list(
+        first.blocks["harvest_system_id"]
+    )
+    # Machines run the system roles in memory while machines.csv keeps the role pool.
+    assert {machine.role for machine in scenario.machines} != set(first.machines["role"])
+
+
+def test_bundle_writes_parquet_tables(tmp_path: Path):
+    config = SyntheticDatasetConfig(
+        name="synthetic-parquet",
+        num_blocks=(5, 5),
+        num_days=(6, 6),
+        num_machines=(2, 2),
+        blackout_probability=0.0,
+    )
+    bundle = generate_random_dataset(config, seed=3)
+    scenario_yaml = bundle.write(tmp_path / "bundle", table_format="parquet")
+
+    payload = yaml.safe_load(scenario_yaml.read_text(encoding="utf-8"))
+    assert all(path.endswith(".parquet") for path in payload["data"].values())
+    loaded = load_scenario(scenario_yaml)
+    assert loaded.model_dump() == bundle.scenario.model_dump()
+
+    with pytest.raises(ValueError, match="Unsupported table format"):
+        bundle.write(tmp_path / "bad", table_format="feather")
+
+
+def test_bundle_write_validates_before_writing(tmp_path: Path):
+    config = SyntheticDatasetConfig(
+        name="synthetic-invalid",
+        num_blocks=(3, 3),
+        num_days=(4, 4),
+        num_machines=(2, 2),
+        blackout_probability=0.0,
+    )
+    bundle = generate_random_dataset(config, seed=3)
+    orphan = pd.DataFrame([{"machine_id": "MISSING", "block_id": "B1", "rate": 1.0}])
+    invalid = replace(bundle, production_rates=pd.concat([bundle.production_rates, orphan]))
+
+    with pytest.raises(ValidationError, match="unknown machine_id=MISSING"):
+        invalid.write(tmp_path / "invalid")
+    assert not (tmp_path / "invalid").exists()
+
+    # Writing revalidates tables edited after the scenario was cached.
+    assert bundle.scenario is not None
+    bundle.production_rates.loc[len(bundle.production_rates)] = orphan.iloc[0]
+    with pytest.raises(ValidationError, match="unknown machine_id=MISSING"):
+        bundle.write(tmp_path / "edited")
+    assert not (tmp_path / "edited").exists()
+
+
+def test_bundle_from_scenario_reuses_validated_scenario(tmp_path: Path):
+    config = SyntheticDatasetConfig(
+        name="synthetic-wrapped",
+        num_blocks=(3, 3),
+        num_days=(4, 4),
+        num_machines=(2, 2),
+        blackout_probability=0.0,
+    )
+    generated = generate_random_dataset(config, seed=5)
+    scenario = generated.scenario
+    bundle = SyntheticDatasetBundle.from_scenario(
+        scenario,
+        blocks=generated.blocks,
+        machines=generated.machines,
+        landings=generated.landings,
+        calendar=generated.calendar,
+        production_rates=generated.production_rates,
+        metadata=generated.metadata,
+    )
+    assert bundle.scenario is scenario
+    assert (bundle.name, bundle.num_days) == (scenario.name, scenario.num_days)
+
+    loaded = load_scenario(bundle.write(tmp_path / "wrapped"))
+    assert [block.id for block in loaded.blocks] == [block.id for block in scenario.blocks]
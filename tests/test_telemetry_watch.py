@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 import json
+import queue
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pytest
 
-from fhops.telemetry.watch import Snapshot, SnapshotBus, summarize_snapshots
+from fhops.telemetry.watch import (
+    ProcessSnapshotRelay,
+    ProcessSnapshotSink,
+    Snapshot,
+    SnapshotBus,
+    summarize_snapshots,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -77,6 +85,79 @@ def test_snapshotbus_drain_flushes_multiple():
     assert list(bus.drain()) == snaps
 
 
+def test_snapshotbus_is_bounded_and_counts_dropped():
+    bus = SnapshotBus(maxsize=2)
+    sink = bus.sink()
+    for i in range(5):
+        sink(
+            Snapshot(
+                scenario="foo",
+                solver="bar",
+                iteration=i,
+                max_iterations=5,
+                objective=float(i),
+                best_gap=None,
+                runtime_seconds=0.0,
+            )
+        )
+    assert bus.dropped == 3
+    assert [snap.iteration for snap in bus.drain()] == [3, 4]
+    with pytest.raises(queue.Empty):
+        bus.get(timeout=0.01)
+
+
+def test_snapshot_resolve_metadata_runs_factory_once():
+    calls = []
+
+    def factory() -> dict[str, str]:
+        calls.append(1)
+        return {"stalls": "2"}
+
+    snap = Snapshot(
+        scenario="foo",
+        solver="ils",
+        iteration=1,
+        max_iterations=2,
+        objective=0.0,
+        best_gap=None,
+        runtime_seconds=0.0,
+        metadata={"scenario": "foo"},
+        metadata_factory=factory,
+    )
+    assert snap.resolve_metadata() == {"scenario": "foo", "stalls": "2"}
+    assert snap.resolve_metadata() == {"scenario": "foo", "stalls": "2"}
+    assert len(calls) == 1
+
+
+def _publish_from_worker(sink: ProcessSnapshotSink, run_id: int) -> None:
+    for iteration in range(3):
+        sink(
+            Snapshot(
+                scenario="foo",
+                solver=f"sa#{run_id}",
+                iteration=iteration,
+                max_iterations=3,
+                objective=float(iteration),
+                best_gap=None,
+                runtime_seconds=0.5,
+                evaluations=10 * iteration,
+                metadata_factory=lambda: {"stalls": "0"},
+            )
+        )
+
+
+def test_process_relay_forwards_worker_snapshots():
+    received: list[Snapshot] = []
+    with ProcessSnapshotRelay(received.append) as relay:
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(_publish_from_worker, relay.sink, i) for i in range(2)]:
+                future.result()
+    assert len(received) == 6
+    assert {snap.solver for snap in received} == {"sa#0", "sa#1"}
+    assert all(snap.worker and snap.worker.startswith("pid ") for snap in received)
+    assert all(snap.metadata == {"stalls": "0"} for snap in received)
+
+
 def _load_fixture_snapshots(name: str) -> list[Snapshot]:
     data = (FIXTURES / name).read_text(encoding="utf-8").splitlines()
     snapshots: list[Snapshot] = []
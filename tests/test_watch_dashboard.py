@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from io import StringIO
+
+from rich.console import Console
+
+from fhops.cli.watch_dashboard import LiveWatch
+from fhops.telemetry.watch import Snapshot, WatchConfig
+
+
+def _snapshot(solver: str, objective: float, worker: str) -> Snapshot:
+    return Snapshot(
+        scenario="tiny7",
+        solver=solver,
+        iteration=50,
+        max_iterations=100,
+        objective=objective,
+        best_gap=None,
+        runtime_seconds=2.0,
+        evaluations=400,
+        worker=worker,
+    )
+
+
+def test_live_watch_renders_worker_and_global_best_panels():
+    console = Console(file=StringIO(), width=160, force_terminal=False)
+    watch = LiveWatch(WatchConfig(), console=console)
+    sink = watch.sink
+    sink(_snapshot("sa#0", 10.0, "pid 1"))
+    sink(_snapshot("sa#1", 12.5, "pid 2"))
+    watch._drain_once()
+
+    console.print(watch._render())
+    output = console.file.getvalue()
+    assert "Workers (2/2 active)" in output
+    assert "Global Best" in output
+    assert "12.500" in output and "sa#1" in output
+    assert "200" in output  # evaluations per second per worker
+
+
+def test_global_best_throughput_skips_finished_and_stale_runs():
+    console = Console(file=StringIO(), width=160, force_terminal=False)
+    watch = LiveWatch(WatchConfig(), console=console)
+    finished = replace(_snapshot("sa#1", 12.5, "pid 2"), iteration=100)
+    stale = replace(
+        _snapshot("sa#2", 11.0, "pid 3"), timestamp=datetime.utcnow() - timedelta(minutes=5)
+    )
+    for snap in (_snapshot("sa#0", 10.0, "pid 1"), finished, stale):
+        watch.sink(snap)
+    watch._drain_once()
+
+    best_table = watch._render_global_best()
+    assert best_table is not None
+    console.print(best_table)
+    row = next(line for line in console.file.getvalue().splitlines() if "tiny7" in line)
+    assert "sa#1" in row and row.rstrip(" │|").split()[-1] == "200"